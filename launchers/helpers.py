@@ -423,8 +423,18 @@ def set_commandline_args():
     parser = argparse.ArgumentParser(description='Generate a password')
     parser.add_argument('-t', '--testbot',
                         action='store')
+    parser.add_argument('--import-profile',
+                        action='store_true',
+                        help='report the cumulative import time of each plugin')
+    parser.add_argument('--import-budget',
+                        type=float,
+                        help='warn if plugin imports take longer than this many seconds')
     args = parser.parse_args()
     globalv.use_testbot = args.testbot
+    if args.import_profile:
+        globalv.import_profile = True
+    if args.import_budget is not None:
+        globalv.import_budget = args.import_budget
 
 
 def initialize_version(appname, debug):
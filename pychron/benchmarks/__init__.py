@@ -0,0 +1,27 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+benchmarks for pychron's throughput critical code.
+
+    python -m pychron.benchmarks list
+    python -m pychron.benchmarks run -o results.json [-k pattern] [--scale 0.1]
+    python -m pychron.benchmarks compare baseline.json results.json [--threshold 0.1]
+
+compare exits with status 1 if any benchmark is slower than its baseline by more than
+the threshold
+"""
+
+# ============= EOF =============================================
@@ -0,0 +1,135 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import argparse
+import sys
+
+# ============= local library imports  ==========================
+from pychron.benchmarks.harness import (
+    get_benchmarks,
+    run_benchmarks,
+    dump_results,
+    load_results,
+    compare,
+    regressions,
+    format_comparison,
+    format_time,
+    SKIPPED,
+)
+
+
+def list_benchmarks(args):
+    for b in get_benchmarks(args.pattern):
+        print(b.name)
+
+
+def run(args):
+    def report(b, r):
+        if SKIPPED in r:
+            msg = "skipped. {}".format(r[SKIPPED])
+        else:
+            msg = "{} (median {})".format(
+                format_time(r["min"]), format_time(r["median"])
+            )
+        print("{:<32s} {}".format(b.name, msg))
+
+    results = run_benchmarks(
+        args.pattern, scale=args.scale, repeat=args.repeat, callback=report
+    )
+    if args.output:
+        dump_results(results, args.output)
+        print("results written to {}".format(args.output))
+
+    if args.baseline:
+        return compare_results(load_results(args.baseline), results, args)
+
+
+def compare_results(baseline, results, args):
+    bs = baseline["metadata"].get("scale")
+    rs = results["metadata"].get("scale")
+    if bs != rs:
+        print("warning: comparing results of different scales {} and {}".format(bs, rs))
+
+    rows = compare(baseline, results, threshold=args.threshold, key=args.key)
+    for line in format_comparison(rows):
+        print(line)
+
+    slow = regressions(rows)
+    if slow:
+        print(
+            "{} benchmark(s) slower than the baseline by more than {:0.0f}%".format(
+                len(slow), args.threshold * 100
+            )
+        )
+        return 1
+
+
+def compare_files(args):
+    return compare_results(
+        load_results(args.baseline), load_results(args.results), args
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run pychron benchmarks")
+    sub = parser.add_subparsers(dest="command")
+    sub.required = True
+
+    def add_compare_args(p):
+        p.add_argument(
+            "--threshold",
+            type=float,
+            default=0.1,
+            help="fractional slowdown reported as a regression",
+        )
+        p.add_argument(
+            "--key",
+            default="min",
+            choices=("min", "median", "mean"),
+            help="statistic to compare",
+        )
+
+    p = sub.add_parser("list", help="list the benchmarks")
+    p.add_argument("-k", dest="pattern", action="append", help="name pattern")
+    p.set_defaults(func=list_benchmarks)
+
+    p = sub.add_parser("run", help="run the benchmarks")
+    p.add_argument("-k", dest="pattern", action="append", help="name pattern")
+    p.add_argument("-o", "--output", help="write the results to a json file")
+    p.add_argument(
+        "--scale", type=float, default=1.0, help="scale the size of the synthetic data"
+    )
+    p.add_argument("--repeat", type=int, help="override the number of repeats")
+    p.add_argument("--baseline", help="compare the results to a baseline json file")
+    add_compare_args(p)
+    p.set_defaults(func=run)
+
+    p = sub.add_parser("compare", help="compare results to a baseline")
+    p.add_argument("baseline")
+    p.add_argument("results")
+    add_compare_args(p)
+    p.set_defaults(func=compare_files)
+
+    args = parser.parse_args(argv)
+    return args.func(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+# ============= EOF =============================================
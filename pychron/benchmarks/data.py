@@ -0,0 +1,317 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+deterministic synthetic data for the benchmarks. every generator takes a seed so
+that two runs, on any machine, time the same work
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+from numpy import array, linspace, random
+
+# ============= local library imports  ==========================
+
+MASSES = {
+    "Ar40": 39.9624,
+    "Ar39": 38.964313,
+    "Ar38": 37.9627322,
+    "Ar37": 36.9667759,
+    "Ar36": 35.9675451,
+}
+
+ISOTOPES = (
+    ("Ar40", "H1"),
+    ("Ar39", "AX"),
+    ("Ar38", "L1"),
+    ("Ar37", "L2"),
+    ("Ar36", "CDD"),
+)
+
+INTERFERENCES = {
+    "K4039": (0.0007, 0.0001),
+    "K3839": (0.012, 0.0002),
+    "K3739": (0.0002, 0.00001),
+    "Ca3937": (0.0007, 0.00001),
+    "Ca3837": (0.00003, 0.000001),
+    "Ca3637": (0.00027, 0.000003),
+    "Cl3638": (262.8, 2),
+}
+
+
+def scaled(n, scale, minimum=1):
+    return max(minimum, int(n * scale))
+
+
+def isotope_evolution(n=500, seed=1):
+    """
+    a decaying isotope evolution with noise
+    """
+    rs = random.RandomState(seed)
+    xs = linspace(5, 400, n)
+    ys = 100 - 0.05 * xs + 2e-5 * xs**2 + rs.normal(0, 0.05, n)
+    return xs, ys
+
+
+def evolution_blob(n=500, seed=1):
+    from pychron.core.helpers.binpack import pack
+
+    xs, ys = isotope_evolution(n, seed)
+    return pack(">ff", zip(xs, ys))
+
+
+def step_heat(n=20, seed=2):
+    """
+    ages, errors and 39Ar signals of a step heat with a plateau in the middle steps
+    """
+    rs = random.RandomState(seed)
+    ages = rs.normal(28.2, 0.05, n)
+    ages[: n // 5] += linspace(5, 1, n // 5)
+    ages[n - n // 10 :] -= 2
+    errors = rs.uniform(0.05, 0.2, n)
+    signals = rs.uniform(1, 10, n)
+    return ages, errors, signals
+
+
+def argon_isotopes(n=100, seed=7):
+    """
+    (N, 5) Ar40, Ar39, Ar38, Ar37, Ar36 intensities, errors, decay times and J
+    """
+    rs = random.RandomState(seed)
+    a39 = rs.uniform(1, 20, n)
+    isotopes = array(
+        [
+            a39 * rs.uniform(5, 50, n),
+            a39,
+            a39 * rs.uniform(0.01, 0.02, n),
+            a39 * rs.uniform(0.01, 2, n),
+            a39 * rs.uniform(0.001, 0.01, n),
+        ]
+    ).T
+    errors = isotopes * rs.uniform(0.001, 0.02, (n, 5))
+    decay_days = rs.uniform(10, 500, n)
+    j = rs.uniform(0.001, 0.01, n)
+    return isotopes, errors, decay_days, j
+
+
+def ideogram_ages(n=1000, seed=4):
+    """
+    two age populations and a scatter of older xenocrysts
+    """
+    rs = random.RandomState(seed)
+    ages = rs.normal(28.2, 0.3, n)
+    ages[::3] = rs.normal(31.5, 0.5, len(ages[::3]))
+    ages[::17] = rs.uniform(35, 100, len(ages[::17]))
+    errors = rs.uniform(0.05, 1, n)
+    return ages, errors
+
+
+class TableAnalysis(object):
+    def __init__(self, i, age, err, kca, omitted):
+        from uncertainties import ufloat
+
+        self.identifier = "{:05d}".format(60000 + i // 20)
+        self.aliquot_step_str = "{:02d}{}".format(i // 20, chr(65 + i % 20))
+        self.nsteps = i % 20 + 1
+        self.rundate = datetime(2026, 1, 1) + timedelta(minutes=i)
+        self.uage = ufloat(age, err)
+        self.kca = ufloat(kca, kca * 0.05)
+        self.tag = None if i % 11 else "invalid"
+        self.cumulative = 100.0 * (i % 20) / 19.0
+        self._omitted = omitted
+
+    def is_omitted(self):
+        return self._omitted
+
+
+def table_analyses(n=1000, seed=3):
+    rs = random.RandomState(seed)
+    ages = rs.normal(28.2, 3, n)
+    errs = 10 ** rs.uniform(-4, 1, n)
+    kcas = rs.uniform(0.1, 20, n)
+    omitted = rs.uniform(size=n) < 0.1
+    return [
+        TableAnalysis(i, a, e, k, o)
+        for i, (a, e, k, o) in enumerate(zip(ages, errs, kcas, omitted))
+    ]
+
+
+def table_columns():
+    from pychron.pipeline.tables.column import (
+        Column,
+        VColumn,
+        EColumn,
+        SigFigColumn,
+        SigFigEColumn,
+    )
+
+    return [
+        Column(label="Status"),
+        Column(attr="identifier", label="Identifier"),
+        Column(attr="aliquot_step_str", label="Step"),
+        Column(attr="tag", label="Tag"),
+        Column(attr="nsteps", label="N"),
+        Column(
+            attr="rundate",
+            label="RunDate",
+            fformat=[("set_num_format", ("mm/dd/yy hh:mm",))],
+        ),
+        SigFigColumn(attr="uage", label="Age", sigformat="age"),
+        SigFigEColumn(attr="uage", sigformat="age"),
+        VColumn(attr="kca", label="K/Ca", sigformat="kca"),
+        EColumn(attr="kca", sigformat="kca", use_scientific=True),
+        EColumn(attr="kca", label="K/Ca Error"),
+        Column(attr="cumulative_ar39", label="Cum. %39Ar", sigformat="cumulative"),
+    ]
+
+
+class Sample(object):
+    id = None
+    note = ""
+
+
+class IrradiationPosition(object):
+    sample = Sample()
+
+
+class Record(object):
+    """
+    the attributes of an analysis database record used by ``DVC.make_analyses``
+    """
+
+    irradiation_position = IrradiationPosition()
+    group_id = 0
+    tag = "ok"
+
+    def __init__(self, uuid, record_id, repository_identifier):
+        self.uuid = uuid
+        self.record_id = record_id
+        self.repository_identifier = repository_identifier
+
+
+def analysis_record_id(i):
+    return "{:05d}-{:02d}{}".format(60000 + i // 400, (i // 20) % 20, chr(65 + i % 20))
+
+
+def write_analysis(root, repository, record_id, i, seed):
+    from pychron.dvc import _analysis_path, dvc_dump
+
+    rs = random.RandomState(seed + i)
+
+    def path(modifier=None):
+        return _analysis_path(
+            record_id, repository, modifier=modifier, mode="w", root=root
+        )
+
+    identifier, rest = record_id.split("-")
+    meta = {
+        "uuid": record_id,
+        "identifier": identifier,
+        "aliquot": int(rest[:2]),
+        "increment": ord(rest[2]) - 65,
+        "analysis_type": "unknown",
+        "mass_spectrometer": "jan",
+        "repository_identifier": repository,
+        "timestamp": (datetime(2026, 1, 1) + timedelta(minutes=i)).strftime(
+            "%Y-%m-%dT%H:%M:%S"
+        ),
+        "isotopes": {
+            iso: {"name": iso, "detector": det, "units": "fA"} for iso, det in ISOTOPES
+        },
+    }
+    dvc_dump(meta, path())
+    dvc_dump(
+        {"extract_device": "Laser", "extract_value": 2.5, "extract_units": "W"},
+        path("extraction"),
+    )
+
+    a39 = rs.uniform(1, 20)
+    values = a39 * array(
+        [
+            rs.uniform(5, 50),
+            1,
+            rs.uniform(0.01, 0.02),
+            rs.uniform(0.01, 2),
+            rs.uniform(0.001, 0.01),
+        ]
+    )
+    dvc_dump(
+        {
+            iso: {
+                "value": v,
+                "error": v * rs.uniform(0.001, 0.02),
+                "fit": "linear",
+                "n": 100,
+                "fn": 100,
+            }
+            for (iso, _), v in zip(ISOTOPES, values)
+        },
+        path("intercepts"),
+    )
+    dvc_dump(
+        {
+            det: {"value": 0.001, "error": 0.0001, "fit": "average", "n": 30}
+            for _, det in ISOTOPES
+        },
+        path("baselines"),
+    )
+
+
+def make_repository(root, repository, n=100, seed=5):
+    """
+    write ``n`` analyses to a new git repository ``root``/``repository`` without a
+    remote and return stand ins for their database records
+    """
+    from git import Actor, Repo
+
+    os.makedirs(os.path.join(root, repository))
+
+    records = []
+    for i in range(n):
+        rid = analysis_record_id(i)
+        write_analysis(root, repository, rid, i, seed)
+        records.append(Record(rid, rid, repository))
+
+    repo = Repo.init(os.path.join(root, repository))
+    repo.git.add(".")
+    actor = Actor("pychron", "pychron@localhost")
+    repo.index.commit("synthetic analyses", author=actor, committer=actor)
+    return records
+
+
+def make_meta(root):
+    """
+    write the parts of a meta repository read by ``DVC.make_analyses`` in quick mode
+    """
+    from pychron.dvc import dvc_dump
+
+    dvc_dump(MASSES, os.path.join(root, "molecular_weights.json"))
+
+
+def ensure_paths():
+    """
+    build pychron's paths in a temporary directory if they have not been built
+    """
+    from pychron.paths import paths
+
+    if paths.user_pipeline_dir is None:
+        paths.build(tempfile.mkdtemp())
+
+
+# ============= EOF =============================================
@@ -0,0 +1,244 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+import types
+from datetime import datetime
+
+# ============= local library imports  ==========================
+
+BENCHMARKS = []
+
+SLOWER = "slower"
+FASTER = "faster"
+UNCHANGED = "ok"
+MISSING = "missing"
+NEW = "new"
+SKIPPED = "skipped"
+
+
+class Benchmark(object):
+    """
+    ``func(scale)`` does the setup and returns the callable that is timed, or yields
+    it so that cleanup code after the yield runs once timing is complete
+    """
+
+    def __init__(self, name, func, number=1, repeat=5, group=None):
+        self.name = name
+        self.func = func
+        self.number = number
+        self.repeat = repeat
+        self.group = group or name.split(".")[0]
+
+    def run(self, scale=1.0, repeat=None):
+        repeat = repeat or self.repeat
+        number = self.number
+
+        stmt = self.func(scale)
+        gen = None
+        if isinstance(stmt, types.GeneratorType):
+            gen = stmt
+            stmt = next(gen)
+
+        try:
+            # warm up caches and lazy imports
+            stmt()
+
+            ts = []
+            for _ in range(repeat):
+                st = time.perf_counter()
+                for _ in range(number):
+                    stmt()
+                ts.append((time.perf_counter() - st) / number)
+        finally:
+            if gen is not None:
+                # resume the generator to run its cleanup
+                next(gen, None)
+
+        return {
+            "min": min(ts),
+            "median": statistics.median(ts),
+            "mean": statistics.mean(ts),
+            "stdev": statistics.stdev(ts) if len(ts) > 1 else 0,
+            "number": number,
+            "repeat": repeat,
+            "scale": scale,
+        }
+
+
+def benchmark(name, number=1, repeat=5):
+    """
+    register a benchmark
+    """
+
+    def decorator(func):
+        BENCHMARKS.append(Benchmark(name, func, number, repeat))
+        return func
+
+    return decorator
+
+
+def get_benchmarks(patterns=None):
+    if not BENCHMARKS:
+        # the suites register themselves on import
+        from pychron.benchmarks import suites  # noqa: F401
+
+    bs = BENCHMARKS
+    if patterns:
+        bs = [
+            b
+            for b in bs
+            if any(fnmatch.fnmatch(b.name, "*{}*".format(p)) for p in patterns)
+        ]
+    return bs
+
+
+def get_metadata(scale):
+    try:
+        import numpy
+
+        npver = numpy.__version__
+    except ImportError:
+        npver = None
+
+    try:
+        sha = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(__file__),
+            stderr=subprocess.DEVNULL,
+        )
+        sha = sha.decode("utf-8").strip()
+    except (OSError, subprocess.CalledProcessError):
+        sha = None
+
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "numpy": npver,
+        "platform": platform.platform(),
+        "machine": platform.node(),
+        "commit": sha,
+        "scale": scale,
+    }
+
+
+def run_benchmarks(patterns=None, scale=1.0, repeat=None, callback=None):
+    """
+    run the benchmarks matching ``patterns``. benchmarks whose dependencies cannot be
+    imported are recorded as skipped
+
+    return a dict of metadata and results keyed by benchmark name
+    """
+    results = {}
+    for b in get_benchmarks(patterns):
+        try:
+            r = b.run(scale, repeat)
+        except ImportError as e:
+            r = {SKIPPED: str(e)}
+
+        results[b.name] = r
+        if callback:
+            callback(b, r)
+
+    return {"metadata": get_metadata(scale), "results": results}
+
+
+def dump_results(obj, path):
+    with open(path, "w") as wfile:
+        json.dump(obj, wfile, indent=4, sort_keys=True)
+
+
+def load_results(path):
+    with open(path, "r") as rfile:
+        return json.load(rfile)
+
+
+def compare(baseline, results, threshold=0.1, key="min"):
+    """
+    compare two sets of results. a benchmark is slower if its time exceeds the
+    baseline time by more than ``threshold``, a fraction of the baseline time
+
+    return a list of (name, baseline time, time, ratio, status)
+    """
+    bs = baseline["results"]
+    rs = results["results"]
+
+    rows = []
+    for name in sorted(set(bs) | set(rs)):
+        b = bs.get(name)
+        r = rs.get(name)
+        if b is None or SKIPPED in b:
+            if r is not None and SKIPPED not in r:
+                rows.append((name, None, r[key], None, NEW))
+            continue
+
+        if r is None or SKIPPED in r:
+            rows.append((name, b[key], None, None, MISSING))
+            continue
+
+        bt, rt = b[key], r[key]
+        ratio = rt / bt if bt else float("inf")
+        if ratio > 1 + threshold:
+            status = SLOWER
+        elif ratio < 1 / (1 + threshold):
+            status = FASTER
+        else:
+            status = UNCHANGED
+        rows.append((name, bt, rt, ratio, status))
+    return rows
+
+
+def regressions(rows):
+    return [r for r in rows if r[4] == SLOWER]
+
+
+def format_time(t):
+    if t is None:
+        return ""
+    for unit, f in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if t >= f:
+            return "{:0.3f} {}".format(t / f, unit)
+    return "{:0.1f} ns".format(t / 1e-9)
+
+
+def format_comparison(rows):
+    lines = [
+        "{:<32s} {:>12s} {:>12s} {:>8s}  {}".format(
+            "Name", "Baseline", "Current", "Ratio", "Status"
+        )
+    ]
+    for name, bt, rt, ratio, status in rows:
+        lines.append(
+            "{:<32s} {:>12s} {:>12s} {:>8s}  {}".format(
+                name,
+                format_time(bt),
+                format_time(rt),
+                "{:0.2f}".format(ratio) if ratio is not None else "",
+                status,
+            )
+        )
+    return lines
+
+
+# ============= EOF =============================================
@@ -0,0 +1,311 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+"""
+the benchmarks. dependencies are imported inside the setup functions so that a
+missing dependency skips only the benchmarks that need it
+"""
+
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import os
+import shutil
+import tempfile
+
+# ============= local library imports  ==========================
+from pychron.benchmarks import data
+from pychron.benchmarks.data import scaled
+from pychron.benchmarks.harness import benchmark
+from pychron.pychron_constants import FLECK, MAHON
+
+
+# binpack
+@benchmark("binpack.pack", number=5)
+def binpack_pack(scale):
+    from pychron.core.helpers.binpack import pack
+
+    xs, ys = data.isotope_evolution(scaled(20000, scale))
+    rows = list(zip(xs, ys))
+    return lambda: pack(">ff", rows)
+
+
+@benchmark("binpack.unpack", number=5)
+def binpack_unpack(scale):
+    from pychron.core.helpers.binpack import unpack, encode_blob
+
+    blob = encode_blob(data.evolution_blob(scaled(20000, scale)))
+    return lambda: unpack(blob, fmt=">ff", decode=True)
+
+
+# dvc
+@benchmark("dvc.dump_load", number=5)
+def dvc_dump_load(scale):
+    from pychron.dvc import dvc_dump, dvc_load
+
+    root = tempfile.mkdtemp()
+    p = os.path.join(root, "intercepts.json")
+    xs, ys = data.isotope_evolution(scaled(2000, scale))
+    obj = {
+        "Ar{}".format(i): {
+            "value": float(y),
+            "error": float(x),
+            "fit": "linear",
+            "filter_outliers_dict": {"filter_outliers": False, "iterations": 1},
+        }
+        for i, (x, y) in enumerate(zip(xs, ys))
+    }
+
+    def func():
+        dvc_dump(obj, p)
+        dvc_load(p)
+
+    yield func
+    shutil.rmtree(root)
+
+
+@benchmark("dvc.make_analyses", repeat=3)
+def dvc_make_analyses(scale):
+    import pychron.dvc
+    from pychron.dvc.dvc import DVC
+    from pychron.paths import paths
+
+    root = tempfile.mkdtemp()
+    records = data.make_repository(root, "BenchmarkRepo", scaled(200, scale))
+    data.make_meta(root)
+
+    dvc = DVC(bind=False)
+    dvc.use_cache = False
+
+    old = paths.repository_dataset_dir, paths.meta_root
+    paths.repository_dataset_dir = paths.meta_root = root
+    pychron.dvc.MASSES = None
+
+    yield lambda: dvc.make_analyses(records, quick=True, use_progress=False)
+
+    paths.repository_dataset_dir, paths.meta_root = old
+    pychron.dvc.MASSES = None
+    shutil.rmtree(root)
+
+
+# isotope evolutions
+def _isotope_fit(scale, fit):
+    from pychron.processing.isotope import Isotope
+
+    xs, ys = data.isotope_evolution(scaled(500, scale, 10))
+
+    def func():
+        iso = Isotope("Ar40", "H1")
+        iso.xs = xs
+        iso.ys = ys
+        iso.set_fit(fit, notify=False)
+        return iso.uvalue
+
+    return func
+
+
+@benchmark("isotope.fit_linear", number=10)
+def isotope_fit_linear(scale):
+    return _isotope_fit(scale, "linear")
+
+
+@benchmark("isotope.fit_parabolic", number=10)
+def isotope_fit_parabolic(scale):
+    return _isotope_fit(scale, "parabolic")
+
+
+@benchmark("isotope.fit_exponential", number=5)
+def isotope_fit_exponential(scale):
+    return _isotope_fit(scale, "exponential")
+
+
+# age calculations
+@benchmark("age.calculate_f")
+def age_calculate_f(scale):
+    from uncertainties import ufloat
+
+    from pychron.processing.arar_constants import ArArConstants
+    from pychron.processing.argon_calculations import calculate_f, age_equation
+
+    isotopes, errors, decay_days, js = data.argon_isotopes(scaled(100, scale))
+    interferences = {k: ufloat(v, e, tag=k) for k, (v, e) in data.INTERFERENCES.items()}
+    arc = ArArConstants()
+    rows = [
+        ([ufloat(v, e) for v, e in zip(vs, es)], d, ufloat(j, j * 0.001))
+        for vs, es, d, j in zip(isotopes, errors, decay_days, js)
+    ]
+
+    def func():
+        for isos, d, j in rows:
+            f = calculate_f(isos, d, interferences=interferences, arar_constants=arc)[0]
+            age_equation(j, f, arar_constants=arc)
+
+    return func
+
+
+@benchmark("age.calculate_ages_batch", number=5)
+def age_calculate_ages_batch(scale):
+    from pychron.processing.arar_constants import ArArConstants
+    from pychron.processing.batch_age import calculate_ages_batch
+
+    isotopes, errors, decay_days, js = data.argon_isotopes(scaled(1000, scale))
+    arc = ArArConstants()
+    return lambda: calculate_ages_batch(
+        isotopes,
+        errors,
+        decay_days,
+        j=js,
+        j_err=js * 0.001,
+        interferences=data.INTERFERENCES,
+        arar_constants=arc,
+    )
+
+
+# plateaus
+def _plateau(scale, method):
+    from pychron.processing.plateau import Plateau
+
+    ages, errors, signals = data.step_heat(scaled(60, scale, 10))
+
+    def func():
+        p = Plateau(ages=ages, errors=errors, signals=signals)
+        return p.find_plateaus(method)
+
+    return func
+
+
+@benchmark("plateau.fleck", number=10)
+def plateau_fleck(scale):
+    return _plateau(scale, FLECK)
+
+
+@benchmark("plateau.mahon", number=10)
+def plateau_mahon(scale):
+    return _plateau(scale, MAHON)
+
+
+# ideograms
+@benchmark("ideogram.cumulative_probability", number=5)
+def ideogram_cumulative_probability(scale):
+    from pychron.core.stats.probability_curves import cumulative_probability
+
+    ages, errors = data.ideogram_ages(scaled(1000, scale))
+    return lambda: cumulative_probability(ages, errors, 20, 100, n=500)
+
+
+@benchmark("ideogram.kernel_density", number=5)
+def ideogram_kernel_density(scale):
+    from pychron.core.stats.probability_curves import kernel_density
+
+    ages, errors = data.ideogram_ages(scaled(1000, scale))
+    return lambda: kernel_density(ages, errors, 20, 100, n=500)
+
+
+# conditionals
+class _Spectrometer(object):
+    analysis_type = "unknown"
+
+
+class _Run(object):
+    def __init__(self, isotope_group):
+        self.isotope_group = isotope_group
+        self.spec = _Spectrometer()
+
+    def get_deflection(self, *args, **kw):
+        return 2000
+
+    def get_pressure(self, attr):
+        return 1e-9
+
+    def get_device_value(self, dev_name):
+        return 60
+
+
+@benchmark("conditional.check", number=3)
+def conditional_check(scale):
+    from pychron.experiment.conditional.conditional import conditional_from_dict
+    from pychron.processing.arar_age import ArArAge
+    from pychron.processing.isotope import Isotope
+
+    xs, ys = data.isotope_evolution(100)
+    ag = ArArAge()
+    isos = {}
+    for name, det in data.ISOTOPES:
+        iso = Isotope(name, det)
+        iso.xs = xs
+        iso.ys = ys
+        iso.set_fit("linear", notify=False)
+        isos[name] = iso
+    ag.isotopes = isos
+    ag.age = 10
+    run = _Run(ag)
+
+    cs = [
+        conditional_from_dict(d, "TerminationConditional")
+        for d in (
+            {"check": "Ar40>1000", "attr": "Ar40"},
+            {"check": "Ar40/Ar39>100", "attr": "Ar40/Ar39"},
+            {"check": "age>0.1 and Ar40<100", "attr": "age"},
+            {"check": "between(Ar36,0,1)", "attr": "Ar36"},
+            {"check": "device.pneumatics<80"},
+        )
+    ]
+    n = scaled(40, scale)
+
+    def func():
+        for i in range(n):
+            for c in cs:
+                c.check(run, ([], []), 1000 + i)
+
+    return func
+
+
+# tables
+@benchmark("table.xlsx_write", repeat=3)
+def table_xlsx_write(scale):
+    from pychron.pipeline.tables.xlsx_table_options import (
+        XLSXAnalysisTableWriterOptions,
+    )
+    from pychron.pipeline.tables.xlsx_table_writer import XLSXAnalysisTableWriter
+
+    data.ensure_paths()
+    root = tempfile.mkdtemp()
+    options = XLSXAnalysisTableWriterOptions("benchmark")
+    analyses = data.table_analyses(scaled(5000, scale))
+    path = os.path.join(root, "table")
+    n = len(analyses)
+
+    def func():
+        cols = data.table_columns()
+        writer = XLSXAnalysisTableWriter()
+        writer._options = options
+        writer._new_workbook(path)
+        sh = writer._workbook.add_worksheet("Unknowns")
+        writer._current_row = 1
+        for i, a in enumerate(analyses):
+            writer._make_analysis(
+                sh,
+                cols,
+                a,
+                is_last=i % 50 == 49 or i == n - 1,
+                is_plateau_step=i % 7 != 0 if i % 3 == 0 else None,
+                cum=a.cumulative,
+            )
+        writer._workbook.close()
+
+    yield func
+    shutil.rmtree(root)
+
+
+# ============= EOF =============================================
@@ -0,0 +1,156 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from numpy import array_equal
+
+from pychron.benchmarks import data
+from pychron.benchmarks.__main__ import main
+from pychron.benchmarks.harness import (
+    Benchmark,
+    run_benchmarks,
+    dump_results,
+    load_results,
+    compare,
+    regressions,
+    SLOWER,
+    FASTER,
+    UNCHANGED,
+    MISSING,
+    NEW,
+    SKIPPED,
+)
+
+
+def results(**kw):
+    return {
+        "metadata": {},
+        "results": {
+            k: {SKIPPED: "No module named x"} if v is None else {"min": v}
+            for k, v in kw.items()
+        },
+    }
+
+
+class CompareTestCase(unittest.TestCase):
+    def test_compare(self):
+        baseline = results(a=1.0, b=1.0, c=1.0, d=1.0, e=None)
+        current = results(a=1.05, b=1.2, c=0.5, e=1.0, f=1.0)
+
+        rows = compare(baseline, current, threshold=0.1)
+        status = {r[0]: r[4] for r in rows}
+        self.assertEqual(
+            status,
+            {
+                "a": UNCHANGED,
+                "b": SLOWER,
+                "c": FASTER,
+                "d": MISSING,
+                "e": NEW,
+                "f": NEW,
+            },
+        )
+        self.assertEqual([r[0] for r in regressions(rows)], ["b"])
+        self.assertAlmostEqual(rows[1][3], 1.2)
+
+        rows = compare(baseline, current, threshold=0.25)
+        self.assertEqual(regressions(rows), [])
+
+
+class HarnessTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_run(self):
+        calls = []
+
+        def func(scale):
+            calls.append("setup")
+            yield lambda: calls.append(scale)
+            calls.append("teardown")
+
+        r = Benchmark("test.run", func, number=2, repeat=3).run(scale=0.5)
+        # one warm up call then number * repeat timed calls
+        self.assertEqual(calls, ["setup"] + [0.5] * 7 + ["teardown"])
+        self.assertLessEqual(r["min"], r["median"])
+        self.assertEqual((r["number"], r["repeat"]), (2, 3))
+
+    def test_teardown_on_error(self):
+        calls = []
+
+        def stmt():
+            raise ValueError
+
+        def func(scale):
+            yield stmt
+            calls.append("teardown")
+
+        with self.assertRaises(ValueError):
+            Benchmark("test.error", func).run()
+        self.assertEqual(calls, ["teardown"])
+
+    def test_round_trip(self):
+        r = run_benchmarks(["plateau", "binpack"], scale=0.01, repeat=2)
+        self.assertEqual(
+            sorted(r["results"]),
+            ["binpack.pack", "binpack.unpack", "plateau.fleck", "plateau.mahon"],
+        )
+        self.assertEqual(r["metadata"]["scale"], 0.01)
+
+        p = os.path.join(self.root, "results.json")
+        dump_results(r, p)
+        self.assertEqual(load_results(p), r)
+        rows = compare(r, load_results(p))
+        self.assertEqual({row[4] for row in rows}, {UNCHANGED})
+
+    def test_main(self):
+        b = os.path.join(self.root, "baseline.json")
+        p = os.path.join(self.root, "results.json")
+        self.assertEqual(main(["run", "-k", "ideogram", "--scale", "0.01", "-o", b]), 0)
+
+        r = load_results(b)
+        for v in r["results"].values():
+            v["min"] *= 2
+        dump_results(r, p)
+        self.assertEqual(main(["compare", b, p]), 1)
+        self.assertEqual(main(["compare", b, p, "--threshold", "1.5"]), 0)
+
+
+class DataTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_deterministic(self):
+        for func in (
+            data.isotope_evolution,
+            data.step_heat,
+            data.argon_isotopes,
+            data.ideogram_ages,
+        ):
+            for a, b in zip(func(), func()):
+                self.assertTrue(array_equal(a, b), func.__name__)
+
+        self.assertEqual(data.evolution_blob(), data.evolution_blob())
+
+    def test_repository(self):
+        from pychron.dvc import analysis_path, dvc_load
+
+        records = data.make_repository(self.root, "Repo", 3)
+        self.assertEqual(
+            [r.record_id for r in records], ["60000-00A", "60000-00B", "60000-00C"]
+        )
+        p = analysis_path(records[0], "Repo", root=self.root)
+        self.assertEqual(dvc_load(p)["identifier"], "60000")
+        p = analysis_path(records[0], "Repo", modifier="intercepts", root=self.root)
+        self.assertEqual(sorted(dvc_load(p)), sorted(i for i, _ in data.ISOTOPES))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,10 +17,14 @@
 # =============enthought library imports=======================
 # =============standard library imports ========================
 from __future__ import absolute_import
+import atexit
 import logging
 import os
 import shutil
-from logging.handlers import RotatingFileHandler
+import time
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from queue import SimpleQueue
+from threading import current_thread
 
 from pychron.core.helpers.filetools import list_directory, unique_path2
 from pychron.paths import paths
@@ -32,6 +36,178 @@ gFORMAT = (
     )
 )
 gLEVEL = logging.DEBUG
+gQUEUE_SIZE = 100000
+
+# argument types that are safe to format on the listener thread
+IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+_queue_handler = None
+_queue_listener = None
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    enqueue records for a QueueListener. when maxsize records are waiting new records
+    are dropped and counted
+
+    records are formatted by the listener's handlers. a record with arguments that may
+    change before they are formatted, i.e. anything but str, int, float, bool or None,
+    is formatted when it is enqueued
+    """
+
+    def __init__(self, queue, maxsize=gQUEUE_SIZE):
+        super(BoundedQueueHandler, self).__init__(queue)
+        self.maxsize = maxsize
+        self.dropped = 0
+
+    def prepare(self, record):
+        args = record.args
+        if args and not _immutable(args):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record):
+        self.put(record)
+
+    def put(self, item):
+        if self.queue.qsize() >= self.maxsize:
+            self.dropped += 1
+        else:
+            self.queue.put(item)
+
+    def log(self, logger, level, msg, args):
+        """
+        enqueue a message without making a LogRecord. the record is made by the listener.
+        the caller is responsible for the level check
+        """
+        if args and not _immutable(args):
+            msg, args = msg % args, ()
+        self.put((logger, level, msg, args, time.time(), current_thread().name))
+
+
+class RecordListener(QueueListener):
+    """
+    a QueueListener that makes the records enqueued by BoundedQueueHandler.log and
+    reports dropped records
+    """
+
+    def __init__(self, queue, handler, *handlers):
+        super(RecordListener, self).__init__(
+            queue, *handlers, respect_handler_level=True
+        )
+        self._queue_handler = handler
+        self._reported = 0
+
+    def prepare(self, item):
+        if isinstance(item, tuple):
+            logger, level, msg, args, created, thread_name = item
+            item = logger.makeRecord(
+                logger.name, level, "(unknown file)", 0, msg, args, None
+            )
+            item.created = created
+            item.msecs = int((created - int(created)) * 1000) + 0.0
+            item.relativeCreated = (created - logging._startTime) * 1000
+            item.threadName = thread_name
+        return item
+
+    def handle(self, record):
+        super(RecordListener, self).handle(record)
+
+        dropped = self._queue_handler.dropped
+        if dropped != self._reported:
+            n, self._reported = dropped - self._reported, dropped
+            r = logging.makeLogRecord(
+                {
+                    "name": "logging",
+                    "levelno": logging.WARNING,
+                    "levelname": "WARNING",
+                    "msg": "log queue full. dropped {} records, total={}".format(
+                        n, dropped
+                    ),
+                }
+            )
+            super(RecordListener, self).handle(r)
+
+
+def _immutable(args):
+    if isinstance(args, tuple):
+        for a in args:
+            if not isinstance(a, IMMUTABLE_TYPES):
+                return False
+        return True
+    return False
+
+
+def get_queue_handler():
+    """
+    the BoundedQueueHandler if queued logging was started
+    """
+    return _queue_handler
+
+
+def start_queued_logging(handlers, maxsize=gQUEUE_SIZE):
+    """
+    route the root logger through a bounded queue. handlers are called on a
+    background thread
+    """
+    global _queue_handler, _queue_listener
+
+    stop_queued_logging()
+
+    queue = SimpleQueue()
+    qhandler = BoundedQueueHandler(queue, maxsize)
+    listener = RecordListener(queue, qhandler, *handlers)
+
+    root = logging.getLogger()
+    for hi in handlers:
+        root.removeHandler(hi)
+    root.addHandler(qhandler)
+
+    listener.start()
+    _queue_handler, _queue_listener = qhandler, listener
+    return qhandler
+
+
+def stop_queued_logging():
+    """
+    handle the enqueued records, stop the listener and attach its handlers to the root
+    logger again
+    """
+    global _queue_handler, _queue_listener
+
+    if _queue_listener is None:
+        return
+
+    qhandler, listener = _queue_handler, _queue_listener
+    _queue_handler = _queue_listener = None
+
+    root = logging.getLogger()
+    root.removeHandler(qhandler)
+    listener.stop()
+    for hi in listener.handlers:
+        root.addHandler(hi)
+
+
+atexit.register(stop_queued_logging)
+
+
+def flush_queued_logging(timeout=1):
+    """
+    wait, at most timeout seconds, for the enqueued records to be handled
+    """
+    qhandler = _queue_handler
+    if qhandler is not None:
+        st = time.time()
+        while qhandler.queue.qsize() and time.time() - st < timeout:
+            time.sleep(0.001)
+
+
+def _root_handlers():
+    handlers = list(logging.getLogger().handlers)
+    if _queue_listener is not None:
+        handlers.extend(_queue_listener.handlers)
+    return handlers
 
 
 def simple_logger(name):
@@ -44,8 +220,8 @@ def simple_logger(name):
 
 
 def get_log_text(n):
-    root = logging.getLogger()
-    for h in root.handlers:
+    flush_queued_logging()
+    for h in _root_handlers():
         if isinstance(h, RotatingFileHandler):
             with open(h.baseFilename, "rb") as rfile:
                 return tail(rfile, n)
@@ -94,8 +270,12 @@ def tail(f, lines=20):
 #         logger.addHandler(h)
 
 
-def logging_setup(name, use_archiver=True, root=None, use_file=True, **kw):
-    """ """
+def logging_setup(
+    name, use_archiver=True, root=None, use_file=True, use_queue=True, **kw
+):
+    """
+    use_queue: call the stream and file handlers on a background thread
+    """
     # set up deprecation warnings
     # import warnings
     #     warnings.simplefilter('default')
@@ -146,7 +326,12 @@ def logging_setup(name, use_archiver=True, root=None, use_file=True, **kw):
     for hi in handlers:
         hi.setLevel(gLEVEL)
         hi.setFormatter(fmt)
-        root.addHandler(hi)
+
+    if use_queue:
+        start_queued_logging(handlers)
+    else:
+        for hi in handlers:
+            root.addHandler(hi)
 
 
 def add_root_handler(path, level=None, strformat=None, **kw):
@@ -156,18 +341,26 @@ def add_root_handler(path, level=None, strformat=None, **kw):
     if strformat is None:
         strformat = gFORMAT
 
-    root = logging.getLogger()
     handler = logging.FileHandler(path, **kw)
     handler.setLevel(level)
     handler.setFormatter(logging.Formatter(strformat))
-    root.addHandler(handler)
+    if _queue_listener is not None:
+        _queue_listener.handlers += (handler,)
+    else:
+        root = logging.getLogger()
+        root.addHandler(handler)
 
     return handler
 
 
 def remove_root_handler(handler):
-    root = logging.getLogger()
-    root.removeHandler(handler)
+    listener = _queue_listener
+    if listener is not None and handler in listener.handlers:
+        flush_queued_logging()
+        listener.handlers = tuple(h for h in listener.handlers if h is not handler)
+    else:
+        root = logging.getLogger()
+        root.removeHandler(handler)
 
 
 def new_logger(name):
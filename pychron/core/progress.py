@@ -20,13 +20,42 @@
 
 from __future__ import absolute_import
 
+import time
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    ProcessPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+)
+
 from pychron.core.ui.progress_dialog import myProgressDialog
 
+# minimum seconds between progress dialog updates in concurrent mode
+PROGRESS_UPDATE_PERIOD = 0.1
+
 
 class CancelLoadingError(BaseException):
     pass
 
 
+class ProgressErrors(list):
+    """
+    the exceptions raised by func for individual items, as (index, item, exception)
+    """
+
+    def summary(self):
+        if not self:
+            return ""
+
+        counts = {}
+        for _, _, e in self:
+            k = type(e).__name__
+            counts[k] = counts.get(k, 0) + 1
+
+        return "{} items failed. {}".format(
+            len(self), ", ".join("{}={}".format(k, v) for k, v in counts.items())
+        )
+
+
 def open_progress(n, close_at_end=True, busy=False, **kw):
     if busy:
         mi, ma = 0, 0
@@ -51,6 +80,9 @@ def progress_loader(
     busy=False,
     step=1,
     unpack=True,
+    workers=None,
+    processes=False,
+    errors=None,
 ):
     """
     xs: list or tuple
@@ -60,6 +92,12 @@ def progress_loader(
     threshold: trigger value to open a progress dialog i.e. if n>threshold open the dialog
     progress: an existing progress_dialog
     reraise_cancel: if canceled during iteration should the exception be reraised for all objects to handle
+    workers: if > 1 call func concurrently using a pool of this many threads, or processes
+        if processes is True. func is called with prog=None, the progress dialog is updated
+        by the loader at most every PROGRESS_UPDATE_PERIOD seconds.
+        results are returned in the order of xs
+    errors: a list, e.g. ProgressErrors, (index, item, exception) is appended for each item
+        that failed. failed items are skipped
 
     return: list
 
@@ -75,9 +113,21 @@ def progress_loader(
 
     # n /= step
 
-    def gen():
+    def call(i, x, *args):
+        try:
+            return func(x, *args)
+        except BaseException as e:
+            if errors is not None:
+                errors.append((i, x, e))
+
+    def results():
         # if use_progress and (n > threshold or progress):
-        if progress:
+        if workers and workers > 1:
+            for r in _concurrent_results(
+                xs, func, n, workers, processes, progress, step, errors
+            ):
+                yield r
+        elif progress:
             for i, x in enumerate(xs):
                 if progress.canceled:
                     raise CancelLoadingError
@@ -88,28 +138,19 @@ def progress_loader(
                     prog = progress
                 else:
                     prog = None if i % step else progress
-                try:
-                    r = func(x, prog, i, n)
-                except BaseException:
-                    r = None
-                if r:
-                    if hasattr(r, "__iter__") and unpack:
-                        for ri in r:
-                            yield ri
-                    else:
-                        yield r
+                yield call(i, x, prog, i, n)
         else:
-            for x in xs:
-                try:
-                    r = func(x, None, 0, 0)
-                except BaseException:
-                    r = None
-                if r:
-                    if hasattr(r, "__iter__") and unpack:
-                        for ri in r:
-                            yield ri
-                    else:
-                        yield r
+            for i, x in enumerate(xs):
+                yield call(i, x, None, 0, 0)
+
+    def gen():
+        for r in results():
+            if r:
+                if hasattr(r, "__iter__") and unpack:
+                    for ri in r:
+                        yield ri
+                else:
+                    yield r
 
     try:
         items = list(gen())
@@ -130,6 +171,58 @@ def progress_loader(
             return []
 
 
+def _concurrent_results(xs, func, n, workers, processes, progress, step, errors):
+    """
+    yield the result of func for each item of xs in order while up to workers items are
+    processed concurrently. a failed item yields None
+    """
+    klass = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    executor = klass(max_workers=workers)
+    jobs = [(x, executor.submit(func, x, None, i, n)) for i, x in enumerate(xs)]
+
+    accepted = False
+    last_update = 0
+    try:
+        for i, (x, fi) in enumerate(jobs):
+            r = None
+            while 1:
+                if progress and not accepted:
+                    if progress.canceled:
+                        raise CancelLoadingError
+                    accepted = progress.accepted
+
+                if accepted and not fi.done():
+                    # keep the items loaded before the user accepted
+                    return
+
+                try:
+                    r = fi.result(timeout=PROGRESS_UPDATE_PERIOD if progress else None)
+                except FutureTimeoutError:
+                    # keep the dialog responsive while waiting on a slow item
+                    progress.change_message(progress.message, auto_increment=False)
+                    continue
+                except BaseException as e:
+                    if errors is not None:
+                        errors.append((i, x, e))
+                break
+
+            if progress:
+                now = time.time()
+                if i == n - 1 or now - last_update >= PROGRESS_UPDATE_PERIOD:
+                    last_update = now
+                    progress.change_message(
+                        "Loaded {}/{}".format(i + 1, n), auto_increment=False
+                    )
+                    progress.update(int(i / step))
+
+            yield r
+    finally:
+        # cancel the pending items if canceled, accepted or failed
+        for _, fi in jobs:
+            fi.cancel()
+        executor.shutdown(wait=False)
+
+
 def progress_iterator(xs, func, threshold=50, progress=None, reraise_cancel=False):
     """
     see progress_loader documentation
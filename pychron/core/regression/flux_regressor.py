@@ -15,19 +15,17 @@
 # ===============================================================================
 
 # ============= standard library imports ========================
-from operator import itemgetter
-
-from numpy import asarray, column_stack, ones_like, array, average, ravel, zeros_like
+from numpy import asarray, column_stack, ones_like, array, zeros, zeros_like
 
 # ============= local library imports  ==========================
 from scipy.interpolate import Rbf, bisplrep, bisplev, griddata
-from statsmodels.regression.linear_model import WLS, OLS
+from scipy.spatial import cKDTree
 
 # ============= enthought library imports =======================
 from traits.api import Bool, Int
 
-from pychron.core.geometry.geometry import calc_distances
 from pychron.core.regression.base_regressor import BaseRegressor
+from pychron.core.regression.linear_model import LinearModel
 from pychron.core.regression.ols_regressor import MultipleLinearRegressor
 from pychron.core.stats.idw import Invdisttree
 
@@ -41,6 +39,14 @@ class SpecialFluxRegressor(BaseRegressor):
     def predict_error(self, pts, error_calc=None):
         return array(self._predict(pts, return_error=True))
 
+    def predict_grid(self, x, y):
+        """
+        predict every point of the grid x, y in one call
+        """
+        x = asarray(x)
+        pts = column_stack((x.ravel(), asarray(y).ravel()))
+        return self.predict(pts).reshape(x.shape)
+
     def get_exog(self, x):
         return x
 
@@ -112,40 +118,38 @@ class IDWRegressor(InterpolationRegressor):
 
 class NearestNeighborFluxRegressor(SpecialFluxRegressor):
     n = Int(3)
+    _tree = None
 
     def _predict(self, pts, return_error=False):
-        def pred(x, y):
-            """
-            get the n positions that are closest (eucledian distance) to x,y
-            """
-
-            v2 = array([[x, y]])
-            ds = ravel(calc_distances(self.clean_xs, v2))
-            idx = sorted(enumerate(ds), key=itemgetter(1))
-            idx, ds = zip(*idx[: self.n])
-
-            v = 0
-            if idx:
-                idx = array(idx)
-
-                vs = self.clean_ys[idx]
-
-                if self.use_weighted_fit:
-                    es = self.clean_yserr[idx]
-                    ws = es**-2
-                    if return_error:
-                        v = ws.sum()
-                    else:
-                        v = average(vs, weights=ws)
-                else:
-                    if return_error:
-                        v = vs.std()
-                    else:
-                        v = vs.mean()
-            return v
-
-        ret = [pred(*pt) for pt in pts]
-        return ret
+        """
+        average of the n positions that are closest (euclidean distance) to each
+        point. all points are looked up in one KD-tree query
+        """
+        pts = asarray(pts, dtype=float).reshape(-1, 2)
+        xs = self.clean_xs
+        k = min(self.n, len(xs))
+        if not k or not len(pts):
+            return zeros(len(pts))
+
+        _, idx = self._get_tree(xs).query(pts, k=k)
+        idx = idx.reshape(len(pts), k)
+
+        vs = self.clean_ys[idx]
+        if self.use_weighted_fit:
+            ws = self.clean_yserr[idx] ** -2
+            if return_error:
+                return ws.sum(axis=1)
+            return (vs * ws).sum(axis=1) / ws.sum(axis=1)
+        else:
+            if return_error:
+                return vs.std(axis=1)
+            return vs.mean(axis=1)
+
+    def _get_tree(self, xs):
+        # clean_xs is a new array whenever the data or exclusions change
+        if self._tree is None or self._tree[0] is not xs:
+            self._tree = (xs, cKDTree(xs))
+        return self._tree[1]
 
 
 # class BracketingFluxRegressor(SpecialFluxRegressor):
@@ -236,9 +240,9 @@ class PlaneFluxRegressor(MultipleLinearRegressor):
 
     def _engine_factory(self, fy, X, check_integrity=True):
         if self.use_weighted_fit:
-            return WLS(fy, X, weights=self._get_weights())
+            return LinearModel(fy, X, weights=self._get_weights())
         else:
-            return OLS(fy, X)
+            return LinearModel(fy, X)
 
 
 # ============= EOF =============================================
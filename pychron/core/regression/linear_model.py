@@ -0,0 +1,253 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+
+# ============= standard library imports ========================
+from numpy import (
+    asarray,
+    average,
+    column_stack,
+    diag,
+    dot,
+    errstate,
+    finfo,
+    float64,
+    isfinite,
+    linalg,
+    ones,
+    sqrt,
+    where,
+)
+
+# ============= local library imports  ==========================
+
+RCOND = 1e-15
+
+
+def pinv_extended(x, rcond=RCOND):
+    """
+    pseudo inverse of x and its singular values. same algorithm as statsmodels so the
+    coefficients and covariance match an OLS/WLS fit bit for bit
+    """
+    u, s, vt = linalg.svd(x, full_matrices=False)
+    cutoff = rcond * s.max()
+    with errstate(divide="ignore"):
+        sinv = where(s > cutoff, 1 / s, 0)
+
+    return dot(vt.T, sinv[:, None] * u.T), s
+
+
+def divide(a, b):
+    """
+    a / b without a warning when b is zero. a saturated fit (nobs == nparams) has no
+    residual degrees of freedom
+    """
+    if b:
+        return a / b
+
+    with errstate(divide="ignore", invalid="ignore"):
+        return float64(a) / 0.0
+
+
+def find_constant(exog):
+    """
+    return the number of constant columns (0 or 1) in the design matrix.
+    follows the statsmodels detection rules
+    """
+    if not isfinite(exog).all():
+        raise ValueError("exog contains inf or nans")
+
+    const_idx = (exog == exog[0]).all(axis=0).nonzero()[0]
+    if (exog[0, const_idx] != 0).any():
+        return 1
+
+    # look for an implicit constant
+    augmented = column_stack((ones(exog.shape[0]), exog))
+    return int(linalg.matrix_rank(exog) == linalg.matrix_rank(augmented))
+
+
+class LinearModel(object):
+    """
+    least squares fit of endog = exog * params with optional weights.
+
+    drop in replacement for the statsmodels OLS/WLS models used by the regressors.
+    fitting a small design directly is much cheaper than building the statsmodels
+    model and results objects for every isotope, baseline and filtering iteration
+    """
+
+    def __init__(self, endog, exog, weights=None):
+        self.endog = asarray(endog, dtype=float)
+        self.exog = asarray(exog, dtype=float)
+        if weights is not None:
+            weights = asarray(weights, dtype=float)
+            if weights.ndim == 0:
+                weights = weights.repeat(self.exog.shape[0])
+
+        self.weights = weights
+        self.wexog = self.whiten(self.exog)
+        self.wendog = self.whiten(self.endog)
+        self.nobs = float(self.exog.shape[0])
+
+        self._pinv_wexog = None
+        self._singular_values = None
+        self._rank = None
+        self._k_constant = None
+
+    def whiten(self, x):
+        x = asarray(x, dtype=float)
+        if self.weights is None:
+            return x
+
+        w = sqrt(self.weights)
+        if x.ndim == 1:
+            return x * w
+        return x * w[:, None]
+
+    def fit(self):
+        return LinearModelResults(self, dot(self.pinv_wexog, self.wendog))
+
+    def summary_model(self):
+        """
+        the equivalent statsmodels model. only used for the text summary
+        """
+        from statsmodels.api import OLS, WLS
+
+        if self.weights is None:
+            return OLS(self.endog, self.exog)
+        return WLS(self.endog, self.exog, weights=self.weights)
+
+    @property
+    def pinv_wexog(self):
+        if self._pinv_wexog is None:
+            self._pinv_wexog, self._singular_values = pinv_extended(self.wexog)
+        return self._pinv_wexog
+
+    @property
+    def singular_values(self):
+        if self._singular_values is None:
+            self._pinv_wexog, self._singular_values = pinv_extended(self.wexog)
+        return self._singular_values
+
+    @property
+    def normalized_cov_params(self):
+        p = self.pinv_wexog
+        return dot(p, p.T)
+
+    @property
+    def rank(self):
+        if self._rank is None:
+            s = self.singular_values
+            tol = s.max() * len(s) * finfo(s.dtype).eps
+            self._rank = int((s > tol).sum())
+        return self._rank
+
+    @property
+    def k_constant(self):
+        if self._k_constant is None:
+            self._k_constant = find_constant(self.exog)
+        return self._k_constant
+
+    @property
+    def df_model(self):
+        return float(self.rank - self.k_constant)
+
+    @property
+    def df_resid(self):
+        return self.nobs - self.rank
+
+
+class LinearModelResults(object):
+    """
+    results of a LinearModel fit. exposes the subset of the statsmodels
+    RegressionResults interface used by pychron
+    """
+
+    def __init__(self, model, params):
+        self.model = model
+        self.params = params
+        self.normalized_cov_params = model.normalized_cov_params
+        self.df_resid = model.df_resid
+        self.df_model = model.df_model
+        self.nobs = model.nobs
+
+        self.fittedvalues = dot(model.exog, params)
+        self.resid = model.endog - self.fittedvalues
+        self.wresid = model.wendog - dot(model.wexog, params)
+        self.ssr = dot(self.wresid, self.wresid)
+
+        self.scale = self.mse_resid = divide(self.ssr, self.df_resid)
+
+    def predict(self, exog):
+        return dot(exog, self.params)
+
+    def cov_params(self):
+        return self.normalized_cov_params * self.scale
+
+    def summary(self):
+        return self.model.summary_model().fit().summary()
+
+    @property
+    def bse(self):
+        return sqrt(diag(self.cov_params()))
+
+    @property
+    def centered_tss(self):
+        model = self.model
+        if model.weights is None:
+            d = model.wendog - model.wendog.mean()
+            return dot(d, d)
+
+        d = model.endog - average(model.endog, weights=model.weights)
+        return (model.weights * d**2).sum()
+
+    @property
+    def uncentered_tss(self):
+        return dot(self.model.wendog, self.model.wendog)
+
+    @property
+    def rsquared(self):
+        tss = self.centered_tss if self.model.k_constant else self.uncentered_tss
+        return 1 - divide(self.ssr, tss)
+
+    @property
+    def rsquared_adj(self):
+        k = divide(self.nobs - self.model.k_constant, self.df_resid)
+        return 1 - k * (1 - self.rsquared)
+
+    def prediction_std(self, alpha=0.05):
+        """
+        standard error and confidence interval of a new observation at each
+        point of the fit. same as statsmodels wls_prediction_std
+        """
+        from scipy.stats import t
+
+        model = self.model
+        weights = 1.0 if model.weights is None else model.weights
+        exog = model.exog
+        predvar = self.mse_resid / weights + (
+            exog * dot(self.cov_params(), exog.T).T
+        ).sum(1)
+        predstd = sqrt(predvar)
+        tppf = t.isf(alpha / 2.0, self.df_resid)
+        return (
+            predstd,
+            self.fittedvalues - tppf * predstd,
+            self.fittedvalues + tppf * predstd,
+        )
+
+
+# ============= EOF =============================================
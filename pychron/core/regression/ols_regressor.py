@@ -21,18 +21,17 @@ from numpy import (
     column_stack,
     sqrt,
     dot,
-    linalg,
     zeros_like,
     hstack,
     ones_like,
     array,
 )
-from statsmodels.api import OLS
 from traits.api import Int, Property
 
 # ============= local library imports  ==========================
 from pychron.core.helpers.fits import FITS, fit_to_degree
 from pychron.core.regression.base_regressor import BaseRegressor
+from pychron.core.regression.linear_model import LinearModel
 from pychron.pychron_constants import MSEM, SEM, AUTO_LINEAR_PARABOLIC
 
 logger = logging.getLogger("Regressor")
@@ -43,6 +42,7 @@ class OLSRegressor(BaseRegressor):
     _degree = Int
     constant = None
     _ols = None
+    _hat_cache = None
 
     def set_degree(self, d, refresh=True):
         if isinstance(d, str):
@@ -66,16 +66,11 @@ class OLSRegressor(BaseRegressor):
 
     def fast_predict(self, endog, pexog, exog=None):
         ols = self._ols
-        ols.wendog = ols.whiten(endog)
-
         if exog is not None:
-            ols.wexog = ols.whiten(exog)
-
-            # force recalculation
-            del ols.pinv_wexog
+            ols = LinearModel(endog, exog, weights=ols.weights)
 
-        result = ols.fit()
-        return result.predict(pexog)
+        beta = dot(ols.pinv_wexog, ols.whiten(endog))
+        return dot(pexog, beta)
 
     def fast_predict2(self, endog, exog):
         """
@@ -84,9 +79,7 @@ class OLSRegressor(BaseRegressor):
 
         currently useful for monte_carlo_estimation
         """
-        if not hasattr(self, "pinv_wexog"):
-            self.pinv_wexog = linalg.pinv(self._ols.wexog)
-        beta = dot(self.pinv_wexog, endog)
+        beta = dot(self._ols.pinv_wexog, endog)
 
         return dot(exog, beta)
 
@@ -156,9 +149,7 @@ class OLSRegressor(BaseRegressor):
             #     traceback.print_exc()
 
     def calculate_prediction_envelope(self, fx, fy):
-        from statsmodels.sandbox.regression.predstd import wls_prediction_std
-
-        prstd, iv_l, iv_u = wls_prediction_std(self._result)
+        prstd, iv_l, iv_u = self._result.prediction_std()
         return iv_l, iv_u, self._result.model.exog[::, 1]
 
     def predict(self, pos):
@@ -219,16 +210,11 @@ class OLSRegressor(BaseRegressor):
         Xbar = xs.mean()
         n = float(xs.shape[0])
 
-        def calc_error(Xk):
-            a = 1 / n + (Xk - Xbar) ** 2 / ((xs - Xbar) ** 2).sum()
-            if error_calc == SEM:
-                var_Ypred = s * s * a
-            else:
-                var_Ypred = s * s * (1 + a)
-
-            return sqrt(var_Ypred)
+        a = 1 / n + (asarray(x) - Xbar) ** 2 / ((xs - Xbar) ** 2).sum()
+        if error_calc != SEM:
+            a = 1 + a
 
-        return [calc_error(xi) for xi in x]
+        return s * sqrt(a)
 
     def predict_error_matrix(self, x, error_calc="SEM"):
         """
@@ -237,44 +223,24 @@ class OLSRegressor(BaseRegressor):
 
         Xk'=(1, x, x**2...x)
 
+        the variance of the fit at every x is evaluated with a single matrix
+        product and cached until the regressor is refit
         """
         x = asarray(x)
-        sef = self.calculate_standard_error_fit()
-
-        covarM = array(self.var_covar)
+        if not self._result:
+            return zeros_like(x)
 
-        def calc_hat(xi):
-            Xk = self._get_X(xi).T
-            varY_hat = Xk.T.dot(covarM).dot(Xk)
-            return varY_hat[0, 0]
+        sef, varY_hat = self._get_hat(x)
 
         error_calc = error_calc.lower()
         if error_calc == SEM.lower():
-
-            def func(xi):
-                varY_hat = calc_hat(xi)
-                return sef * sqrt(varY_hat)
-
+            return sef * sqrt(varY_hat)
         elif error_calc == MSEM.lower():
             mswd = self.mswd
-
-            def func(xi):
-                varY_hat = calc_hat(xi)
-                m = mswd**0.5 if mswd > 1 else 1
-                return sef * sqrt(varY_hat) * m
-
-        else:
-
-            def func(xi):
-                varY_hat = calc_hat(xi)
-                return sqrt(sef**2 + sef**2 * varY_hat)
-
-        if not self._result:
-            return zeros_like(x)
+            m = mswd**0.5 if mswd > 1 else 1
+            return sef * sqrt(varY_hat) * m
         else:
-            return [func(xi) for xi in x]
-            # func = calc_sem if error_calc == 'SEM' else calc_sd
-            # return [func(xi) for xi in x]
+            return sqrt(sef**2 + sef**2 * varY_hat)
 
     def predict_error_al(self, x, error_calc="sem"):
         """
@@ -282,30 +248,22 @@ class OLSRegressor(BaseRegressor):
 
         only here for verification
 
+        bx= x**0,x**1,x**n where n= degree of fit linear=2, parabolic=3 etc
         """
-        cov_varM = array(self.var_covar)
-        se = self.calculate_standard_error_fit()
-
-        def predict_yi_err(xi):
-            """
-            bx= x**0,x**1,x**n where n= degree of fit linear=2, parabolic=3 etc
-            """
-            bx = asarray([pow(xi, i) for i in range(self.degree + 1)])
-            bx_covar = bx.dot(cov_varM)
-            bx_covar = asarray(bx_covar)[0]
-            var = sum(bx * bx_covar)
-            #            print var
-            s = se * var**0.5
-            if error_calc == "sd":
-                s = (se**2 + s**2) ** 0.5
-
-            return s
-
         if isinstance(x, (float, int)):
             x = [x]
         x = asarray(x)
 
-        return [predict_yi_err(xi) for xi in x]
+        cov_varM = array(self.var_covar)
+        se = self.calculate_standard_error_fit()
+
+        bx = column_stack([x**i for i in range(self.degree + 1)])
+        var = (bx.dot(cov_varM) * bx).sum(axis=1)
+        s = se * var**0.5
+        if error_calc == "sd":
+            s = (se**2 + s**2) ** 0.5
+
+        return s
 
         # def calculate_y(self, x):
         #     coeffs = self.coefficients
@@ -344,7 +302,30 @@ class OLSRegressor(BaseRegressor):
             return [0, 0]
 
     def _engine_factory(self, fy, X, check_integrity=True):
-        return OLS(fy, X)
+        return LinearModel(fy, X)
+
+    def _get_hat(self, x):
+        """
+        return the standard error of the fit and the variance of the fitted value
+        Xk'.C.Xk for every point in x, keyed on the current fit result
+        """
+        result = self._result
+        cache = self._hat_cache
+        if cache is None or cache[0] is not result:
+            cache = (result, self.calculate_standard_error_fit(), {})
+            self._hat_cache = cache
+
+        _, sef, hats = cache
+        key = (x.shape, x.tobytes())
+        varY_hat = hats.get(key)
+        if varY_hat is None:
+            X = self._get_X(x)
+            varY_hat = (X.dot(array(self.var_covar)) * X).sum(axis=1)
+            if len(hats) > 16:
+                hats.clear()
+            hats[key] = varY_hat
+
+        return sef, varY_hat
 
     def _get_degree(self):
         return self._degree
@@ -412,6 +393,14 @@ class MultipleLinearRegressor(OLSRegressor):
         # use fast_predict instead
         return self.fast_predict(endog, pexog, **kw)
 
+    def predict_grid(self, x, y):
+        """
+        predict every point of the grid x, y with a single design matrix
+        """
+        x = asarray(x)
+        pts = column_stack((x.ravel(), asarray(y).ravel()))
+        return self.predict(pts).reshape(x.shape)
+
     def _get_X(self, xs=None):
         if xs is None:
             xs = self.clean_xs
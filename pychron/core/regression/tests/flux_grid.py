@@ -0,0 +1,90 @@
+import unittest
+from operator import itemgetter
+
+from numpy import allclose, array, average, meshgrid, linspace, random, ravel, vstack
+
+from pychron.core.geometry.geometry import calc_distances
+from pychron.core.regression.flux_regressor import (
+    BowlFluxRegressor,
+    IDWRegressor,
+    NearestNeighborFluxRegressor,
+    PlaneFluxRegressor,
+)
+
+
+def reference_nearest(reg, pts, return_error=False):
+    """
+    per point nearest neighbor evaluation
+    """
+    vs = []
+    for x, y in pts:
+        ds = ravel(calc_distances(reg.clean_xs, array([[x, y]])))
+        idx = sorted(enumerate(ds), key=itemgetter(1))
+        idx = array([i for i, _ in idx[: reg.n]])
+
+        ys = reg.clean_ys[idx]
+        if reg.use_weighted_fit:
+            ws = reg.clean_yserr[idx] ** -2
+            v = ws.sum() if return_error else average(ys, weights=ws)
+        else:
+            v = ys.std() if return_error else ys.mean()
+        vs.append(v)
+    return array(vs)
+
+
+class FluxGridTestCase(unittest.TestCase):
+    def setUp(self):
+        rs = random.RandomState(7)
+        self.xs = rs.uniform(-1, 1, (40, 2))
+        self.ys = (
+            0.01 + 1e-3 * self.xs[:, 0] - 2e-3 * self.xs[:, 1] + rs.normal(0, 1e-5, 40)
+        )
+        self.yserr = rs.uniform(1e-5, 3e-5, 40)
+        self.gx, self.gy = meshgrid(linspace(-1, 1, 25), linspace(-1, 1, 25))
+
+    def _regressor(self, klass, **kw):
+        reg = klass(xs=self.xs, ys=self.ys, yserr=self.yserr, **kw)
+        reg.calculate()
+        return reg
+
+    def _row_by_row(self, reg):
+        return array(
+            [reg.predict(vstack((gx, gy)).T) for gx, gy in zip(self.gx, self.gy)]
+        )
+
+    def test_nearest_neighbor(self):
+        pts = vstack((self.gx.ravel(), self.gy.ravel())).T
+        for weighted in (False, True):
+            for n in (1, 3, 100):
+                reg = self._regressor(
+                    NearestNeighborFluxRegressor, use_weighted_fit=weighted, n=n
+                )
+                for return_error in (False, True):
+                    a = reg._predict(pts, return_error=return_error)
+                    b = reference_nearest(reg, pts, return_error=return_error)
+                    self.assertTrue(allclose(a, b, rtol=1e-12, atol=0))
+
+    def test_nearest_neighbor_data_changed(self):
+        reg = self._regressor(NearestNeighborFluxRegressor)
+        a = reg.predict([(0, 0)])
+        reg.ys = self.ys * 2
+        reg.xs = self.xs + 0.5
+        b = reg.predict([(0, 0)])
+        self.assertNotAlmostEqual(a[0], b[0] / 2)
+        self.assertEqual(b[0], reference_nearest(reg, [(0, 0)])[0])
+
+    def test_predict_grid(self):
+        for klass in (
+            NearestNeighborFluxRegressor,
+            IDWRegressor,
+            PlaneFluxRegressor,
+            BowlFluxRegressor,
+        ):
+            reg = self._regressor(klass)
+            nz = reg.predict_grid(self.gx, self.gy)
+            self.assertEqual(nz.shape, self.gx.shape)
+            self.assertTrue(abs(nz - self._row_by_row(reg)).max() < 1e-15)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import unittest
+
+from numpy import column_stack, ones, random
+from statsmodels.api import OLS, WLS
+from statsmodels.sandbox.regression.predstd import wls_prediction_std
+
+from pychron.core.regression.flux_regressor import PlaneFluxRegressor
+from pychron.core.regression.linear_model import LinearModel
+from pychron.core.regression.ols_regressor import OLSRegressor
+from pychron.core.regression.wls_regressor import WeightedPolynomialRegressor
+
+
+class LinearModelTestCase(unittest.TestCase):
+    def setUp(self):
+        self.rs = random.RandomState(11)
+
+    def _data(self, n, degree):
+        xs = self.rs.uniform(0, 100, n)
+        ys = 10 - 0.05 * xs + 1e-4 * xs**2 + self.rs.normal(0, 0.1, n)
+        es = self.rs.uniform(0.05, 0.2, n)
+        X = column_stack([xs**i for i in range(degree + 1)])
+        return xs, ys, es, X
+
+    def _compare(self, a, b):
+        for attr in (
+            "params",
+            "bse",
+            "normalized_cov_params",
+            "resid",
+            "fittedvalues",
+            "rsquared",
+            "rsquared_adj",
+            "ssr",
+            "df_resid",
+            "mse_resid",
+        ):
+            self.assertTrue(
+                abs(getattr(a, attr) - getattr(b, attr)).max()
+                <= 1e-9 * abs(getattr(b, attr)).max(),
+                attr,
+            )
+
+        for ai, bi in zip(a.prediction_std(), wls_prediction_std(b)):
+            self.assertTrue(abs(ai - bi).max() <= 1e-9 * abs(bi).max())
+
+    def test_ols(self):
+        for n, degree in ((5, 1), (30, 1), (30, 2), (50, 3)):
+            _, ys, _, X = self._data(n, degree)
+            self._compare(LinearModel(ys, X).fit(), OLS(ys, X).fit())
+
+    def test_wls(self):
+        for n, degree in ((5, 1), (30, 1), (30, 2), (50, 3)):
+            _, ys, es, X = self._data(n, degree)
+            ws = es**-2
+            self._compare(
+                LinearModel(ys, X, weights=ws).fit(), WLS(ys, X, weights=ws).fit()
+            )
+
+    def test_no_constant(self):
+        xs, ys, _, _ = self._data(20, 1)
+        X = column_stack((xs, xs**2))
+        self._compare(LinearModel(ys, X).fit(), OLS(ys, X).fit())
+
+    def test_constant_last(self):
+        xs, ys, _, _ = self._data(20, 1)
+        X = column_stack((xs, self.rs.uniform(0, 1, 20), ones(20)))
+        self._compare(LinearModel(ys, X).fit(), OLS(ys, X).fit())
+
+    def test_singular(self):
+        xs, ys, _, _ = self._data(20, 1)
+        X = column_stack((ones(20), xs, 2 * xs))
+        a, b = LinearModel(ys, X).fit(), OLS(ys, X).fit()
+        self.assertEqual(a.model.rank, b.model.rank)
+        self._compare(a, b)
+
+    def test_summary(self):
+        _, ys, _, X = self._data(10, 1)
+        self.assertEqual(
+            str(LinearModel(ys, X).fit().summary().tables[1]),
+            str(OLS(ys, X).fit().summary().tables[1]),
+        )
+
+
+class RegressorTestCase(unittest.TestCase):
+    def setUp(self):
+        rs = random.RandomState(5)
+        self.xs = rs.uniform(0, 100, 40)
+        self.ys = 5 + 0.01 * self.xs + rs.normal(0, 0.05, 40)
+        self.yserr = rs.uniform(0.02, 0.1, 40)
+
+    def _reference(self, reg, model):
+        ref = model.fit()
+        self.assertTrue(abs(reg.coefficients - ref.params).max() < 1e-12)
+        self.assertTrue(abs(reg.coefficient_errors - ref.bse).max() < 1e-12)
+        self.assertAlmostEqual(reg.rsquared, ref.rsquared, 12)
+        self.assertAlmostEqual(reg.rsquared_adj, ref.rsquared_adj, 12)
+
+    def test_ols_regressor(self):
+        reg = OLSRegressor(xs=self.xs, ys=self.ys, fit="parabolic")
+        reg.calculate()
+        X = column_stack((ones(40), self.xs, self.xs**2))
+        self._reference(reg, OLS(self.ys, X))
+
+        pred = reg.predict_error([10, 50])
+        self.assertEqual(len(pred), 2)
+        self.assertAlmostEqual(
+            reg.fast_predict(self.ys, X[:3])[0], reg.predict(self.xs[0]), 12
+        )
+
+    def test_wls_regressor(self):
+        reg = WeightedPolynomialRegressor(
+            xs=self.xs, ys=self.ys, yserr=self.yserr, fit="linear"
+        )
+        reg.calculate()
+        X = column_stack((ones(40), self.xs))
+        self._reference(reg, WLS(self.ys, X, weights=self.yserr**-2))
+
+    def test_filtered(self):
+        ys = self.ys.copy()
+        ys[3] += 2
+        reg = OLSRegressor(
+            xs=self.xs,
+            ys=ys,
+            fit="linear",
+            filter_outliers_dict={
+                "filter_outliers": True,
+                "iterations": 2,
+                "std_devs": 2,
+            },
+        )
+        reg.calculate()
+        self.assertIn(3, reg.outlier_excluded)
+
+        mask = [i for i in range(40) if i not in reg.outlier_excluded]
+        X = column_stack((ones(40), self.xs))[mask]
+        self._reference(reg, OLS(ys[mask], X))
+
+    def test_plane_regressor(self):
+        rs = random.RandomState(2)
+        pts = rs.uniform(-1, 1, (30, 2))
+        zs = 0.01 + 1e-4 * pts[:, 0] - 2e-4 * pts[:, 1] + rs.normal(0, 1e-5, 30)
+        es = rs.uniform(1e-6, 1e-5, 30)
+        X = column_stack((pts, ones(30)))
+        for weighted in (False, True):
+            reg = PlaneFluxRegressor(xs=pts, ys=zs, yserr=es, use_weighted_fit=weighted)
+            reg.calculate()
+            model = WLS(zs, X, weights=es**-2) if weighted else OLS(zs, X)
+            self._reference(reg, model)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+
+from numpy import array, linspace, random, sqrt
+
+from pychron.core.regression.flux_regressor import PlaneFluxRegressor
+from pychron.core.regression.ols_regressor import OLSRegressor
+from pychron.pychron_constants import MSEM, SEM
+
+
+def reference_error(reg, x, error_calc):
+    """
+    per point evaluation of the fit variance Xk'.C.Xk
+    """
+    sef = reg.calculate_standard_error_fit()
+    covarM = array(reg.var_covar)
+    es = []
+    for xi in x:
+        Xk = reg._get_X(xi).T
+        varY_hat = Xk.T.dot(covarM).dot(Xk)[0, 0]
+        if error_calc == SEM:
+            e = sef * sqrt(varY_hat)
+        elif error_calc == MSEM:
+            mswd = reg.mswd
+            e = sef * sqrt(varY_hat) * (mswd**0.5 if mswd > 1 else 1)
+        else:
+            e = sqrt(sef**2 + sef**2 * varY_hat)
+        es.append(e)
+    return es
+
+
+class PredictionErrorTestCase(unittest.TestCase):
+    def setUp(self):
+        rs = random.RandomState(3)
+        self.xs = rs.uniform(0, 100, 30)
+        self.ys = 5 + 0.01 * self.xs - 1e-4 * self.xs**2 + rs.normal(0, 0.05, 30)
+        self.yserr = rs.uniform(0.01, 0.03, 30)
+        self.fx = linspace(-10, 110, 100)
+
+    def _regressor(self, fit):
+        reg = OLSRegressor(xs=self.xs, ys=self.ys, yserr=self.yserr, fit=fit)
+        reg.calculate()
+        return reg
+
+    def test_matrix(self):
+        for fit in ("linear", "parabolic", "cubic"):
+            reg = self._regressor(fit)
+            for error_calc in (SEM, MSEM, "SD"):
+                es = reg.predict_error_matrix(self.fx, error_calc)
+                ref = reference_error(reg, self.fx, error_calc)
+                for a, b in zip(es, ref):
+                    self.assertAlmostEqual(a / b, 1, 12)
+
+    def test_single(self):
+        reg = self._regressor("linear")
+        e = reg.predict_error(50.0, SEM)
+        self.assertAlmostEqual(e, reference_error(reg, [50.0], SEM)[0], 12)
+
+    def test_envelope(self):
+        reg = self._regressor("parabolic")
+        fy = reg.predict(self.fx)
+        ly, uy = reg.calculate_error_envelope(self.fx, fy, error_calc="SD")
+        ref = reference_error(reg, self.fx, "SD")
+        self.assertAlmostEqual(abs(uy - fy - ref).max(), 0, 12)
+        self.assertAlmostEqual(abs(fy - ly - ref).max(), 0, 12)
+
+    def test_cache_invalidated_on_refit(self):
+        reg = self._regressor("linear")
+        a = reg.predict_error_matrix(self.fx, SEM)
+        self.assertIs(reg._hat_cache[0], reg._result)
+
+        reg.fit = "parabolic"
+        b = reg.predict_error_matrix(self.fx, SEM)
+        for bi, ri in zip(b, reference_error(reg, self.fx, SEM)):
+            self.assertAlmostEqual(bi / ri, 1, 12)
+        self.assertNotAlmostEqual(a[0], b[0])
+
+    def test_al(self):
+        reg = self._regressor("parabolic")
+        es = reg.predict_error_al(self.fx, "sd")
+        ref = reference_error(reg, self.fx, "SD")
+        for a, b in zip(es, ref):
+            self.assertAlmostEqual(a / b, 1, 12)
+
+    def test_algebraic(self):
+        reg = self._regressor("linear")
+        es = reg.predict_error_algebraic(self.fx, SEM)
+        ref = reference_error(reg, self.fx, SEM)
+        for a, b in zip(es, ref):
+            self.assertAlmostEqual(a / b, 1, 8)
+
+    def test_plane(self):
+        rs = random.RandomState(1)
+        pts = rs.uniform(-1, 1, (20, 2))
+        zs = 0.01 + 1e-4 * pts[:, 0] + rs.normal(0, 1e-5, 20)
+        reg = PlaneFluxRegressor(xs=pts, ys=zs, yserr=zs * 0.001)
+        reg.calculate()
+
+        ppts = rs.uniform(-1, 1, (50, 2))
+        es = reg.predict_error_matrix(ppts, SEM)
+        for a, b in zip(es, reference_error(reg, ppts, SEM)):
+            self.assertAlmostEqual(a / b, 1, 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -19,11 +19,9 @@
 from __future__ import absolute_import
 from numpy import delete, hstack
 
-from statsmodels.api import WLS
-
 # ============= local library imports  ==========================
 # from pychron.core.regression.base_regressor import BaseRegressor
-
+from pychron.core.regression.linear_model import LinearModel
 from pychron.core.regression.ols_regressor import OLSRegressor, MultipleLinearRegressor
 
 
@@ -59,7 +57,7 @@ class WeightedPolynomialRegressor(OLSRegressor):
             else:
                 return
 
-        return WLS(fy, X, weights=ws)
+        return LinearModel(fy, X, weights=ws)
 
     def _check_integrity(self, x, y, e=None, **kw):
         nx, ny = len(x), len(y)
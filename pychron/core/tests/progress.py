@@ -0,0 +1,120 @@
+import threading
+import time
+import unittest
+
+from pychron.core.progress import (
+    progress_loader,
+    ProgressErrors,
+    CancelLoadingError,
+)
+
+
+class StubProgress(object):
+    message = ""
+    canceled = False
+    accepted = False
+    closed = False
+
+    def __init__(self):
+        self.messages = []
+
+    def change_message(self, message, auto_increment=True):
+        self.message = message
+        self.messages.append(message)
+
+    def update(self, value):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def square(x, prog, i, n):
+    if x % 7 == 3:
+        raise ValueError(x)
+    return x * x
+
+
+def pairs(x, prog, i, n):
+    time.sleep(0.001 * (x % 3))
+    return x, -x
+
+
+MODES = ({}, {"workers": 4}, {"workers": 2, "processes": True})
+
+
+class ProgressLoaderTestCase(unittest.TestCase):
+    def test_ordering(self):
+        xs = list(range(50))
+        for kw in MODES:
+            items = progress_loader(xs, pairs, use_progress=False, **kw)
+            self.assertEqual(items, [v for x in xs for v in (x, -x)], kw)
+
+            items = progress_loader(xs, pairs, use_progress=False, unpack=False, **kw)
+            self.assertEqual(items, [(x, -x) for x in xs], kw)
+
+    def test_errors(self):
+        xs = list(range(30))
+        # falsy results, e.g. 0, are dropped
+        expected = [x * x for x in xs if x % 7 != 3 and x]
+        for kw in MODES:
+            errors = ProgressErrors()
+            items = progress_loader(
+                xs, square, progress=StubProgress(), errors=errors, **kw
+            )
+            self.assertEqual(items, expected, kw)
+            self.assertEqual([i for i, x, e in errors], [3, 10, 17, 24], kw)
+            self.assertTrue(all(isinstance(e, ValueError) for i, x, e in errors))
+            self.assertEqual(errors.summary(), "4 items failed. ValueError=4")
+
+        # errors are still skipped when not collected
+        self.assertEqual(progress_loader(xs, square, use_progress=False), expected)
+
+    def _cancel(self, kw, attr, reraise_cancel=False):
+        prog = StubProgress()
+        called = []
+        lock = threading.Lock()
+
+        def func(x, p, i, n):
+            with lock:
+                called.append(x)
+            if x == 5:
+                setattr(prog, attr, True)
+            time.sleep(0.005)
+            return x + 1
+
+        items = progress_loader(
+            list(range(200)), func, progress=prog, reraise_cancel=reraise_cancel, **kw
+        )
+        self.assertTrue(prog.closed)
+        return items, called
+
+    def test_cancel(self):
+        for kw in MODES[:2]:
+            items, called = self._cancel(kw, "canceled")
+            self.assertEqual(items, [], kw)
+            # the pending items were not started
+            self.assertLess(len(called), 50, kw)
+
+            with self.assertRaises(CancelLoadingError):
+                self._cancel(kw, "canceled", reraise_cancel=True)
+
+    def test_accept(self):
+        for kw in MODES[:2]:
+            items, called = self._cancel(kw, "accepted")
+            # the items loaded before accepting, in order
+            self.assertEqual(items, list(range(1, len(items) + 1)), kw)
+            self.assertTrue(items, kw)
+            self.assertLess(len(called), 50, kw)
+            if not kw:
+                self.assertEqual(len(items), 6)
+
+    def test_throttled(self):
+        prog = StubProgress()
+        progress_loader(list(range(1000)), pairs, progress=prog, workers=4)
+        self.assertLess(len(prog.messages), 100)
+        self.assertEqual(prog.messages[-1], "Loaded 1000/1000")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import logging
+import threading
+import time
+import unittest
+
+from pychron.core.helpers.logger_setup import (
+    start_queued_logging,
+    stop_queued_logging,
+    flush_queued_logging,
+    get_queue_handler,
+)
+from pychron.loggable import Loggable
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, delay=0):
+        super(RecordingHandler, self).__init__()
+        self.delay = delay
+        self.records = []
+        self.threads = set()
+
+    def emit(self, record):
+        if self.delay:
+            time.sleep(self.delay)
+        self.threads.add(threading.current_thread().name)
+        self.records.append((record.threadName, record.levelname, self.format(record)))
+
+
+class Counted(object):
+    def __init__(self):
+        self.n = 0
+
+    def __str__(self):
+        self.n += 1
+        return "counted"
+
+
+class QueuedLoggingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = logging.getLogger()
+        self.root_level = self.root.level
+        self.root.setLevel(logging.DEBUG)
+
+        self.handler = RecordingHandler()
+        self.handler.setFormatter(logging.Formatter("%(message)s"))
+        start_queued_logging([self.handler], maxsize=1000)
+
+        self.obj = Loggable(name="queued_logging_test")
+
+    def tearDown(self):
+        stop_queued_logging()
+        self.root.removeHandler(self.handler)
+        self.root.setLevel(self.root_level)
+        self.obj.logger.setLevel(logging.DEBUG)
+
+    def _messages(self):
+        flush_queued_logging()
+        # the last dequeued record may still be in the handler
+        time.sleep(0.01)
+        return [m for _, _, m in self.handler.records]
+
+    def test_background(self):
+        obj = self.obj
+        obj.debug("a %s %s", 1, 2.5)
+        obj.debug("b")
+        obj.info("c")
+        obj.warning("100% d")
+        self.assertEqual(self._messages(), ["a 1 2.5", "b", "c", "100% d"])
+
+        name = threading.current_thread().name
+        self.assertEqual({t for t, _, _ in self.handler.records}, {name})
+        self.assertEqual(
+            [l for _, l, _ in self.handler.records],
+            ["DEBUG", "DEBUG", "INFO", "WARNING"],
+        )
+        self.assertNotIn(name, self.handler.threads)
+
+    def test_lazy(self):
+        obj = self.obj
+        c = Counted()
+        obj.logger.setLevel(logging.INFO)
+        obj.debug("value=%s", c)
+        self.assertEqual(c.n, 0)
+
+        obj.logger.setLevel(logging.DEBUG)
+        values = [1, 2]
+        obj.debug("values=%s", values)
+        # mutable arguments are formatted before they are enqueued
+        values.append(3)
+        self.assertEqual(self._messages(), ["values=[1, 2]"])
+
+    def test_stdlib_logger(self):
+        logger = logging.getLogger("queued_logging_stdlib")
+        values = [1]
+        logger.warning("values=%s %s", values, 2)
+        values.append(2)
+        self.assertEqual(self._messages(), ["values=[1] 2"])
+
+    def test_drop(self):
+        handler = get_queue_handler()
+        handler.maxsize = 0
+        for i in range(10):
+            self.obj.debug("dropped %s", i)
+        handler.maxsize = 1000
+        self.assertEqual(handler.dropped, 10)
+
+        self.obj.debug("kept")
+        self.assertEqual(
+            self._messages(), ["kept", "log queue full. dropped 10 records, total=10"]
+        )
+
+    def test_hot_path(self):
+        # a slow file or gui handler does not slow the caller
+        self.handler.delay = 1e-4
+        obj = self.obj
+        n = 20000
+        get_queue_handler().maxsize = n
+
+        ts = []
+        for j in range(5):
+            st = time.perf_counter()
+            for i in range(n // 5):
+                obj.debug("no intensity change cnt= %s", i)
+            ts.append((time.perf_counter() - st) / (n // 5))
+
+        self.assertLess(min(ts), 5e-6)
+        stop_queued_logging()
+        self.assertEqual(len(self.handler.records), n)
+
+
+if __name__ == "__main__":
+    unittest.main()
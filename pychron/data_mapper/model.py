@@ -22,6 +22,7 @@ from traits.api import HasTraits, Str, Int, Bool, Any, Button, Instance, List, D
 from pychron.core.fuzzyfinder import fuzzyfinder
 from pychron.core.helpers.iterfuncs import groupby_key
 from pychron.core.progress import open_progress
+from pychron.core.utils import alpha_to_int
 from pychron.dvc.dvc_persister import DVCPersister
 from pychron.entry.entry_views.repository_entry import RepositoryIdentifierEntry
 from pychron.loggable import Loggable
@@ -82,6 +83,47 @@ class Mapper:
         return p
 
 
+class ImportCache:
+    """
+    remembers which samples, projects, materials, positions etc. were already
+    resolved during an import so each one hits the database once instead of once per
+    analysis. existing analyses are loaded with one query per irradiation
+    """
+
+    def __init__(self):
+        self._resolved = set()
+        self._steps = {}
+
+    def resolve(self, key, func, *args):
+        if key not in self._resolved:
+            func(*args)
+            self._resolved.add(key)
+
+    def load_analyses(self, db, identifiers):
+        self._steps.update(db.get_analysis_steps(identifiers))
+
+    def has_analysis(self, rspec):
+        """
+        same matching as DVCDatabase.get_analysis_runid
+        """
+        step = rspec.step
+        if isinstance(step, str):
+            step = alpha_to_int(step)
+        aliquot = int(rspec.aliquot) if rspec.aliquot else None
+
+        for al, inc in self._steps.get(rspec.identifier, ()):
+            if (step is None or inc == step) and (aliquot is None or al == aliquot):
+                return True
+
+    def add_analysis(self, rspec):
+        step = rspec.step
+        if isinstance(step, str):
+            step = alpha_to_int(step)
+        self._steps.setdefault(rspec.identifier, []).append(
+            (int(rspec.aliquot), -1 if step is None else step)
+        )
+
+
 class BaseDVCImporterModel(Loggable):
     dvc = Instance("pychron.dvc.dvc.DVC")
     sources = Dict
@@ -263,6 +305,9 @@ class DVCAnalysisImporterModel(BaseDVCImporterModel):
     extract_device = Str
     principal_investigator = Str
 
+    bulk = Bool(False)
+    batch_size = Int(100)
+
     def __init__(self, *args, **kw):
         super(DVCAnalysisImporterModel, self).__init__(*args, **kw)
         self.refresh_repository_identifiers()
@@ -285,6 +330,10 @@ class DVCAnalysisImporterModel(BaseDVCImporterModel):
         self.debug("doing import")
 
         aspecs = self.source.get_analysis_import_specs()
+        if self.bulk:
+            self._bulk_import(aspecs)
+            return
+
         dest = self.dvc
         persister = DVCPersister(dvc=dest)
         persister.initialize(self.repository_identifier)
@@ -327,6 +376,77 @@ class DVCAnalysisImporterModel(BaseDVCImporterModel):
 
             persister.push()
 
+    def _bulk_import(self, aspecs):
+        """
+        write analyses in batches of batch_size. each batch is one repository commit
+        and one database transaction. samples, projects etc. are resolved once per
+        import
+        """
+        dest = self.dvc
+        db = dest.db
+        persister = DVCPersister(dvc=dest)
+        persister.initialize(self.repository_identifier)
+        commit_tag = "Transfer:{}".format(self.source.url())
+        cache = ImportCache()
+
+        def key(s):
+            return s.run_spec.irradiation
+
+        for irrad, iaspec in groupby_key(aspecs, key):
+            if not dest.get_irradiation(irrad):
+                self.warning_dialog(
+                    'No Irradiation "{}". Please import the irradiation'.format(irrad)
+                )
+                continue
+
+            iaspec = list(iaspec)
+            cache.load_analyses(db, {a.run_spec.identifier for a in iaspec})
+
+            n = self.batch_size
+            for i in range(0, len(iaspec), n):
+                self._save_batch(persister, cache, iaspec[i : i + n], commit_tag)
+
+            persister.push()
+
+    def _save_batch(self, persister, cache, aspecs, commit_tag):
+        dest = self.dvc
+        paths = []
+        n = 0
+        with dest.session_ctx(), dest.db.deferred_commit():
+            for aspec in aspecs:
+                rspec = aspec.run_spec
+
+                rspec.repository_identifier = self.repository_identifier
+                rspec.mass_spectrometer = self.mass_spectrometer
+                rspec.principal_investigator = self.principal_investigator
+
+                if cache.has_analysis(rspec):
+                    self.warning("{} already exists".format(rspec.runid))
+                    continue
+
+                pi = rspec.principal_investigator
+                for k, func in (
+                    (("ms", rspec.mass_spectrometer), self._add_mass_spectrometer),
+                    (("ed", rspec.extract_device), self._add_extract_device),
+                    (("pi", pi), self._add_principal_investigator),
+                    (("material", rspec.material), self._add_material),
+                    (("project", rspec.project, pi), self._add_project),
+                    (
+                        ("sample", rspec.sample, rspec.project, pi, rspec.material),
+                        self._add_sample,
+                    ),
+                    (("position", rspec.identifier), self._add_position),
+                ):
+                    cache.resolve(k, func, aspec)
+
+                persister.per_spec_save(aspec, commit=False, push=False)
+                paths.extend(persister.get_analysis_paths())
+                cache.add_analysis(rspec)
+                n += 1
+
+        self.debug("saved batch of {} analyses".format(n))
+        persister.commit_batch(paths, commit_tag, n)
+
     def _add_position(self, spec):
         rspec = spec.run_spec
         dest = self.dvc
@@ -14,8 +14,9 @@
 # limitations under the License.
 # ===============================================================================
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-from traits.api import File, Directory
+from traits.api import File, Directory, Int
 
 # ============= standard library imports ========================
 from uncertainties import ufloat
@@ -47,6 +48,7 @@ class FileSource(DVCSource):
     path = File
     _delimiter = ","
     directory = Directory
+    parse_workers = Int(4)
 
     def url(self):
         return "{}:{}".format(self.__class__.__name__, self.path)
@@ -64,20 +66,24 @@ class FileSource(DVCSource):
 
     def get_analysis_import_specs(self, delimiter=None):
         if self.directory:
-            ps = []
-            for di in os.listdir(self.directory):
-                self.path = os.path.join(self.directory, di)
-                print(os.path.isfile(self.path), self.path)
-                # try:
-                s = self.get_analysis_import_spec()
-                ps.append(s)
-                # except BaseException as e:
-                #     print('get analysis import specs', e)
+            paths = [
+                os.path.join(self.directory, di) for di in os.listdir(self.directory)
+            ]
+            nworkers = max(1, min(self.parse_workers, len(paths)))
+            with ThreadPoolExecutor(max_workers=nworkers) as executor:
+                ps = list(executor.map(self._get_file_import_spec, paths))
         elif self.path:
             ps = [self.get_analysis_import_spec(delimiter)]
 
         return ps
 
+    def _get_file_import_spec(self, path):
+        # parse each file with its own copy of the source so files can be parsed
+        # concurrently
+        src = self.clone_traits()
+        src.path = path
+        return src.get_analysis_import_spec()
+
     # def traits_view(self):
     #     return View(VGroup(UItem('path'), show_border=True, label='File'))
 
@@ -149,9 +149,18 @@ class DVCAnalysisImporterView(BaseDVCImporterView):
             Item("mass_spectrometer"),
             Item("extract_device"),
         )
+        grp2 = HGroup(
+            Item("bulk", tooltip="Commit analyses in batches instead of one by one"),
+            Item("batch_size", enabled_when="bulk"),
+        )
 
         v = View(
-            VGroup(grp, grp1, UItem("source", style="custom", editor=InstanceEditor())),
+            VGroup(
+                grp,
+                grp1,
+                grp2,
+                UItem("source", style="custom", editor=InstanceEditor()),
+            ),
             kind="livemodal",
             resizable=True,
             width=700,
@@ -16,6 +16,7 @@
 
 # =============enthought library imports=======================
 import os
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from threading import Lock
 
@@ -42,7 +43,7 @@ from traits.api import (
 )
 
 from pychron.database.core.base_orm import AlembicVersionTable
-from pychron.database.core.query import compile_query
+from pychron.database.core.query import compile_query, QueryCounter
 from pychron.loggable import Loggable
 from pychron.regex import IPREGEX
 
@@ -189,6 +190,19 @@ class DatabaseAdapter(Loggable):
         # if self.kind == 'sqlite':
         metadata.create_all(self.session.bind)
 
+    def count_queries(self):
+        """
+        return a QueryCounter for this adapter's engine. use as a context manager to
+        count the SQL statements issued by a block of code
+        """
+        if not self.session_factory:
+            self.connect(test=False)
+
+        engine = None
+        if self.session_factory:
+            engine = self.session_factory.kw["bind"]
+        return QueryCounter(engine)
+
     # def session_ctx(self, sess=None, commit=True, rollback=True):
     #     """
     #     Make a new session context.
@@ -201,6 +215,7 @@ class DatabaseAdapter(Loggable):
     #         return SessionCTX(sess, parent=self, commit=commit, rollback=rollback)
 
     _session_cnt = 0
+    _commit_deferred = 0
 
     def session_ctx(self, use_parent_session=True):
         with self._session_lock:
@@ -365,16 +380,48 @@ host= {}\nurl= {}'.format(
         if self.session:
             self.session.expire_all()
 
+    @contextmanager
+    def deferred_commit(self, commit=True):
+        """
+        defer every commit until the block exits and commit once. used by bulk
+        inserts so a batch of rows is written in a single transaction.
+
+        the block is rolled back if it raises. with commit=False the caller commits,
+        e.g. to check the result of the commit
+        """
+        commit_on_add = self.commit_on_add
+        self.commit_on_add = False
+        self._commit_deferred += 1
+        try:
+            yield
+        except BaseException:
+            self.rollback()
+            raise
+        finally:
+            self._commit_deferred -= 1
+            if not self._commit_deferred:
+                self.commit_on_add = commit_on_add
+
+        if commit and not self._commit_deferred:
+            self.commit()
+
     def commit(self):
         """
-        commit the session
+        commit the session. return False if the commit failed and was rolled back
         """
+        if self._commit_deferred:
+            if self.session:
+                self.session.flush()
+            return True
+
         if self.session:
             try:
                 self.session.commit()
+                return True
             except BaseException as e:
                 self.warning("Commit exception: {}".format(e))
                 self.session.rollback()
+                return False
 
     def delete(self, obj):
         if self.session:
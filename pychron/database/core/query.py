@@ -17,7 +17,7 @@
 from datetime import datetime, timedelta
 
 import six
-from sqlalchemy import func, DateTime
+from sqlalchemy import event, func, DateTime
 
 # ============= standard library imports ========================
 from sqlalchemy.engine.default import DefaultDialect
@@ -47,6 +47,35 @@ def in_func(q, col, values):
     return q
 
 
+class QueryCounter(object):
+    """
+    context manager that counts the SQL statements executed on ``engine``. counts
+    nothing if ``engine`` is None
+
+    with QueryCounter(engine) as qc:
+        ...
+    print(qc.count)
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+        self.statements = []
+
+    def __enter__(self):
+        if self.engine is not None:
+            event.listen(self.engine, "before_cursor_execute", self._handle_execute)
+        return self
+
+    def __exit__(self, *args):
+        if self.engine is not None:
+            event.remove(self.engine, "before_cursor_execute", self._handle_execute)
+
+    def _handle_execute(self, conn, cursor, statement, *args):
+        self.count += 1
+        self.statements.append(statement)
+
+
 # ========================================================================
 # https://exceptionshub.com/sqlalchemy-print-the-actual-query.html
 class StringLiteral(SQLString):
@@ -55,6 +55,7 @@ ICFACTORS = "icfactors"
 INTERCEPTS = "intercepts"
 PEAKCENTER = "peakcenter"
 COSMOGENIC = "cosmogenic"
+PROFILE = "profile"
 
 HISTORY_PATHS = (None, DATA, BASELINES, BLANKS, ICFACTORS, INTERCEPTS, TAGS)
 
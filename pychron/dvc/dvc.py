@@ -17,6 +17,7 @@
 import os
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
@@ -84,6 +85,11 @@ from pychron.user.user import User
 
 HOST_WARNING_MESSAGE = "GitLab or GitHub or LocalGit plugin is required"
 
+FETCH_UP_TO_DATE = "up-to-date"
+FETCH_MERGE = "merge"
+FETCH_CLONE = "clone"
+FETCH_FAILED = "failed"
+
 
 @provides(IDatastore)
 class DVC(Loggable):
@@ -104,6 +110,7 @@ class DVC(Loggable):
     use_auto_pull = Bool(True)
     use_auto_push = Bool(False)
     use_default_commit_author = Bool(False)
+    sync_workers = Int(4)
 
     pulled_repositories = Set
     selected_repositories = List
@@ -1030,14 +1037,6 @@ class DVC(Loggable):
 
             records = nrecords
 
-        def func(xi, prog, i, n):
-            if prog:
-                prog.change_message("Syncing repository= {}".format(xi))
-            try:
-                self.sync_repo(xi, use_progress=False, pull_frequency=pull_frequency)
-            except BaseException:
-                pass
-
         bad_records = [r for r in records if r.repository_identifier is None]
         if bad_records:
             self.warning_dialog(
@@ -1057,11 +1056,18 @@ class DVC(Loggable):
 
         exps = {r.repository_identifier for r in records}
 
-        if use_progress:
-            progress_iterator(exps, func, threshold=1)
-        else:
-            for ei in exps:
-                self.sync_repo(ei, use_progress=False)
+        failed = self.sync_repos(
+            exps,
+            use_progress=use_progress,
+            pull_frequency=pull_frequency if use_progress else None,
+        )
+        if failed:
+            self.warning_dialog(
+                "Failed syncing repositories: {}. "
+                "Analyses will be loaded from the local copies".format(
+                    ", ".join(failed)
+                )
+            )
         try:
             branches = {ei: get_repository_branch(repository_path(ei)) for ei in exps}
         except NoSuchPathError:
@@ -1106,7 +1112,7 @@ class DVC(Loggable):
                         prod_levels = {}
 
                     if level not in flux_levels:
-                        flux_levels[level] = meta_repo.get_flux_positions(irrad, level)
+                        flux_levels[level] = meta_repo.get_level_index(irrad, level)
                         prod_levels[level] = meta_repo.get_production(irrad, level)
 
                     if irrad not in chronos:
@@ -1301,10 +1307,90 @@ class DVC(Loggable):
     def clear_pull_cache(self):
         self._pull_cache = {}
 
-    def sync_repo(self, name, use_progress=True, pull_frequency=None):
+    def sync_repos(self, names, use_progress=True, pull_frequency=None, progress=None):
+        """
+        sync ``names`` using at most ``sync_workers`` threads for the network work.
+
+        the workers only check the remote head (ls-remote) and fetch. merging, which
+        may prompt the user, and cloning, which may warn, are done serially on the
+        calling thread. repositories whose remote head has not changed are not pulled
+
+        return a list of the repositories that failed to sync
+        """
+        names = [ni for ni in names if not self._recently_pulled(ni, pull_frequency)]
+        if not names:
+            return []
+
+        prog = progress
+        if prog is None and use_progress and len(names) > 1:
+            prog = open_progress(len(names))
+
+        def fetch(name):
+            st = time.time()
+            try:
+                state = self._fetch_repo(name)
+            except Exception as e:
+                self.warning("failed fetching {}. {}".format(name, e))
+                state = FETCH_FAILED
+            return name, state, time.time() - st
+
+        st = time.time()
+        states = {}
+        canceled = False
+        nworkers = max(1, min(self.sync_workers, len(names)))
+        with ThreadPoolExecutor(max_workers=nworkers) as executor:
+            futures = [executor.submit(fetch, ni) for ni in names]
+            for fi in as_completed(futures):
+                name, state, et = fi.result()
+                states[name] = state
+                self.debug(
+                    "fetched repository {} state={} {:0.2f}s".format(name, state, et)
+                )
+                if prog:
+                    if prog.canceled:
+                        canceled = True
+                        for fj in futures:
+                            fj.cancel()
+                        break
+                    prog.change_message("Fetched repository= {}".format(name))
+
+        failed = []
+        if not canceled:
+            for name in names:
+                state = states.get(name)
+                if state in (FETCH_MERGE, FETCH_CLONE):
+                    if prog:
+                        prog.change_message("Syncing repository= {}".format(name))
+                    try:
+                        ok = self.sync_repo(name, use_progress=False, fetch=False)
+                    except Exception as e:
+                        self.warning("failed syncing {}. {}".format(name, e))
+                        ok = False
+                else:
+                    ok = state == FETCH_UP_TO_DATE
+
+                if not ok:
+                    failed.append(name)
+
+        if prog and progress is None:
+            prog.close()
+
+        if failed:
+            self.warning("failed syncing repositories: {}".format(",".join(failed)))
+
+        self.debug(
+            "synced {} repositories in {:0.2f}s workers={} canceled={}".format(
+                len(names), time.time() - st, nworkers, canceled
+            )
+        )
+        return failed
+
+    def sync_repo(self, name, use_progress=True, pull_frequency=None, fetch=True):
         """
         pull or clone an repo
 
+        if fetch is False merge the changes already fetched by ``_fetch_repo``
+
         """
         root = repository_path(name)
         exists = os.path.isdir(os.path.join(root, ".git"))
@@ -1315,23 +1401,16 @@ class DVC(Loggable):
         )
 
         if exists:
-            if pull_frequency:
-                now = datetime.now()
-                last_pull = self._pull_cache.get(name)
-                self._pull_cache[name] = now
-                args = (
-                    last_pull,
-                    (datetime.now() - last_pull).seconds,
-                    (datetime.now() - last_pull).seconds < pull_frequency,
-                )
-
-                self.debug(" ".join([str(a) for a in args]))
-
-                if last_pull and (datetime.now() - last_pull).seconds < pull_frequency:
-                    return True
+            if self._recently_pulled(name, pull_frequency):
+                return True
 
-            repo = self._get_repository(name)
-            repo.pull(use_progress=use_progress, use_auto_pull=self.use_auto_pull)
+            repo = self._get_repository(name, as_current=False)
+            repo.pull(
+                branch=self._get_sync_branch(repo),
+                use_progress=use_progress,
+                use_auto_pull=self.use_auto_pull,
+                fetch=fetch,
+            )
             return True
         else:
             self.debug("getting repository from remote")
@@ -1362,6 +1441,43 @@ class DVC(Loggable):
                         for ni in names:
                             self.debug("available repo== {}".format(ni))
 
+    def _recently_pulled(self, name, pull_frequency):
+        if not pull_frequency:
+            return False
+
+        now = datetime.now()
+        last_pull = self._pull_cache.get(name)
+        self._pull_cache[name] = now
+        if last_pull:
+            dt = (now - last_pull).seconds
+            self.debug("{} last pull={} dt={}".format(name, last_pull, dt))
+            return dt < pull_frequency
+
+    def _get_sync_branch(self, repo):
+        try:
+            return repo.get_current_branch()
+        except TypeError:
+            # detached head
+            return "master"
+
+    def _fetch_repo(self, name):
+        """
+        network half of a sync. called from worker threads so it must not open dialogs
+
+        return FETCH_CLONE if the repository does not exist locally, FETCH_UP_TO_DATE
+        if the remote head has not changed, otherwise fetch and return FETCH_MERGE
+        """
+        root = repository_path(name)
+        if not os.path.isdir(os.path.join(root, ".git")):
+            return FETCH_CLONE
+
+        repo = self._get_repository(name, as_current=False)
+        if not repo.remote_changed(branch=self._get_sync_branch(repo)):
+            return FETCH_UP_TO_DATE
+
+        repo.fetch(handled=False)
+        return FETCH_MERGE
+
     def rollback_repository(self, expid):
         repo = self._get_repository(expid)
 
@@ -2283,6 +2399,7 @@ class DVC(Loggable):
         )
         bind_preference(self, "use_auto_pull", "{}.use_auto_pull".format(prefid))
         bind_preference(self, "use_auto_push", "{}.use_auto_push".format(prefid))
+        bind_preference(self, "sync_workers", "{}.sync_workers".format(prefid))
         bind_preference(
             self,
             "use_default_commit_author",
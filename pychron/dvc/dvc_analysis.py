@@ -36,6 +36,7 @@ from pychron.dvc import (
     ICFACTORS,
     PEAKCENTER,
     COSMOGENIC,
+    PROFILE,
 )
 from pychron.dvc import (
     dvc_dump,
@@ -50,6 +51,7 @@ from pychron.dvc import (
 from pychron.experiment.utilities.environmentals import set_environmentals
 from pychron.experiment.utilities.runid import make_aliquot_step, make_step
 from pychron.processing.analyses.analysis import Analysis
+from pychron.processing.decay_factors import decay_factor_cache, chron_segments
 from pychron.processing.isotope import Isotope
 from pychron.pychron_constants import (
     INTERFERENCE_KEYS,
@@ -352,31 +354,26 @@ class DVCAnalysis(Analysis):
 
     def set_chronology(self, chron):
         analts = self.rundate
-
-        def convert_days(x):
-            return x.total_seconds() / (60.0 * 60 * 24)
-
         doses = chron.get_doses()
+        use_endtime = chron.use_irradiation_endtime
 
-        def calc_ti(st, en):
-            t = st
-            if chron.use_irradiation_endtime:
-                t = en
-            return convert_days(analts - t)
-
-        segments = [
-            (pwr, convert_days(en - st), calc_ti(st, en), st, en)
-            for pwr, st, en in doses
-            if st is not None and en is not None
-        ]
         d_o = 0
         if doses:
             d_o = doses[0][1]
         self.irradiation_time = time.mktime(d_o.timetuple()) if d_o else 0
 
-        self.chron_segments = segments
-        # self.chron_dosages = doses
-        self.calculate_decay_factors()
+        self.chron_segments = chron_segments(doses, analts, use_endtime)
+
+        arc = self.arar_constants
+        a37df, a39df = decay_factor_cache.decay_factors(
+            doses,
+            analts,
+            nominal_value(arc.lambda_Ar37),
+            nominal_value(arc.lambda_Ar39),
+            use_endtime,
+        )
+        self.ar37decayfactor = a37df
+        self.ar39decayfactor = a39df
 
     def set_fits(self, fitobjs):
         isos = self.isotopes
@@ -409,7 +406,7 @@ class DVCAnalysis(Analysis):
         nsignals = []
         nsniffs = []
 
-        for (new, existing) in ((nsignals, "signals"), (nsniffs, "sniffs")):
+        for new, existing in ((nsignals, "signals"), (nsniffs, "sniffs")):
             for sig in jd[existing]:
                 key = sig["isotope"]
                 if key in keys:
@@ -742,6 +739,11 @@ class DVCAnalysis(Analysis):
         for k, v in isos.items():
             v.mass = masses.get(k, 0)
 
+    def load_measurement_profiles(self):
+        path = self._analysis_path(modifier=PROFILE)
+        if path and os.path.isfile(path):
+            return dvc_load(path)
+
     def _dump(self, obj, path=None, modifier=None):
         if path is None:
             path = self._analysis_path(modifier)
@@ -18,6 +18,7 @@ from datetime import timedelta, datetime
 from string import digits, ascii_letters
 
 from sqlalchemy import not_, func, distinct, or_, and_
+from sqlalchemy.orm import joinedload, lazyload, selectinload
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.sql.functions import count
 from sqlalchemy.util import OrderedSet
@@ -84,6 +85,52 @@ def listify(obj):
     return obj
 
 
+def labnumber_browser_options(path=None):
+    """
+    loader options that fetch everything LabnumberRecordView reads from an irradiation
+    position with one SELECT ... IN per relationship instead of queries per position.
+
+    path: loader option leading to IrradiationPositionTbl or None if
+    IrradiationPositionTbl is the queried entity
+
+    the reverse collections (e.g. Level.positions) are configured lazy="joined" and are
+    not needed by the browser so they are not loaded here
+    """
+    if path is None:
+        sample = selectinload(IrradiationPositionTbl.sample)
+        level = selectinload(IrradiationPositionTbl.level)
+    else:
+        sample = path.selectinload(IrradiationPositionTbl.sample)
+        level = path.selectinload(IrradiationPositionTbl.level)
+
+    return [
+        sample.lazyload(SampleTbl.positions),
+        sample.undefer(SampleTbl.lithology),
+        sample.undefer(SampleTbl.location),
+        sample.undefer(SampleTbl.elevation),
+        sample.selectinload(SampleTbl.material),
+        sample.selectinload(SampleTbl.project).selectinload(
+            ProjectTbl.principal_investigator
+        ),
+        level.lazyload(LevelTbl.positions),
+        level.selectinload(LevelTbl.irradiation).lazyload(IrradiationTbl.levels),
+    ]
+
+
+def analysis_browser_options():
+    """
+    loader options that fetch everything AnalysisTbl.bind and the analysis table read
+    (position, level, irradiation, sample, project, material, load) in a fixed number of
+    set based queries regardless of the number of analyses
+    """
+    pos = joinedload(AnalysisTbl.irradiation_position)
+    return labnumber_browser_options(pos) + [
+        selectinload(AnalysisTbl.measured_positions).selectinload(
+            MeasuredPositionTbl.load
+        ),
+    ]
+
+
 def make_filter(qq, table, col="value"):
     comp = qq.comparator
     v = qq.criterion
@@ -1457,6 +1504,29 @@ class DVCDatabase(DatabaseAdapter):
             q = q.filter(IrradiationPositionTbl.identifier == idn)
             return self._query_one(q)
 
+    def get_analysis_steps(self, identifiers, chunk=500):
+        """
+        return {identifier: [(aliquot, increment), ...]} for every analysis of the given
+        identifiers. one query per chunk of identifiers instead of one per run
+        """
+        identifiers = list(identifiers)
+        steps = {}
+        with self.session_ctx() as sess:
+            for i in range(0, len(identifiers), chunk):
+                q = sess.query(
+                    IrradiationPositionTbl.identifier,
+                    AnalysisTbl.aliquot,
+                    AnalysisTbl.increment,
+                )
+                q = q.select_from(AnalysisTbl)
+                q = q.join(IrradiationPositionTbl)
+                q = q.filter(
+                    IrradiationPositionTbl.identifier.in_(identifiers[i : i + chunk])
+                )
+                for idn, aliquot, increment in self._query_all(q, verbose_query=False):
+                    steps.setdefault(idn, []).append((aliquot, increment))
+        return steps
+
     def get_analysis_by_attr(self, **kw):
         with self.session_ctx() as sess:
             q = sess.query(AnalysisTbl)
@@ -1532,10 +1602,16 @@ class DVCDatabase(DatabaseAdapter):
         order="asc",
         limit=None,
         verbose_query=True,
+        eager=False,
     ):
-
+        """
+        eager: load the related records needed by the browser up front. see
+            analysis_browser_options
+        """
         with self.session_ctx() as sess:
             q = sess.query(AnalysisTbl)
+            if eager:
+                q = q.options(*analysis_browser_options())
             q = q.join(IrradiationPositionTbl)
             if omit_key or not include_invalid:
                 q = q.join(AnalysisChangeTbl)
@@ -1607,7 +1683,12 @@ class DVCDatabase(DatabaseAdapter):
         exclude_uuids=None,
         exclude_invalid=True,
         verbose=True,
+        eager=False,
     ):
+        """
+        eager: load the related records needed by the browser up front. see
+            analysis_browser_options
+        """
         if verbose:
             self.debug("------get analyses by date range parameters------")
             self.debug("low={}".format(lpost))
@@ -1623,6 +1704,8 @@ class DVCDatabase(DatabaseAdapter):
 
         with self.session_ctx() as sess:
             q = sess.query(AnalysisTbl)
+            if eager:
+                q = q.options(*analysis_browser_options())
             if exclude_invalid:
                 q = q.join(AnalysisChangeTbl)
             if labnumber:
@@ -1850,6 +1933,7 @@ class DVCDatabase(DatabaseAdapter):
                 if res:
                     ids = [r[0] for r in res]
                     q = sess.query(IrradiationPositionTbl)
+                    q = q.options(*labnumber_browser_options())
                     q = q.filter(IrradiationPositionTbl.id.in_(ids))
                     return self._query_all(q, verbose_query=False)
 
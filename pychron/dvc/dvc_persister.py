@@ -30,7 +30,17 @@ from yaml import YAMLError
 
 from pychron.core.helpers.binpack import encode_blob, pack
 from pychron.core.yaml import yload
-from pychron.dvc import dvc_dump, analysis_path, repository_path, NPATH_MODIFIERS
+from pychron.dvc import (
+    dvc_dump,
+    analysis_path,
+    repository_path,
+    NPATH_MODIFIERS,
+    INTERCEPTS,
+    BASELINES,
+    BLANKS,
+    ICFACTORS,
+    PROFILE,
+)
 from pychron.experiment.automated_run.persistence import BasePersister
 from pychron.git_archive.repo_manager import GitRepoManager
 from pychron.paths import paths
@@ -109,6 +119,40 @@ class DVCPersister(BasePersister):
         # push commit
         self.dvc.meta_push()
 
+    def get_analysis_paths(self):
+        """
+        return the files written for the current per_spec
+        """
+        ar = self.active_repository
+        ps = [os.path.join(ar.path, "{}.json".format(self._get_spectrometer_sha()))]
+        ps.extend(
+            self._make_path(modifier=m)
+            for m in NPATH_MODIFIERS
+            + (INTERCEPTS, BASELINES, BLANKS, ICFACTORS, PROFILE)
+        )
+        return [p for p in ps if os.path.isfile(p)]
+
+    def commit_batch(self, paths, commit_tag, n):
+        """
+        stage and commit the files of n analyses saved with commit=False as a single
+        repository commit and a single meta repository commit
+        """
+        if not self.stage_files or not paths:
+            return
+
+        ar = self.active_repository
+        dvc = self.dvc
+        try:
+            ar.smart_pull(accept_their=True)
+            ar.add_paths_explicit(paths)
+            ar.commit("<{}> {} analyses".format(commit_tag, n))
+
+            dvc.meta_pull(accept_our=True)
+            dvc.meta_commit("repo updated for {} analyses".format(n))
+            return True
+        except GitCommandError as e:
+            self.warning(e)
+
     def initialize(self, repository, pull=True):
         """
         setup git repos.
@@ -278,6 +322,9 @@ class DVCPersister(BasePersister):
         # save peak center
         self._save_peak_center(self.per_spec.peak_center)
 
+        # save measurement profile
+        self._save_profile(self.per_spec.measurement_profiles)
+
         # stage files
         dvc = self.dvc
 
@@ -288,7 +335,10 @@ class DVCPersister(BasePersister):
 
                     paths = [
                         spec_path,
-                    ] + [self._make_path(modifier=m) for m in NPATH_MODIFIERS]
+                    ] + [
+                        self._make_path(modifier=m)
+                        for m in NPATH_MODIFIERS + (PROFILE,)
+                    ]
 
                     for p in paths:
                         if os.path.isfile(p):
@@ -826,6 +876,11 @@ class DVCPersister(BasePersister):
 
             dvc_dump(obj, p)
 
+    def _save_profile(self, profiles):
+        if profiles:
+            p = self._make_path(modifier=PROFILE)
+            dvc_dump(profiles, p)
+
     def _make_path(self, modifier=None, extension=".json"):
         runid = self.per_spec.run_spec.runid
         uuid = self.per_spec.run_spec.uuid
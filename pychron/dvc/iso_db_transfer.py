@@ -20,7 +20,9 @@ from __future__ import print_function
 
 import json
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from itertools import groupby
 
@@ -35,6 +37,7 @@ from pychron.database.records.isotope_record import IsotopeRecordView
 from pychron.dvc import dvc_dump
 from pychron.dvc.dvc import DVC
 from pychron.dvc.dvc_persister import DVCPersister, format_repository_identifier
+from pychron.dvc.transfer_checkpoint import TransferCheckpoint, TransferStats, pages
 from pychron.dvc.pychrondata_transfer_helpers import (
     get_irradiation_timestamps,
     get_project_timestamps,
@@ -55,6 +58,10 @@ from pychron.pychron_constants import QTEGRA_SOURCE_KEYS
 
 ORG = "NMGRLData"
 
+TRANSFERRED = "transferred"
+SKIPPED = "skipped"
+FAILED = "failed"
+
 
 def create_github_repo(name):
     org = Organization(ORG)
@@ -75,6 +82,25 @@ class IsoDBTransfer(Loggable):
 
     quiet = False
 
+    # analyses are fetched from the source and unpacked by nworkers threads, each
+    # with its own source connection. destination rows are written in
+    # transactions of batch_size analyses. existing analyses are looked up once
+    # per page of runs
+    nworkers = 4
+    batch_size = 50
+    page_size = 500
+
+    _src_conn = None
+    _local = None
+    _dest_lock = None
+    _resolved = None
+
+    def __init__(self, *args, **kw):
+        super(IsoDBTransfer, self).__init__(*args, **kw)
+        self._local = threading.local()
+        self._dest_lock = threading.RLock()
+        self._resolved = set()
+
     def init(self):
         conn = dict(
             host=os.environ.get("ARGONSERVER_HOST"),
@@ -128,6 +154,7 @@ class IsoDBTransfer(Loggable):
         src = proc.db
         src.connect()
         self.processor = proc
+        self._src_conn = conn
 
     def copy_productions(self):
         src = self.processor.db
@@ -409,54 +436,177 @@ class IsoDBTransfer(Loggable):
         creator,
         create_repo=False,
         monitor_mapping=None,
+        checkpoint=None,
     ):
+        """
+        transfer runs to the destination.
 
-        # self._init_src_dest()
-        src = self.processor.db
+        checkpoint is the path of a file recording the finished runs. an interrupted
+        export run again with the same checkpoint only transfers the remaining runs
+
+        return the TransferStats
+        """
         dest = self.dvc.db
 
-        with src.session_ctx():
+        def key(x):
+            return x.split("-")[0]
 
-            def key(x):
-                return x.split("-")[0]
+        ckpt = TransferCheckpoint(checkpoint)
+        runs = ckpt.pending(sorted(runs, key=key))
 
-            runs = sorted(runs, key=key)
-            with dest.session_ctx():
-                repo = self._add_repository(
-                    dest, repository_identifier, creator, create_repo
-                )
+        with dest.session_ctx():
+            repo = self._add_repository(
+                dest, repository_identifier, creator, create_repo
+            )
 
-            self.persister.active_repository = repo
-            self.dvc.current_repository = repo
-
-            total = len(runs)
-            j = 0
-
-            for ln, ans in groupby(runs, key=key):
-                ans = list(ans)
-                n = len(ans)
-                for i, a in enumerate(ans):
-                    with dest.session_ctx() as sess:
-                        st = time.time()
-                        try:
-                            if self._transfer_analysis(
-                                a,
-                                repository_identifier,
-                                monitor_mapping=monitor_mapping,
-                            ):
-                                j += 1
-                                self.debug(
-                                    "{}/{} transfer time {:0.3f}".format(
-                                        j, total, time.time() - st
-                                    )
-                                )
-                        except BaseException as e:
-                            import traceback
-
-                            traceback.print_exc()
-                            self.warning("failed transfering {}. {}".format(a, e))
+        self.persister.active_repository = repo
+        self.dvc.current_repository = repo
+
+        stats = TransferStats(len(runs))
+        self.info("transferring {} runs".format(len(runs)))
+        nworkers = max(1, min(self.nworkers, len(runs)))
+        with ThreadPoolExecutor(max_workers=nworkers) as executor:
+            for page in pages(runs, self.page_size):
+                existing = self._get_existing(dest, page)
+                for batch in pages(page, self.batch_size):
+                    self._transfer_batch(
+                        executor,
+                        batch,
+                        repository_identifier,
+                        monitor_mapping,
+                        existing,
+                        ckpt,
+                        stats,
+                    )
+                    self.info(stats.report())
+
+        return stats
 
     # private
+    def _transfer_batch(
+        self, executor, batch, exp, monitor_mapping, existing, ckpt, stats
+    ):
+        """
+        transfer a batch of runs in one destination transaction and record the
+        finished runs in the checkpoint once the transaction is committed
+        """
+        dest = self.dvc.db
+
+        def transfer(rec):
+            st = time.time()
+            try:
+                ret = self._transfer_analysis(
+                    rec, exp, monitor_mapping=monitor_mapping, existing=existing
+                )
+            except BaseException as e:
+                self.debug_exception()
+                self.warning("failed transfering {}. {}".format(rec, e))
+                return FAILED, str(e)
+
+            if ret is None:
+                return FAILED, "invalid runid"
+            elif ret:
+                self.debug("{} transfer time {:0.3f}".format(rec, time.time() - st))
+                return TRANSFERRED, None
+            return SKIPPED, None
+
+        with dest.session_ctx():
+            with dest.deferred_commit(commit=False):
+                results = list(executor.map(transfer, batch))
+            committed = dest.commit()
+
+        if not committed:
+            # the rolled back rows have to be looked up again
+            self._resolved.clear()
+
+        ntransferred = nskipped = 0
+        done, failed = [], {}
+        for rec, (state, err) in zip(batch, results):
+            if state == FAILED:
+                failed[rec] = err
+            elif not committed:
+                failed[rec] = "destination commit failed"
+            else:
+                done.append(rec)
+                if state == TRANSFERRED:
+                    ntransferred += 1
+                else:
+                    nskipped += 1
+
+        ckpt.add(done, failed)
+        stats.update(transferred=ntransferred, skipped=nskipped, failed=len(failed))
+
+    def _get_existing(self, dest, runs):
+        """
+        return the aliquots and increments of the destination analyses of every
+        identifier in runs
+        """
+        idns = set()
+        for rec in runs:
+            args = self._parse_runid(rec)
+            if args:
+                idns.add(args[0])
+        with dest.session_ctx():
+            return dest.get_analysis_steps(idns)
+
+    def _analysis_exists(self, dest, idn, aliquot, step, existing=None):
+        """
+        same matching as DVCDatabase.get_analysis_runid
+        """
+        if existing is None:
+            return dest.get_analysis_runid(idn, aliquot, step)
+
+        inc = alpha_to_int(step) if step else None
+        for al, i in existing.get(idn, ()):
+            if al == int(aliquot) and (inc is None or i == inc):
+                return True
+
+    def _get_processor(self):
+        """
+        return the source database manager of the calling thread. database sessions
+        can not be shared between threads
+        """
+        if self.nworkers <= 1 or self._src_conn is None:
+            return self.processor
+
+        proc = getattr(self._local, "processor", None)
+        if proc is None:
+            proc = IsotopeDatabaseManager(bind=False, connect=False)
+            proc.db.trait_set(**self._src_conn)
+            proc.db.connect()
+            self._local.processor = proc
+        return proc
+
+    def _resolve(self, key, func):
+        """
+        call func once per transfer for each key
+        """
+        if key not in self._resolved:
+            func()
+            self._resolved.add(key)
+
+    def _parse_runid(self, rec):
+        m = IDENTIFIER_REGEX.match(rec)
+        if not m:
+            m = SPECIAL_IDENTIFIER_REGEX.match(rec)
+
+        if not m:
+            return
+
+        idn = m.group("identifier")
+        aliquot = m.group("aliquot")
+        try:
+            step = m.group("step") or None
+        except IndexError:
+            step = None
+
+        if idn == "4359":
+            idn = "c-01-j"
+        elif idn == "4358":
+            idn = "c-01-o"
+
+        return idn, aliquot, step
+
     def _get_project_timestamps(self, project, mass_spectrometer, tol_hrs=6):
         src = self.processor.db
         return get_project_timestamps(src, project, mass_spectrometer, tol_hrs)
@@ -658,61 +808,52 @@ class IsoDBTransfer(Loggable):
 
         dest.commit()
 
-    def _transfer_analysis(self, rec, exp, overwrite=True, monitor_mapping=None):
+    def _transfer_analysis(
+        self, rec, exp, overwrite=True, monitor_mapping=None, existing=None
+    ):
+        """
+        return True if transferred, False if the analysis already exists and None if
+        rec is not a valid runid
+        """
         dest = self.dvc.db
-        proc = self.processor
-        src = proc.db
-
-        # args = rec.split('-')
-        # idn = '-'.join(args[:-1])
-        # t = args[-1]
-        # try:
-        #     aliquot = int(t)
-        #     step = None
-        # except ValueError:
-        #     aliquot = int(t[:-1])
-        #     step = t[-1]
-        m = IDENTIFIER_REGEX.match(rec)
-        if not m:
-            m = SPECIAL_IDENTIFIER_REGEX.match(rec)
 
-        if not m:
+        args = self._parse_runid(rec)
+        if not args:
             self.warning("invalid runid {}".format(rec))
             return
-        else:
-            idn = m.group("identifier")
-            aliquot = m.group("aliquot")
-            try:
-                step = m.group("step") or None
-            except IndexError:
-                step = None
 
-        if idn == "4359":
-            idn = "c-01-j"
-        elif idn == "4358":
-            idn = "c-01-o"
+        idn, aliquot, step = args
 
         # check if analysis already exists. skip if it does
-        if dest.get_analysis_runid(idn, aliquot, step):
+        if self._analysis_exists(dest, idn, aliquot, step, existing):
             self.warning("{} already exists".format(make_runid(idn, aliquot, step)))
-            return
+            return False
 
-        dban = src.get_analysis_runid(idn, aliquot, step)
-        iv = IsotopeRecordView()
-        iv.uuid = dban.uuid
+        proc = self._get_processor()
+        with proc.db.session_ctx():
+            dban = proc.db.get_analysis_runid(idn, aliquot, step)
+            iv = IsotopeRecordView()
+            iv.uuid = dban.uuid
 
-        self.debug(
-            "make analysis idn:{}, aliquot:{} step:{}".format(idn, aliquot, step)
-        )
-        # try:
-        an = proc.make_analysis(iv, unpack=True, use_cache=False, use_progress=False)
-        # except BaseException as e:
-        #     self.warning('Failed to make {}'.format(make_runid(idn, aliquot, step)))
-        #     self.warning('exception: {}'.format(e))
-        #     return
+            self.debug(
+                "make analysis idn:{}, aliquot:{} step:{}".format(idn, aliquot, step)
+            )
+            an = proc.make_analysis(
+                iv, unpack=True, use_cache=False, use_progress=False
+            )
 
-        self._transfer_meta(dest, dban, monitor_mapping)
-        # return
+            # the destination session and the persister are shared by all workers
+            with self._dest_lock:
+                with dest.session_ctx():
+                    return self._save_analysis(
+                        dest, dban, an, idn, aliquot, step, exp, monitor_mapping
+                    )
+
+    def _save_analysis(self, dest, dban, an, idn, aliquot, step, exp, monitor_mapping):
+        self._resolve(
+            ("meta", dban.labnumber.identifier),
+            lambda: self._transfer_meta(dest, dban, monitor_mapping),
+        )
 
         dblab = dban.labnumber
 
@@ -728,19 +869,26 @@ class IsoDBTransfer(Loggable):
 
         extraction = dban.extraction
         ms = dban.measurement.mass_spectrometer.name
-        if not dest.get_mass_spectrometer(ms):
-            self.debug("adding mass spectrometer {}".format(ms))
-            dest.add_mass_spectrometer(ms)
-            dest.commit()
+
+        def add_ms():
+            if not dest.get_mass_spectrometer(ms):
+                self.debug("adding mass spectrometer {}".format(ms))
+                dest.add_mass_spectrometer(ms)
+                dest.commit()
+
+        self._resolve(("ms", ms), add_ms)
 
         ed = extraction.extraction_device.name if extraction.extraction_device else None
         if not ed:
             ed = "No Extract Device"
 
-        if not dest.get_extraction_device(ed):
-            self.debug("adding extract device {}".format(ed))
-            dest.add_extraction_device(ed)
-            dest.commit()
+        def add_ed():
+            if not dest.get_extraction_device(ed):
+                self.debug("adding extract device {}".format(ed))
+                dest.add_extraction_device(ed)
+                dest.commit()
+
+        self._resolve(("ed", ed), add_ed)
 
         if step is None:
             inc = -1
@@ -750,10 +898,14 @@ class IsoDBTransfer(Loggable):
         username = ""
         if dban.user:
             username = dban.user.name
-            if not dest.get_user(username):
-                self.debug("adding user. username:{}".format(username))
-                dest.add_user(username)
-                dest.commit()
+
+            def add_user():
+                if not dest.get_user(username):
+                    self.debug("adding user. username:{}".format(username))
+                    dest.add_user(username)
+                    dest.commit()
+
+            self._resolve(("user", username), add_user)
 
         if monitor_mapping:
             sample_name, material_name, project_name = monitor_mapping
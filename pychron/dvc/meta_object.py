@@ -295,6 +295,43 @@ class IrradiationGeometry(BaseGeometry):
     pass
 
 
+class LevelIndex(MetaObject):
+    """
+    an irradiation level file with its positions indexed by hole number
+    """
+
+    z = 0
+    positions = None
+
+    def __init__(self, *args, **kw):
+        self.positions = []
+        self._index = {}
+        super(LevelIndex, self).__init__(*args, **kw)
+
+    def _load_hook(self, path, rfile):
+        try:
+            obj = json.load(rfile)
+        except ValueError as e:
+            print("level index load exception. error: {}, {}".format(e, path))
+            obj = {}
+
+        if isinstance(obj, list):
+            positions = obj
+        else:
+            positions = obj.get("positions", [])
+            self.z = obj.get("z", 0)
+
+        index = {}
+        for p in positions:
+            index.setdefault(p["position"], p)
+
+        self.positions = positions
+        self._index = index
+
+    def get_position(self, position):
+        return self._index.get(position)
+
+
 class Cached(object):
     def __init__(self, clear=None):
         self.clear = clear
@@ -17,7 +17,7 @@ import os
 import shutil
 from datetime import datetime
 
-from traits.api import Bool
+from traits.api import Bool, Dict
 from uncertainties import ufloat
 
 from pychron.core.helpers.datetime_tools import ISO_FORMAT_STR
@@ -35,6 +35,7 @@ from pychron.dvc.meta_object import (
     Gains,
     LoadGeometry,
     MetaObjectException,
+    LevelIndex,
 )
 from pychron.git_archive.repo_manager import GitRepoManager
 from pychron.paths import paths, r_mkdir
@@ -46,7 +47,6 @@ from pychron.pychron_constants import (
     NULL_STR,
 )
 
-
 # ============= enthought library imports =======================
 
 
@@ -112,6 +112,8 @@ def get_frozen_flux(repo, irradiation):
 
 class MetaRepo(GitRepoManager):
     clear_cache = Bool
+    # path: ((mtime, size), parsed object)
+    _meta_cache = Dict
 
     def get_correlation_ellipses(self):
         p = os.path.join(paths.meta_root, "correlation_ellipses.json")
@@ -167,7 +169,7 @@ class MetaRepo(GitRepoManager):
         self, irradiation, level, monitor_name, monitor_material, monitor_age, lambda_k
     ):
         obj, path = self.get_level_obj(irradiation, level)
-        positions = self._get_level_positions(irradiation, level)
+        positions = obj.get("positions", [])
 
         options = {
             "monitor_name": monitor_name,
@@ -181,7 +183,7 @@ class MetaRepo(GitRepoManager):
 
         obj["positions"] = positions
 
-        dvc_dump(obj, path)
+        self._dump(obj, path)
         self.add(path)
 
     def add_production_to_irradiation(
@@ -200,6 +202,7 @@ class MetaRepo(GitRepoManager):
             prod.update(params)
 
         prod.dump()
+        self.clear_meta_cache(p)
         if add:
             self.add(p, commit=commit)
 
@@ -226,6 +229,7 @@ class MetaRepo(GitRepoManager):
             setattr(p, ke, e)
 
         p.dump()
+        self.clear_meta_cache(p.path)
         if add:
             self.add(p.path, commit=commit)
 
@@ -257,13 +261,13 @@ class MetaRepo(GitRepoManager):
                     )
                 )
                 obj[level] = production
-                dvc_dump(obj, p)
+                self._dump(obj, p)
 
                 if add:
                     self.add(p, commit=False)
         else:
             obj[level] = production
-            dvc_dump(obj, p)
+            self._dump(obj, p)
             if add:
                 self.add(p, commit=False)
 
@@ -271,14 +275,13 @@ class MetaRepo(GitRepoManager):
         # p = self.get_level_path(irradiation, level)
         # jd = dvc_load(p)
         jd, p = self.get_level_obj(irradiation, level)
-        positions = self._get_level_positions(irradiation, level)
+        positions = jd if isinstance(jd, list) else jd.get("positions", [])
 
         d = next((p for p in positions if p["position"] == pos), None)
         if d:
             d["identifier"] = identifier
-            jd["positions"] = positions
 
-        dvc_dump(jd, p)
+        self._dump(jd, p)
         self.add(p, commit=False)
 
     def get_level_path(self, irrad, level):
@@ -287,7 +290,7 @@ class MetaRepo(GitRepoManager):
     def add_level(self, irrad, level, add=True):
         p = self.get_level_path(irrad, level)
         lv = dict(z=0, positions=[])
-        dvc_dump(lv, p)
+        self._dump(lv, p)
         if add:
             self.add(p, commit=False)
 
@@ -295,6 +298,7 @@ class MetaRepo(GitRepoManager):
         p = os.path.join(paths.meta_root, irrad, "chronology.txt")
 
         dump_chronology(p, doses)
+        self.clear_meta_cache(p)
         if add:
             self.add(p, commit=False)
 
@@ -317,7 +321,7 @@ class MetaRepo(GitRepoManager):
         if pd is None:
             positions.append({"position": pos, "decay_constants": {}})
 
-        dvc_dump({"z": z, "positions": positions}, p)
+        self._dump({"z": z, "positions": positions}, p)
         if add:
             self.add(p, commit=False)
 
@@ -394,7 +398,7 @@ class MetaRepo(GitRepoManager):
             obj = {"z": z, "positions": obj}
             add = True
 
-        dvc_dump(obj, p)
+        self._dump(obj, p)
         if add:
             self.add(p, commit=False)
 
@@ -413,13 +417,13 @@ class MetaRepo(GitRepoManager):
 
             npositions = [ji for ji in positions if not ji["position"] == hole]
             obj = {"z": z, "positions": npositions}
-            dvc_dump(obj, p)
+            self._dump(obj, p)
             self.add(p, commit=False)
 
     def new_flux_positions(self, irradiation, level, positions, add=True):
         p = self.get_level_path(irradiation, level)
         obj = {"positions": positions, "z": 0}
-        dvc_dump(obj, p)
+        self._dump(obj, p)
         if add:
             self.add(p, commit=False)
 
@@ -438,7 +442,7 @@ class MetaRepo(GitRepoManager):
                 ip["j"] = j
                 ip["j_err"] = e
 
-            dvc_dump(jd, p)
+            self._dump(jd, p)
             if add:
                 self.add(p, commit=False)
 
@@ -522,7 +526,7 @@ class MetaRepo(GitRepoManager):
 
         obj = {"z": z, "positions": npositions}
         if dump:
-            dvc_dump(obj, p)
+            self._dump(obj, p)
         else:
             jd["z"] = z
             jd["positions"] = npositions
@@ -533,6 +537,7 @@ class MetaRepo(GitRepoManager):
     def update_chronology(self, name, doses):
         p = os.path.join(paths.meta_root, name, "chronology.txt")
         dump_chronology(p, doses)
+        self.clear_meta_cache(p)
 
         self.add(p, commit=False)
 
@@ -582,6 +587,10 @@ class MetaRepo(GitRepoManager):
         return cs
 
     def get_flux_positions(self, irradiation, level):
+        """
+        the positions are shared with the level index, treat them as read only. use
+        get_level_obj to edit a level
+        """
         positions = self._get_level_positions(irradiation, level)
         return positions
 
@@ -589,42 +598,57 @@ class MetaRepo(GitRepoManager):
         p = self.get_level_path(irradiation, level)
         return dvc_load(p), p
 
+    def get_level_index(self, irradiation, level):
+        """
+        the parsed level file, reloaded when the file changes
+        """
+        p = self.get_level_path(irradiation, level)
+        return self._get_cached(p, lambda: LevelIndex(p, allow_null=True))
+
     def get_flux(self, irradiation, level, position):
-        positions = self.get_flux_positions(irradiation, level)
-        return self.get_flux_from_positions(position, positions)
+        index = self.get_level_index(irradiation, level)
+        return self.get_flux_from_positions(position, index)
 
     def get_flux_from_positions(self, position, positions):
+        """
+        positions: a LevelIndex or a list of position dicts
+        """
         j, je, pe, lambda_k = 0, 0, 0, None
         monitor_name, monitor_material, monitor_age = (
             DEFAULT_MONITOR_NAME,
             "sanidine",
             ufloat(28.201, 0),
         )
-        if positions:
+        if isinstance(positions, LevelIndex):
+            pos = positions.get_position(position)
+        elif positions:
             pos = next((p for p in positions if p["position"] == position), None)
-            if pos:
-                j, je, pe = (
-                    pos.get("j", 0),
-                    pos.get("j_err", 0),
-                    pos.get("position_jerr", 0),
-                )
-                dc = pos.get("decay_constants")
-                if dc:
-                    # this was a temporary fix and likely can be removed
-                    if isinstance(dc, float):
-                        v, e = dc, 0
-                    else:
-                        v, e = dc.get("lambda_k_total", 0), dc.get(
-                            "lambda_k_total_error", 0
-                        )
-                    lambda_k = ufloat(v, e)
-                mon = pos.get("monitor")
-                if mon:
-                    monitor_name = mon.get("name", DEFAULT_MONITOR_NAME)
-                    sa = mon.get("age", 28.201)
-                    se = mon.get("error", 0)
-                    monitor_age = ufloat(sa, se, tag="monitor_age")
-                    monitor_material = mon.get("material", "sanidine")
+        else:
+            pos = None
+
+        if pos:
+            j, je, pe = (
+                pos.get("j", 0),
+                pos.get("j_err", 0),
+                pos.get("position_jerr", 0),
+            )
+            dc = pos.get("decay_constants")
+            if dc:
+                # this was a temporary fix and likely can be removed
+                if isinstance(dc, float):
+                    v, e = dc, 0
+                else:
+                    v, e = dc.get("lambda_k_total", 0), dc.get(
+                        "lambda_k_total_error", 0
+                    )
+                lambda_k = ufloat(v, e)
+            mon = pos.get("monitor")
+            if mon:
+                monitor_name = mon.get("name", DEFAULT_MONITOR_NAME)
+                sa = mon.get("age", 28.201)
+                se = mon.get("error", 0)
+                monitor_age = ufloat(sa, se, tag="monitor_age")
+                monitor_material = mon.get("material", "sanidine")
 
         fd = {
             "j": ufloat(j, je, tag="J"),
@@ -685,25 +709,33 @@ class MetaRepo(GitRepoManager):
         p = gain_path(name)
         return Gains(p)
 
-    # @cached('clear_cache')
-    def get_production(self, irrad, level, allow_null=False, **kw):
+    def get_production(self, irrad, level, allow_null=False, force=False, **kw):
+        """
+        productions are shared between calls and reloaded when their files change.
+        use force=True to get a new Production
+        """
         path = os.path.join(paths.meta_root, irrad, "productions.json")
-        obj = dvc_load(path)
+        obj = self._get_cached(path, lambda: dvc_load(path))
 
         pname = obj.get(level, "")
         p = os.path.join(
             paths.meta_root, irrad, "productions", add_extension(pname, ext=".json")
         )
 
-        ip = Production(p, allow_null=allow_null)
+        if force:
+            ip = Production(p, allow_null=allow_null)
+        else:
+            ip = self._get_cached(p, lambda: Production(p, allow_null=allow_null))
         # print 'new production id={}, name={}, irrad={}, level={}'.format(id(ip), pname, irrad, level)
         return pname, ip
 
-    # @cached('clear_cache')
     def get_chronology(self, name, allow_null=False, **kw):
+        """
+        chronologies are shared between calls and reloaded when chronology.txt changes
+        """
         chron = None
         try:
-            chron = irradiation_chronology(name, allow_null=allow_null)
+            chron = self._get_cached_chronology(name, allow_null)
             if self.application:
                 chron.use_irradiation_endtime = self.application.get_boolean_preference(
                     "pychron.arar.constants.use_irradiation_endtime", False
@@ -715,9 +747,11 @@ class MetaRepo(GitRepoManager):
                 )
         return chron
 
-    @cached("clear_cache")
-    def get_irradiation_holder_holes(self, name, **kw):
-        return irradiation_geometry_holes(name)
+    def get_irradiation_holder_holes(self, name, force=False, **kw):
+        p = os.path.join(paths.meta_root, "irradiation_holders", add_extension(name))
+        if force:
+            self.clear_meta_cache(p)
+        return self._get_cached(p, lambda: irradiation_geometry_holes(name))
 
     @cached("clear_cache")
     def get_load_holder_holes(self, name, **kw):
@@ -725,18 +759,63 @@ class MetaRepo(GitRepoManager):
         holder = LoadGeometry(p)
         return holder.holes
 
+    def clear_meta_cache(self, path=None):
+        """
+        forget the parsed meta files, or only path
+        """
+        if path is None:
+            self._meta_cache = {}
+        else:
+            self._meta_cache.pop(path, None)
+
+    def pull(self, *args, **kw):
+        try:
+            return super(MetaRepo, self).pull(*args, **kw)
+        finally:
+            self.clear_meta_cache()
+
+    def smart_pull(self, *args, **kw):
+        try:
+            return super(MetaRepo, self).smart_pull(*args, **kw)
+        finally:
+            self.clear_meta_cache()
+
     @property
     def sensitivity_path(self):
         return os.path.join(paths.meta_root, "sensitivity.json")
 
     # private
+    def _get_cached(self, p, factory):
+        """
+        return factory(), parsed once per version of the file at p. a file is
+        considered changed when its mtime or size changes. missing files are not cached
+        """
+        try:
+            st = os.stat(p)
+            sig = st.st_mtime_ns, st.st_size
+        except OSError:
+            return factory()
+
+        entry = self._meta_cache.get(p)
+        if entry and entry[0] == sig:
+            return entry[1]
+
+        obj = factory()
+        self._meta_cache[p] = (sig, obj)
+        return obj
+
+    def _dump(self, obj, p):
+        dvc_dump(obj, p)
+        self.clear_meta_cache(p)
+
+    def _get_cached_chronology(self, name, allow_null):
+        p = os.path.join(paths.meta_root, name, "chronology.txt")
+        return self._get_cached(
+            p, lambda: irradiation_chronology(name, allow_null=allow_null)
+        )
+
     def _get_level_positions(self, irrad, level):
-        obj, p = self.get_level_obj(irrad, level)
-        if isinstance(obj, list):
-            positions = obj
-        else:
-            positions = obj.get("positions", [])
-        return positions
+        return self.get_level_index(irrad, level).positions
 
     def _update_text(self, tag, name, path_or_blob):
         if not name:
@@ -27,7 +27,6 @@ from traits.api import List
 
 from pychron.dvc import repository_path
 from pychron.dvc.dvc import DVC
-from pychron.dvc.dvc_persister import DVCPersister
 from pychron.dvc.tasks import list_local_repos
 from pychron.dvc.tasks.actions import (
     WorkOfflineAction,
@@ -36,13 +35,6 @@ from pychron.dvc.tasks.actions import (
     ClearCacheAction,
     GenerateCurrentsAction,
 )
-from pychron.dvc.tasks.dvc_preferences import (
-    DVCConnectionPreferencesPane,
-    DVCExperimentPreferencesPane,
-    DVCRepositoryPreferencesPane,
-    DVCPreferencesPane,
-)
-from pychron.dvc.tasks.repo_task import ExperimentRepoTask
 from pychron.envisage.tasks.base_task_plugin import BaseTaskPlugin
 from pychron.git.hosts import IGitHost
 
@@ -109,6 +101,8 @@ class DVCPlugin(BaseTaskPlugin):
         return d
 
     def _repo_factory(self):
+        from pychron.dvc.tasks.repo_task import ExperimentRepoTask
+
         dvc = self.application.get_service(DVC)
         r = ExperimentRepoTask(dvc=dvc)
         return r
@@ -132,8 +126,8 @@ class DVCPlugin(BaseTaskPlugin):
 
     def _service_offers_default(self):
         so = self.service_offer_factory(
-            protocol=DVCPersister,
-            factory=DVCPersister,
+            protocol="pychron.dvc.dvc_persister.DVCPersister",
+            factory="pychron.dvc.dvc_persister.DVCPersister",
             properties={"dvc": self._dvc_factory()},
         )
 
@@ -146,10 +140,13 @@ class DVCPlugin(BaseTaskPlugin):
 
     def _preferences_panes_default(self):
         return [
-            DVCPreferencesPane,
-            DVCConnectionPreferencesPane,
-            DVCExperimentPreferencesPane,
-            DVCRepositoryPreferencesPane,
+            self.lazy_factory("pychron.dvc.tasks.dvc_preferences.{}".format(p))
+            for p in (
+                "DVCPreferencesPane",
+                "DVCConnectionPreferencesPane",
+                "DVCExperimentPreferencesPane",
+                "DVCRepositoryPreferencesPane",
+            )
         ]
 
     def _tasks_default(self):
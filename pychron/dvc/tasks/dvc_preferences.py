@@ -161,6 +161,7 @@ class DVCPreferences(BasePreferencesHelper):
     use_auto_pull = Bool(True)
     use_auto_push = Bool(False)
     use_default_commit_author = Bool(False)
+    sync_workers = Int(4)
 
 
 class DVCPreferencesPane(PreferencesPane):
@@ -194,6 +195,11 @@ class DVCPreferencesPane(PreferencesPane):
                         tooltip="Push changes when a PushNode is used automatically without asking "
                         "for confirmation.",
                     ),
+                    Item(
+                        "sync_workers",
+                        label="Sync Workers",
+                        tooltip="Maximum number of repositories to sync concurrently",
+                    ),
                 ),
                 BorderVGroup(
                     Item(
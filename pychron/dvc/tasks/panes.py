@@ -125,6 +125,7 @@ class RepoAdapter(TabularAdapter):
         ("Name", "name"),
         ("Branch", "active_branch"),
         ("Status (Ahead,Behind)", "status"),
+        ("Age", "status_age"),
     ]
 
     name_width = Int(180)
@@ -44,6 +44,7 @@ from pychron.column_sorter_mixin import ColumnSorterMixin
 from pychron.core.fuzzyfinder import fuzzyfinder
 from pychron.core.helpers.datetime_tools import format_iso_datetime
 from pychron.core.helpers.filetools import unique_dir
+from pychron.core.ui.gui import invoke_in_main_thread
 from pychron.dvc import repository_path, UUID_RE
 from pychron.dvc.tasks import list_local_repos
 from pychron.dvc.tasks.actions import (
@@ -73,7 +74,8 @@ from pychron.envisage.tasks.base_task import BaseTask
 # from pychron.git_archive.history import from_gitlog
 from pychron.git.hosts import IGitHost
 from pychron.git_archive.repo_manager import GitRepoManager
-from pychron.git_archive.utils import ahead_behind, get_tags
+from pychron.git_archive.repo_status import repository_status
+from pychron.git_archive.utils import get_tags
 from pychron.git_archive.views import CommitFactory
 from pychron.paths import paths
 from pychron.pychron_constants import NULL_STR, STARTUP_MESSAGE_POSITION
@@ -95,6 +97,7 @@ class RepoItem(HasTraits):
     ahead = Int
     behind = Int
     status = Str
+    status_age = Str
     refresh_needed = Event
     active_branch = Str
     create_date = Date
@@ -105,18 +108,39 @@ class RepoItem(HasTraits):
         p = repository_path(name)
         try:
             try:
-                a, b = ahead_behind(p, fetch=fetch)
+                st = repository_status.update(p, fetch=fetch)
             except InvalidGitRepositoryError:
                 return True
 
-            self.ahead = a
-            self.behind = b
-            self.status = "{},{}".format(a, b)
-            self.refresh_needed = True
+            self.set_status(st)
             return True
         except GitCommandError:
             pass
 
+    def load_status(self, callback=None):
+        """
+        set the cached status without blocking. a missing or out of date status is
+        refreshed in the background and ``callback`` is called, in the main thread,
+        when it is set
+        """
+
+        def refreshed(st):
+            if st.error is None:
+                invoke_in_main_thread(self.set_status, st, callback)
+
+        st = repository_status.get(repository_path(self.name), callback=refreshed)
+        if st is not None and st.error is None:
+            self.set_status(st)
+
+    def set_status(self, st, callback=None):
+        self.ahead = st.ahead
+        self.behind = st.behind
+        self.status = "{},{}".format(st.ahead, st.behind)
+        self.status_age = st.age_str
+        self.refresh_needed = True
+        if callback:
+            callback()
+
 
 class ExperimentRepoTask(BaseTask, ColumnSorterMixin):
     id = "pychron.repo.task"
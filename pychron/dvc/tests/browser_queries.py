@@ -0,0 +1,182 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from pychron.dvc.dvc_database import DVCDatabase
+from pychron.dvc.dvc_orm import (
+    Base,
+    AnalysisTbl,
+    AnalysisChangeTbl,
+    IrradiationTbl,
+    IrradiationPositionTbl,
+    LevelTbl,
+    LoadTbl,
+    MaterialTbl,
+    MeasuredPositionTbl,
+    PrincipalInvestigatorTbl,
+    ProjectTbl,
+    SampleTbl,
+)
+from pychron.envisage.browser.record_views import LabnumberRecordView
+
+
+def populate(sess, n):
+    pi = PrincipalInvestigatorTbl(last_name="Ross", first_initial="J")
+    irrad = IrradiationTbl(name="NM-1")
+    load = LoadTbl(name="1", holderName="221-hole")
+    sess.add_all((pi, irrad, load))
+
+    levels = [LevelTbl(name=l, irradiation=irrad) for l in "AB"]
+    st = datetime(2020, 1, 1)
+    for i in range(n):
+        project = ProjectTbl(name="p{}".format(i), principal_investigator=pi)
+        material = MaterialTbl(name="m{}".format(i), grainsize="20-40")
+        sample = SampleTbl(
+            name="s{}".format(i),
+            project=project,
+            material=material,
+            lithology="basalt",
+            elevation=i,
+        )
+        pos = IrradiationPositionTbl(
+            identifier="{}".format(1000 + i),
+            position=i,
+            sample=sample,
+            level=levels[i % 2],
+        )
+        for j in range(2):
+            a = AnalysisTbl(
+                irradiation_position=pos,
+                aliquot=j + 1,
+                increment=-1,
+                timestamp=st + timedelta(hours=i * 2 + j),
+                uuid="{}-{}".format(i, j),
+                analysis_type="unknown",
+                mass_spectrometer="jan",
+            )
+            a.change = AnalysisChangeTbl(tag="ok")
+            a.measured_positions = [MeasuredPositionTbl(position=i, load=load)]
+            sess.add(a)
+    sess.commit()
+
+
+def browse(ans):
+    rows = []
+    for a in ans:
+        a.bind()
+        rows.append(
+            (
+                a.record_id,
+                a.sample,
+                a.project,
+                a.principal_investigator,
+                a.material,
+                a.irradiation_info,
+                a.load_name,
+                a.load_holder,
+                a.tag,
+            )
+        )
+    return rows
+
+
+def browse_labnumbers(lns):
+    rows = []
+    for li in lns:
+        r = LabnumberRecordView(li)
+        rows.append(
+            (
+                r.labnumber,
+                r.name,
+                r.material,
+                r.project,
+                r.irradiation,
+                r.irradiation_level,
+                r.lithology,
+                r.elevation,
+            )
+        )
+    return rows
+
+
+class BrowserQueriesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self._ndbs = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _db(self, n):
+        self._ndbs += 1
+        p = os.path.join(self.root, "{}.db".format(self._ndbs))
+        db = DVCDatabase(kind="sqlite", path=p)
+        db.connect()
+        with db.session_ctx() as sess:
+            Base.metadata.create_all(sess.bind)
+            populate(sess, n)
+        return db
+
+    def _analyses(self, db, eager, by_date=False):
+        with db.session_ctx() as sess:
+            sess.expunge_all()
+            with db.count_queries() as qc:
+                if by_date:
+                    ans = db.get_analyses_by_date_range(
+                        datetime(2019, 1, 1), None, eager=eager, verbose=False
+                    )
+                else:
+                    lns = [str(1000 + i) for i in range(100)]
+                    ans, _ = db.get_labnumber_analyses(
+                        lns, eager=eager, verbose_query=False
+                    )
+                rows = browse(ans)
+        return rows, qc.count
+
+    def _labnumbers(self, db):
+        with db.session_ctx() as sess:
+            sess.expunge_all()
+            with db.count_queries() as qc:
+                lns = db.get_labnumbers(principal_investigators=["Ross, J"])
+                rows = browse_labnumbers(lns)
+        return rows, qc.count
+
+    def test_labnumber_analyses(self):
+        db = self._db(20)
+        lazy_rows, lazy_count = self._analyses(db, False)
+        rows, count = self._analyses(db, True)
+
+        self.assertEqual(len(rows), 40)
+        self.assertEqual(rows, lazy_rows)
+        self.assertLess(count, lazy_count)
+
+    def test_analyses_by_date_range(self):
+        db = self._db(20)
+        lazy_rows, lazy_count = self._analyses(db, False, by_date=True)
+        rows, count = self._analyses(db, True, by_date=True)
+
+        self.assertEqual(len(rows), 40)
+        self.assertEqual(rows, lazy_rows)
+        self.assertLess(count, lazy_count)
+
+    def test_query_count_independent_of_n(self):
+        _, a = self._analyses(self._db(5), True)
+        _, b = self._analyses(self._db(40), True)
+        self.assertEqual(a, b)
+
+        _, a = self._labnumbers(self._db(5))
+        _, b = self._labnumbers(self._db(40))
+        self.assertEqual(a, b)
+
+    def test_labnumbers(self):
+        rows, _ = self._labnumbers(self._db(10))
+        self.assertEqual(len(rows), 10)
+        self.assertIn(("1003", "s3", "m3", "p3", "NM-1", "B", "basalt", 3), rows)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from pychron.dvc.dvc_database import DVCDatabase
+from pychron.dvc.dvc_orm import Base, MaterialTbl
+from pychron.dvc.tests.browser_queries import populate
+
+
+class RunSpec:
+    def __init__(self, identifier, aliquot, step=""):
+        self.identifier = identifier
+        self.aliquot = aliquot
+        self.step = step
+
+
+class BulkImportTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.db = DVCDatabase(kind="sqlite", path=os.path.join(self.root, "test.db"))
+        self.db.connect()
+        with self.db.session_ctx() as sess:
+            Base.metadata.create_all(sess.bind)
+            populate(sess, 5)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _materials(self):
+        with self.db.session_ctx(use_parent_session=False) as sess:
+            return sorted(m.name for m in sess.query(MaterialTbl).all())
+
+    def test_deferred_commit(self):
+        db = self.db
+        n = len(self._materials())
+        with db.session_ctx():
+            with db.deferred_commit():
+                for i in range(10):
+                    db.add_material("bulk{}".format(i))
+                    db.commit()
+                # visible to this session, not committed yet
+                self.assertIsNotNone(db.get_material("bulk3"))
+                self.assertEqual(len(self._materials()), n)
+
+        self.assertEqual(len(self._materials()), n + 10)
+        self.assertTrue(db.commit_on_add)
+
+    def test_deferred_commit_rollback(self):
+        db = self.db
+        n = len(self._materials())
+        with db.session_ctx():
+            with self.assertRaises(ValueError):
+                with db.deferred_commit():
+                    db.add_material("bulk")
+                    raise ValueError
+
+        self.assertEqual(len(self._materials()), n)
+        self.assertFalse(db._commit_deferred)
+
+    def test_deferred_commit_by_caller(self):
+        db = self.db
+        n = len(self._materials())
+        with db.session_ctx():
+            with db.deferred_commit(commit=False):
+                db.add_material("bulk")
+            self.assertEqual(len(self._materials()), n)
+            self.assertTrue(db.commit())
+
+        self.assertEqual(len(self._materials()), n + 1)
+
+    def test_analysis_steps(self):
+        steps = self.db.get_analysis_steps(["1000", "1003", "9999"], chunk=1)
+        self.assertEqual(sorted(steps), ["1000", "1003"])
+        self.assertEqual(sorted(steps["1003"]), [(1, -1), (2, -1)])
+
+    def test_import_cache(self):
+        from pychron.data_mapper.model import ImportCache
+
+        cache = ImportCache()
+        cache.load_analyses(self.db, ["1000", "1001", "1002"])
+        for rs in (
+            RunSpec("1000", 1),
+            RunSpec("1000", 2),
+            RunSpec("1000", 3),
+            RunSpec("1001", 1, "A"),
+            RunSpec("1002", 1),
+            RunSpec("2000", 1),
+        ):
+            self.assertEqual(
+                bool(cache.has_analysis(rs)),
+                bool(self.db.get_analysis_runid(rs.identifier, rs.aliquot, rs.step)),
+            )
+
+        rs = RunSpec("2000", 1, "B")
+        cache.add_analysis(rs)
+        self.assertTrue(cache.has_analysis(rs))
+        self.assertTrue(cache.has_analysis(RunSpec("2000", 1)))
+        self.assertFalse(cache.has_analysis(RunSpec("2000", 1, "A")))
+
+    def test_import_cache_resolve(self):
+        from pychron.data_mapper.model import ImportCache
+
+        calls = []
+        cache = ImportCache()
+        for name in ("a", "b", "a", "a"):
+            cache.resolve(("sample", name), calls.append, name)
+        self.assertEqual(calls, ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
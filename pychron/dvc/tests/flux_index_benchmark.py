@@ -0,0 +1,76 @@
+"""
+flux, production and chronology lookups for n analyses on one irradiation level, as done
+when loading analyses.
+
+    python -m pychron.dvc.tests.flux_index_benchmark [n] [npositions]
+
+"legacy" repeats the previous path, the level file parsed and the positions scanned for
+every analysis
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from pychron.dvc import dvc_load
+from pychron.dvc.meta_object import Production
+from pychron.dvc.tests.meta_repo import make_meta_root
+from pychron.paths import paths
+
+
+def legacy_load(repo, positions):
+    p = repo.get_level_path("NM-1", "A")
+    for pos in positions:
+        obj = dvc_load(p)
+        repo.get_flux_from_positions(pos, obj["positions"])
+
+        pobj = dvc_load(os.path.join(paths.meta_root, "NM-1", "productions.json"))
+        Production(
+            os.path.join(
+                paths.meta_root, "NM-1", "productions", "{}.json".format(pobj["A"])
+            )
+        )
+
+
+def load(repo, positions):
+    for pos in positions:
+        repo.get_flux("NM-1", "A", pos)
+        repo.get_production("NM-1", "A")
+
+
+def run(func, *args):
+    st = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - st
+
+
+def benchmark(n=5000, npositions=200):
+    from pychron.dvc.meta_repo import MetaRepo
+
+    root = tempfile.mkdtemp()
+    meta_root = paths.meta_root
+    paths.meta_root = root
+    try:
+        make_meta_root(root, npositions)
+        repo = MetaRepo()
+        positions = [i % npositions + 1 for i in range(n)]
+        return [
+            ("legacy", run(legacy_load, repo, positions)),
+            ("level index", run(load, repo, positions)),
+        ]
+    finally:
+        paths.meta_root = meta_root
+        shutil.rmtree(root)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    npositions = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    for name, t in benchmark(n, npositions):
+        print("{:<14s}{:>10.3f} s {:>10.1f} us/analysis".format(name, t, t / n * 1e6))
+
+
+if __name__ == "__main__":
+    main()
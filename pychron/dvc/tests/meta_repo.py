@@ -0,0 +1,169 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from pychron.dvc import dvc_dump, dvc_load
+from pychron.paths import paths
+
+
+def make_meta_root(root, npositions=100, irradiation="NM-1", level="A"):
+    """
+    an irradiation with one level of npositions holes, a production and a holder
+    """
+    iroot = os.path.join(root, irradiation)
+    os.makedirs(os.path.join(iroot, "productions"))
+    os.makedirs(os.path.join(root, "irradiation_holders"))
+
+    positions = [
+        {
+            "position": i + 1,
+            "identifier": "{}".format(10000 + i),
+            "j": 1e-3 + i * 1e-6,
+            "j_err": 1e-6,
+            "position_jerr": 1e-7,
+            "decay_constants": {
+                "lambda_k_total": 5.463e-10,
+                "lambda_k_total_error": 1e-12,
+            },
+            "analyses": [
+                {"uuid": "{}-{}".format(i, k), "record_id": "{}-{:02d}".format(i, k)}
+                for k in range(5)
+            ],
+        }
+        for i in range(npositions)
+    ]
+    dvc_dump(
+        {"z": 0, "positions": positions}, os.path.join(iroot, "{}.json".format(level))
+    )
+
+    dvc_dump({level: "Triga"}, os.path.join(iroot, "productions.json"))
+    dvc_dump(
+        {"K4039": (0.01, 0.001), "Ca3937": (0.0007, 0.00001)},
+        os.path.join(iroot, "productions", "Triga.json"),
+    )
+
+    with open(os.path.join(root, "irradiation_holders", "tray.txt"), "w") as wfile:
+        wfile.write("circle,0.05\n")
+        for i in range(npositions):
+            wfile.write("{},{}\n".format(i * 0.1, 0))
+
+
+class MetaRepoTestCase(unittest.TestCase):
+    def setUp(self):
+        from pychron.dvc.meta_repo import MetaRepo
+
+        self.root = tempfile.mkdtemp()
+        self._meta_root = paths.meta_root
+        paths.meta_root = self.root
+        make_meta_root(self.root)
+        self.repo = MetaRepo()
+        self.repo.init_repo(self.root)
+        self.level_path = self.repo.get_level_path("NM-1", "A")
+
+    def tearDown(self):
+        paths.meta_root = self._meta_root
+        shutil.rmtree(self.root)
+
+    def _legacy_flux(self, pos):
+        positions = dvc_load(self.level_path)["positions"]
+        return self.repo.get_flux_from_positions(pos, positions)
+
+    def _rewrite(self, func):
+        # keep mtime and size so only explicit invalidation can notice the change
+        st = os.stat(self.level_path)
+        obj = dvc_load(self.level_path)
+        func(obj)
+        dvc_dump(obj, self.level_path)
+        os.utime(self.level_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertEqual(os.path.getsize(self.level_path), st.st_size)
+
+    def test_flux_matches(self):
+        repo = self.repo
+        for pos in (1, 50, 100, 101):
+            fd = repo.get_flux("NM-1", "A", pos)
+            efd = self._legacy_flux(pos)
+            self.assertEqual(fd["j"].nominal_value, efd["j"].nominal_value)
+            self.assertEqual(fd["j"].std_dev, efd["j"].std_dev)
+            self.assertEqual(fd["position_jerr"], efd["position_jerr"])
+            self.assertEqual(str(fd["lambda_k"]), str(efd["lambda_k"]))
+
+        # independent J per call
+        a = repo.get_flux("NM-1", "A", 1)["j"]
+        b = repo.get_flux("NM-1", "A", 1)["j"]
+        self.assertIsNot(a, b)
+
+    def test_index_reused(self):
+        repo = self.repo
+        index = repo.get_level_index("NM-1", "A")
+        self.assertIs(repo.get_level_index("NM-1", "A"), index)
+        self.assertIs(repo.get_flux_positions("NM-1", "A"), index.positions)
+        self.assertEqual(len(index.positions), 100)
+        self.assertEqual(index.get_position(2)["identifier"], "10001")
+
+    def test_missing_level(self):
+        repo = self.repo
+        fd = repo.get_flux("NM-1", "B", 1)
+        self.assertEqual(fd["j"].nominal_value, 0)
+        self.assertEqual(repo.get_flux_positions("NM-1", "B"), [])
+
+    def test_external_change(self):
+        repo = self.repo
+        index = repo.get_level_index("NM-1", "A")
+        obj = dvc_load(self.level_path)
+        obj["positions"] = obj["positions"][:10]
+        dvc_dump(obj, self.level_path)
+
+        nindex = repo.get_level_index("NM-1", "A")
+        self.assertIsNot(nindex, index)
+        self.assertEqual(len(nindex.positions), 10)
+
+    def test_resave(self):
+        repo = self.repo
+        self.assertEqual(repo.get_flux("NM-1", "A", 1)["j"].nominal_value, 1e-3)
+        repo.update_flux("NM-1", "A", 1, "10000", 2e-3, 1e-6, add=False)
+        self.assertEqual(repo.get_flux("NM-1", "A", 1)["j"].nominal_value, 2e-3)
+
+        repo.set_identifier("NM-1", "A", 2, "20001")
+        self.assertEqual(
+            repo.get_level_index("NM-1", "A").get_position(2)["identifier"], "20001"
+        )
+
+    def test_pull(self):
+        repo = self.repo
+        repo.get_flux("NM-1", "A", 1)
+
+        def edit(obj):
+            obj["positions"][0]["identifier"] = "99999"
+
+        self._rewrite(edit)
+        index = repo.get_level_index("NM-1", "A")
+        self.assertEqual(index.get_position(1)["identifier"], "10000")
+
+        # there is no remote, only the invalidation is exercised
+        repo.smart_pull()
+        index = repo.get_level_index("NM-1", "A")
+        self.assertEqual(index.get_position(1)["identifier"], "99999")
+
+    def test_production(self):
+        repo = self.repo
+        pname, prod = repo.get_production("NM-1", "A")
+        self.assertEqual(pname, "Triga")
+        self.assertEqual(prod.K4039, 0.01)
+        self.assertIs(repo.get_production("NM-1", "A")[1], prod)
+        self.assertIsNot(repo.get_production("NM-1", "A", force=True)[1], prod)
+
+        repo.update_productions("NM-1", "A", "Other", add=False)
+        pname, oprod = repo.get_production("NM-1", "A", allow_null=True)
+        self.assertEqual(pname, "Other")
+        self.assertIsNot(oprod, prod)
+
+    def test_holder(self):
+        repo = self.repo
+        holes = repo.get_irradiation_holder_holes("tray")
+        self.assertEqual(len(holes), 100)
+        self.assertIs(repo.get_irradiation_holder_holes("tray"), holes)
+
+
+if __name__ == "__main__":
+    unittest.main()
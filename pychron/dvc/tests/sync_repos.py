@@ -0,0 +1,94 @@
+import os
+import unittest
+
+# no display is available when running headless
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from git import Repo
+
+from pychron.dvc.dvc import DVC
+from pychron.git_archive.tests.repo_manager import BareRemoteTestCase
+from pychron.paths import paths
+
+
+class CanceledProgress(object):
+    canceled = True
+
+    def change_message(self, *args, **kw):
+        pass
+
+
+class SyncReposTestCase(BareRemoteTestCase):
+    def setUp(self):
+        super(SyncReposTestCase, self).setUp()
+        self._root = paths.repository_dataset_dir
+        paths.repository_dataset_dir = self.root
+
+        self.dvc = DVC(bind=False, use_auto_pull=True)
+        self.pulled = []
+
+        def pull(*args, **kw):
+            self.pulled.append(kw)
+            return pull_orig(*args, **kw)
+
+        from pychron.git_archive.repo_manager import GitRepoManager
+
+        pull_orig = GitRepoManager.pull
+        GitRepoManager.pull = pull
+        self.addCleanup(setattr, GitRepoManager, "pull", pull_orig)
+
+    def tearDown(self):
+        paths.repository_dataset_dir = self._root
+        super(SyncReposTestCase, self).tearDown()
+
+    def _head(self):
+        return Repo(self.local_path).head.commit.hexsha
+
+    def test_skip_unchanged(self):
+        failed = self.dvc.sync_repos(["local"], use_progress=False)
+        self.assertEqual(failed, [])
+        self.assertEqual(self.pulled, [])
+
+    def test_pull_advanced(self):
+        self.push_upstream()
+        failed = self.dvc.sync_repos(["local"], use_progress=False)
+        self.assertEqual(failed, [])
+        self.assertEqual(len(self.pulled), 1)
+        self.assertFalse(self.pulled[0]["fetch"])
+        self.assertEqual(self.pulled[0]["branch"], "master")
+        self.assertEqual(self._head(), self.upstream.head.commit.hexsha)
+
+    def test_pull_fetched_not_merged(self):
+        self.push_upstream()
+        self.local.git.fetch("origin")
+        self.dvc.sync_repos(["local"], use_progress=False)
+        self.assertEqual(len(self.pulled), 1)
+        self.assertEqual(self._head(), self.upstream.head.commit.hexsha)
+
+    def test_bad_repository(self):
+        self.local.git.remote("set-url", "origin", os.path.join(self.root, "nope"))
+        failed = self.dvc.sync_repos(["local"], use_progress=False)
+        self.assertEqual(failed, ["local"])
+        self.assertEqual(self.pulled, [])
+
+    def test_cancel(self):
+        for i in range(3):
+            Repo.clone_from(self.origin, os.path.join(self.root, "local{}".format(i)))
+        self.push_upstream()
+
+        self.dvc.sync_workers = 1
+        names = ["local{}".format(i) for i in range(3)]
+        failed = self.dvc.sync_repos(names, progress=CanceledProgress())
+        self.assertEqual(failed, [])
+        self.assertEqual(self.pulled, [])
+
+    def test_multiple(self):
+        Repo.clone_from(self.origin, os.path.join(self.root, "local2"))
+        self.push_upstream()
+        failed = self.dvc.sync_repos(["local", "local2"], use_progress=False)
+        self.assertEqual(failed, [])
+        self.assertEqual(len(self.pulled), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
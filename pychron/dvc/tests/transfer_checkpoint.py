@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from pychron.dvc.transfer_checkpoint import TransferCheckpoint, TransferStats, pages
+
+
+class Clock:
+    def __init__(self):
+        self.t = 0
+
+    def __call__(self):
+        return self.t
+
+
+class TransferCheckpointTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, "transfer.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_pages(self):
+        self.assertEqual(pages(list(range(5)), 2), [[0, 1], [2, 3], [4]])
+        self.assertEqual(pages([], 2), [])
+
+    def test_resume(self):
+        runs = ["1000-01", "1000-02", "1001-01A", "1001-01B"]
+        ckpt = TransferCheckpoint(self.path)
+        self.assertEqual(ckpt.pending(runs), runs)
+
+        ckpt.add(["1000-01", "1000-02"], {"1001-01A": "error"})
+
+        ckpt = TransferCheckpoint(self.path)
+        self.assertEqual(ckpt.pending(runs), ["1001-01A", "1001-01B"])
+        self.assertEqual(ckpt.pending(runs, retry_failed=False), ["1001-01B"])
+
+        ckpt.add(["1001-01A"])
+        ckpt = TransferCheckpoint(self.path)
+        self.assertEqual(ckpt.failed, {})
+        self.assertEqual(ckpt.pending(runs), ["1001-01B"])
+        self.assertFalse(os.path.isfile("{}.tmp".format(self.path)))
+
+    def test_no_path(self):
+        ckpt = TransferCheckpoint()
+        ckpt.add(["a"])
+        self.assertEqual(ckpt.pending(["a", "b"]), ["b"])
+        self.assertEqual(os.listdir(self.root), [])
+
+    def test_stats(self):
+        clock = Clock()
+        stats = TransferStats(10, clock=clock)
+        self.assertIsNone(stats.eta)
+
+        clock.t = 36
+        stats.update(transferred=3, skipped=1, failed=1)
+        self.assertEqual(stats.processed, 5)
+        self.assertAlmostEqual(stats.rate, 500)
+        self.assertAlmostEqual(stats.eta, 36)
+        self.assertIn("transferred=3", stats.report())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+
+# ============= standard library imports ========================
+import json
+import os
+import time
+
+# ============= local library imports  ==========================
+
+
+def pages(items, n):
+    """
+    split items into consecutive lists of at most n items
+    """
+    n = max(1, int(n))
+    return [items[i : i + n] for i in range(0, len(items), n)]
+
+
+class TransferCheckpoint(object):
+    """
+    persistent record of the runs a transfer has finished and the runs that failed.
+
+    written atomically after every batch so an interrupted transfer can be restarted
+    and only the remaining runs are transferred. no path keeps the record in memory
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.done = set()
+        self.failed = {}
+        if path and os.path.isfile(path):
+            self.load()
+
+    def load(self):
+        with open(self.path, "r") as rfile:
+            obj = json.load(rfile)
+
+        self.done = set(obj.get("done", []))
+        self.failed = obj.get("failed", {})
+
+    def dump(self):
+        if not self.path:
+            return
+
+        tmp = "{}.tmp".format(self.path)
+        with open(tmp, "w") as wfile:
+            json.dump({"done": sorted(self.done), "failed": self.failed}, wfile)
+        os.replace(tmp, self.path)
+
+    def pending(self, runs, retry_failed=True):
+        """
+        the runs, in order, that still need to be transferred
+        """
+        return [
+            r
+            for r in runs
+            if r not in self.done and (retry_failed or r not in self.failed)
+        ]
+
+    def add(self, done=None, failed=None):
+        if done:
+            self.done.update(done)
+            for r in done:
+                self.failed.pop(r, None)
+        if failed:
+            self.failed.update(failed)
+        self.dump()
+
+
+class TransferStats(object):
+    """
+    counts and throughput of a transfer
+    """
+
+    def __init__(self, total, clock=time.time):
+        self.total = total
+        self.transferred = 0
+        self.skipped = 0
+        self.failed = 0
+        self._clock = clock
+        self._start = clock()
+
+    def update(self, transferred=0, skipped=0, failed=0):
+        self.transferred += transferred
+        self.skipped += skipped
+        self.failed += failed
+
+    @property
+    def processed(self):
+        return self.transferred + self.skipped + self.failed
+
+    @property
+    def elapsed(self):
+        return self._clock() - self._start
+
+    @property
+    def rate(self):
+        """
+        runs processed per hour
+        """
+        et = self.elapsed
+        return self.processed / et * 3600 if et > 0 else 0
+
+    @property
+    def eta(self):
+        """
+        estimated seconds remaining
+        """
+        rate = self.rate
+        if rate:
+            return (self.total - self.processed) / rate * 3600
+
+    def report(self):
+        eta = self.eta
+        return (
+            "{}/{} transferred={} skipped={} failed={} elapsed={:0.1f}s "
+            "rate={:0.1f}/hr eta={}".format(
+                self.processed,
+                self.total,
+                self.transferred,
+                self.skipped,
+                self.failed,
+                self.elapsed,
+                self.rate,
+                "--" if eta is None else "{:0.0f}s".format(eta),
+            )
+        )
+
+
+# ============= EOF =============================================
@@ -497,42 +497,46 @@ class BaseBrowserModel(PersistenceLoggable, ColumnSorterMixin):
         analysis_types=None,
     ):
         db = self.db
-        if samples:
-            lns = [si.labnumber for si in samples]
-            self.debug("retrieving identifiers={}".format(",".join(lns)))
-            # if low_post is None:
-            # lps = [si.low_post for si in samples if si.low_post is not None]
-            #     low_post = min(lps) if lps else None
-            ans, tc = db.get_labnumber_analyses(
-                lns,
-                order=order,
-                low_post=low_post,
-                high_post=high_post,
-                limit=limit,
-                exclude_uuids=exclude_uuids,
-                include_invalid=include_invalid,
-                mass_spectrometers=mass_spectrometers,
-                repositories=repositories,
-                loads=loads,
-            )
-            self.debug("retrieved analyses n={}".format(tc))
-        else:
-            self.debug("retrieved analyses by date range")
-            ans = db.get_analyses_by_date_range(
-                low_post,
-                high_post,
-                order=order,
-                mass_spectrometers=mass_spectrometers,
-                repositories=repositories,
-                limit=limit,
-                analysis_types=analysis_types,
-                loads=loads,
-            )
-
-        if make_records:
-            return self._make_records(ans)
-        else:
-            return ans
+        with db.count_queries() as qc:
+            if samples:
+                lns = [si.labnumber for si in samples]
+                self.debug("retrieving identifiers={}".format(",".join(lns)))
+                # if low_post is None:
+                # lps = [si.low_post for si in samples if si.low_post is not None]
+                #     low_post = min(lps) if lps else None
+                ans, tc = db.get_labnumber_analyses(
+                    lns,
+                    order=order,
+                    low_post=low_post,
+                    high_post=high_post,
+                    limit=limit,
+                    exclude_uuids=exclude_uuids,
+                    include_invalid=include_invalid,
+                    mass_spectrometers=mass_spectrometers,
+                    repositories=repositories,
+                    loads=loads,
+                    eager=make_records,
+                )
+                self.debug("retrieved analyses n={}".format(tc))
+            else:
+                self.debug("retrieved analyses by date range")
+                ans = db.get_analyses_by_date_range(
+                    low_post,
+                    high_post,
+                    order=order,
+                    mass_spectrometers=mass_spectrometers,
+                    repositories=repositories,
+                    limit=limit,
+                    analysis_types=analysis_types,
+                    loads=loads,
+                    eager=make_records,
+                )
+
+            if make_records:
+                ans = self._make_records(ans)
+
+        self.debug("retrieved analyses queries={}".format(qc.count))
+        return ans
 
     # def _retrieve_sample_analyses(self, samples, **kw):
     #    return self._retrieve_analyses(samples=samples, **kw)
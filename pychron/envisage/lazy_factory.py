@@ -0,0 +1,153 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+# ============= enthought library imports =======================
+# ============= standard library imports ========================
+import importlib
+import logging
+import sys
+import time
+from contextlib import contextmanager
+
+# ============= local library imports  ==========================
+
+logger = logging.getLogger("ImportProfile")
+
+
+class ImportProfile(object):
+    """
+    cumulative import time and number of newly imported modules keyed by plugin name
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.budget = None
+        self._records = {}
+
+    def clear(self):
+        self._records = {}
+
+    @contextmanager
+    def timed(self, name):
+        n = len(sys.modules)
+        st = time.perf_counter()
+        try:
+            yield
+        finally:
+            et = time.perf_counter() - st
+            self.add(name, et, len(sys.modules) - n)
+
+    def add(self, name, seconds, nmodules=0):
+        r = self._records.setdefault(name, [0, 0, 0])
+        r[0] += seconds
+        r[1] += nmodules
+        r[2] += 1
+
+    def get(self, name):
+        return tuple(self._records.get(name, (0, 0, 0)))
+
+    @property
+    def total(self):
+        return sum(r[0] for r in self._records.values())
+
+    def report(self):
+        lines = ["{:<35s} {:>8s} {:>8s}".format("Name", "Time(s)", "Modules")]
+        for name, (t, n, _) in sorted(
+            self._records.items(), key=lambda x: x[1][0], reverse=True
+        ):
+            lines.append("{:<35s} {:>8.3f} {:>8d}".format(name, t, n))
+
+        total = self.total
+        lines.append("{:<35s} {:>8.3f}".format("Total", total))
+        if self.budget is not None:
+            lines.append(
+                "{:<35s} {:>8.3f} {}".format(
+                    "Budget", self.budget, "exceeded" if self.over_budget() else "ok"
+                )
+            )
+        return lines
+
+    def over_budget(self):
+        return self.budget is not None and self.total > self.budget
+
+    def dump(self, title="Import Profile"):
+        extra = {"threadName_": "Launcher"}
+        logger.info("============= {} =============".format(title), extra=extra)
+        for line in self.report():
+            logger.info(line, extra=extra)
+
+        if self.over_budget():
+            logger.warning(
+                "import time {:0.3f}s exceeds budget {:0.3f}s".format(
+                    self.total, self.budget
+                ),
+                extra=extra,
+            )
+
+
+import_profile = ImportProfile()
+
+
+def import_symbol(path):
+    """
+    import "package.module.attr" or "package.module:attr"
+    """
+    if ":" in path:
+        module, attr = path.split(":")
+    else:
+        module, attr = path.rsplit(".", 1)
+
+    m = importlib.import_module(module)
+    for a in attr.split("."):
+        m = getattr(m, a)
+    return m
+
+
+class LazyFactory(object):
+    """
+    callable stand-in for a class or function. The module is imported the first
+    time the factory is called, so plugins can contribute tasks, services and
+    preference panes without importing them at startup
+    """
+
+    def __init__(self, path, name=None):
+        self.path = path
+        self.name = name or path
+        self._factory = None
+
+    @property
+    def resolved(self):
+        return self._factory is not None
+
+    def resolve(self):
+        if self._factory is None:
+            with import_profile.timed(self.name):
+                self._factory = import_symbol(self.path)
+
+            if import_profile.enabled:
+                t, n, _ = import_profile.get(self.name)
+                logger.debug(
+                    "deferred import {} {:0.3f}s modules={}".format(self.path, t, n)
+                )
+        return self._factory
+
+    def __call__(self, *args, **kw):
+        return self.resolve()(*args, **kw)
+
+    def __repr__(self):
+        return "LazyFactory({})".format(self.path)
+
+
+# ============= EOF =============================================
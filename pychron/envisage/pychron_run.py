@@ -23,8 +23,10 @@ from pyface.message_dialog import warning
 from pychron.core.displays.gdisplays import gTraceDisplay
 from pychron.envisage.initialization.initialization_parser import InitializationParser
 from pychron.envisage.key_bindings import update_key_bindings
+from pychron.envisage.lazy_factory import import_profile
 from pychron.envisage.tasks.base_plugin import BasePlugin
 from pychron.envisage.tasks.tasks_plugin import PychronTasksPlugin, myTasksPlugin
+from pychron.globals import globalv
 from pychron.logger.tasks.logger_plugin import LoggerPlugin
 from pychron.user.tasks.plugin import UsersPlugin
 from pychron.pychron_constants import LASER_PLUGINS
@@ -137,7 +139,8 @@ def get_hardware_plugins():
 
 def get_klass(package, name):
     try:
-        m = __import__(package, globals(), locals(), [name])
+        with import_profile.timed(name):
+            m = __import__(package, globals(), locals(), [name])
         klass = getattr(m, name)
 
     except ImportError as e:
@@ -229,6 +232,9 @@ def app_factory(klass):
     assemble the plugins
     return a Pychron TaskApplication
     """
+    import_profile.enabled = globalv.import_profile
+    import_profile.budget = globalv.import_budget
+
     pychron_plugin = PychronTasksPlugin()
 
     plugins = [
@@ -247,6 +253,9 @@ def app_factory(klass):
     # set key bindings
     update_key_bindings(pychron_plugin.actions)
 
+    if import_profile.enabled or import_profile.over_budget():
+        import_profile.dump("Startup Import Profile")
+
     return app
 
 
@@ -24,6 +24,7 @@ from traits.api import List
 # ============= standard library imports ========================
 # ============= local library imports  ==========================
 from pychron.core.helpers.filetools import add_extension
+from pychron.envisage.lazy_factory import LazyFactory
 from pychron.loggable import Loggable
 from pychron.paths import paths
 
@@ -59,6 +60,13 @@ class BasePlugin(Plugin, Loggable):
     def service_offer_factory(self, **kw):
         return ServiceOffer(**kw)
 
+    def lazy_factory(self, path):
+        """
+        a factory for "package.module.attr" that is imported when first called.
+        the import time is profiled under this plugin's name
+        """
+        return LazyFactory(path, name=self.__class__.__name__)
+
     def check(self):
         return True
 
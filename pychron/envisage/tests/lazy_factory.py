@@ -0,0 +1,95 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import pychron
+from pychron.envisage.lazy_factory import LazyFactory, ImportProfile, import_profile
+
+MODULE = """
+class Pane(object):
+    def __init__(self, dialog=None):
+        self.dialog = dialog
+"""
+
+
+class LazyFactoryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        with open(os.path.join(self.root, "lazy_factory_target.py"), "w") as wfile:
+            wfile.write(MODULE)
+        sys.path.insert(0, self.root)
+
+    def tearDown(self):
+        sys.path.remove(self.root)
+        sys.modules.pop("lazy_factory_target", None)
+        shutil.rmtree(self.root)
+
+    def test_deferred(self):
+        f = LazyFactory("lazy_factory_target.Pane", name="TestPlugin")
+        self.assertNotIn("lazy_factory_target", sys.modules)
+        self.assertFalse(f.resolved)
+
+        p = f(dialog=1)
+        self.assertEqual(p.dialog, 1)
+        self.assertIn("lazy_factory_target", sys.modules)
+        self.assertIs(f.resolve(), sys.modules["lazy_factory_target"].Pane)
+
+        t, n, calls = import_profile.get("TestPlugin")
+        self.assertGreater(t, 0)
+        self.assertEqual(n, 1)
+        self.assertEqual(calls, 1)
+
+        f()
+        self.assertEqual(import_profile.get("TestPlugin")[2], 1)
+
+    def test_colon_path(self):
+        f = LazyFactory("lazy_factory_target:Pane")
+        self.assertEqual(f().__class__.__name__, "Pane")
+
+    def test_import_error(self):
+        f = LazyFactory("lazy_factory_target.Missing")
+        with self.assertRaises(AttributeError):
+            f()
+
+
+class ImportProfileTestCase(unittest.TestCase):
+    def test_report(self):
+        p = ImportProfile()
+        p.add("APlugin", 0.25, 10)
+        p.add("BPlugin", 0.5, 20)
+        p.add("APlugin", 0.5, 5)
+
+        self.assertEqual(p.get("APlugin"), (0.75, 15, 2))
+        self.assertAlmostEqual(p.total, 1.25)
+
+        lines = p.report()
+        self.assertTrue(lines[1].startswith("APlugin"))
+        self.assertTrue(lines[2].startswith("BPlugin"))
+        self.assertTrue(lines[-1].startswith("Total"))
+        self.assertFalse(p.over_budget())
+
+        p.budget = 1
+        self.assertTrue(p.over_budget())
+        self.assertTrue(p.report()[-1].endswith("exceeded"))
+
+
+class PluginImportTestCase(unittest.TestCase):
+    def test_pipeline_plugin(self):
+        # importing the plugin module does not pull in dvc or the database stack
+        code = (
+            "import sys\n"
+            "import pychron.pipeline.tasks.plugin\n"
+            "print('loaded=' + ','.join(m for m in ('pychron.dvc.dvc', 'sqlalchemy') "
+            "if m in sys.modules))"
+        )
+        root = os.path.dirname(os.path.dirname(pychron.__file__))
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen", PYTHONPATH=root)
+        out = subprocess.check_output([sys.executable, "-c", code], env=env)
+        self.assertEqual(out.decode().strip().splitlines()[-1], "loaded=")
+
+
+if __name__ == "__main__":
+    unittest.main()
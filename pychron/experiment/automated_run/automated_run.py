@@ -2746,6 +2746,11 @@ anaylsis_type={}
         with self.persister.writer_ctx():
             m.measure()
 
+        if len(m.profiler):
+            profile = m.profiler.to_dict()
+            profile["group"] = grpname
+            self.persistence_spec.measurement_profiles.append(profile)
+
         # mem_log('post measure')
         if m.terminated:
             self.debug("measurement terminated")
@@ -23,6 +23,7 @@ from apptools.preferences.preference_binding import bind_preference
 from traits.api import Any, List, CInt, Int, Bool, Enum, Str, Instance
 
 from pychron.envisage.consoleable import Consoleable
+from pychron.experiment.automated_run.profiler import MeasurementProfiler
 from pychron.pychron_constants import AR_AR, SIGNAL, BASELINE, WHIFF, SNIFF
 
 
@@ -71,6 +72,7 @@ class DataCollector(Consoleable):
     not_intensity_count = 0
     trigger = None
     plot_panel_update_period = Int(1)
+    profiler = Instance(MeasurementProfiler, ())
 
     def __init__(self, *args, **kw):
         super(DataCollector, self).__init__(*args, **kw)
@@ -119,11 +121,14 @@ class DataCollector(Consoleable):
         et = self.ncounts * self.period_ms * 0.001
 
         self._alive = True
+        self.profiler.reset(period=self.period_ms * 0.001)
 
         self._measure()
 
         tt = time.time() - self.starttime
         self.debug("estimated time: {:0.3f} actual time: :{:0.3f}".format(et, tt))
+        if len(self.profiler):
+            self.debug("measurement profile\n{}".format(self.profiler.report()))
 
     # def plot_data(self, *args, **kw):
     #     from pychron.core.ui.gui import invoke_in_main_thread
@@ -159,22 +164,28 @@ class DataCollector(Consoleable):
         period = self.period_ms * 0.001
         i = 1
 
+        prof = self.profiler
         while not evt.is_set():
-            result = self._check_iteration(i)
+            prof.start(i)
+            with prof.phase("conditionals"):
+                result = self._check_iteration(i)
             if not result:
-                if not self._pre_trigger_hook():
-                    break
+                with prof.phase("trigger"):
+                    if not self._pre_trigger_hook():
+                        break
 
-                if self.trigger:
-                    self.trigger()
+                    if self.trigger:
+                        self.trigger()
 
-                evt.wait(period)
+                with prof.phase("wait"):
+                    evt.wait(period)
                 self.automated_run.plot_panel.counts = i
                 inc = self._iter_hook(i)
                 if inc is None:
                     break
 
                 self._post_iter_hook(i)
+                prof.stop()
                 if inc:
                     i += 1
             else:
@@ -195,7 +206,8 @@ class DataCollector(Consoleable):
 
     def _post_iter_hook(self, i):
         if self.experiment_type == AR_AR and self.refresh_age and not i % 5:
-            self.isotope_group.calculate_age(force=True)
+            with self.profiler.phase("age"):
+                self.isotope_group.calculate_age(force=True)
 
     def _pre_trigger_hook(self):
         return True
@@ -204,8 +216,10 @@ class DataCollector(Consoleable):
         return self._iteration(i)
 
     def _iteration(self, i, detectors=None):
+        prof = self.profiler
         try:
-            data = self._get_data(detectors)
+            with prof.phase("get_data"):
+                data = self._get_data(detectors)
             if not data:
                 return
 
@@ -217,7 +231,8 @@ class DataCollector(Consoleable):
         if k is not None and s is not None:
             x = self._get_time(t)
             self._save_data(x, k, s)
-            self._plot_data(i, x, k, s)
+            with prof.phase("plot"):
+                self._plot_data(i, x, k, s)
 
         return inc
 
@@ -260,13 +275,16 @@ class DataCollector(Consoleable):
 
     def _save_data(self, x, keys, signals):
         # self._queue.put((x, keys, signals))
-        self.data_writer(self.detectors, x, keys, signals)
+        prof = self.profiler
+        with prof.phase("save"):
+            self.data_writer(self.detectors, x, keys, signals)
 
         # update arar_age
-        if self.is_baseline and self.for_peak_hop:
-            self._update_baseline_peak_hop(x, keys, signals)
-        else:
-            self._update_isotopes(x, keys, signals)
+        with prof.phase("isotopes"):
+            if self.is_baseline and self.for_peak_hop:
+                self._update_baseline_peak_hop(x, keys, signals)
+            else:
+                self._update_isotopes(x, keys, signals)
 
     def _update_baseline_peak_hop(self, x, keys, signals):
         ig = self.isotope_group
@@ -120,6 +120,9 @@ class PersistenceSpec(HasTraits):
     lab_humiditys = List
     lab_pneumatics = List
 
+    # per iteration phase timings of each measurement group
+    measurement_profiles = List
+
     # lithographic_unit = Str
     # lat_long = Str
     # rock_type = Str
@@ -0,0 +1,218 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+
+# ============= standard library imports ========================
+import time
+
+from numpy import zeros, roll, histogram, percentile
+
+# ============= local library imports  ==========================
+
+WAIT = "wait"
+TOTAL = "total"
+PHASES = (
+    "conditionals",
+    "trigger",
+    WAIT,
+    "get_data",
+    "save",
+    "isotopes",
+    "plot",
+    "age",
+)
+
+
+class _Phase(object):
+    __slots__ = ("_row", "_idx", "_clock", "_st")
+
+    def __init__(self, row, idx, clock):
+        self._row = row
+        self._idx = idx
+        self._clock = clock
+        self._st = 0
+
+    def __enter__(self):
+        self._st = self._clock()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._row[self._idx] += self._clock() - self._st
+
+
+class MeasurementProfiler(object):
+    """
+    per iteration timing of the phases of a measurement loop.
+
+    the durations of the last ``capacity`` iterations are kept in a preallocated
+    ring buffer so profiling a long run neither grows memory nor allocates in the
+    loop. ``wait`` is the time spent waiting for the integration period, everything
+    else is software overhead
+
+        prof.start(i)
+        with prof.phase('get_data'):
+            ...
+        prof.stop()
+
+    """
+
+    def __init__(self, capacity=4096, phases=PHASES, clock=time.perf_counter):
+        self.capacity = capacity
+        self.phases = tuple(phases)
+        self.period = None
+        self._clock = clock
+        self._columns = self.phases + (TOTAL,)
+
+        self._buf = zeros((capacity, len(self._columns)))
+        self._counts = zeros(capacity, dtype=int)
+        self._n = 0
+
+        self._row = [0.0] * len(self.phases)
+        self._phase_objs = {
+            p: _Phase(self._row, i, clock) for i, p in enumerate(self.phases)
+        }
+        self._cnt = 0
+        self._st = None
+
+    def __len__(self):
+        return min(self._n, self.capacity)
+
+    def reset(self, period=None):
+        self.period = period
+        self._n = 0
+        self._st = None
+
+    def start(self, cnt):
+        row = self._row
+        for i in range(len(row)):
+            row[i] = 0.0
+        self._cnt = cnt
+        self._st = self._clock()
+
+    def phase(self, name):
+        return self._phase_objs[name]
+
+    def add(self, name, dt):
+        self._row[self.phases.index(name)] += dt
+
+    def stop(self):
+        if self._st is None:
+            return
+
+        idx = self._n % self.capacity
+        buf = self._buf[idx]
+        buf[:-1] = self._row
+        buf[-1] = self._clock() - self._st
+        self._counts[idx] = self._cnt
+        self._n += 1
+        self._st = None
+
+    @property
+    def columns(self):
+        return self._columns
+
+    @property
+    def niterations(self):
+        return self._n
+
+    @property
+    def counts(self):
+        return self._ordered(self._counts)
+
+    def timings(self, name=None):
+        """
+        durations in seconds, oldest iteration first. all columns, or one column if
+        name is given. the ``total`` column is the wall time of the iteration
+        """
+        buf = self._ordered(self._buf)
+        if name is not None:
+            buf = buf[:, self._columns.index(name)]
+        return buf
+
+    def overhead(self):
+        """
+        iteration time not spent waiting for the integration period
+        """
+        return self.timings(TOTAL) - self.timings(WAIT)
+
+    def histogram(self, name, bins=20):
+        """
+        return frequencies and bin edges (ms) of the durations of a phase
+        """
+        return histogram(self.timings(name) * 1000, bins=bins)
+
+    def summary(self):
+        """
+        mean, median, 95th percentile and max duration (ms) of each column
+        """
+        s = {}
+        if len(self):
+            ts = self.timings() * 1000
+            for i, c in enumerate(self._columns):
+                ci = ts[:, i]
+                s[c] = {
+                    "mean": float(ci.mean()),
+                    "median": float(percentile(ci, 50)),
+                    "p95": float(percentile(ci, 95)),
+                    "max": float(ci.max()),
+                }
+        return s
+
+    def report(self):
+        lines = [
+            "{:<14s}{:>10s}{:>10s}{:>10s}{:>10s}".format(
+                "phase (ms)", "mean", "median", "p95", "max"
+            )
+        ]
+        for c, si in self.summary().items():
+            lines.append(
+                "{:<14s}{mean:>10.3f}{median:>10.3f}{p95:>10.3f}{max:>10.3f}".format(
+                    c, **si
+                )
+            )
+
+        if self.period and len(self):
+            oh = self.overhead()
+            lines.append(
+                "overhead mean={:0.3f}ms max={:0.3f}ms, {:0.1f}% of period".format(
+                    oh.mean() * 1000,
+                    oh.max() * 1000,
+                    oh.mean() / self.period * 100,
+                )
+            )
+        return "\n".join(lines)
+
+    def to_dict(self):
+        ts = self.timings() * 1000
+        return {
+            "period": self.period,
+            "capacity": self.capacity,
+            "niterations": self._n,
+            "counts": self.counts.tolist(),
+            "timings": {c: ts[:, i].tolist() for i, c in enumerate(self._columns)},
+            "summary": self.summary(),
+        }
+
+    # private
+    def _ordered(self, a):
+        n = self._n
+        if n <= self.capacity:
+            return a[:n].copy()
+        return roll(a, -(n % self.capacity), axis=0)
+
+
+# ============= EOF =============================================
@@ -2018,7 +2018,7 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
 
         e = self._sync_repositories(prog)
         if e:
-            raise PreExecuteCheckException('Syncing Repository "{}"'.format(e))
+            raise PreExecuteCheckException('Syncing Repositories "{}"'.format(e))
 
         if prog:
             prog.change_message("Pre execute check complete")
@@ -2225,11 +2225,12 @@ class ExperimentExecutor(Consoleable, PreferenceMixin):
             for q in self.experiment_queues
             for a in q.cleaned_automated_runs
         }
-        for e in experiment_ids:
-            if prog:
-                prog.change_message("Syncing {}".format(e))
-                if not self.datahub.mainstore.sync_repo(e, use_progress=False):
-                    return e
+        if prog:
+            failed = self.datahub.mainstore.sync_repos(
+                sorted(experiment_ids), use_progress=False, progress=prog
+            )
+            if failed:
+                return ",".join(failed)
 
     def _post_run_check(self, run):
         """
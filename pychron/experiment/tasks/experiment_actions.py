@@ -25,7 +25,6 @@ from pychron.envisage.resources import icon
 from pychron.envisage.tasks.actions import PTaskAction as TaskAction
 from pychron.envisage.ui_actions import UIAction, UITaskAction
 from pychron.envisage.view_util import open_view
-from pychron.experiment.melting_point_calibrator import MeltingPointCalibrator
 from pychron.extraction_line.ipyscript_runner import IPyScriptRunner
 from pychron.globals import globalv
 from pychron.paths import paths
@@ -342,6 +341,7 @@ class MeltingPointCalibrationAction(UIAction):
     name = "Melting Point Calibration"
 
     def perform(self, event):
+        from pychron.experiment.melting_point_calibrator import MeltingPointCalibrator
         from pychron.lasers.laser_managers.ilaser_manager import ILaserManager
 
         app = event.task.window.application
@@ -20,11 +20,8 @@ from pyface.tasks.action.schema import SGroup
 from pyface.tasks.action.schema_addition import SchemaAddition
 from traits.api import List, Callable
 
-from pychron.entry.entry_views.sensitivity_entry import SensitivitySelector
 from pychron.envisage.tasks.base_task_plugin import BaseTaskPlugin
 from pychron.experiment.events import ExperimentEventAddition
-from pychron.experiment.run_history_view import RunHistoryView, RunHistoryModel
-from pychron.experiment.signal_calculator import SignalCalculator
 from pychron.experiment.tasks.experiment_actions import (
     NewExperimentQueueAction,
     OpenExperimentQueueAction,
@@ -48,13 +45,6 @@ from pychron.experiment.tasks.experiment_actions import (
     RunHistoryAction,
     MeltingPointCalibrationAction,
 )
-from pychron.experiment.tasks.experiment_preferences import (
-    ExperimentPreferencesPane,
-    ConsolePreferencesPane,
-    UserNotifierPreferencesPane,
-    HumanErrorCheckerPreferencesPane,
-)
-from pychron.experiment.tasks.experiment_task import ExperimentEditorTask
 
 
 class ExperimentPlugin(BaseTaskPlugin):
@@ -72,12 +62,18 @@ class ExperimentPlugin(BaseTaskPlugin):
     )
 
     def _signal_calculator_factory(self, *args, **kw):
+        from pychron.experiment.signal_calculator import SignalCalculator
+
         return SignalCalculator()
 
     def _sens_selector_factory(self, *args, **kw):
+        from pychron.entry.entry_views.sensitivity_entry import SensitivitySelector
+
         return SensitivitySelector()
 
     def _run_history_factory(self, *args, **kw):
+        from pychron.experiment.run_history_view import RunHistoryView, RunHistoryModel
+
         dvc = self.application.get_service("pychron.dvc.dvc.DVC")
 
         rhm = RunHistoryModel(dvc=dvc)
@@ -98,6 +94,8 @@ class ExperimentPlugin(BaseTaskPlugin):
         ]
 
     def _task_factory(self):
+        from pychron.experiment.tasks.experiment_task import ExperimentEditorTask
+
         return ExperimentEditorTask(
             application=self.application,
             events=self.events,
@@ -111,10 +109,15 @@ class ExperimentPlugin(BaseTaskPlugin):
 
     def _preferences_panes_default(self):
         return [
-            ExperimentPreferencesPane,
-            ConsolePreferencesPane,
-            UserNotifierPreferencesPane,
-            HumanErrorCheckerPreferencesPane,
+            self.lazy_factory(
+                "pychron.experiment.tasks.experiment_preferences.{}".format(p)
+            )
+            for p in (
+                "ExperimentPreferencesPane",
+                "ConsolePreferencesPane",
+                "UserNotifierPreferencesPane",
+                "HumanErrorCheckerPreferencesPane",
+            )
         ]
 
     def _file_defaults_default(self):
@@ -258,7 +261,8 @@ class ExperimentPlugin(BaseTaskPlugin):
 
     def _service_offers_default(self):
         so_signal_calculator = self.service_offer_factory(
-            protocol=SignalCalculator, factory=self._signal_calculator_factory
+            protocol="pychron.experiment.signal_calculator.SignalCalculator",
+            factory=self._signal_calculator_factory,
         )
 
         # so_image_browser = self.service_offer_factory(
@@ -266,11 +270,13 @@ class ExperimentPlugin(BaseTaskPlugin):
         #     factory=self._image_browser_factory)
 
         so_sens_selector = self.service_offer_factory(
-            protocol=SensitivitySelector, factory=self._sens_selector_factory
+            protocol="pychron.entry.entry_views.sensitivity_entry.SensitivitySelector",
+            factory=self._sens_selector_factory,
         )
 
         so_run_history = self.service_offer_factory(
-            protocol=RunHistoryView, factory=self._run_history_factory
+            protocol="pychron.experiment.run_history_view.RunHistoryView",
+            factory=self._run_history_factory,
         )
         return [
             so_signal_calculator,
@@ -0,0 +1,92 @@
+import json
+import unittest
+
+from pychron.experiment.automated_run.profiler import MeasurementProfiler
+
+
+class Clock:
+    def __init__(self):
+        self.t = 0
+
+    def __call__(self):
+        return self.t
+
+
+class MeasurementProfilerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+
+    def _iteration(self, prof, i, wait=1.0, save=0.01):
+        clock = self.clock
+        prof.start(i)
+        with prof.phase("wait"):
+            clock.t += wait
+        with prof.phase("save"):
+            clock.t += save
+        clock.t += 0.001
+        prof.stop()
+
+    def test_phases(self):
+        prof = MeasurementProfiler(capacity=10, clock=self.clock)
+        prof.reset(period=1.0)
+        for i in range(3):
+            self._iteration(prof, i + 1, save=0.01 * (i + 1))
+
+        self.assertEqual(len(prof), 3)
+        self.assertEqual(prof.counts.tolist(), [1, 2, 3])
+        for a, b in zip(prof.timings("save"), (0.01, 0.02, 0.03)):
+            self.assertAlmostEqual(a, b)
+        for a, b in zip(prof.overhead(), (0.011, 0.021, 0.031)):
+            self.assertAlmostEqual(a, b)
+        self.assertTrue((prof.timings("plot") == 0).all())
+
+        s = prof.summary()
+        self.assertAlmostEqual(s["save"]["max"], 30)
+        self.assertAlmostEqual(s["total"]["median"], 1021)
+        self.assertIn("% of period", prof.report())
+
+    def test_ring_buffer(self):
+        prof = MeasurementProfiler(capacity=4, clock=self.clock)
+        for i in range(10):
+            self._iteration(prof, i + 1)
+
+        self.assertEqual(len(prof), 4)
+        self.assertEqual(prof.niterations, 10)
+        self.assertEqual(prof.counts.tolist(), [7, 8, 9, 10])
+        self.assertEqual(prof.timings().shape, (4, len(prof.columns)))
+
+        prof.reset()
+        self.assertEqual(len(prof), 0)
+        self.assertEqual(prof.summary(), {})
+
+    def test_unfinished_iteration(self):
+        prof = MeasurementProfiler(capacity=4, clock=self.clock)
+        self._iteration(prof, 1)
+        prof.start(2)
+        prof.stop()
+        prof.stop()
+        self.assertEqual(prof.counts.tolist(), [1, 2])
+
+    def test_histogram(self):
+        prof = MeasurementProfiler(capacity=100, clock=self.clock)
+        for i in range(50):
+            self._iteration(prof, i + 1, save=0.001 * (i % 5))
+
+        f, edges = prof.histogram("save", bins=5)
+        self.assertEqual(f.tolist(), [10] * 5)
+        self.assertAlmostEqual(edges[-1], 4)
+
+    def test_to_dict(self):
+        prof = MeasurementProfiler(capacity=10, clock=self.clock)
+        prof.reset(period=1.0)
+        self._iteration(prof, 1)
+
+        d = json.loads(json.dumps(prof.to_dict()))
+        self.assertEqual(d["counts"], [1])
+        self.assertEqual(d["period"], 1.0)
+        self.assertEqual(set(d["timings"]), set(prof.columns))
+        self.assertAlmostEqual(d["timings"]["wait"][0], 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -35,7 +35,8 @@ from pychron.git_archive.diff_view import DiffView, DiffModel
 from pychron.git_archive.git_objects import GitSha
 from pychron.git_archive.history import BaseGitHistory
 from pychron.git_archive.merge_view import MergeModel, MergeView
-from pychron.git_archive.utils import get_head_commit, ahead_behind, from_gitlog, LOGFMT
+from pychron.git_archive.repo_status import repository_status
+from pychron.git_archive.utils import get_head_commit, from_gitlog, LOGFMT
 from pychron.git_archive.views import NewBranchView
 from pychron.loggable import Loggable
 from pychron.pychron_constants import DATE_FORMAT, NULL_STR
@@ -152,6 +153,7 @@ class GitRepoManager(Loggable):
             branch = self._repo.active_branch.name
 
         self._repo.git.reset("--hard", "{}/{}".format(remote, branch))
+        repository_status.invalidate(self._repo.working_dir)
 
     def delete_commits(self, hexsha, remote="origin", branch=None, push=True):
         if branch is None:
@@ -160,6 +162,7 @@ class GitRepoManager(Loggable):
         self._repo.git.reset("--hard", hexsha)
         if push:
             self._repo.git.push(remote, branch, "--force")
+        repository_status.invalidate(self._repo.working_dir)
 
     def add_paths_explicit(self, apaths):
         self.index.add(apaths)
@@ -731,11 +734,13 @@ class GitRepoManager(Loggable):
         handled=True,
         use_progress=True,
         use_auto_pull=False,
+        fetch=True,
     ):
         """
         fetch and merge
 
         if use_auto_pull is False ask user if they want to accept the available updates
+        if fetch is False merge changes that have already been fetched
         """
         self.debug("pulling {} from {}".format(branch, remote))
 
@@ -758,13 +763,14 @@ class GitRepoManager(Loggable):
                 prog.change_message(
                     'Fetching branch:"{}" from "{}"'.format(branch, remote)
                 )
-            try:
-                self.fetch(remote)
-            except GitCommandError as e:
-                self.debug(e)
-                if not handled:
-                    raise e
-            self.debug("fetch complete")
+            if fetch:
+                try:
+                    self.fetch(remote)
+                except GitCommandError as e:
+                    self.debug(e)
+                    if not handled:
+                        raise e
+                self.debug("fetch complete")
 
             def merge():
                 try:
@@ -774,7 +780,7 @@ class GitRepoManager(Loggable):
                     self.smart_pull(branch=branch, remote=remote)
 
             if not use_auto_pull:
-                ahead, behind = self.ahead_behind(remote)
+                ahead, behind = self.ahead_behind(remote, fetch=fetch)
                 if behind:
                     if self.confirmation_dialog(
                         'Repository "{}" is behind the official version by {} changes.\n'
@@ -793,6 +799,8 @@ class GitRepoManager(Loggable):
             if use_progress:
                 prog.close()
 
+            repository_status.invalidate(self._repo.working_dir)
+
         self.debug("pull complete")
 
     def has_remote(self, remote="origin"):
@@ -807,6 +815,7 @@ class GitRepoManager(Loggable):
 
             try:
                 self._repo.git.push(remote, branch)
+                repository_status.invalidate(self._repo.working_dir)
                 if inform:
                     self.information_dialog("{} push complete".format(self.name))
             except GitCommandError as e:
@@ -944,6 +953,7 @@ class GitRepoManager(Loggable):
                 self._git_command(
                     lambda g: g.merge("FETCH_HEAD"), "GitRepoManager.smart_pull/!ahead"
                 )
+            repository_status.invalidate(repo.working_dir)
         else:
             self.debug("Up-to-date with {}".format(remote))
             if not quiet:
@@ -953,18 +963,72 @@ class GitRepoManager(Loggable):
 
         return True
 
-    def fetch(self, remote="origin"):
+    def fetch(self, remote="origin", handled=True):
         if self._repo:
-            return self._git_command(lambda g: g.fetch(remote), "GitRepoManager.fetch")
-            # return self._repo.git.fetch(remote)
+            if not handled:
+                ret = self._repo.git.fetch(remote)
+            else:
+                ret = self._git_command(
+                    lambda g: g.fetch(remote), "GitRepoManager.fetch"
+                )
+                if ret is None:
+                    return
 
-    def ahead_behind(self, remote="origin"):
-        self.debug("ahead behind")
+            repository_status.fetched(self._repo.working_dir, remote)
+            return ret
+
+    def remote_changed(self, remote="origin", branch=None):
+        """
+        check if a pull from ``remote`` is required using a single ls-remote round trip
+        instead of a full fetch. ``branch`` should be the branch that will be pulled,
+        defaults to the current branch.
+
+        return False if the remote head matches the local tracking ref and that ref is
+        already merged into HEAD.
 
+        a repository without ``remote`` returns False because ``pull`` is a no-op for it.
+        any other case that cannot be decided here (detached head, missing remote
+        branch, ls-remote error) returns True so the caller falls back to a normal pull,
+        which reports the problem
+        """
         repo = self._repo
-        ahead, behind = ahead_behind(repo, remote)
+        if not self._get_remote(remote):
+            return False
+
+        if branch is None:
+            try:
+                branch = self.get_current_branch()
+            except TypeError:
+                # detached head
+                return True
+
+        try:
+            txt = repo.git.ls_remote(remote, "refs/heads/{}".format(branch))
+            if not txt:
+                return True
+
+            remote_sha = txt.split()[0]
+            local_sha = repo.git.rev_parse("{}/{}".format(remote, branch))
+        except GitCommandError as e:
+            self.debug("remote changed check failed. {}".format(e))
+            return True
 
-        return ahead, behind
+        if remote_sha != local_sha:
+            return True
+
+        return not repo.is_ancestor(local_sha, "HEAD")
+
+    def ahead_behind(self, remote="origin", fetch=True):
+        """
+        the fetch is skipped if ``remote`` was fetched recently. see RepositoryStatusService
+        """
+        self.debug("ahead behind")
+        if not self._repo:
+            return 0, 0
+
+        return repository_status.ahead_behind(
+            self._repo.working_dir, remote=remote, fetch=fetch
+        )
 
     def merge(self, from_, to_=None, inform=True):
         repo = self._repo
@@ -977,6 +1041,7 @@ class GitRepoManager(Loggable):
 
         try:
             repo.git.merge(src.commit)
+            repository_status.invalidate(repo.working_dir)
         except GitCommandError:
             self.debug_exception()
             if inform:
@@ -993,6 +1058,7 @@ class GitRepoManager(Loggable):
         if index:
             try:
                 index.commit(msg, author=author, committer=author)
+                repository_status.invalidate(self._repo.working_dir)
                 return True
             except git.exc.GitError as e:
                 self.warning("Commit failed: {}".format(e))
@@ -1193,6 +1259,7 @@ class GitRepoManager(Loggable):
 
             if commit:
                 index.commit(msg)
+                repository_status.invalidate(self._repo.working_dir)
 
     def _get_remote(self, remote):
         repo = self._repo
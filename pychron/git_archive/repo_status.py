@@ -0,0 +1,319 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+from traits.api import Int, Float
+
+# ============= standard library imports ========================
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import urlparse
+
+from git import Git
+from git.exc import GitCommandError, InvalidGitRepositoryError
+
+# ============= local library imports  ==========================
+from pychron.loggable import Loggable
+
+
+def format_age(seconds):
+    seconds = max(0, int(seconds))
+    for unit, n in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= n:
+            return "{}{}".format(seconds // n, unit)
+    return "{}s".format(seconds)
+
+
+def remote_host(url):
+    """
+    the host of a remote url. scp style urls (git@host:org/name) are supported and
+    local paths are grouped under "local"
+    """
+    if "://" in url:
+        return urlparse(url).hostname or "local"
+    elif ":" in url and not os.path.exists(url):
+        return url.split(":")[0].split("@")[-1]
+    return "local"
+
+
+class RepoStatus(object):
+    """
+    a snapshot of a repository's HEAD, upstream and working tree
+    """
+
+    __slots__ = (
+        "path",
+        "branch",
+        "head",
+        "upstream",
+        "upstream_sha",
+        "ahead",
+        "behind",
+        "dirty",
+        "timestamp",
+        "valid",
+        "error",
+    )
+
+    def __init__(self, path, timestamp=None):
+        self.path = path
+        self.branch = None
+        self.head = None
+        self.upstream = None
+        self.upstream_sha = None
+        self.ahead = 0
+        self.behind = 0
+        self.dirty = False
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.valid = True
+        self.error = None
+
+    @property
+    def age(self):
+        return time.time() - self.timestamp
+
+    @property
+    def age_str(self):
+        return format_age(self.age)
+
+    def __repr__(self):
+        return "RepoStatus({}, ahead={}, behind={}, dirty={}, age={})".format(
+            os.path.basename(self.path),
+            self.ahead,
+            self.behind,
+            self.dirty,
+            self.age_str,
+        )
+
+
+def parse_status(path, txt):
+    """
+    parse ``git status --porcelain=v2 --branch``
+    """
+    st = RepoStatus(path)
+    for line in txt.splitlines():
+        if line.startswith("# "):
+            key, _, value = line[2:].partition(" ")
+            if key == "branch.oid":
+                st.head = None if value == "(initial)" else value
+            elif key == "branch.head":
+                st.branch = None if value == "(detached)" else value
+            elif key == "branch.upstream":
+                st.upstream = value
+            elif key == "branch.ab":
+                a, b = value.split()
+                st.ahead = int(a)
+                st.behind = abs(int(b))
+        elif line:
+            st.dirty = True
+    return st
+
+
+def read_status(path):
+    """
+    HEAD, upstream, ahead/behind and dirty state with one status call and, if there
+    is an upstream, one rev-parse
+    """
+    if not os.path.exists(os.path.join(path, ".git")):
+        raise InvalidGitRepositoryError(path)
+
+    g = Git(path)
+    st = parse_status(
+        path, g.status("--porcelain=v2", "--branch", "--untracked-files=no")
+    )
+    if st.upstream:
+        try:
+            st.upstream_sha = g.rev_parse("--verify", "-q", st.upstream)
+        except GitCommandError:
+            pass
+    return st
+
+
+class RepositoryStatusService(Loggable):
+    """
+    cache of repository status.
+
+    ``get`` answers from the cache and schedules a background refresh when an entry
+    is missing, invalidated or older than ``max_age``. A repository's remote is not
+    fetched again within ``fetch_interval`` and at most ``host_fetches`` fetches run
+    against one host at a time
+    """
+
+    workers = Int(4)
+    fetch_interval = Float(60)
+    host_fetches = Int(2)
+    max_age = Float(300)
+
+    def __init__(self, *args, **kw):
+        super(RepositoryStatusService, self).__init__(*args, **kw)
+        self._lock = threading.RLock()
+        self._cache = {}
+        self._pending = {}
+        self._fetch_times = {}
+        self._remote_urls = {}
+        self._host_semaphores = {}
+        self._executor = None
+
+    def get(self, path, callback=None, refresh=True):
+        """
+        return the cached status of ``path``, or None, without blocking.
+
+        ``callback`` is called with the new status, from a worker thread, if a
+        refresh is scheduled
+        """
+        path = os.path.abspath(path)
+        st = self._cache.get(path)
+        if refresh and (st is None or not st.valid or st.age > self.max_age):
+            self.refresh([path], callback=callback)
+        return st
+
+    def refresh(self, paths, fetch=True, remote="origin", callback=None):
+        """
+        refresh ``paths`` in the background. return a list of futures
+        """
+        futures = []
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.workers, thread_name_prefix="RepoStatus"
+                )
+
+            for p in paths:
+                p = os.path.abspath(p)
+                f = self._pending.get(p)
+                if f is None:
+                    f = self._executor.submit(self._refresh, p, fetch, remote)
+                    self._pending[p] = f
+                    f.add_done_callback(lambda f, p=p: self._done(p, f))
+
+                if callback:
+                    f.add_done_callback(lambda f: callback(f.result()))
+                futures.append(f)
+        return futures
+
+    def update(self, path, fetch=True, remote="origin"):
+        """
+        fetch, if the remote was not fetched recently, and read the status of
+        ``path``. git errors are raised
+        """
+        path = os.path.abspath(path)
+        if fetch:
+            self._fetch(path, str(remote))
+
+        st = read_status(path)
+        self._cache[path] = st
+        return st
+
+    def ahead_behind(self, path, remote="origin", fetch=True):
+        st = self.update(path, fetch=fetch, remote=remote)
+        return st.ahead, st.behind
+
+    def invalidate(self, path):
+        """
+        mark the status of ``path`` as out of date, e.g. after a commit or merge
+        """
+        st = self._cache.get(os.path.abspath(path))
+        if st is not None:
+            st.valid = False
+
+    def fetched(self, path, remote="origin"):
+        """
+        record a fetch made outside of the service, e.g. by a pull
+        """
+        path = os.path.abspath(path)
+        self._fetch_times[(path, str(remote))] = time.time()
+        self.invalidate(path)
+
+    def wait(self, timeout=None):
+        wait(list(self._pending.values()), timeout=timeout)
+
+    def clear(self):
+        self._cache = {}
+        self._fetch_times = {}
+        self._remote_urls = {}
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    # private
+    def _done(self, path, future):
+        with self._lock:
+            if self._pending.get(path) is future:
+                self._pending.pop(path)
+
+    def _refresh(self, path, fetch, remote):
+        try:
+            return self.update(path, fetch, remote)
+        except (GitCommandError, InvalidGitRepositoryError, OSError) as e:
+            self.debug("failed refreshing status {}. {}".format(path, e))
+            st = self._cache.get(path)
+            if st is None:
+                st = RepoStatus(path)
+                self._cache[path] = st
+            st.error = e
+            return st
+
+    def _fetch(self, path, remote):
+        url = self._remote_url(path, remote)
+        if url is None:
+            return
+
+        key = (path, remote)
+        if self._recently_fetched(key):
+            return
+
+        with self._host_semaphore(remote_host(url)):
+            # the repository may have been fetched while waiting for the host
+            if self._recently_fetched(key):
+                return
+
+            Git(path).fetch(remote)
+            self._fetch_times[key] = time.time()
+            return True
+
+    def _recently_fetched(self, key):
+        last = self._fetch_times.get(key)
+        return last is not None and time.time() - last < self.fetch_interval
+
+    def _remote_url(self, path, remote):
+        key = (path, remote)
+        try:
+            return self._remote_urls[key]
+        except KeyError:
+            try:
+                url = Git(path).config("--get", "remote.{}.url".format(remote))
+            except GitCommandError:
+                url = None
+            self._remote_urls[key] = url
+            return url
+
+    def _host_semaphore(self, host):
+        with self._lock:
+            s = self._host_semaphores.get(host)
+            if s is None:
+                s = threading.BoundedSemaphore(self.host_fetches)
+                self._host_semaphores[host] = s
+            return s
+
+
+repository_status = RepositoryStatusService()
+
+# ============= EOF =============================================
@@ -0,0 +1,80 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+# no display is available when running headless
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from git import Repo
+
+from pychron.git_archive.repo_manager import GitRepoManager
+
+
+def commit(repo, msg):
+    with repo.config_writer() as cw:
+        cw.set_value("user", "name", "test")
+        cw.set_value("user", "email", "test@test.com")
+    repo.git.commit("--allow-empty", "-m", msg)
+
+
+class BareRemoteTestCase(unittest.TestCase):
+    """
+    a bare repository acting as "origin", an upstream clone used to push new commits
+    and a local clone under test
+    """
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.origin = os.path.join(self.root, "origin.git")
+        origin = Repo.init(self.origin, bare=True)
+        origin.git.symbolic_ref("HEAD", "refs/heads/master")
+
+        self.upstream = Repo.clone_from(
+            self.origin, os.path.join(self.root, "upstream")
+        )
+        commit(self.upstream, "initial")
+        self.upstream.git.push("origin", "HEAD:master")
+
+        self.local_path = os.path.join(self.root, "local")
+        self.local = Repo.clone_from(self.origin, self.local_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def push_upstream(self, msg="change"):
+        commit(self.upstream, msg)
+        self.upstream.git.push("origin", "HEAD:master")
+
+
+class RemoteChangedTestCase(BareRemoteTestCase):
+    def setUp(self):
+        super(RemoteChangedTestCase, self).setUp()
+        self.repo = GitRepoManager()
+        self.repo.open_repo(self.local_path)
+
+    def test_unchanged(self):
+        self.assertFalse(self.repo.remote_changed(branch="master"))
+
+    def test_remote_advanced(self):
+        self.push_upstream()
+        self.assertTrue(self.repo.remote_changed(branch="master"))
+
+    def test_fetched_not_merged(self):
+        self.push_upstream()
+        self.local.git.fetch("origin")
+        self.assertTrue(self.repo.remote_changed(branch="master"))
+
+        self.local.git.merge("origin/master")
+        self.assertFalse(self.repo.remote_changed(branch="master"))
+
+    def test_no_remote(self):
+        self.local.git.remote("remove", "origin")
+        self.assertFalse(self.repo.remote_changed(branch="master"))
+
+    def test_missing_branch(self):
+        self.assertTrue(self.repo.remote_changed(branch="nobranch"))
+
+
+if __name__ == "__main__":
+    unittest.main()
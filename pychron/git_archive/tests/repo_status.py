@@ -0,0 +1,189 @@
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+from git import Git, Repo
+
+from pychron.git_archive import repo_status
+from pychron.git_archive.repo_manager import GitRepoManager
+from pychron.git_archive.repo_status import (
+    RepositoryStatusService,
+    repository_status,
+    remote_host,
+    format_age,
+)
+from pychron.git_archive.tests.repo_manager import BareRemoteTestCase, commit
+
+
+class CountingGit(Git):
+    lock = threading.Lock()
+    fetches = []
+    active = 0
+    max_active = 0
+
+    def fetch(self, *args):
+        cls = CountingGit
+        with cls.lock:
+            cls.fetches.append(self._working_dir)
+            cls.active += 1
+            cls.max_active = max(cls.active, cls.max_active)
+        try:
+            time.sleep(0.05)
+            return self._call_process("fetch", *args)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    @classmethod
+    def reset(cls):
+        cls.fetches = []
+        cls.active = cls.max_active = 0
+
+
+class RepositoryStatusTestCase(BareRemoteTestCase):
+    def setUp(self):
+        super(RepositoryStatusTestCase, self).setUp()
+        self.service = RepositoryStatusService(workers=4, fetch_interval=60)
+        CountingGit.reset()
+
+    def tearDown(self):
+        self.service.shutdown()
+        super(RepositoryStatusTestCase, self).tearDown()
+
+    def test_status(self):
+        st = self.service.update(self.local_path)
+        self.assertEqual(st.branch, "master")
+        self.assertEqual(st.upstream, "origin/master")
+        self.assertEqual(st.head, self.local.head.commit.hexsha)
+        self.assertEqual(st.upstream_sha, st.head)
+        self.assertEqual((st.ahead, st.behind, st.dirty), (0, 0, False))
+
+        commit(self.local, "local change")
+        with open(os.path.join(self.local_path, "a.txt"), "w") as wfile:
+            wfile.write("a")
+        # untracked files do not make the repository dirty
+        st = self.service.update(self.local_path, fetch=False)
+        self.assertEqual((st.ahead, st.dirty), (1, False))
+
+        self.local.git.add("a.txt")
+        st = self.service.update(self.local_path, fetch=False)
+        self.assertTrue(st.dirty)
+
+    def test_behind(self):
+        self.push_upstream()
+        self.assertEqual(self.service.ahead_behind(self.local_path), (0, 1))
+
+        # the remote was just fetched so the second fetch is skipped
+        self.push_upstream()
+        with mock.patch.object(repo_status, "Git", CountingGit):
+            self.assertEqual(self.service.ahead_behind(self.local_path), (0, 1))
+            self.assertEqual(CountingGit.fetches, [])
+
+            self.service.fetch_interval = 0
+            self.assertEqual(self.service.ahead_behind(self.local_path), (0, 2))
+            self.assertEqual(len(CountingGit.fetches), 1)
+
+    def test_cached(self):
+        service = self.service
+        called = []
+        self.assertIsNone(service.get(self.local_path, callback=called.append))
+        service.wait()
+        self.assertEqual(len(called), 1)
+
+        st = service.get(self.local_path)
+        self.assertIs(st, called[0])
+
+        st = time.perf_counter()
+        for i in range(1000):
+            service.get(self.local_path)
+        self.assertLess((time.perf_counter() - st) / 1000, 1e-4)
+        self.assertEqual(service.get(self.local_path).age_str, "0s")
+
+        # invalidated entries are returned and refreshed in the background
+        commit(self.local, "local change")
+        service.invalidate(self.local_path)
+        st = service.get(self.local_path)
+        self.assertEqual(st.ahead, 0)
+        service.wait()
+        self.assertEqual(service.get(self.local_path).ahead, 1)
+
+    def test_invalid(self):
+        p = os.path.join(self.root, "missing")
+        (f,) = self.service.refresh([p])
+        st = f.result()
+        self.assertIsNotNone(st.error)
+        self.assertIsNone(st.head)
+
+    def test_rate_limited(self):
+        service = self.service
+        service.host_fetches = 2
+
+        ps = []
+        for i in range(8):
+            p = os.path.join(self.root, "clone{}".format(i))
+            Repo.clone_from(self.origin, p)
+            ps.append(p)
+
+        self.push_upstream()
+        with mock.patch.object(repo_status, "Git", CountingGit):
+            sts = [f.result() for f in service.refresh(ps)]
+
+            self.assertEqual(sorted(CountingGit.fetches), ps)
+            self.assertEqual([st.behind for st in sts], [1] * 8)
+            # four workers but only two fetches from the same host at a time
+            self.assertEqual(CountingGit.max_active, 2)
+
+            # each repository is fetched at most once per fetch_interval
+            CountingGit.reset()
+            service.refresh(ps)
+            service.wait()
+            self.assertEqual(CountingGit.fetches, [])
+
+    def test_helpers(self):
+        self.assertEqual(
+            remote_host("https://github.com/NMGRLData/a.git"), "github.com"
+        )
+        self.assertEqual(remote_host("git@gitlab.com:org/a.git"), "gitlab.com")
+        self.assertEqual(remote_host(self.origin), "local")
+        self.assertEqual(format_age(5), "5s")
+        self.assertEqual(format_age(125), "2m")
+        self.assertEqual(format_age(7300), "2h")
+
+
+class RepoManagerHooksTestCase(BareRemoteTestCase):
+    def setUp(self):
+        super(RepoManagerHooksTestCase, self).setUp()
+        repository_status.clear()
+        self.repo = GitRepoManager()
+        self.repo.open_repo(self.local_path)
+
+    def tearDown(self):
+        repository_status.clear()
+        super(RepoManagerHooksTestCase, self).tearDown()
+
+    def test_commit(self):
+        p = self.local.working_dir
+        self.assertEqual(repository_status.update(p).ahead, 0)
+
+        with open(os.path.join(self.local_path, "a.txt"), "w") as wfile:
+            wfile.write("a")
+        commit(self.local, "config")
+        self.repo.add("a.txt", commit=False)
+        self.repo.commit("add a")
+        self.assertFalse(repository_status.get(p, refresh=False).valid)
+        self.assertEqual(self.repo.ahead_behind(), (2, 0))
+
+    def test_fetch(self):
+        CountingGit.reset()
+        self.push_upstream()
+        self.repo.fetch()
+        with mock.patch.object(repo_status, "Git", CountingGit):
+            self.assertEqual(self.repo.ahead_behind(), (0, 1))
+        # the fetch made by the manager is not repeated
+        self.assertEqual(CountingGit.fetches, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -113,6 +113,9 @@ class Globals(object):
 
     laser_version = 1
 
+    import_profile = False
+    import_budget = None
+
     def build(self, ip):
         for attr, func in [
             ("use_ipc", to_bool),
@@ -160,6 +163,8 @@ class Globals(object):
             ("client_only_locking", to_bool),
             ("cert_file", str),
             ("laser_version", int),
+            ("import_profile", to_bool),
+            ("import_budget", float),
         ]:
             a = ip.get_global(attr)
             if a is not None:
@@ -41,6 +41,7 @@ from traitsui.api import View, Item, UItem
 from pychron.core.helpers.color_generators import colorname_generator as color_generator
 from pychron.core.helpers.filetools import add_extension
 from pychron.graph.context_menu_mixin import ContextMenuMixin
+from pychron.graph.lod import LODSeries
 from pychron.graph.ml_label import MPlotAxis
 from pychron.graph.offset_plot_label import OffsetPlotLabel
 from pychron.graph.tools.axis_tool import AxisTool
@@ -197,6 +198,12 @@ class Graph(ContextMenuMixin):
     data_len = List
     data_limits = List
 
+    # series served through a LODSeries are decimated to the visible range and
+    # plot width once they have more points than this
+    lod_threshold = 5000
+    lods = Dict
+    _lod_updating = False
+
     def __init__(self, *args, **kw):
         """ """
         super(Graph, self).__init__(*args, **kw)
@@ -256,6 +263,11 @@ class Graph(ContextMenuMixin):
         if isinstance(series, (str, six.text_type)):
             s = series
         else:
+            lod = self.lods.get((plotid, series))
+            if lod is not None:
+                # full resolution data
+                return lod.y if axis else lod.x
+
             s = self.series[plotid][series][axis]
 
         p = self.plots[plotid]
@@ -346,6 +358,7 @@ class Graph(ContextMenuMixin):
         self.series = [[] for _ in x]
         self.data_len = [[] for _ in x]
         self.data_limits = [[] for _ in x]
+        self.lods = {}
 
         for pi in self.plots:
             for k, pp in list(pi.plots.items()):
@@ -407,6 +420,7 @@ class Graph(ContextMenuMixin):
 
     def clear_data(self, plotid=None, **kw):
         if plotid is None:
+            self.lods = {}
             for i, p in enumerate(self.plots):
                 for s in self.series[i]:
                     for k in s:
@@ -417,11 +431,42 @@ class Graph(ContextMenuMixin):
     def set_data(self, d, plotid=0, series=0, axis=0):
         """ """
         if isinstance(series, int):
+            # the data is replaced, stop serving the old level of detail store
+            self.lods.pop((plotid, series), None)
             n = self.series[plotid][series]
             series = n[axis]
 
         self.plots[plotid].data.set_data(series, d)
 
+    def set_lod(self, plotid=0, series=0, x=None, y=None):
+        """
+        serve a series through a level of detail store. only the points needed for
+        the visible range and plot width are handed to the renderer. x must be
+        sorted
+        """
+        if x is None:
+            x = self.get_data(plotid, series)
+            y = self.get_data(plotid, series, axis=1)
+
+        lod = LODSeries(x, y)
+        self.lods[(plotid, series)] = lod
+
+        plot = self.plots[plotid]
+        if not getattr(plot, "lod_bound", False):
+            plot.lod_bound = True
+
+            def handler():
+                self._refresh_lod(plot)
+
+            plot.index_range.on_trait_change(handler, "updated")
+            plot.on_trait_change(handler, "bounds, bounds_items")
+
+        self._set_lod_view(plotid, series, lod)
+        return lod
+
+    def get_lod(self, plotid=0, series=0):
+        return self.lods.get((plotid, series))
+
     def set_axis_traits(self, plotid=0, axis="x", **kw):
         """ """
         plot = self.plots[plotid]
@@ -1054,6 +1099,48 @@ class Graph(ContextMenuMixin):
                     for row in a:
                         write(",".join(["{:0.8f}".format(r) for r in row]))
 
+    def _refresh_lod(self, plot):
+        if self._lod_updating:
+            return
+
+        try:
+            plotid = self.plots.index(plot)
+        except ValueError:
+            return
+
+        for (pid, series), lod in list(self.lods.items()):
+            if pid == plotid:
+                self._set_lod_view(plotid, series, lod)
+
+    def _set_lod_view(self, plotid, series, lod):
+        plot = self.plots[plotid]
+        r = plot.index_range
+        npixels = int(plot.width) or 1000
+
+        if len(lod) > self.lod_threshold:
+            key = (lod.version, r.low, r.high, npixels)
+        else:
+            key = (lod.version,)
+
+        if key == getattr(lod, "view_key", None):
+            return
+
+        if len(key) > 1:
+            x, y = lod.get_view(r.low, r.high, npixels)
+        else:
+            x, y = lod.x, lod.y
+
+        lod.view_key = key
+        lod.view_x = x
+
+        xn, yn = self.series[plotid][series][:2]
+        self._lod_updating = True
+        try:
+            plot.data.set_data(xn, x)
+            plot.data.set_data(yn, y)
+        finally:
+            self._lod_updating = False
+
     def _series_factory(self, x, y, yer=None, plotid=0, add=True, **kw):
         """ """
 
@@ -0,0 +1,303 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+
+# ============= standard library imports ========================
+from numpy import arange, asarray, empty, hstack, sort, take_along_axis
+
+# ============= local library imports  ==========================
+
+
+class GrowableArray(object):
+    """
+    1D array with amortized O(1) append and drop from the front.
+
+    appending never modifies elements already in a view, so a view can be handed to
+    a renderer without copying
+
+    elements are addressed by absolute index, i.e. the number of elements ever
+    appended before them, so dropping old elements does not renumber the rest
+    """
+
+    def __init__(self, dtype=float, capacity=64):
+        self._data = empty(capacity, dtype=dtype)
+        # absolute index of _data[0]
+        self._offset = 0
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    @property
+    def start(self):
+        return self._start
+
+    @property
+    def end(self):
+        return self._end
+
+    def view(self, start=None, end=None):
+        """
+        elements [start, end) by absolute index
+        """
+        if start is None:
+            start = self._start
+        if end is None:
+            end = self._end
+        return self._data[start - self._offset : end - self._offset]
+
+    def take(self, idx):
+        return self._data[asarray(idx) - self._offset]
+
+    def append(self, v):
+        self._reserve(1)
+        self._data[self._end - self._offset] = v
+        self._end += 1
+
+    def extend(self, vs):
+        vs = asarray(vs)
+        n = vs.shape[0]
+        self._reserve(n)
+        i = self._end - self._offset
+        self._data[i : i + n] = vs
+        self._end += n
+
+    def drop_front(self, start):
+        """
+        drop every element before absolute index start
+        """
+        self._start = min(max(self._start, start), self._end)
+
+    def clear(self):
+        self._data = empty(self._data.shape[0], dtype=self._data.dtype)
+        self._offset = self._start = self._end = 0
+
+    def _reserve(self, n):
+        cap = self._data.shape[0]
+        used = self._end - self._offset
+        if used + n <= cap:
+            return
+
+        # always reallocate, never move in place, so views handed out earlier stay
+        # valid snapshots
+        live = self._end - self._start
+        if live + n > cap // 2:
+            cap = max(cap * 2, live + n)
+
+        data = empty(cap, dtype=self._data.dtype)
+        data[:live] = self.view()
+        self._data = data
+        self._offset = self._start
+
+
+class LODSeries(object):
+    """
+    level of detail store for an x sorted series.
+
+    keeps the full resolution data and a pyramid of decimated levels. level k
+    holds, for every block of factor**k points, the indices of the smallest and
+    largest y. a view of any x range at a given pixel width is assembled from the
+    coarsest level that still has about two points per pixel, so the rendered
+    envelope of the data is preserved exactly while the number of points handed to
+    the renderer stays bounded.
+
+    appending is amortized O(1), only the blocks completed by the new point are
+    reduced. dropping old points (streaming data limits) discards whole blocks
+    """
+
+    def __init__(self, x=None, y=None, factor=4):
+        self.factor = factor
+        self._x = GrowableArray()
+        self._y = GrowableArray()
+        self._levels = []
+        self.is_sorted = True
+        # incremented on every modification
+        self.version = 0
+        if x is not None:
+            self.set_data(x, y)
+
+    def __len__(self):
+        return len(self._x)
+
+    @property
+    def x(self):
+        return self._x.view()
+
+    @property
+    def y(self):
+        return self._y.view()
+
+    def set_data(self, x, y):
+        x = asarray(x, dtype=float)
+        y = asarray(y, dtype=float)
+        self._x.clear()
+        self._y.clear()
+        self._x.extend(x)
+        self._y.extend(y)
+        self.is_sorted = bool((x[1:] >= x[:-1]).all())
+        self._build()
+        self.version += 1
+
+    def append(self, x, y):
+        n = self._x.end
+        if n > self._x.start and x < self._x.view(n - 1, n)[0]:
+            self.is_sorted = False
+
+        self._x.append(x)
+        self._y.append(y)
+        self.version += 1
+
+        n += 1
+        for k in range(1, len(self._levels) + 1):
+            b = self.factor**k
+            if n % b:
+                break
+
+            self._reduce_block(k, n // b - 1)
+        else:
+            b = self.factor ** (len(self._levels) + 1)
+            if n == b:
+                self._levels.append(GrowableArray(dtype=int))
+                self._reduce_block(len(self._levels), 0)
+
+    def trim(self, n):
+        """
+        keep only the last n points
+        """
+        start = max(self._x.end - n, self._x.start)
+        if start == self._x.start:
+            return
+
+        self.version += 1
+        self._x.drop_front(start)
+        self._y.drop_front(start)
+        for k, level in enumerate(self._levels):
+            level.drop_front(2 * (start // self.factor ** (k + 1)))
+
+    def limits(self):
+        """
+        return the min and max y. O(factor * nlevels)
+        """
+        if not len(self):
+            return
+        ys = self._y.take(self._query(len(self._levels), self._x.start, self._x.end))
+        return ys.min(), ys.max()
+
+    def get_view(self, low=None, high=None, npixels=1000):
+        """
+        return the x, y arrays needed to render [low, high] at npixels width.
+        one point either side of the window is included so lines reach the edges
+        """
+        x = self._x.view()
+        start, end = self._x.start, self._x.end
+        if not self.is_sorted:
+            return x, self._y.view()
+
+        if low is not None:
+            start = max(start, start + int(x.searchsorted(low)) - 1)
+        if high is not None:
+            end = min(end, self._x.start + int(x.searchsorted(high, "right")) + 1)
+
+        n = end - start
+        if n <= 0:
+            return x[:0], self._y.view()[:0]
+
+        npixels = max(int(npixels), 1)
+        if n <= 2 * npixels:
+            return self._x.view(start, end), self._y.view(start, end)
+
+        k = 0
+        while k < len(self._levels) and n > 2 * npixels * self.factor**k:
+            k += 1
+
+        # always keep the end points so the rendered line spans the window
+        idx = self._query(k, start, end)
+        idx = hstack((start, idx[(idx != start) & (idx != end - 1)], end - 1))
+        return self._x.take(idx), self._y.take(idx)
+
+    # private
+    def _build(self):
+        self._levels = []
+        x0 = self._x.start
+        n = len(self._x)
+        idx = arange(x0, x0 + n)
+        y = self._y.view()
+
+        k = 1
+        width = 1
+        while n >= self.factor**k:
+            # entries per block in the level below
+            nblocks = n // self.factor**k
+            prev = idx[: nblocks * width * self.factor].reshape(nblocks, -1)
+            ys = y[prev - x0]
+            lo = take_along_axis(prev, ys.argmin(axis=1)[:, None], axis=1)
+            hi = take_along_axis(prev, ys.argmax(axis=1)[:, None], axis=1)
+            idx = sort(hstack((lo, hi)), axis=1).ravel()
+
+            level = GrowableArray(dtype=int, capacity=max(idx.shape[0], 64))
+            level.extend(idx)
+            self._levels.append(level)
+
+            width = 2
+            k += 1
+
+    def _reduce_block(self, k, j):
+        """
+        reduce block j of level k from the entries of level k - 1
+        """
+        f = self.factor
+        b = f**k
+        if j * b < self._x.start:
+            # partially dropped. never queried, only keeps the level aligned
+            lo = hi = (j + 1) * b - 1
+        else:
+            if k == 1:
+                idx = arange(j * f, (j + 1) * f)
+            else:
+                idx = self._levels[k - 2].view(2 * j * f, 2 * (j + 1) * f)
+
+            ys = self._y.take(idx)
+            lo, hi = idx[ys.argmin()], idx[ys.argmax()]
+            if lo > hi:
+                lo, hi = hi, lo
+
+        self._levels[k - 1].extend((lo, hi))
+
+    def _query(self, k, start, end):
+        """
+        indices representing the points [start, end) at level k
+        """
+        if k == 0:
+            return arange(start, end)
+
+        b = self.factor**k
+        first = -(-start // b)
+        last = end // b
+        if first >= last:
+            return self._query(k - 1, start, end)
+
+        return hstack(
+            (
+                self._query(k - 1, start, first * b),
+                self._levels[k - 1].view(2 * first, 2 * last),
+                self._query(k - 1, last * b, end),
+            )
+        )
+
+
+# ============= EOF =============================================
@@ -18,12 +18,13 @@
 from chaco.lineplot import LinePlot
 from chaco.text_box_overlay import TextBoxOverlay
 from enable.component_editor import ComponentEditor
-from numpy import linspace
+from numpy import asarray, linspace
 from traits.api import List, Any, Event, Callable, Dict, Int, Bool
 from traitsui.api import View, UItem
 
 from pychron.core.helpers.fits import convert_fit
 from pychron.core.regression.base_regressor import BaseRegressor
+from pychron.core.ui.gui import invoke_in_main_thread
 from pychron.graph.context_menu_mixin import RegressionContextMenuMixin
 from pychron.graph.error_envelope_overlay import ErrorEnvelopeOverlay
 from pychron.graph.graph import Graph
@@ -41,6 +42,18 @@ from pychron.graph.tools.regression_inspector import (
 from pychron.pychron_constants import AUTO_LINEAR_PARABOLIC, EXPONENTIAL
 
 
+def has_event_loop():
+    from pyface.qt.QtCore import QCoreApplication
+
+    return QCoreApplication.instance() is not None
+
+
+def data_key(ds):
+    d = ds.get_data()
+    if d is not None:
+        return hash(asarray(d).tobytes())
+
+
 class StatisticsTextBoxOverlay(TextBoxOverlay):
     pass
 
@@ -79,6 +92,10 @@ class RegressionGraph(Graph, RegressionContextMenuMixin):
     grouping = Int
     show_grouping = Bool
 
+    # coalesce bursts of metadata changes, e.g. bound selections, into one update
+    coalesce_updates = True
+    _update_pending = False
+
     # def __init__(self, *args, **kw):
     #     super(RegressionGraph, self).__init__(*args, **kw)
     #     self._regression_lock = Lock()
@@ -419,7 +436,7 @@ class RegressionGraph(Graph, RegressionContextMenuMixin):
         return NoRegressionCTX(self, refresh=refresh)
 
     def refresh(self, **kw):
-        self._update_graph()
+        self._update_graph(force=True)
 
     def update_metadata(self, obj, name, old, new):
         """
@@ -430,11 +447,27 @@ class RegressionGraph(Graph, RegressionContextMenuMixin):
             if obj.suppress_hover_update:
                 return
 
-        self._update_graph()
+        if self.coalesce_updates and has_event_loop():
+            if not self._update_pending:
+                self._update_pending = True
+                invoke_in_main_thread(self._deferred_update)
+        else:
+            self._update_graph()
 
     # private
+    def _deferred_update(self):
+        self._update_pending = False
+        self._update_graph()
+
     def _update_graph(self, *args, **kw):
+        """
+        refit and redraw only the series whose data, fit, exclusions or range
+        changed since the last update. force=True refits every series
+        """
+        force = kw.get("force", False)
+
         regs = []
+        changed = []
         for i, plot in enumerate(self.plots):
             ps = plot.plots
             ks = list(ps.keys())
@@ -446,31 +479,73 @@ class RegressionGraph(Graph, RegressionContextMenuMixin):
                 fls = [ps["fit{}".format(idx)][0] for idx in idxes]
                 for si, fl in zip(scatters, fls):
                     if not si.no_regression:
-                        r = self._plot_regression(plot, si, fl)
+                        r, dirty = self._plot_regression(plot, si, fl, force)
                         regs.append((plot, r))
+                        if dirty and plot not in changed:
+                            changed.append(plot)
 
             except ValueError as e:
                 # add a float instead of regressor to regs
                 try:
                     si = ps[ks[0]][0]
                     regs.append((plot, si.value.get_data()[-1]))
+                    changed.append(plot)
                 except IndexError:
                     break
 
+        if not changed:
+            return
+
         self.regression_results = regs
 
         # force layout updates. i.e for ErrorBarOverlay
-        for plot in self.plots:
+        for plot in changed:
             for p in plot.plots.values():
                 p[0]._layout_needed = True
+            plot.request_redraw()
+
+    def _plot_regression(self, plot, scatter, line, force=False):
+        """
+        return the regressor for this series and whether it was refit
+        """
+        key = self._regression_key(plot, scatter, line)
+        state = getattr(scatter, "regression_state", None)
+        if not force and state is not None:
+            skey, r, reg = state
+            if skey == key and reg is getattr(line, "regressor", None):
+                return r, False
 
-        self.redraw(force=False)
+        r = None
+        if plot.visible:
+            r = self._regress(plot, scatter, line)
 
-    def _plot_regression(self, plot, scatter, line):
-        if not plot.visible:
-            return
+        # the regression can change the selections, e.g. filtered outliers
+        key = self._regression_key(plot, scatter, line)
+        scatter.regression_state = (key, r, getattr(line, "regressor", None))
+        return r, True
 
-        return self._regress(plot, scatter, line)
+    def _regression_key(self, plot, scatter, line):
+        """
+        everything the fit and the rendered fit line depend on
+        """
+        sel = scatter.index.metadata.get("selections")
+        if sel is not None:
+            sel = tuple(sel)
+
+        yerror = getattr(scatter, "yerror", None)
+        return (
+            plot.visible,
+            scatter.fit,
+            scatter.truncate,
+            sorted(scatter.filter_outliers_dict.items()),
+            sel,
+            data_key(scatter.index),
+            data_key(scatter.value),
+            data_key(yerror) if yerror is not None else None,
+            plot.index_range._low_value,
+            plot.index_range._high_value,
+            getattr(line, "regression_bounds", None),
+        )
 
     def _regress(self, plot, scatter, line):
         fit, err = convert_fit(scatter.fit)
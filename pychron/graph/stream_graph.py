@@ -26,7 +26,7 @@ set_qt()
 from pyface.timer.api import do_after as do_after_timer
 
 # =============standard library imports ========================
-from numpy import hstack, Inf
+from numpy import Inf
 import time
 
 # =============local library imports  ==========================
@@ -168,13 +168,7 @@ class StreamGraph(Graph):
         self.set_x_limits(max_=ma, min_=mi, plotid=plotid)
 
     def record(self, y, x=None, series=0, plotid=0, track_x=True, track_y=True):
-
-        xn, yn = self.series[plotid][series]
-
-        plot = self.plots[plotid]
-
-        xd = plot.data.get_data(xn)
-        yd = plot.data.get_data(yn)
+        lod = self._get_record_lod(plotid, series)
         if x is None:
             try:
                 tg = self.time_generators[plotid]
@@ -205,16 +199,17 @@ class StreamGraph(Graph):
                 mi = self.cur_min[plotid]
 
             self.set_y_limits(max_=ma, min_=mi, pad="0.1", plotid=plotid)
-        lim = int(-dl)
 
-        new_xd = hstack((xd[lim:], [nx]))
-        new_yd = hstack((yd[lim:], [float(y)]))
+        # amortized append instead of rebuilding the arrays for every sample
+        lod.append(nx, float(y))
+        if dl:
+            lod.trim(int(dl) + 1)
 
-        plot.data.set_data(xn, new_xd)
-        plot.data.set_data(yn, new_yd)
+        self._set_lod_view(plotid, series, lod)
 
-        self.cur_max[plotid] = max(self.cur_max[plotid], max(new_yd))
-        self.cur_min[plotid] = min(self.cur_min[plotid], min(new_yd))
+        mi, ma = lod.limits()
+        self.cur_max[plotid] = max(self.cur_max[plotid], ma)
+        self.cur_min[plotid] = min(self.cur_min[plotid], mi)
         return nx
 
     def record_multiple(self, ys, plotid=0, series=None, track_y=True):
@@ -241,6 +236,20 @@ class StreamGraph(Graph):
         self._set_xlimits(x, plotid=plotid)
         return x
 
+    def _get_record_lod(self, plotid, series):
+        lod = self.lods.get((plotid, series))
+        if lod is not None:
+            xn = self.series[plotid][series][0]
+            # data was set outside of record, e.g. cleared
+            if self.plots[plotid].data.get_data(xn) is not lod.view_x:
+                lod = None
+
+        if lod is None:
+            xn, yn = self.series[plotid][series][:2]
+            data = self.plots[plotid].data
+            lod = self.set_lod(plotid, series, data.get_data(xn), data.get_data(yn))
+        return lod
+
 
 class StreamStackedGraph(StreamGraph, StackedGraph):
     pass
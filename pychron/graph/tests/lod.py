@@ -0,0 +1,107 @@
+import unittest
+
+from numpy import arange, array, diff, nonzero, random, sort
+
+from pychron.graph.lod import GrowableArray, LODSeries
+
+
+class LODSeriesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.rs = random.RandomState(0)
+
+    def _series(self, n):
+        x = sort(self.rs.uniform(0, 1000, n))
+        y = self.rs.normal(0, 1, n).cumsum()
+        return x, y
+
+    def _check_view(self, lod, x, y, low, high, npixels):
+        vx, vy = lod.get_view(low, high, npixels)
+        idx = nonzero((x >= low) & (x <= high))[0]
+        if not idx.shape[0]:
+            return
+
+        a, b = max(idx[0] - 1, 0), min(idx[-1] + 2, x.shape[0])
+        # the envelope of the window is preserved
+        self.assertEqual(vy.min(), y[a:b].min())
+        self.assertEqual(vy.max(), y[a:b].max())
+        self.assertEqual(vx[0], x[a])
+        self.assertEqual(vx[-1], x[b - 1])
+        self.assertTrue((diff(vx) >= 0).all())
+        self.assertLessEqual(vx.shape[0], 4 * npixels + 200)
+
+    def test_views(self):
+        for n in (10, 1000, 12345, 100000):
+            x, y = self._series(n)
+            lod = LODSeries(x, y)
+            for i in range(30):
+                low, high = sort(self.rs.uniform(-10, 1010, 2))
+                self._check_view(lod, x, y, low, high, self.rs.randint(1, 800))
+
+    def test_full_view(self):
+        x, y = self._series(100000)
+        lod = LODSeries(x, y)
+        vx, vy = lod.get_view(npixels=500)
+        self.assertLessEqual(vx.shape[0], 2000)
+        self.assertEqual(lod.limits(), (y.min(), y.max()))
+
+    def test_small(self):
+        x, y = self._series(100)
+        vx, vy = LODSeries(x, y).get_view(npixels=500)
+        self.assertTrue((vx == x).all())
+        self.assertTrue((vy == y).all())
+
+    def test_append_matches_bulk(self):
+        x, y = self._series(5000)
+        bulk = LODSeries(x, y)
+        lod = LODSeries()
+        for xi, yi in zip(x, y):
+            lod.append(xi, yi)
+
+        self.assertEqual(len(bulk._levels), len(lod._levels))
+        for a, b in zip(bulk._levels, lod._levels):
+            self.assertTrue((a.view() == b.view()).all())
+
+    def test_trim(self):
+        lod = LODSeries()
+        xs, ys = [], []
+        for i in range(20000):
+            yi = self.rs.normal()
+            lod.append(float(i), yi)
+            xs.append(float(i))
+            ys.append(yi)
+            lod.trim(3000)
+
+            if not i % 997:
+                x, y = array(xs[-3000:]), array(ys[-3000:])
+                self.assertTrue((lod.x == x).all())
+                self.assertEqual(lod.limits(), (y.min(), y.max()))
+                for j in range(5):
+                    low, high = sort(self.rs.uniform(x[0] - 5, x[-1] + 5, 2))
+                    self._check_view(lod, x, y, low, high, self.rs.randint(1, 500))
+
+        # memory is bounded by the data limit
+        self.assertLess(lod._x._data.shape[0], 10000)
+
+    def test_unsorted(self):
+        lod = LODSeries([0, 2, 1], [1, 2, 3])
+        self.assertFalse(lod.is_sorted)
+        vx, vy = lod.get_view(0, 1, 1)
+        self.assertEqual(list(vx), [0, 2, 1])
+
+
+class GrowableArrayTestCase(unittest.TestCase):
+    def test_views_are_snapshots(self):
+        a = GrowableArray(capacity=4)
+        a.extend(arange(3))
+        v = a.view()
+        for i in range(100):
+            a.append(i)
+            a.drop_front(a.end - 5)
+
+        self.assertEqual(list(v), [0, 1, 2])
+        self.assertEqual(list(a.view()), [95, 96, 97, 98, 99])
+        self.assertEqual(list(a.take([a.start, a.end - 1])), [95, 99])
+
+
+if __name__ == "__main__":
+    unittest.main()
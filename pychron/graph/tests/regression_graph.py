@@ -0,0 +1,111 @@
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from numpy import linspace, random
+
+from pychron.graph import regression_graph
+from pychron.graph.regression_graph import RegressionGraph
+
+
+class CountingRegressionGraph(RegressionGraph):
+    coalesce_updates = False
+
+    def __init__(self, *args, **kw):
+        super(CountingRegressionGraph, self).__init__(*args, **kw)
+        self.nregress = []
+
+    def _regress(self, plot, scatter, line):
+        self.nregress.append(scatter)
+        return super(CountingRegressionGraph, self)._regress(plot, scatter, line)
+
+
+class RegressionGraphTestCase(unittest.TestCase):
+    def setUp(self):
+        rs = random.RandomState(1)
+        self.graph = g = CountingRegressionGraph()
+        self.scatters = []
+        self.lines = []
+        for i in range(4):
+            g.new_plot()
+            xs = linspace(0, 100, 20)
+            ys = i + 0.01 * xs + rs.normal(0, 0.01, 20)
+            _, s, l = g.new_series(xs, ys, fit="linear", plotid=i)
+            self.scatters.append(s)
+            self.lines.append(l)
+
+        g.refresh()
+        g.nregress = []
+
+    def _select(self, i, sel):
+        self.scatters[i].index.metadata["selections"] = sel
+
+    def test_refresh(self):
+        self.graph.refresh()
+        self.assertEqual(len(self.graph.nregress), 4)
+
+    def test_selection_refits_one_series(self):
+        results = []
+        self.graph.on_trait_change(
+            lambda new: results.append(new), "regression_results"
+        )
+
+        a = self.lines[1].regressor.predict(0)
+        self._select(2, [3])
+        self.assertEqual(self.graph.nregress, [self.scatters[2]])
+        self.assertEqual(self.lines[2].regressor.user_excluded, [3])
+        self.assertEqual(self.lines[1].regressor.predict(0), a)
+
+        # every series is still reported
+        self.assertEqual(len(results[-1]), 4)
+
+    def test_unchanged(self):
+        self._select(2, [])
+        self.assertEqual(self.graph.nregress, [])
+
+    def test_fit_changed(self):
+        self.graph.set_fit("parabolic", plotid=3)
+        self.graph.refresh()
+        self.graph.nregress = []
+
+        self.graph.set_fit("linear", plotid=3)
+        self.graph._update_graph()
+        self.assertEqual(self.graph.nregress, [self.scatters[3]])
+        self.assertEqual(self.lines[3].regressor.degree, 1)
+
+    def test_data_changed(self):
+        s = self.scatters[1]
+        ys = s.value.get_data().copy()
+        ys[0] += 1
+        s.value.set_data(ys)
+        self.graph._update_graph()
+        self.assertEqual(self.graph.nregress, [s])
+
+    def test_coalesce(self):
+        calls = []
+        g = self.graph
+        g.coalesce_updates = True
+
+        has_event_loop = regression_graph.has_event_loop
+        invoke = regression_graph.invoke_in_main_thread
+        regression_graph.has_event_loop = lambda: True
+        regression_graph.invoke_in_main_thread = calls.append
+        try:
+            self._select(0, [1])
+            self._select(1, [1])
+            self._select(2, [1])
+        finally:
+            regression_graph.has_event_loop = has_event_loop
+            regression_graph.invoke_in_main_thread = invoke
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(g.nregress, [])
+
+        calls[0]()
+        self.assertEqual(g.nregress, self.scatters[:3])
+        self.assertFalse(g._update_pending)
+
+
+if __name__ == "__main__":
+    unittest.main()
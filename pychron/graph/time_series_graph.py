@@ -124,9 +124,13 @@ class TimeSeriesGraph(Graph):
         downsample=None,
         use_smooth=False,
         scale=None,
+        use_lod=None,
         **kw
     ):
-        """ """
+        """
+        use_lod: serve the series through a level of detail store so only the points
+        needed for the visible range are rendered. None enables it for line series
+        """
         if not time_series:
             return super(TimeSeriesGraph, self).new_series(
                 x=x, y=y, plotid=plotid, **kw
@@ -169,13 +173,20 @@ class TimeSeriesGraph(Graph):
                 xd = xd * scale
 
         plot, names, rd = self._series_factory(xd, y, plotid=plotid, **kw)
-        if "type" in rd:
-            if rd["type"] == "line_scatter":
-                plot.plot(names, type="scatter", marker_size=2, marker="circle")
-                rd["type"] = "line"
+        ptype = rd.get("type", "line")
+        if ptype == "line_scatter":
+            plot.plot(names, type="scatter", marker_size=2, marker="circle")
+            rd["type"] = "line"
 
         plota = plot.plot(names, **rd)[0]
 
+        if use_lod is None:
+            # decimating scatters would break index based selections
+            use_lod = ptype == "line"
+
+        if use_lod and xd is not None and y is not None:
+            self.set_lod(plotid, len(self.series[plotid]) - 1, x=xd, y=y)
+
         #        plota.unified_draw = True
         #        plota.use_downsampling = True
         # if the plot is not visible dont remove the underlays
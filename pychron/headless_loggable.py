@@ -46,8 +46,8 @@ class HeadlessLoggable(HasTraits):
     def warning(self, msg, **kw):
         self.logger.warning(msg)
 
-    def debug(self, msg, **kw):
-        self.logger.debug(msg)
+    def debug(self, msg, *args, **kw):
+        self.logger.debug(msg, *args)
 
     def critical(self, msg, **kw):
         self.logger.critcial(msg)
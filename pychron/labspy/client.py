@@ -28,6 +28,7 @@ from pychron.core.helpers.logger_setup import logging_setup
 from pychron.core.yaml import yload
 from pychron.hardware.core.i_core_device import ICoreDevice
 from pychron.labspy.database_adapter import LabspyDatabaseAdapter
+from pychron.labspy.publisher import MeasurementPublisher
 from pychron.loggable import Loggable
 from pychron.paths import paths
 from pychron.pychron_constants import SCRIPT_NAMES, NULL_STR
@@ -87,9 +88,7 @@ class NotificationTrigger(object):
         message = """device: {}
 tag: {}
 cmp: {}
-test_value: {} ({})""".format(
-            dev, tag, mcmp, val, unit
-        )
+test_value: {} ({})""".format(dev, tag, mcmp, val, unit)
         return addrs, sub, message
 
 
@@ -105,6 +104,7 @@ class LabspyClient(Loggable):
     connection_status_period = Int
 
     _timer = None
+    _publisher = None
     session_lock = None
 
     def __init__(self, bind=True, *args, **kw):
@@ -287,19 +287,30 @@ class LabspyClient(Loggable):
                     "{}Monitor".format(ms), "{}{}".format(ms, name), v, units
                 )
 
-    @auto_connect
     def add_measurement(self, dev, tag, val, unit):
-        val = float(val)
-        self.debug(
-            "adding measurement dev={} process={} value={} ({})".format(
-                dev, tag, val, unit
+        """
+        queue a measurement. measurements are inserted in batches by the publisher
+        thread so the caller never waits on the database
+        """
+        self.publisher.put(dev, tag, float(val), unit)
+
+    def stop(self):
+        if self._publisher:
+            self._publisher.stop()
+            self._publisher = None
+
+    @property
+    def publisher(self):
+        if self._publisher is None:
+            spool = None
+            if paths.labspy_dir:
+                spool = os.path.join(paths.labspy_dir, "measurement_spool.jsonl")
+
+            self._publisher = MeasurementPublisher(
+                self._insert_measurements, spool_path=spool
             )
-        )
-        try:
-            self.db.add_measurement(dev, tag, val, unit)
-            self._check_notifications(dev, tag, val, unit)
-        except BaseException as e:
-            self.debug("failed adding measurement. {}".format(e))
+            self._publisher.start()
+        return self._publisher
 
     def connect(self):
         self.warning("not connected to db {}".format(self.db.public_url))
@@ -337,8 +348,36 @@ class LabspyClient(Loggable):
 
         return config
 
-    def _check_notifications(self, dev, tag, val, unit):
-        if not os.path.isfile(paths.notification_triggers):
+    def _insert_measurements(self, ms):
+        """
+        insert a batch of measurements in one transaction. return False if the
+        database is not reachable or the commit failed
+        """
+        db = self.db
+        with self.session_lock:
+            if not db.connected:
+                self.connect()
+
+            if not db.connected:
+                return False
+
+            self.debug("adding {} measurements".format(len(ms)))
+            with db.session_ctx(use_parent_session=False):
+                with db.deferred_commit(commit=False):
+                    db.add_measurements(ms)
+                ok = db.commit()
+
+        if ok:
+            # the batch is written. a notification failure must not cause a retry
+            try:
+                self._check_notifications(ms)
+            except BaseException as e:
+                self.warning("failed checking notifications. {}".format(e))
+        return ok
+
+    def _check_notifications(self, ms):
+        p = paths.notification_triggers
+        if not p or not os.path.isfile(p):
             self.debug(
                 "no notification trigger file available. {}".format(
                     paths.notification_triggers
@@ -347,11 +386,13 @@ class LabspyClient(Loggable):
             return
 
         ns = []
-        for nt in self.notification_triggers:
-            self.debug("testing {} {} {} {}".format(dev, tag, val, unit))
-            if nt.test(dev, tag, val, unit):
-                self.debug("notification triggered")
-                ns.append(nt.notify(val, unit))
+        triggers = self.notification_triggers
+        for dev, tag, val, unit, _ in ms:
+            for nt in triggers:
+                self.debug("testing {} {} {} {}".format(dev, tag, val, unit))
+                if nt.test(dev, tag, val, unit):
+                    self.debug("notification triggered")
+                    ns.append(nt.notify(val, unit))
         self.debug("notifications: {}".format(ns))
         if ns:
             emailer = self.application.get_service(
@@ -122,6 +122,29 @@ class LabspyDatabaseAdapter(DatabaseAdapter):
         else:
             self.warning("ProcessInfo={} Device={} not available".format(name, dev))
 
+    def add_measurements(self, ms):
+        """
+        add a batch of (dev, name, value, unit, timestamp) measurements. the process
+        info of each device/name is looked up once and the rows are flushed together
+        """
+        pinfos = {}
+        for dev, name, value, unit, ts in ms:
+            key = (dev, name)
+            if key not in pinfos:
+                pinfos[key] = pinfo = self.get_process_info(dev, name)
+                if not pinfo:
+                    self.warning(
+                        "ProcessInfo={} Device={} not available".format(name, dev)
+                    )
+
+            pinfo = pinfos[key]
+            if pinfo:
+                measurement = Measurement(value=value, pub_date=ts)
+                measurement.process = pinfo
+                self.session.add(measurement)
+
+        self.session.flush()
+
     def add_process_info(self, dev, name, unit):
         self.debug("add process info {} {} {}".format(dev, name, unit))
         dbdev = self.get_device(dev)
@@ -0,0 +1,213 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+
+# ============= standard library imports ========================
+import json
+import logging
+import os
+from collections import deque
+from datetime import datetime
+from threading import Condition, Thread
+
+# ============= local library imports  ==========================
+
+TIMESTAMP_FMT = "%Y-%m-%dT%H:%M:%S.%f"
+
+logger = logging.getLogger("MeasurementPublisher")
+
+
+class MeasurementPublisher(object):
+    """
+    queue measurements and insert them in batches on a background thread so the
+    caller, e.g. a device polling loop, never waits on the database.
+
+    insert is called with a list of (dev, tag, value, unit, timestamp) tuples and
+    returns True if the batch was written. a failed batch is appended to the spool
+    file, or kept in the buffer if there is no spool file, and retried with an
+    increasing delay. spooled measurements are inserted before new ones once the
+    database is reachable again.
+
+    the buffer is bounded, when it is full the oldest measurements are dropped
+    """
+
+    def __init__(
+        self,
+        insert,
+        spool_path=None,
+        maxsize=10000,
+        batch_size=100,
+        period=1.0,
+        max_retry_period=60,
+    ):
+        self._insert = insert
+        self.spool_path = spool_path
+        self.batch_size = batch_size
+        self.period = period
+        self.max_retry_period = max_retry_period
+
+        self._buffer = deque(maxlen=maxsize)
+        self._cv = Condition()
+        self._thread = None
+        self._alive = False
+        self._retry_period = period
+
+        self.ninserted = 0
+        self.ndropped = 0
+        self.nfailed = 0
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def put(self, dev, tag, value, unit, timestamp=None):
+        if timestamp is None:
+            timestamp = datetime.now()
+
+        with self._cv:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.ndropped += 1
+            self._buffer.append((dev, tag, value, unit, timestamp))
+            if len(self._buffer) >= self.batch_size:
+                self._cv.notify()
+
+    def start(self):
+        if self._thread is None:
+            self._alive = True
+            self._thread = Thread(target=self._run, name="LabspyPublisher")
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self, flush=True, timeout=5):
+        with self._cv:
+            self._alive = False
+            self._cv.notify()
+
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+        if flush:
+            self.flush()
+
+    def flush(self):
+        """
+        insert the spooled and buffered measurements now. return True if everything
+        was written
+        """
+        if not self._publish_spool():
+            return False
+
+        while 1:
+            batch = self._pop_batch()
+            if not batch:
+                return True
+            if not self._publish(batch):
+                return False
+
+    # private
+    def _run(self):
+        while 1:
+            with self._cv:
+                if self._alive:
+                    self._cv.wait(self._retry_period)
+                if not self._alive:
+                    break
+
+            if self.flush():
+                self._retry_period = self.period
+            else:
+                self._retry_period = min(self._retry_period * 2, self.max_retry_period)
+
+    def _pop_batch(self):
+        with self._cv:
+            n = min(self.batch_size, len(self._buffer))
+            return [self._buffer.popleft() for _ in range(n)]
+
+    def _publish(self, batch):
+        if self._try_insert(batch):
+            return True
+
+        if self.spool_path:
+            # move everything to disk until the database is reachable again
+            with self._cv:
+                batch.extend(self._buffer)
+                self._buffer.clear()
+            self._spool(self.spool_path, batch)
+        else:
+            # put back in front of newer measurements
+            with self._cv:
+                for m in reversed(batch):
+                    if len(self._buffer) == self._buffer.maxlen:
+                        self.ndropped += 1
+                        break
+                    self._buffer.appendleft(m)
+        return False
+
+    def _try_insert(self, batch):
+        try:
+            ok = self._insert(batch)
+        except BaseException as e:
+            logger.warning("failed inserting measurements. {}".format(e))
+            ok = False
+
+        if ok:
+            self.ninserted += len(batch)
+        else:
+            self.nfailed += len(batch)
+        return ok
+
+    def _spool(self, p, batch, mode="a"):
+        d = os.path.dirname(p)
+        if d and not os.path.isdir(d):
+            os.makedirs(d)
+
+        with open(p, mode) as wfile:
+            for dev, tag, value, unit, ts in batch:
+                wfile.write(
+                    "{}\n".format(
+                        json.dumps((dev, tag, value, unit, ts.strftime(TIMESTAMP_FMT)))
+                    )
+                )
+
+    def _publish_spool(self):
+        p = self.spool_path
+        if not p or not os.path.isfile(p):
+            return True
+
+        with open(p, "r") as rfile:
+            ms = []
+            for line in rfile:
+                try:
+                    dev, tag, value, unit, ts = json.loads(line)
+                except ValueError:
+                    # partially written line
+                    continue
+                ms.append((dev, tag, value, unit, datetime.strptime(ts, TIMESTAMP_FMT)))
+
+        for i in range(0, len(ms), self.batch_size):
+            if not self._try_insert(ms[i : i + self.batch_size]):
+                # keep what is left for the next attempt
+                tmp = "{}.tmp".format(p)
+                self._spool(tmp, ms[i:], mode="w")
+                os.replace(tmp, p)
+                return False
+
+        os.remove(p)
+        return True
+
+
+# ============= EOF =============================================
@@ -0,0 +1,121 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+
+from pychron.labspy.publisher import MeasurementPublisher
+
+
+class Database:
+    def __init__(self):
+        self.available = True
+        self.batches = []
+        self.event = threading.Event()
+
+    def insert(self, ms):
+        if not self.available:
+            return False
+        self.batches.append(list(ms))
+        self.event.set()
+        return True
+
+    @property
+    def rows(self):
+        return [m for b in self.batches for m in b]
+
+
+class MeasurementPublisherTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.spool = os.path.join(self.root, "spool.jsonl")
+        self.db = Database()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _put(self, pub, n, start=0):
+        for i in range(start, start + n):
+            pub.put("Environmental", "temperature", float(i), "C", datetime(2020, 1, 1))
+
+    def test_batches(self):
+        pub = MeasurementPublisher(self.db.insert, batch_size=10)
+        self._put(pub, 25)
+        self.assertTrue(pub.flush())
+        self.assertEqual([len(b) for b in self.db.batches], [10, 10, 5])
+        self.assertEqual([m[2] for m in self.db.rows], list(range(25)))
+        self.assertEqual(pub.ninserted, 25)
+
+    def test_background_thread(self):
+        pub = MeasurementPublisher(self.db.insert, batch_size=5, period=10)
+        pub.start()
+        try:
+            self._put(pub, 5)
+            # a full batch wakes the thread without waiting for the period
+            self.assertTrue(self.db.event.wait(5))
+        finally:
+            pub.stop()
+        self.assertEqual(len(self.db.rows), 5)
+
+    def test_stop_flushes(self):
+        pub = MeasurementPublisher(self.db.insert, batch_size=100, period=10)
+        pub.start()
+        self._put(pub, 3)
+        pub.stop()
+        self.assertEqual(len(self.db.rows), 3)
+
+    def test_bounded_buffer(self):
+        self.db.available = False
+        pub = MeasurementPublisher(self.db.insert, maxsize=10, batch_size=4)
+        self._put(pub, 15)
+        self.assertFalse(pub.flush())
+        self.assertEqual(len(pub), 10)
+        self.assertEqual(pub.ndropped, 5)
+
+        self.db.available = True
+        self.assertTrue(pub.flush())
+        self.assertEqual([m[2] for m in self.db.rows], list(range(5, 15)))
+
+    def test_spool(self):
+        self.db.available = False
+        pub = MeasurementPublisher(self.db.insert, spool_path=self.spool, batch_size=4)
+        self._put(pub, 10)
+        self.assertFalse(pub.flush())
+        self.assertEqual(len(pub), 0)
+        self.assertTrue(os.path.isfile(self.spool))
+
+        # spooled measurements survive a restart and are inserted first
+        pub = MeasurementPublisher(self.db.insert, spool_path=self.spool, batch_size=4)
+        self._put(pub, 2, start=10)
+        self.db.available = True
+        self.assertTrue(pub.flush())
+        self.assertFalse(os.path.isfile(self.spool))
+
+        rows = self.db.rows
+        self.assertEqual([m[2] for m in rows], list(range(12)))
+        self.assertEqual(rows[0][4], datetime(2020, 1, 1))
+
+    def test_spool_partial(self):
+        self.db.available = False
+        pub = MeasurementPublisher(self.db.insert, spool_path=self.spool, batch_size=4)
+        self._put(pub, 10)
+        pub.flush()
+
+        calls = []
+
+        def insert(ms):
+            calls.append(ms)
+            return len(calls) == 1 and self.db.insert(ms)
+
+        self.db.available = True
+        pub = MeasurementPublisher(insert, spool_path=self.spool, batch_size=4)
+        self.assertFalse(pub.flush())
+
+        pub = MeasurementPublisher(self.db.insert, spool_path=self.spool, batch_size=4)
+        self.assertTrue(pub.flush())
+        self.assertEqual([m[2] for m in self.db.rows], list(range(10)))
+
+
+if __name__ == "__main__":
+    unittest.main()
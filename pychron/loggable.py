@@ -16,6 +16,7 @@
 # ===============================================================================
 
 # ============= standard library imports ========================
+import logging
 from threading import current_thread
 
 # ============= enthought library imports =======================
@@ -25,13 +26,20 @@ from traits.api import Any, String
 from pychron.base_fs import BaseFS
 from pychron.core.confirmation import confirmation_dialog
 from pychron.core.helpers.color_generators import colorname_generator
-from pychron.core.helpers.logger_setup import new_logger
+from pychron.core.helpers.logger_setup import new_logger, get_queue_handler
 from pychron.globals import globalv
 
 color_name_gen = colorname_generator()
 NAME_WIDTH = 40
 __gloggers__ = dict()
 
+LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "critical": logging.CRITICAL,
+}
+
 
 class unique(object):
     def __init__(self):
@@ -139,8 +147,12 @@ class Loggable(BaseFS):
     def critical(self, msg):
         self._log_("critical", msg)
 
-    def debug(self, msg):
-        self._log_("debug", msg)
+    def debug(self, msg, *args):
+        """
+        msg is %-formatted with args only if debug messages are logged, e.g.
+        self.debug("signals=%s", signals)
+        """
+        self._log_("debug", msg, *args)
 
     def log(self, msg, level=10):
         def log(m, *args, **kw):
@@ -211,7 +223,7 @@ class Loggable(BaseFS):
             c = next(color_name_gen)
         self.logcolor = c
 
-    def _log_(self, func, msg):
+    def _log_(self, func, msg, *args):
 
         # def get_thread_name():
         #     name = 'foo'
@@ -223,19 +235,33 @@ class Loggable(BaseFS):
         #
         #     return name
 
-        if self.logger is None:
+        logger = self.logger
+        if logger is None:
             return
 
-        # extras = {'threadName_': get_thread_name()}
+        level = None
         if isinstance(func, str):
-            func = getattr(self.logger, func)
+            level = LEVELS.get(func)
+            if level is None:
+                func = getattr(logger, func)
+            elif not logger.isEnabledFor(level):
+                return
 
         if isinstance(msg, (list, tuple)):
             msg = ",".join(map(str, msg))
 
         msg = self._post_process_msg(msg)
-        # func(msg, extra=extras)
-        func(msg)
+
+        # extras = {'threadName_': get_thread_name()}
+        if level is not None:
+            handler = get_queue_handler()
+            if handler is not None:
+                handler.log(logger, level, msg, args)
+            else:
+                logger.log(level, msg, *args)
+        else:
+            # func(msg, extra=extras)
+            func(msg, *args)
 
     def _post_process_msg(self, msg):
         return msg
@@ -366,7 +366,7 @@ class BaseFluxVisualizationEditor(BaseTraitsEditor):
         if isinstance(reg, (BSplineRegressor,)):
             g = linspace(-r, r, n)
             nz = reg.predict_grid(g, g)
-        elif isinstance(reg, (RBFRegressor, GridDataRegressor)):
+        elif hasattr(reg, "predict_grid"):
             nz = reg.predict_grid(gx, gy)
         else:
             for i in range(n):
@@ -307,6 +307,7 @@ class PipelineEngine(Loggable):
     add_pipeline = Event
     run_needed = Event
     refresh_all_needed = Event
+    refresh_needed = Event
     update_needed = Event
     refresh_table_needed = Event
     tag_event = Event
@@ -1155,8 +1156,10 @@ class PipelineEngine(Loggable):
     def _update_repository_status(self):
         for r in self.repositories:
             if r.name:
-                if not r.update():
-                    self.warning('Failed to update repo="{}"'.format(r.name))
+                r.load_status(callback=self._repository_status_loaded)
+
+    def _repository_status_loaded(self):
+        self.refresh_needed = True
 
     def _set_grouping(self, items, gid, attr="group_id"):
         for si in items:
@@ -331,6 +331,7 @@ class FluxPersistNode(DVCPersistNode):
             )
 
             dvc_dump(level_obj, p)
+            meta_repo.clear_meta_cache(p)
 
             meta_repo.add(p, commit=False)
             self.dvc.meta_commit(
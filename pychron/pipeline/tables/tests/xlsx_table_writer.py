@@ -0,0 +1,312 @@
+import math
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import zipfile
+from datetime import datetime, timedelta
+from xml.etree import ElementTree
+
+import xlsxwriter
+from numpy import random
+from uncertainties import ufloat
+
+from pychron.core.helpers.filetools import add_extension
+from pychron.paths import paths
+from pychron.pipeline.tables.column import (
+    Column,
+    VColumn,
+    EColumn,
+    SigFigColumn,
+    SigFigEColumn,
+)
+from pychron.pipeline.tables.xlsx_table_writer import XLSXAnalysisTableWriter
+
+NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+
+class LegacyXLSXAnalysisTableWriter(XLSXAnalysisTableWriter):
+    """
+    the previous writer, a Format added for every cell and the cells written one at a
+    time to an in memory worksheet
+    """
+
+    def _new_workbook(self, path):
+        self._workbook = xlsxwriter.Workbook(
+            add_extension(path, ".xlsx"), {"nan_inf_to_errors": True}
+        )
+
+    def _legacy_number_format(self, kind=None, use_scientific=False, sig_figs=2):
+        fn = self._workbook.add_format()
+        fn.set_num_format(self._get_num_format(kind, use_scientific, sig_figs))
+        return fn
+
+    def _legacy_fmt(self, col):
+        fmt = None
+        if col.sigformat:
+            fmt = self._legacy_number_format(col.sigformat, col.use_scientific)
+        elif col.fformat:
+            fmt = self._workbook.add_format()
+            for cmd, args in col.fformat:
+                getattr(fmt, cmd)(*args)
+        return fmt
+
+    def _legacy_sigfig_fmt(self, col, txt):
+        try:
+            kind = None
+            sf = math.ceil((abs(math.log10(txt))))
+        except ValueError:
+            kind = col.sigformat
+            sf = 2
+
+        fmt = self._legacy_number_format(
+            kind=kind, use_scientific=col.use_scientific, sig_figs=sf
+        )
+        if txt >= 1:
+            fmt.set_num_format("0")
+        return fmt
+
+    def _make_analysis(
+        self, sh, cols, item, is_last=False, is_plateau_step=None, cum=""
+    ):
+        row = self._current_row
+
+        fmt = self._workbook.add_format()
+
+        status = "X" if item.is_omitted() else ""
+        highlight_color = self._options.highlight_color.name()
+        if is_plateau_step is False:
+            fmt.set_bg_color(highlight_color)
+            if not status:
+                status = "pX"
+
+        sh.write(row, 0, status, fmt)
+
+        pcfmt = None
+        for j, c in enumerate(cols[1:]):
+            if c.attr == "cumulative_ar39":
+                txt = cum
+            else:
+                txt = self._get_txt(item, c)
+
+            if self._options.use_standard_sigfigs:
+                if isinstance(c, SigFigColumn):
+                    cfmt = pcfmt = self._legacy_sigfig_fmt(
+                        c, self._get_txt(item, cols[j + 2])
+                    )
+                elif isinstance(c, SigFigEColumn):
+                    cfmt = pcfmt
+                else:
+                    cfmt = self._legacy_fmt(c)
+            else:
+                cfmt = self._legacy_fmt(c)
+
+            if cfmt:
+                if is_plateau_step is False:
+                    cfmt.set_bg_color(highlight_color)
+            else:
+                cfmt = fmt
+
+            if is_last:
+                cfmt.set_bottom(1)
+
+            if c.label in ("N", "Power"):
+                sh.write(row, j + 1, txt, cfmt)
+            elif c.label == "RunDate":
+                sh.write_datetime(row, j + 1, txt, cfmt)
+            else:
+                if isinstance(txt, float):
+                    sh.write_number(row, j + 1, txt, cell_format=cfmt)
+                else:
+                    sh.write(row, j + 1, txt, fmt)
+
+            c.calculate_width(txt)
+        self._current_row += 1
+
+
+class StubAnalysis(object):
+    def __init__(self, i, age, err, kca, omitted):
+        self.identifier = "{:05d}".format(60000 + i // 20)
+        self.aliquot_step_str = "{:02d}{}".format(i // 20, chr(65 + i % 20))
+        self.nsteps = i % 20 + 1
+        self.rundate = datetime(2026, 1, 1) + timedelta(minutes=i)
+        self.uage = ufloat(age, err)
+        self.kca = ufloat(kca, kca * 0.05)
+        self.tag = None if i % 11 else "invalid"
+        self.cumulative = 100.0 * (i % 20) / 19.0
+        self._omitted = omitted
+
+    def is_omitted(self):
+        return self._omitted
+
+
+def make_analyses(n, seed=3):
+    random.seed(seed)
+    ages = random.normal(28.2, 3, n)
+    errs = 10 ** random.uniform(-4, 1, n)
+    # exact zeros take the fallback sig figs path
+    errs[::97] = 0
+    kcas = random.uniform(0.1, 20, n)
+    omitted = random.uniform(size=n) < 0.1
+    return [
+        StubAnalysis(i, a, e, k, o)
+        for i, (a, e, k, o) in enumerate(zip(ages, errs, kcas, omitted))
+    ]
+
+
+def make_columns():
+    return [
+        Column(label="Status"),
+        Column(attr="identifier", label="Identifier"),
+        Column(attr="aliquot_step_str", label="Step"),
+        Column(attr="tag", label="Tag"),
+        Column(attr="nsteps", label="N"),
+        Column(
+            attr="rundate",
+            label="RunDate",
+            fformat=[("set_num_format", ("mm/dd/yy hh:mm",))],
+        ),
+        SigFigColumn(attr="uage", label="Age", sigformat="age"),
+        SigFigEColumn(attr="uage", sigformat="age"),
+        VColumn(attr="kca", label="K/Ca", sigformat="kca"),
+        EColumn(attr="kca", sigformat="kca", use_scientific=True),
+        EColumn(attr="kca", label="K/Ca Error"),
+        Column(attr="cumulative_ar39", label="Cum. %39Ar", sigformat="cumulative"),
+    ]
+
+
+def read_cells(path, sheet="sheet1"):
+    """
+    map each cell reference to its value and the xml of its resolved style
+    """
+
+    def tostring(e):
+        return ElementTree.tostring(e) if e is not None else None
+
+    with zipfile.ZipFile(path) as z:
+        names = z.namelist()
+        styles = ElementTree.fromstring(z.read("xl/styles.xml"))
+        strings = []
+        if "xl/sharedStrings.xml" in names:
+            sst = ElementTree.fromstring(z.read("xl/sharedStrings.xml"))
+            strings = [
+                "".join(t.text or "" for t in si.iter(NS + "t"))
+                for si in sst.iter(NS + "si")
+            ]
+        ws = ElementTree.fromstring(z.read("xl/worksheets/{}.xml".format(sheet)))
+
+    numfmts = {
+        n.get("numFmtId"): n.get("formatCode") for n in styles.iter(NS + "numFmt")
+    }
+    parts = {
+        k: [tostring(e) for e in styles.find("{}{}s".format(NS, k))]
+        for k in ("font", "fill", "border")
+    }
+    xfs = []
+    for xf in styles.find(NS + "cellXfs"):
+        nid = xf.get("numFmtId")
+        xfs.append(
+            (
+                numfmts.get(nid, nid),
+                parts["font"][int(xf.get("fontId"))],
+                parts["fill"][int(xf.get("fillId"))],
+                parts["border"][int(xf.get("borderId"))],
+                tostring(xf.find(NS + "alignment")),
+            )
+        )
+
+    cells = {}
+    for c in ws.iter(NS + "c"):
+        # shared and inline strings are both plain strings
+        t = c.get("t")
+        if t == "s":
+            v = strings[int(c.find(NS + "v").text)]
+        elif t == "inlineStr":
+            v = "".join(e.text or "" for e in c.iter(NS + "t"))
+        else:
+            v = c.find(NS + "v")
+            if v is not None:
+                v = v.text
+        if t in ("s", "inlineStr"):
+            t = "str"
+        cells[c.get("r")] = (t, v, xfs[int(c.get("s", 0))])
+    return cells
+
+
+class XLSXTableWriterTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from pychron.pipeline.tables.xlsx_table_options import (
+            XLSXAnalysisTableWriterOptions,
+        )
+
+        cls.root = tempfile.mkdtemp()
+        paths.build(cls.root)
+        cls.options = XLSXAnalysisTableWriterOptions("xlsx_table_writer_test")
+        cls.analyses = make_analyses(20000)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.root)
+
+    def _write(self, writer, name, analyses):
+        cols = make_columns()
+        path = os.path.join(self.root, name)
+        writer._options = self.options
+        writer._new_workbook(path)
+        sh = writer._workbook.add_worksheet("Unknowns")
+        writer._current_row = 1
+
+        n = len(analyses)
+        st = time.perf_counter()
+        for i, a in enumerate(analyses):
+            plateau = None
+            if i % 3 == 0:
+                plateau = i % 7 != 0
+
+            writer._make_analysis(
+                sh,
+                cols,
+                a,
+                is_last=i % 50 == 49 or i == n - 1,
+                is_plateau_step=plateau,
+                cum=a.cumulative,
+            )
+        writer._workbook.close()
+        et = time.perf_counter() - st
+        return "{}.xlsx".format(path), cols, et
+
+    def _assert_matches(self, analyses):
+        lpath, lcols, lt = self._write(
+            LegacyXLSXAnalysisTableWriter(), "legacy", analyses
+        )
+        writer = XLSXAnalysisTableWriter()
+        path, cols, t = self._write(writer, "streaming", analyses)
+
+        expected = read_cells(lpath)
+        cells = read_cells(path)
+        self.assertEqual(len(cells), len(expected))
+        for k, v in expected.items():
+            self.assertEqual(cells[k], v, k)
+
+        self.assertEqual(
+            [c.calculated_width for c in cols], [c.calculated_width for c in lcols]
+        )
+        return writer, lt, t
+
+    def test_matches_legacy(self):
+        writer, lt, t = self._assert_matches(self.analyses)
+        self.assertLess(len(writer._formats), 100)
+        self.assertLess(t, lt)
+
+    def test_no_standard_sigfigs(self):
+        self.options.use_standard_sigfigs = False
+        try:
+            self._assert_matches(self.analyses[:500])
+        finally:
+            self.options.use_standard_sigfigs = True
+
+
+if __name__ == "__main__":
+    unittest.main()
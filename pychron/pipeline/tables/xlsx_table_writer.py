@@ -65,8 +65,71 @@ def format_mswd(t, n=3):
     return FM(m, v, include_tag=True, n=n)
 
 
+class FormatRegistry(object):
+    """
+    interns workbook formats by their properties so identical cells share one Format.
+
+    the returned formats are shared, never mutate them. ask for a format with the
+    additional properties instead
+    """
+
+    def __init__(self, workbook):
+        self._workbook = workbook
+        self._formats = {}
+
+    def __len__(self):
+        return len(self._formats)
+
+    def get(self, props=None, **kw):
+        if props:
+            kw = dict(props, **kw)
+
+        key = tuple(sorted(kw.items()))
+        fmt = self._formats.get(key)
+        if fmt is None:
+            fmt = self._formats[key] = self._workbook.add_format(kw)
+        return fmt
+
+
+class CompiledColumn(object):
+    """
+    a table column resolved once per sheet. get returns the cell value of an analysis,
+    props the cell format properties or None if the cell uses the row format
+    """
+
+    __slots__ = ("column", "get", "props", "kind", "cumulative", "write")
+
+    def __init__(self, column, get, props, kind, cumulative, write):
+        self.column = column
+        self.get = get
+        self.props = props
+        self.kind = kind
+        self.cumulative = cumulative
+        self.write = write
+
+
+def make_getter(col):
+    attr = col.attr
+    if attr is None:
+        return lambda item: ""
+
+    func = col.func
+    if func is None:
+        func = getattr
+
+    def get(item):
+        v = func(item, attr)
+        if isinstance(v, Variable):
+            v = nominal_value(v)
+        return v
+
+    return get
+
+
 class XLSXAnalysisTableWriter(BaseTableWriter):
     _workbook = None
+    _formats = None
+    _compiled = None
     _current_row = 0
     _bold = None
     _superscript = None
@@ -75,9 +138,13 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
     _options = Instance(XLSXAnalysisTableWriterOptions)
 
     def _new_workbook(self, path):
+        # rows are written in order so they can be streamed to disk
         self._workbook = xlsxwriter.Workbook(
-            add_extension(path, ".xlsx"), {"nan_inf_to_errors": True}
+            add_extension(path, ".xlsx"),
+            {"nan_inf_to_errors": True, "constant_memory": True},
         )
+        self._formats = FormatRegistry(self._workbook)
+        self._compiled = None
 
     def build(self, groups, path=None, options=None):
         if options is None:
@@ -92,12 +159,13 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
 
         self._new_workbook(path)
 
-        self._bold = self._workbook.add_format({"bold": True})
-        self._superscript = self._workbook.add_format({"font_script": 1})
-        self._subscript = self._workbook.add_format({"font_script": 2})
-        self._bsuperscript = self._workbook.add_format({"font_script": 1, "bold": True})
-        self._bsubscript = self._workbook.add_format({"font_script": 2, "bold": True})
-        self._ital = self._workbook.add_format({"italic": True})
+        formats = self._formats
+        self._bold = formats.get(bold=True)
+        self._superscript = formats.get(font_script=1)
+        self._subscript = formats.get(font_script=2)
+        self._bsuperscript = formats.get(font_script=1, bold=True)
+        self._bsubscript = formats.get(font_script=2, bold=True)
+        self._ital = formats.get(italic=True)
 
         unknowns = groups.get("unknowns")
         if unknowns:
@@ -735,7 +803,7 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
         cols = [c for c in cols if c.visible]
         self._make_title(sh, "Summary", cols, key="summary")
 
-        fmt = self._workbook.add_format({"bottom": 1, "align": "center"})
+        fmt = self._formats.get(bottom=1, align="center")
         sh.set_row(self._current_row, 5)
         self._current_row += 1
 
@@ -976,9 +1044,7 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
             self.debug_exception()
             title = None
 
-        fmt = self._workbook.add_format(
-            {"font_size": 14, "bold": True, "bottom": 6 if not title else 0}
-        )
+        fmt = self._formats.get(font_size=14, bold=True, bottom=6 if not title else 0)
 
         if title is None:
             title = "Table X. {}".format(name)
@@ -1013,8 +1079,8 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
     def _write_header(self, sh, cols, include_units=True):
         names, units = self._get_names_units(cols)
 
-        border = self._workbook.add_format({"bottom": 2, "align": "center"})
-        center = self._workbook.add_format({"align": "center"})
+        border = self._formats.get(bottom=2, align="center")
+        center = self._formats.get(align="center")
         if include_units:
             t = ((names, False), (units, True))
         else:
@@ -1085,14 +1151,11 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
             (i for i, c in enumerate(cols) if c.attr == "cumulative_ar39"), 0
         )
 
-        fmt = self._get_number_format("summary_age")
-        kcafmt = self._get_number_format("summary_kca")
+        fmt = self._get_number_format("summary_age", bottom=1)
+        kcafmt = self._get_number_format("summary_kca", bottom=1)
 
-        fmt.set_bottom(1)
-        kcafmt.set_bottom(1)
-
-        fmt2 = self._workbook.add_format({"bottom": 1, "bold": True})
-        border = self._workbook.add_format({"bottom": 1})
+        fmt2 = self._formats.get(bottom=1, bold=True)
+        border = self._formats.get(bottom=1)
 
         for i in range(age_idx + 1):
             sh.write_blank(row, i, "", fmt)
@@ -1134,14 +1197,18 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
             sh.write_number(row, cum_idx, ag.valid_total_ar39(), fmt)
         self._current_row += 1
 
-    def _get_number_format(self, kind=None, use_scientific=False, sig_figs=2):
+    def _get_number_format(self, kind=None, use_scientific=False, sig_figs=2, **props):
+        return self._formats.get(
+            props, num_format=self._get_num_format(kind, use_scientific, sig_figs)
+        )
+
+    def _get_num_format(self, kind=None, use_scientific=False, sig_figs=2):
         if kind:
             try:
                 sig_figs = getattr(self._options, "{}_sig_figs".format(kind))
             except AttributeError as e:
                 sig_figs = self._options.sig_figs
 
-        fn = self._workbook.add_format()
         if use_scientific:
             fmt = "0.0E+00"
         else:
@@ -1151,75 +1218,114 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
         # if not self._options.ensure_trailing_zeros:
         #     fmt = '{}#'.format(fmt)
 
-        fn.set_num_format(fmt)
-        return fn
+        return fmt
+
+    def _compile_columns(self, cols):
+        """
+        resolve the accessor, format and writer of each column once instead of for
+        every cell
+        """
+        if self._compiled is not None and self._compiled[0] is cols:
+            return self._compiled[1]
+
+        use_standard_sigfigs = self._options.use_standard_sigfigs
+        ccols = []
+        for c in cols[1:]:
+            kind = None
+            if use_standard_sigfigs:
+                if isinstance(c, SigFigColumn):
+                    kind = "sigfig"
+                elif isinstance(c, SigFigEColumn):
+                    kind = "sigfig_error"
+
+            if c.label in ("N", "Power"):
+                write = "write"
+            elif c.label == "RunDate":
+                write = "datetime"
+            else:
+                write = "number"
+
+            ccols.append(
+                CompiledColumn(
+                    c,
+                    make_getter(c),
+                    self._get_fmt_props(c),
+                    kind,
+                    c.attr == "cumulative_ar39",
+                    write,
+                )
+            )
+
+        self._compiled = (cols, ccols)
+        return ccols
 
     def _make_analysis(
         self, sh, cols, item, is_last=False, is_plateau_step=None, cum=""
     ):
         row = self._current_row
-
-        fmt = self._workbook.add_format()
+        ccols = self._compile_columns(cols)
+        values = [cum if c.cumulative else c.get(item) for c in ccols]
 
         status = "X" if item.is_omitted() else ""
-        highlight_color = self._options.highlight_color.name()
+        extra = {}
         if is_plateau_step is False:
-            fmt.set_bg_color(highlight_color)
-            sh.set_row(0, -1, fmt)
+            extra["bg_color"] = self._options.highlight_color.name()
             if not status:
                 status = "pX"
 
-        sh.write(row, 0, status, fmt)
-
-        pcfmt = None
-        for j, c in enumerate(cols[1:]):
-            if c.attr == "cumulative_ar39":
-                txt = cum
+        if is_last:
+            extra["bottom"] = 1
+
+        # cells without a format of their own share the row format. resolve all cell
+        # formats before writing so the row format is known
+        use_row_fmt = False
+        fmts = []
+        pprops = None
+        for i, c in enumerate(ccols):
+            props = c.props
+            if c.kind == "sigfig":
+                # get the txt from the next column to determine number of sigfigs
+                n = ccols[i + 1]
+                etxt = n.get(item) if n.cumulative else values[i + 1]
+                props = pprops = self._get_standard_sigfig_props(c.column, etxt)
+            elif c.kind == "sigfig_error":
+                props = pprops
+
+            if props is None:
+                use_row_fmt = True
+                fmts.append(None)
             else:
-                txt = self._get_txt(item, c)
+                fmts.append(self._formats.get(props, **extra))
 
-            if self._options.use_standard_sigfigs:
-                if isinstance(c, SigFigColumn):
-                    # get the txt from the next column to determine number of sigfigs
-                    cfmt = pcfmt = self._get_standard_sigfig_fmt(
-                        c, self._get_txt(item, cols[j + 2])
-                    )
-                elif isinstance(c, SigFigEColumn):
-                    cfmt = pcfmt
-                else:
-                    cfmt = self._get_fmt(c)
-            else:
-                cfmt = self._get_fmt(c)
+        rowprops = dict(extra)
+        if not use_row_fmt:
+            rowprops.pop("bottom", None)
+        rowfmt = self._formats.get(rowprops)
 
-            if cfmt:
-                if is_plateau_step is False:
-                    cfmt.set_bg_color(highlight_color)
-            else:
-                cfmt = fmt
+        sh.write(row, 0, status, rowfmt)
 
-            if is_last:
-                cfmt.set_bottom(1)
+        for j, (c, txt, cfmt) in enumerate(zip(ccols, values, fmts)):
+            if cfmt is None:
+                cfmt = rowfmt
 
-            if c.label in ("N", "Power"):
+            write = c.write
+            if write == "write":
                 sh.write(row, j + 1, txt, cfmt)
-            elif c.label == "RunDate":
+            elif write == "datetime":
                 sh.write_datetime(row, j + 1, txt, cfmt)
+            elif isinstance(txt, float):
+                sh.write_number(row, j + 1, txt, cfmt)
             else:
-                # self.debug('writing {} attr={} label={}'.format(type(txt), c.attr, c.label))
-                if isinstance(txt, float):
-                    sh.write_number(row, j + 1, txt, cell_format=cfmt)
-                else:
-                    sh.write(row, j + 1, txt, fmt)
+                sh.write(row, j + 1, txt, rowfmt)
 
-            c.calculate_width(txt)
+            c.column.calculate_width(txt)
         self._current_row += 1
 
     def _make_summary(self, sh, cols, group):
         fmt = self._bold
         start_col = 0
         if self._options.include_summary_kca:
-            nfmt = self._get_number_format("asummary_kca")
-            nfmt.set_bold(True)
+            nfmt = self._get_number_format("asummary_kca", bold=True)
 
             kcalabel = "Ca/K" if self._options.invert_kca_kcl else "K/Ca"
             idx = next((i for i, c in enumerate(cols) if c.label == kcalabel), 3)
@@ -1251,8 +1357,7 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
             sh.write_string(self._current_row, idx + 2, pv.error_kind, fmt)
             self._current_row += 1
 
-        nfmt = self._get_number_format("asummary_age")
-        nfmt.set_bold(True)
+        nfmt = self._get_number_format("asummary_age", bold=True)
 
         idx = next((i for i, c in enumerate(cols) if c.label == "Age"), 5)
 
@@ -1381,15 +1486,14 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
                 " {}".format(PLUSMINUS_NSIGMA.format(nsigma)),
             )
 
-            nfmt = self._get_number_format("asummary_trapped_ratio")
-            nfmt.set_bold(True)
+            nfmt = self._get_number_format("asummary_trapped_ratio", bold=True)
             sh.write_number(self._current_row, idx, trapped_value, nfmt)
             sh.write_number(self._current_row, idx + 1, trapped_error * nsigma, nfmt)
 
             self._current_row += 1
 
     def _make_notes(self, groups, sh, ncols, key):
-        top = self._workbook.add_format({"top": 1, "bold": True})
+        top = self._formats.get(top=1, bold=True)
 
         sh.write_string(self._current_row, 0, "Notes:", top)
         for i in range(1, ncols):
@@ -1479,7 +1583,7 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
         units = [c.units for c in cols]
         return names, units
 
-    def _get_standard_sigfig_fmt(self, col, txt):
+    def _get_standard_sigfig_props(self, col, txt):
         try:
             kind = None
             sf = math.ceil((abs(math.log10(txt))))
@@ -1487,26 +1591,30 @@ class XLSXAnalysisTableWriter(BaseTableWriter):
             kind = col.sigformat
             sf = 2
 
-        fmt = self._get_number_format(
-            kind=kind, use_scientific=col.use_scientific, sig_figs=sf
-        )
-
         if txt >= 1:
-            fmt.set_num_format("0")
-
-        return fmt
+            fmt = "0"
+        else:
+            fmt = self._get_num_format(
+                kind=kind, use_scientific=col.use_scientific, sig_figs=sf
+            )
+        return {"num_format": fmt}
 
-    def _get_fmt(self, col):
-        fmt = None
+    def _get_fmt_props(self, col):
+        props = None
         if col.sigformat:
-            fmt = self._get_number_format(col.sigformat, col.use_scientific)
+            props = {
+                "num_format": self._get_num_format(col.sigformat, col.use_scientific)
+            }
 
         elif col.fformat:
-            fmt = self._workbook.add_format()
-            for cmd, args in col.fformat:
-                getattr(fmt, cmd)(*args)
+            props = {cmd[4:]: args[0] for cmd, args in col.fformat}
 
-        return fmt
+        return props
+
+    def _get_fmt(self, col):
+        props = self._get_fmt_props(col)
+        if props is not None:
+            return self._formats.get(props)
 
     def _get_txt(self, item, col):
         attr = col.attr
@@ -750,7 +750,12 @@ class AnalysesPane(TraitsDockPane):
 
 
 class RepositoryTabularAdapter(TabularAdapter):
-    columns = [("Name", "name"), ("Ahead", "ahead"), ("Behind", "behind")]
+    columns = [
+        ("Name", "name"),
+        ("Ahead", "ahead"),
+        ("Behind", "behind"),
+        ("Age", "status_age"),
+    ]
 
     def get_menu(self, obj, trait, row, column):
         return MenuManager(
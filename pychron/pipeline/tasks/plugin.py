@@ -21,11 +21,6 @@ from pyface.tasks.action.schema import SMenu, SGroup
 from pyface.tasks.action.schema_addition import SchemaAddition
 from traits.api import List
 
-from pychron.dvc.dvc import DVC
-from pychron.envisage.browser.interpreted_age_browser_model import (
-    InterpretedAgeBrowserModel,
-)
-from pychron.envisage.browser.sample_browser_model import SampleBrowserModel
 from pychron.envisage.tasks.base_task_plugin import BaseTaskPlugin
 from pychron.pipeline.tasks.actions import (
     ConfigureRecallAction,
@@ -51,7 +46,16 @@ from pychron.pipeline.tasks.actions import (
     IdentifyPeaksDemoAction,
     ImportOptionsActions,
 )
-from pychron.pipeline.tasks.preferences import PipelinePreferencesPane
+
+# services are looked up by name so DVC and the browser models are not imported until
+# the pipeline is opened
+DVC_PROTOCOL = "pychron.dvc.dvc.DVC"
+SAMPLE_BROWSER_MODEL_PROTOCOL = (
+    "pychron.envisage.browser.sample_browser_model.SampleBrowserModel"
+)
+INTERPRETED_AGE_BROWSER_MODEL_PROTOCOL = (
+    "pychron.envisage.browser.interpreted_age_browser_model.InterpretedAgeBrowserModel"
+)
 
 
 # ============= enthought library imports =======================
@@ -77,9 +81,9 @@ class PipelinePlugin(BaseTaskPlugin):
         return files
 
     def _pipeline_factory(self):
-        model = self.application.get_service(SampleBrowserModel)
-        iamodel = self.application.get_service(InterpretedAgeBrowserModel)
-        dvc = self.application.get_service(DVC)
+        model = self.application.get_service(SAMPLE_BROWSER_MODEL_PROTOCOL)
+        iamodel = self.application.get_service(INTERPRETED_AGE_BROWSER_MODEL_PROTOCOL)
+        dvc = self.application.get_service(DVC_PROTOCOL)
 
         from pychron.pipeline.tasks.task import PipelineTask
 
@@ -110,26 +114,36 @@ class PipelinePlugin(BaseTaskPlugin):
         return t
 
     def _browser_model_factory(self):
+        from pychron.envisage.browser.sample_browser_model import SampleBrowserModel
+
         return SampleBrowserModel(application=self.application)
 
     def _interpreted_age_browser_model_factory(self):
-        dvc = self.application.get_service(DVC)
+        from pychron.envisage.browser.interpreted_age_browser_model import (
+            InterpretedAgeBrowserModel,
+        )
+
+        dvc = self.application.get_service(DVC_PROTOCOL)
         return InterpretedAgeBrowserModel(application=self.application, dvc=dvc)
 
     # defaults
     def _service_offers_default(self):
         so = self.service_offer_factory(
-            protocol=SampleBrowserModel, factory=self._browser_model_factory
+            protocol=SAMPLE_BROWSER_MODEL_PROTOCOL, factory=self._browser_model_factory
         )
 
         so1 = self.service_offer_factory(
-            protocol=InterpretedAgeBrowserModel,
+            protocol=INTERPRETED_AGE_BROWSER_MODEL_PROTOCOL,
             factory=self._interpreted_age_browser_model_factory,
         )
         return [so, so1]
 
     def _preferences_panes_default(self):
-        return [PipelinePreferencesPane]
+        return [
+            self.lazy_factory(
+                "pychron.pipeline.tasks.preferences.PipelinePreferencesPane"
+            )
+        ]
 
     def _task_extensions_default(self):
         def data_menu():
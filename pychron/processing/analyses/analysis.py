@@ -656,6 +656,12 @@ class Analysis(ArArAge, IdeogramPlotable):
 
         return r
 
+    def load_measurement_profiles(self):
+        """
+        per iteration phase timings recorded while the analysis was measured
+        """
+        return
+
     def get_isotope_evolutions(self, isotopes=None, load_data=True, **kw):
         if isotopes:
             if isinstance(isotopes[0], (str, six.text_type)):
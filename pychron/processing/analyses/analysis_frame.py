@@ -0,0 +1,161 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+
+# ============= standard library imports ========================
+from numpy import array, array_equal, empty, nan
+from uncertainties import nominal_value, std_dev
+
+# ============= local library imports  ==========================
+
+
+def _float(v, func):
+    try:
+        return float(func(v))
+    except (TypeError, ValueError):
+        return nan
+
+
+class Column(object):
+    """
+    the values of one attribute for every analysis of a frame. nominal and errors are
+    contiguous float arrays, valid is False where the analysis returned None
+    """
+
+    __slots__ = ("values", "nominal", "errors", "valid")
+
+    def __init__(self, values):
+        n = len(values)
+        vs = empty(n, dtype=object)
+        vs[:] = values
+        self.values = vs
+        self.valid = array([v is not None for v in values], dtype=bool)
+        self.nominal = array([_float(v, nominal_value) for v in values], dtype=float)
+        self.errors = array([_float(v, std_dev) for v in values], dtype=float)
+
+    def __len__(self):
+        return len(self.values)
+
+    def equals(self, other):
+        return (
+            array_equal(self.valid, other.valid)
+            and array_equal(self.nominal, other.nominal, equal_nan=True)
+            and array_equal(self.errors, other.errors, equal_nan=True)
+        )
+
+
+class AnalysisFrame(object):
+    """
+    columnar view of a group's analyses.
+
+    columns are read from the analyses once and kept until invalidated. an invalidated
+    column is reread lazily and results memoized against it are only dropped if the
+    new values differ, so a recalculation that leaves the values unchanged keeps the
+    statistics
+    """
+
+    def __init__(self, analyses):
+        self.analyses = list(analyses)
+        self._columns = {}
+        self._stale = set()
+        self._omitted = None
+        self._omitted_key = None
+        self._omitted_stale = False
+        self._memo = {}
+
+    def __len__(self):
+        return len(self.analyses)
+
+    def invalidate_values(self):
+        """
+        analysis values, e.g. after a refit, may have changed
+        """
+        self._stale.update(self._columns)
+        self._omitted_stale = True
+
+    def invalidate_omitted(self):
+        """
+        analysis tags may have changed
+        """
+        self._omitted_stale = True
+
+    def omitted(self, is_omitted, key=None):
+        """
+        boolean mask of the omitted analyses. key identifies the is_omitted function,
+        e.g. the omit_by_tag flag of the group
+        """
+        if self._omitted is None or self._omitted_stale or key != self._omitted_key:
+            mask = array([bool(is_omitted(a)) for a in self.analyses], dtype=bool)
+            if self._omitted is None or not array_equal(mask, self._omitted):
+                # every memoized result depends on the mask
+                self._memo = {}
+            self._omitted, self._omitted_key = mask, key
+            self._omitted_stale = False
+
+        return self._omitted
+
+    def column(self, attr):
+        """
+        the Column of analysis.get_value(attr)
+        """
+        return self._get_column(attr, lambda a: a.get_value(attr))
+
+    def attribute(self, attr):
+        """
+        the Column of getattr(analysis, attr), keyed "attr:<attr>"
+        """
+        return self._get_column(
+            "attr:{}".format(attr), lambda a: getattr(a, attr, None)
+        )
+
+    def derived(self, key, getter):
+        """
+        the Column of getter(analysis)
+        """
+        return self._get_column(key, getter)
+
+    def memoize(self, key, func, depends=()):
+        """
+        return func(), memoized under key until the omit mask or one of the columns
+        keyed in depends changes. fetch the mask and the depends columns before calling
+        so stale ones are reread and compared, otherwise func is always called
+        """
+        depends = frozenset(depends)
+        entry = self._memo.get(key)
+        if entry and not (self._omitted_stale or depends & self._stale):
+            return entry[1]
+
+        ret = func()
+        self._memo[key] = (depends, ret)
+        return ret
+
+    def _get_column(self, key, getter):
+        col = self._columns.get(key)
+        if col is None or key in self._stale:
+            ncol = Column([getter(a) for a in self.analyses])
+            self._stale.discard(key)
+            if col is not None and not col.equals(ncol):
+                self._memo = {k: v for k, v in self._memo.items() if key not in v[0]}
+            elif col is not None:
+                # unchanged, keep the values objects memoized results were built from
+                ncol = col
+
+            self._columns[key] = col = ncol
+        return col
+
+
+# ============= EOF =============================================
@@ -48,6 +48,7 @@ from pychron.core.stats.core import (
 from pychron.core.utils import alphas
 from pychron.experiment.utilities.runid import make_aliquot
 from pychron.processing.analyses.analysis import IdeogramPlotable
+from pychron.processing.analyses.analysis_frame import AnalysisFrame
 from pychron.processing.analyses.preferred import Preferred
 from pychron.processing.arar_age import ArArAge
 from pychron.processing.argon_calculations import (
@@ -187,10 +188,34 @@ class AnalysisGroup(IdeogramPlotable):
 
     color = Color("black")
 
+    _frame = Any
+
     def __init__(self, *args, **kw):
         super(AnalysisGroup, self).__init__(make_arar_constants=False, *args, **kw)
 
+    @property
+    def frame(self):
+        """
+        the AnalysisFrame of the analyses, rebuilt when the analyses list changes
+        """
+        if self._frame is None:
+            self._frame = AnalysisFrame(self.analyses)
+        return self._frame
+
+    def _dirty_fired(self):
+        if self._frame is not None:
+            self._frame.invalidate_values()
+
+    @on_trait_change("analyses:temp_status")
+    def _handle_temp_status(self):
+        if self._frame is not None:
+            self._frame.invalidate_omitted()
+
+    def _analyses_items_changed(self):
+        self._frame = None
+
     def _analyses_changed(self, new):
+        self._frame = None
         if new:
             a = new[0]
             for attr in (
@@ -317,7 +342,12 @@ class AnalysisGroup(IdeogramPlotable):
         return [i for i, ai in enumerate(ans) if self._is_omitted(ai, tags=tags)]
 
     def clean_analyses(self):
-        return (ai for ai in self.analyses if not self._is_omitted(ai))
+        frame = self.frame
+        mask = self._omitted_mask()
+        return (ai for ai, o in zip(frame.analyses, mask) if not o)
+
+    def _omitted_mask(self):
+        return self.frame.omitted(self._is_omitted, key=self.omit_by_tag)
 
     def sorted_clean_analyses(self, key="age"):
         return sorted(self.clean_analyses(), key=attrgetter(key))
@@ -458,12 +488,12 @@ class AnalysisGroup(IdeogramPlotable):
 
     @cached_property
     def _get_age_span(self):
-        ans = self.clean_analyses()
-        ages = [nominal_value(a.age) for a in ans]
+        mask = ~self._omitted_mask()
+        ages = self.frame.attribute("age").nominal[mask]
 
         ret = 0
-        if ages:
-            ret = max(ages) - min(ages)
+        if len(ages):
+            ret = ages.max() - ages.min()
 
         return ret
 
@@ -535,18 +565,26 @@ class AnalysisGroup(IdeogramPlotable):
 
     @cached_property
     def _get_nanalyses(self):
-        return len(list(self.clean_analyses()))
+        return int((~self._omitted_mask()).sum())
 
     # private functions
     def _calculate_mswd(self, attr, values=None):
-        m = 0
-        if values is None:
-            values = self._get_values(attr)
-        if values:
-            vs, es = values
-            m = calculate_mswd(vs, es)
-
-        return m
+        def func(values):
+            m = 0
+            if values:
+                vs, es = values
+                m = calculate_mswd(vs, es)
+            return m
+
+        if values is not None:
+            return func(values)
+
+        frame = self.frame
+        self._omitted_mask()
+        frame.column(attr)
+        return frame.memoize(
+            ("mswd", attr), lambda: func(self._get_values(attr)), (attr,)
+        )
 
     def _apply_external_err(self, wa, force=False):
         def func(aa):
@@ -599,11 +637,11 @@ class AnalysisGroup(IdeogramPlotable):
         return ufloat(v, e)
 
     def _get_values(self, attr):
-        vs = (ai.get_value(attr) for ai in self.clean_analyses())
-        ans = [vi for vi in vs if vi is not None]
-        if ans:
-            vs = array([nominal_value(v) for v in ans])
-            es = array([std_dev(v) for v in ans])
+        col = self.frame.column(attr)
+        mask = col.valid & ~self._omitted_mask()
+        if mask.any():
+            vs = col.nominal[mask]
+            es = col.errors[mask]
             if attr not in (
                 "lab_temperature",
                 "peak_center",
@@ -617,12 +655,22 @@ class AnalysisGroup(IdeogramPlotable):
             return vs, es
 
     def _calculate_mean(self, attr, use_weights=True, error_kind=None):
+        frame = self.frame
+        self._omitted_mask()
+        frame.column(attr)
+        return frame.memoize(
+            ("mean", attr, use_weights, error_kind),
+            lambda: self._calculate_mean_values(attr, use_weights, error_kind),
+            (attr,),
+        )
+
+    def _calculate_mean_values(self, attr, use_weights, error_kind):
         def sd(a, v, e):
             n = len(v)
             if n == 1:
                 we = e[0]
             else:
-                we = (sum((a - v) ** 2) / (n - 1)) ** 0.5
+                we = (((a - v) ** 2).sum() / (n - 1)) ** 0.5
             return we
 
         args = self._get_values(attr)
@@ -678,7 +726,69 @@ class AnalysisGroup(IdeogramPlotable):
         return f
 
     def _calculate_integrated(self, attr, kind="total", weighting=None):
+        if kind == "plateau":
+            # depends on the plateau, not memoized
+            return self._calculate_integrated_values(attr, kind, weighting)
+
+        if attr == "age" and weighting is None:
+            weighting = self.integrated_age_weighting
+
+        depends = self._integrated_depends(attr)
+        key = ("integrated", attr, kind, weighting, self.include_j_error_in_integrated)
+        return self.frame.memoize(
+            key,
+            lambda: self._calculate_integrated_values(attr, kind, weighting),
+            depends,
+        )
+
+    def _integrated_depends(self, attr):
+        """
+        fetch and return the keys of the columns an integrated value is computed from
+        """
+        frame = self.frame
+        self._omitted_mask()
+
+        def non_ar(k):
+            key = "non_ar:{}".format(k)
+            frame.derived(
+                key,
+                lambda a: (
+                    None
+                    if isinstance(a, InterpretedAgeGroup)
+                    else a.get_non_ar_isotope(k)
+                ),
+            )
+            return key
+
+        def attribute(k):
+            frame.attribute(k)
+            return "attr:{}".format(k)
+
+        if attr == "kca":
+            keys = attribute("k39"), non_ar("ca37")
+        elif attr == "kcl":
+            keys = attribute("k39"), non_ar("cl38")
+        elif attr == "signal_k39":
+            keys = (attribute("k39"),)
+        elif attr == "radiogenic_yield":
+            keys = attribute("rad40"), attribute("total40")
+        elif attr == "moles_k39":
+            keys = (attribute("moles_k39"),)
+        elif attr == "age":
+            frame.derived(
+                "computed:rad40",
+                lambda a: (
+                    None
+                    if isinstance(a, InterpretedAgeGroup)
+                    else a.get_computed_value("rad40")
+                ),
+            )
+            keys = "computed:rad40", attribute("k39"), attribute("j")
+        else:
+            keys = ()
+        return keys
 
+    def _calculate_integrated_values(self, attr, kind, weighting):
         uv = ufloat(0, 0)
         if kind == "total":
             ans = self.analyses
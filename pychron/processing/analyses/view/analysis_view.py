@@ -48,6 +48,7 @@ from pychron.processing.analyses.view.error_components_view import ErrorComponen
 from pychron.processing.analyses.view.interferences_view import InterferencesView
 from pychron.processing.analyses.view.main_view import MainView
 from pychron.processing.analyses.view.peak_center_view import PeakCenterView
+from pychron.processing.analyses.view.profile_view import MeasurementProfileView
 from pychron.processing.analyses.view.regression_view import RegressionView
 from pychron.processing.analyses.view.snapshot_view import SnapshotView
 from pychron.processing.analyses.view.spectrometer_view import SpectrometerView
@@ -341,6 +342,10 @@ class AnalysisView(HasTraits):
         if pch.load(an):
             gs.append(pch)
 
+        prof = MeasurementProfileView()
+        if prof.load(an):
+            gs.append(prof)
+
     def traits_view(self):
         v = View(
             VGroup(
@@ -0,0 +1,113 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+from numpy import histogram
+from traits.api import HasTraits, Instance, Str, List, on_trait_change
+from traitsui.api import View, UItem, VGroup, HGroup, EnumEditor
+
+# ============= standard library imports ========================
+# ============= local library imports  ==========================
+from pychron.graph.graph import Graph
+
+
+class MeasurementProfileView(HasTraits):
+    """
+    histogram of the per iteration phase timings recorded while the analysis was
+    measured
+    """
+
+    graph = Instance(Graph)
+    name = "Profile"
+
+    group = Str
+    groups = List
+    phase = Str
+    phases = List
+    bins = 40
+
+    _profiles = None
+
+    def load(self, an):
+        profiles = an.load_measurement_profiles()
+        if profiles:
+            self._profiles = {}
+            for i, p in enumerate(profiles):
+                key = p["group"]
+                if key in self._profiles:
+                    key = "{} {}".format(key, i)
+                self._profiles[key] = p
+
+            self.groups = list(self._profiles)
+            self.phases = list(profiles[0]["timings"])
+            self.phase = "total"
+            self.group = self.groups[0]
+            return True
+
+    @on_trait_change("group, phase")
+    def _refresh(self):
+        profile = self._profiles and self._profiles.get(self.group)
+        if not profile:
+            return
+
+        g = Graph()
+        g.new_plot(
+            xtitle="{} (ms)".format(self.phase),
+            ytitle="Frequency",
+            padding_left=70,
+            padding_right=5,
+        )
+
+        ys = profile["timings"].get(self.phase)
+        if ys:
+            f, edges = histogram(ys, bins=self.bins)
+            width = edges[1] - edges[0]
+            g.new_series(edges[:-1] + width / 2.0, f, type="bar", bar_width=width * 0.9)
+
+            period = profile.get("period")
+            if period and self.phase == "total":
+                g.add_vertical_rule(period * 1000)
+
+            s = profile["summary"].get(self.phase)
+            if s:
+                g.add_plot_label(
+                    "n={} mean={mean:0.3f} median={median:0.3f} p95={p95:0.3f} "
+                    "max={max:0.3f} (ms)".format(len(ys), **s),
+                    x_offset=10,
+                    y_offset=-10,
+                    border_visible=True,
+                    border_width=1,
+                    bgcolor="white",
+                    font="modern 10",
+                    color="black",
+                )
+
+        self.graph = g
+
+    def traits_view(self):
+        v = View(
+            VGroup(
+                HGroup(
+                    UItem("group", editor=EnumEditor(name="groups")),
+                    UItem("phase", editor=EnumEditor(name="phases")),
+                ),
+                UItem("graph", style="custom"),
+            )
+        )
+        return v
+
+
+# ============= EOF =============================================
@@ -0,0 +1,407 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+
+# ============= standard library imports ========================
+from numpy import asarray, broadcast_to, einsum, errstate, log, stack, where, zeros
+from uncertainties import nominal_value, std_dev
+
+# ============= local library imports  ==========================
+from pychron.processing.arar_constants import ArArConstants
+from pychron.pychron_constants import ARGON_KEYS
+
+INTERFERENCE_KEYS = ("K4039", "K3839", "K3739", "Ca3937", "Ca3837", "Ca3637", "Cl3638")
+TRAPPED_4036 = "trapped_4036"
+FIXED_K3739 = "fixed_k3739"
+J = "J"
+LAMBDA_K = "lambda_k"
+
+
+class UArray(object):
+    """
+    N values with their first order derivatives with respect to the named inputs of
+    a batch.
+
+    value: (N,) array
+    jac: dict of input name -> (N,) array of d(value)/d(input)
+
+    the jacobian is propagated analytically through + - * / so the linear error
+    propagation is identical to ``uncertainties`` without building a ufloat per
+    analysis
+    """
+
+    __slots__ = ("value", "jac")
+
+    # make numpy defer to the reflected operators, e.g. ndarray * UArray
+    __array_ufunc__ = None
+
+    def __init__(self, value, jac=None):
+        self.value = asarray(value, dtype=float)
+        self.jac = jac or {}
+
+    def __neg__(self):
+        return UArray(-self.value, {k: -d for k, d in self.jac.items()})
+
+    def __add__(self, other):
+        if isinstance(other, UArray):
+            return UArray(self.value + other.value, _combine(self.jac, 1, other.jac, 1))
+        return UArray(self.value + other, dict(self.jac))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, UArray):
+            return UArray(
+                self.value - other.value, _combine(self.jac, 1, other.jac, -1)
+            )
+        return UArray(self.value - other, dict(self.jac))
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __mul__(self, other):
+        if isinstance(other, UArray):
+            return UArray(
+                self.value * other.value,
+                _combine(self.jac, other.value, other.jac, self.value),
+            )
+        return UArray(self.value * other, _scale(self.jac, other))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, UArray):
+            with errstate(divide="ignore", invalid="ignore"):
+                v = self.value / other.value
+                jac = _combine(self.jac, 1 / other.value, other.jac, -v / other.value)
+            return UArray(v, jac)
+
+        with errstate(divide="ignore", invalid="ignore"):
+            return UArray(self.value / other, _scale(self.jac, 1 / other))
+
+    def __rtruediv__(self, other):
+        with errstate(divide="ignore", invalid="ignore"):
+            v = other / self.value
+            return UArray(v, _scale(self.jac, -v / self.value))
+
+    def log(self):
+        with errstate(divide="ignore", invalid="ignore"):
+            return UArray(log(self.value), _scale(self.jac, 1 / self.value))
+
+    def where(self, mask, value):
+        """
+        return a copy with ``value`` (exact, no uncertainty) wherever ``mask`` is True
+        """
+        return UArray(
+            where(mask, value, self.value),
+            {k: where(mask, 0, d) for k, d in self.jac.items()},
+        )
+
+
+def _scale(jac, s):
+    return {k: d * s for k, d in jac.items()}
+
+
+def _combine(ja, sa, jb, sb):
+    jac = {k: d * sa for k, d in ja.items()}
+    for k, d in jb.items():
+        if k in jac:
+            jac[k] = jac[k] + d * sb
+        else:
+            jac[k] = d * sb
+    return jac
+
+
+class BatchInputs(object):
+    """
+    the independent inputs of a batch. each input is a named variable with a
+    value and a standard deviation per analysis, except the isotopes which share a
+    (N, 5, 5) covariance matrix
+    """
+
+    def __init__(self, isotopes, isotope_errors):
+        isotopes = asarray(isotopes, dtype=float)
+        self.n = n = isotopes.shape[0]
+
+        cov = asarray(isotope_errors, dtype=float)
+        if cov.ndim == 2:
+            errs = cov
+            cov = zeros((n, 5, 5))
+            for i in range(5):
+                cov[:, i, i] = errs[:, i] ** 2
+
+        self.isotope_covariance = cov
+        self.errors = {}
+
+        ones = broadcast_to(1.0, (n,))
+        self.isotopes = [
+            UArray(isotopes[:, i], {k: ones}) for i, k in enumerate(ARGON_KEYS)
+        ]
+
+    def variable(self, key, value, error=0):
+        """
+        add an input. value and error may be scalars or (N,) arrays. ufloats are
+        split into their nominal value and standard deviation
+        """
+        if error is None:
+            error = 0
+        value, error = _split(value, error)
+        n = self.n
+        self.errors[key] = broadcast_to(asarray(error, dtype=float), (n,))
+        return UArray(
+            broadcast_to(asarray(value, dtype=float), (n,)),
+            {key: broadcast_to(1.0, (n,))},
+        )
+
+    def variance(self, u, exclude=None):
+        """
+        return the (N,) variance of ``u`` ignoring the inputs in ``exclude``
+        """
+        exclude = exclude or ()
+        var = zeros(self.n)
+        for k, d in u.jac.items():
+            if k in exclude or k in ARGON_KEYS:
+                continue
+            var += (d * self.errors[k]) ** 2
+
+        g = stack([broadcast_to(u.jac.get(k, 0), (self.n,)) for k in ARGON_KEYS], 1)
+        var += einsum("ni,nij,nj->n", g, self.isotope_covariance, g)
+        return var
+
+    def std_dev(self, u, exclude=None):
+        return self.variance(u, exclude) ** 0.5
+
+    def error_components(self, u):
+        """
+        return a dict of input name -> (N,) contribution to the standard deviation of
+        ``u``. equivalent to ``ufloat.error_components``
+        """
+        comps = {}
+        for k, d in u.jac.items():
+            if k in ARGON_KEYS:
+                i = ARGON_KEYS.index(k)
+                e = self.isotope_covariance[:, i, i] ** 0.5
+            else:
+                e = self.errors[k]
+            comps[k] = abs(d * e)
+        return comps
+
+
+def _split(value, error):
+    if hasattr(value, "nominal_value"):
+        return nominal_value(value), std_dev(value)
+    if isinstance(value, tuple):
+        return value
+    return value, error
+
+
+class BatchAges(object):
+    """
+    F and ages for N analyses. mirrors the values ArArAge stores after calculate_age
+
+    f, f_err, f_err_wo_irrad
+    age, age_err, age_err_wo_j: j error excluded (uage)
+    age_err_w_j: j error included (uage_w_j_err)
+    computed: dict of name -> UArray of the intermediate values (rad40, k39, ...)
+    """
+
+    def __init__(self, inputs, f, age, computed, non_ar_isotopes):
+        self.inputs = inputs
+        self.uf = f
+        self.uage = age
+        self.computed = computed
+        self.non_ar_isotopes = non_ar_isotopes
+
+        self.f = f.value
+        self.f_err = inputs.std_dev(f)
+        self.f_err_wo_irrad = inputs.std_dev(f, exclude=INTERFERENCE_KEYS)
+
+        if age is not None:
+            self.age = age.value
+            self.age_err = self.age_err_wo_j = inputs.std_dev(age, exclude=(J,))
+            self.age_err_w_j = inputs.std_dev(age)
+
+    def value(self, key):
+        u = self.computed.get(key)
+        if u is None:
+            u = self.non_ar_isotopes.get(key)
+        if u is not None:
+            return u.value, self.inputs.std_dev(u)
+
+    def get_error_component(self, key):
+        """
+        return the percent of the age variance (including J) contributed by ``key``.
+        same definition as ArArAge.get_error_component
+        """
+        comps = self.inputs.error_components(self.uage)
+        v = comps.get(key)
+        if v is None:
+            return zeros(self.inputs.n)
+
+        ae = self.age_err_w_j
+        with errstate(divide="ignore", invalid="ignore"):
+            return where(ae > 0, (v / ae) ** 2 * 100, 0)
+
+
+def interference_corrections_batch(
+    a39, a37, pr, inputs, arar_constants, fixed_k3739=False
+):
+    if arar_constants.k3739_mode.lower() == "normal" and not fixed_k3739:
+        ca3937 = pr.get("Ca3937", 0)
+        k3739 = pr.get("K3739", 0)
+        k39 = (a39 - ca3937 * a37) / (1 - k3739 * ca3937)
+        k37 = k3739 * k39
+
+        ca37 = a37 - k37
+        ca39 = ca3937 * ca37
+    else:
+        if not fixed_k3739:
+            fixed_k3739 = arar_constants.fixed_k3739
+
+        x = inputs.variable(FIXED_K3739, fixed_k3739)
+        ca3937 = pr.get("Ca3937")
+        if ca3937 is None:
+            y = 1
+            ca3937 = 0
+        else:
+            y = 1 / ca3937
+            y = y.where(ca3937.value == 0, 1)
+
+        ca37 = (a39 * x * y) / (x + y)
+        ca39 = ca3937 * ca37
+        k39 = a39 - ca39
+        k37 = x * k39
+
+    k38 = pr.get("K3839", 0) * k39
+
+    if not arar_constants.allow_negative_ca_correction:
+        ca37 = ca37.where(ca37.value < 0, 0)
+
+    ca36 = pr.get("Ca3637", 0) * ca37
+    ca38 = pr.get("Ca3837", 0) * ca37
+    return k37, k38, k39, ca36, ca37, ca38, ca39
+
+
+def calculate_ages_batch(
+    isotopes,
+    isotope_errors,
+    decay_time,
+    j=None,
+    j_err=0,
+    interferences=None,
+    arar_constants=None,
+    fixed_k3739=False,
+    include_decay_error=False,
+):
+    """
+    vectorized equivalent of ``calculate_f`` followed by ``age_equation`` for N
+    analyses
+
+    isotopes: (N, 5) corrected intensities ordered Ar40, Ar39, Ar38, Ar37, Ar36
+    isotope_errors: (N, 5) standard deviations or (N, 5, 5) covariance matrices
+    decay_time: scalar or (N,) days since irradiation
+    j, j_err: scalar or (N,). if j is None only F is calculated
+    interferences: dict of production ratio name -> ufloat, (value, error) or value.
+        values and errors may be (N,) arrays
+
+    F with and without irradiation errors come from one pass. the error without
+    irradiation errors is the same jacobian with the production ratio terms
+    dropped.
+
+    the cosmogenic correction is not supported
+    """
+    if arar_constants is None:
+        arar_constants = ArArConstants()
+
+    if arar_constants.use_cosmogenic_correction:
+        raise NotImplementedError("cosmogenic correction is not supported in batch")
+
+    inputs = BatchInputs(isotopes, isotope_errors)
+    a40, a39, a38, a37, a36 = inputs.isotopes
+
+    pr = {}
+    if interferences:
+        for k, v in interferences.items():
+            if k in INTERFERENCE_KEYS:
+                pr[k] = inputs.variable(k, v)
+
+    k37, k38, k39, ca36, ca37, ca38, ca39 = interference_corrections_batch(
+        a39, a37, pr, inputs, arar_constants, fixed_k3739
+    )
+
+    # atmospheric and chlorine
+    m = (
+        pr.get("Cl3638", 0)
+        * nominal_value(arar_constants.lambda_Cl36)
+        * asarray(decay_time, dtype=float)
+    )
+    atm3836 = nominal_value(arar_constants.atm3836)
+    atm36 = (a36 - ca36 - m * (a38 - k38 - ca38)) / (1 - m * atm3836)
+    atm38 = atm3836 * atm36
+    cl38 = a38 - atm38 - k38 - ca38
+    cl36 = cl38 * m
+
+    trapped_4036 = inputs.variable(TRAPPED_4036, arar_constants.atm4036)
+    atm40 = atm36 * trapped_4036
+
+    k40 = k39 * pr.get("K4039", 0)
+    rad40 = a40 - atm40 - k40
+
+    f = (rad40 / k39).where(k39.value == 0, 1)
+    rp = (rad40 / a40 * 100).where(a40.value == 0, 0)
+
+    non_ar = {
+        "k40": k40,
+        "ca39": ca39,
+        "k38": k38,
+        "ca38": ca38,
+        "cl38": cl38,
+        "k37": k37,
+        "ca37": ca37,
+        "ca36": ca36,
+        "cl36": cl36,
+    }
+    computed = {
+        "rad40": rad40,
+        "a40": a40,
+        "radiogenic_yield": rp,
+        "ca37": ca37,
+        "ca39": ca39,
+        "ca36": ca36,
+        "k39": k39,
+        "atm40": atm40,
+    }
+
+    age = None
+    if j is not None:
+        uj = inputs.variable(J, j, j_err)
+        if include_decay_error:
+            lambda_k = inputs.variable(LAMBDA_K, arar_constants.lambda_k)
+        else:
+            lambda_k = nominal_value(arar_constants.lambda_k)
+
+        # lambda is defined in years, so age is in years
+        age = (1 + uj * f).log() / lambda_k
+        age = arar_constants.scale_age(age, current="a")
+
+        # age_equation returns 0 +/- 0 if the log is undefined
+        age = age.where(1 + uj.value * f.value <= 0, 0)
+
+    return BatchAges(inputs, f, age, computed, non_ar)
+
+
+# ============= EOF =============================================
@@ -0,0 +1,138 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+
+# ============= standard library imports ========================
+import math
+from threading import Lock
+
+# ============= local library imports  ==========================
+from pychron.processing.argon_calculations import calculate_arar_decay_factors
+
+
+def convert_days(x):
+    return x.total_seconds() / (60.0 * 60 * 24)
+
+
+def chron_segments(doses, analts, use_irradiation_endtime=False):
+    """
+    return the irradiation segments (power, duration, time since irradiation, start, end)
+    used by calculate_arar_decay_factors
+    """
+
+    def calc_ti(st, en):
+        t = en if use_irradiation_endtime else st
+        return convert_days(analts - t)
+
+    return [
+        (pwr, convert_days(en - st), calc_ti(st, en), st, en)
+        for pwr, st, en in doses
+        if st is not None and en is not None
+    ]
+
+
+class DecayTerms(object):
+    """
+    the analysis independent part of the McDougall and Harrison decay factor for one
+    chronology and decay constant
+
+    df = tpower / sum(p_i * (1 - exp(-dc * t_i)) / (dc * exp(dc * dt_i)))
+
+    with dt_i = A - c_i, A the analysis time and c_i the time of segment i relative to
+    the start of the irradiation, this factors into
+
+    df = tpower * exp(dc * A) / sum(p_i * (1 - exp(-dc * t_i)) * exp(dc * c_i) / dc)
+
+    so only one exponential is evaluated per analysis
+    """
+
+    def __init__(self, segments, ref, dc):
+        self.ref = ref
+        self.dc = dc
+        self.tpower = sum(p * ti for p, ti, _, _ in segments)
+        self.b = sum(
+            p * (1 - math.exp(-dc * ti)) * math.exp(dc * ci) / dc
+            for p, ti, ci, _ in segments
+        )
+
+    def decay_factor(self, analts):
+        if not self.b:
+            return 1.0
+
+        a = convert_days(analts - self.ref)
+        return self.tpower * math.exp(self.dc * a) / self.b
+
+
+class DecayFactorCache(object):
+    """
+    process-wide cache of DecayTerms keyed by (doses, decay constant, endtime flag).
+
+    analyses from the same irradiation share one entry so a bulk load only evaluates
+    one exponential per analysis and decay constant. the doses are part of the key, so
+    editing a chronology invalidates its entries
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._terms = {}
+
+    def clear(self):
+        with self._lock:
+            self._terms.clear()
+
+    def decay_factors(self, doses, analts, dc37, dc39, use_irradiation_endtime=False):
+        """
+        return (ar37 decay factor, ar39 decay factor). identical to
+        calculate_arar_decay_factors(dc37, dc39, chron_segments(doses, analts, ...))
+        """
+        if not dc37 or not dc39:
+            segments = chron_segments(doses, analts, use_irradiation_endtime)
+            return calculate_arar_decay_factors(dc37, dc39, segments)
+
+        doses = tuple(doses)
+        return (
+            self._get_terms(doses, dc37, use_irradiation_endtime).decay_factor(analts),
+            self._get_terms(doses, dc39, use_irradiation_endtime).decay_factor(analts),
+        )
+
+    def _get_terms(self, doses, dc, use_irradiation_endtime):
+        key = (doses, dc, use_irradiation_endtime)
+        with self._lock:
+            terms = self._terms.get(key)
+
+        if terms is None:
+            segments = []
+            ref = None
+            for p, st, en in doses:
+                if st is None or en is None:
+                    continue
+                if ref is None:
+                    ref = st
+
+                t = en if use_irradiation_endtime else st
+                segments.append((p, convert_days(en - st), convert_days(t - ref), st))
+
+            terms = DecayTerms(segments, ref, dc)
+            with self._lock:
+                self._terms[key] = terms
+
+        return terms
+
+
+decay_factor_cache = DecayFactorCache()
+
+# ============= EOF =============================================
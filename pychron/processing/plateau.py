@@ -17,26 +17,26 @@
 # ============= enthought library imports =======================
 from __future__ import absolute_import
 
-from numpy import argmax, array
+from numpy import (
+    argmax,
+    array,
+    arange,
+    asarray,
+    cumsum,
+    errstate,
+    hstack,
+    logical_and,
+    maximum,
+    where,
+    zeros,
+)
 from six.moves import range
 from traits.api import HasTraits, List, Array
 
-from pychron.core.stats.core import validate_mswd, calculate_mswd
+from pychron.core.stats.core import validate_mswd, calculate_mswd, get_mswd_limits
 from pychron.pychron_constants import MAHON
 
 
-def memoize(function):
-    cache = {}
-
-    def closure(*args):
-        # return function(*args)
-        if args not in cache:
-            cache[args] = function(*args)
-        return cache[args]
-
-    return closure
-
-
 class Log:
     def debug(self, txt):
         pass
@@ -63,8 +63,14 @@ class Plateau(HasTraits):
     def find_plateaus(self, method=""):
         """
         method: str either fleck 1977 or mahon 1996
+
+        every start/end window is evaluated at once. cumulative 39Ar and the weighted
+        mean/MSWD terms come from prefix sums and the fleck criterion from a pairwise
+        overlap matrix.
+
+        return (start, end) of the longest plateau or [] if no plateau is found
         """
-        if method.lower() == MAHON:
+        if method.lower() == MAHON.lower():
             self.use_mswd = True
             self.use_overlap = False
         else:
@@ -72,56 +78,121 @@ class Plateau(HasTraits):
             self.use_overlap = True
 
         n = len(self.ages)
-        excludes = self.excludes
-        ss = [s for i, s in enumerate(self.signals) if i not in excludes]
-
-        self.total_signal = float(sum(ss))
-        # log.info(self.total_signal)
-
-        idxs = []
-        spans = []
-
-        overlap_func = memoize(self._overlap)
-        for i in range(n):
-            if i in excludes:
-                continue
-            idx = self._find_plateaus(n, i, excludes, overlap_func)
-            if idx:
-                # log.debug('found {} {}'.format(*idx))
-                idxs.append(idx)
-                spans.append(idx[1] - idx[0])
-
-        if spans:
+        if not n:
+            return []
+
+        excluded = zeros(n, dtype=bool)
+        for i in self.excludes:
+            if 0 <= i < n:
+                excluded[i] = True
+
+        signals = asarray(self.signals, dtype=float)
+        signals = where(excluded, 0, signals)
+        self.total_signal = float(signals.sum())
+
+        starts = arange(n)[:, None]
+        ends = arange(n)[None, :]
+
+        # candidate (start, end) windows
+        valid = (ends >= starts) & ~excluded[:, None] & ~excluded[None, :]
+        valid &= ends - starts + 1 >= self.nsteps
+
+        if self.use_overlap:
+            valid &= self._overlap_windows(n)
+
+        if self.use_mswd:
+            valid &= self._mswd_windows(n)
+
+        cs = hstack(([0], cumsum(signals)))
+        with errstate(divide="ignore", invalid="ignore"):
+            released = (cs[None, 1:] - cs[:-1, None]) / self.total_signal
+        valid &= released >= self.gas_fraction / 100.0
+
+        # last valid end for each start
+        has_end = valid.any(axis=1)
+        potential_ends = n - 1 - argmax(valid[:, ::-1], axis=1)
+
+        idxs = [
+            (int(i), int(e))
+            for i, (h, e) in enumerate(zip(has_end, potential_ends))
+            if h and e
+        ]
+        if idxs:
+            spans = [e - i for i, e in idxs]
             return idxs[argmax(array(spans))]
 
         return idxs
 
-    def _find_plateaus(self, n, start, excludes, overlap_func):
-        potential_end = None
-        for i in range(start, n, 1):
-            if i in excludes:
-                continue
+    def _overlap_windows(self, n):
+        """
+        return an n x n boolean array. [start, end] is True if every pair of steps in
+        the window overlaps at ``overlap_sigma``
+        """
+        ages = asarray(self.ages, dtype=float)
+        errors = asarray(self.errors, dtype=float) * self.overlap_sigma
+        lo = ages - errors
+        hi = ages + errors
 
-            if not self.check_nsteps(start, i):
-                log.debug("{} {} nsteps failed".format(start, i))
-                continue
+        overlap = (lo[:, None] < hi[None, :]) & (hi[:, None] > lo[None, :])
 
-            if self.use_overlap and not self.check_overlap(start, i, overlap_func):
-                log.debug("{} {} overlap failed".format(start, i))
-                # potential_end=None
-                break
+        # bad[i, j] True if i < j and steps i, j do not overlap
+        bad = ~overlap & (arange(n)[:, None] < arange(n)[None, :])
 
-            if self.use_mswd and not self.check_mswd(start, i):
-                continue
+        # latest[j] = largest i < j that does not overlap j, -1 if none
+        idx = where(bad, arange(n)[:, None], -1)
+        latest = idx.max(axis=0)
 
-            if not self.check_percent_released(start, i):
-                log.debug("{} {} percent failed".format(start, i))
-                continue
+        # a window [s, e] is valid if latest[j] < s for all s < j <= e
+        ok = latest[None, :] < arange(n)[:, None]
+        return logical_and.accumulate(
+            ok | (arange(n)[None, :] <= arange(n)[:, None]), axis=1
+        )
 
-            potential_end = i
+    def _mswd_windows(self, n):
+        """
+        return an n x n boolean array. [start, end] is True if the MSWD of the window
+        is acceptable (Mahon 1996)
+        """
+        ages = asarray(self.ages, dtype=float)
+        errors = asarray(self.errors, dtype=float)
+
+        nonzero = errors != 0
+        bad = hstack(([0], cumsum(~nonzero)))
+        with errstate(divide="ignore", invalid="ignore"):
+            w = where(nonzero, 1 / errors**2, 0)
+
+        # center on the mean to limit cancellation in S2 - S1**2/S0
+        x = ages - ages[nonzero].mean() if nonzero.any() else ages
+        s0 = hstack(([0], cumsum(w)))
+        s1 = hstack(([0], cumsum(w * x)))
+        s2 = hstack(([0], cumsum(w * x**2)))
+
+        def window(c):
+            return c[None, 1:] - c[:-1, None]
+
+        counts = arange(n)[None, :] - arange(n)[:, None] + 1
+        with errstate(divide="ignore", invalid="ignore"):
+            chi2 = window(s2) - window(s1) ** 2 / window(s0)
+            mswd = chi2 / (counts - 1)
+
+        lows = zeros((n, n))
+        highs = zeros((n, n))
+        for c in range(2, n + 1):
+            lows[counts == c], highs[counts == c] = get_mswd_limits(c)
+
+        ok = (counts > 1) & (window(bad) == 0) & (lows <= mswd) & (mswd <= highs)
+
+        # resolve windows within rounding of a limit exactly
+        tol = 1e-9 * maximum(abs(highs), 1)
+        edge = (
+            (counts > 1)
+            & (window(bad) == 0)
+            & ((abs(mswd - lows) < tol) | (abs(mswd - highs) < tol))
+        )
+        for s, e in zip(*edge.nonzero()):
+            ok[s, e] = self.check_mswd(s, e)
 
-        if potential_end:
-            return start, potential_end
+        return ok
 
     def check_percent_released(self, start, end):
         ss = sum(
@@ -138,12 +209,15 @@ class Plateau(HasTraits):
         """
         return False if not valid
         """
-        ages = self.ages[start, end + 1]
-        errors = self.errors[start, end + 1]
+        ages = self.ages[start : end + 1]
+        errors = self.errors[start : end + 1]
         mswd = calculate_mswd(ages, errors)
         return validate_mswd(mswd, len(ages))
 
-    def check_overlap(self, start, end, overlap_func):
+    def check_overlap(self, start, end, overlap_func=None):
+        if overlap_func is None:
+            overlap_func = self._overlap
+
         overlap_sigma = self.overlap_sigma
         for c, i in enumerate(range(start, end, 1)):
             for j in range(start + c, end + 1, 1):
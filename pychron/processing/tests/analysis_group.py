@@ -0,0 +1,152 @@
+import time
+import unittest
+
+from numpy import random, array
+from uncertainties import ufloat, nominal_value, std_dev
+
+from pychron.core.stats.core import calculate_weighted_mean, calculate_mswd
+from pychron.processing.analyses.analysis import IdeogramPlotable
+from pychron.processing.analyses.analysis_group import AnalysisGroup
+from pychron.processing.arar_constants import ArArConstants
+
+CONSTANTS = ArArConstants()
+
+
+class StubAnalysis(IdeogramPlotable):
+    def __init__(self, age, err, k39=1, ca37=0.1, **kw):
+        super(StubAnalysis, self).__init__(make_arar_constants=False, **kw)
+        self.arar_constants = CONSTANTS
+        self.uage = ufloat(age, err)
+        self.age = age
+        self.j = ufloat(1e-3, 0)
+        self.k39 = ufloat(k39, k39 * 0.01)
+        self.ca37 = ufloat(ca37, ca37 * 0.01)
+        self.production_ratios = {}
+
+    def get_value(self, attr):
+        return getattr(self, attr)
+
+    def get_non_ar_isotope(self, k):
+        return getattr(self, k)
+
+
+def make_analyses(n, seed=1):
+    random.seed(seed)
+    ages = random.normal(28.2, 0.1, n)
+    errs = random.uniform(0.05, 0.2, n)
+    return [StubAnalysis(a, e) for a, e in zip(ages, errs)]
+
+
+def make_group(ans):
+    return AnalysisGroup(analyses=ans, include_j_error_in_mean=False)
+
+
+class AnalysisGroupFrameTestCase(unittest.TestCase):
+    def setUp(self):
+        self.analyses = make_analyses(20)
+        self.group = make_group(self.analyses)
+
+    def _expected(self, ans):
+        vs = array([nominal_value(a.uage) for a in ans])
+        es = array([std_dev(a.uage) for a in ans])
+        wm, we = calculate_weighted_mean(vs, es)
+        return wm, we, calculate_mswd(vs, es)
+
+    def test_statistics(self):
+        g = self.group
+        wm, we, mswd = self._expected(self.analyses)
+        self.assertAlmostEqual(nominal_value(g.weighted_age), wm, places=10)
+        self.assertAlmostEqual(g.mswd, mswd, places=10)
+        self.assertEqual(g.nanalyses, 20)
+
+        ages = [a.age for a in self.analyses]
+        self.assertAlmostEqual(g.age_span, max(ages) - min(ages))
+
+    def test_omit(self):
+        g = self.group
+        self.analyses[0].set_temp_status("omit")
+        self.analyses[3].set_temp_status("invalid")
+
+        ans = [a for i, a in enumerate(self.analyses) if i not in (0, 3)]
+        wm, we, mswd = self._expected(ans)
+        self.assertEqual(g.nanalyses, 18)
+        self.assertAlmostEqual(nominal_value(g.weighted_age), wm, places=10)
+        self.assertAlmostEqual(g.mswd, mswd, places=10)
+        self.assertEqual(list(g.clean_analyses()), ans)
+
+        self.analyses[0].set_temp_status("ok")
+        self.assertEqual(g.nanalyses, 19)
+
+    def test_memoized(self):
+        g = self.group
+        calls = []
+        func = g._calculate_mean_values
+
+        def counted(*args):
+            calls.append(args)
+            return func(*args)
+
+        g._calculate_mean_values = counted
+        for i in range(5):
+            g._calculate_weighted_mean("uage")
+        self.assertEqual(len(calls), 1)
+
+        # a recalculation that does not change the values keeps the result
+        g.dirty = True
+        g._calculate_weighted_mean("uage")
+        self.assertEqual(len(calls), 1)
+
+        a = self.analyses[0]
+        a.uage = ufloat(30, 0.1)
+        g.dirty = True
+        v, e = g._calculate_weighted_mean("uage")
+        self.assertEqual(len(calls), 2)
+
+        wm, we, mswd = self._expected(self.analyses)
+        self.assertAlmostEqual(v, wm, places=10)
+
+    def test_analyses_changed(self):
+        g = self.group
+        g.mswd
+        ans = self.analyses[:5]
+        g.analyses = ans
+        self.assertEqual(g.nanalyses, 5)
+        self.assertAlmostEqual(g.mswd, self._expected(ans)[2], places=10)
+
+        g.analyses.append(self.analyses[5])
+        ans = self.analyses[:6]
+        self.assertEqual(list(g.clean_analyses()), ans)
+        self.assertAlmostEqual(g.mswd, self._expected(ans)[2], places=10)
+
+    def test_integrated_kca(self):
+        g = self.group
+        kca = g._calculate_integrated("kca", "valid")
+        ks = sum(a.k39 for a in self.analyses)
+        cas = sum(a.ca37 for a in self.analyses)
+        self.assertAlmostEqual(nominal_value(kca), nominal_value(ks / cas))
+        self.assertIs(g._calculate_integrated("kca", "valid"), kca)
+
+        self.analyses[1].ca37 = ufloat(1, 0.01)
+        g.dirty = True
+        nkca = g._calculate_integrated("kca", "valid")
+        self.assertLess(nominal_value(nkca), nominal_value(kca))
+
+    def test_large_group(self):
+        ans = make_analyses(10000)
+        g = make_group(ans)
+
+        st = time.perf_counter()
+        g.mswd
+        first = time.perf_counter() - st
+
+        st = time.perf_counter()
+        for i in range(100):
+            g.mswd
+            g._calculate_weighted_mean("uage")
+        repeat = (time.perf_counter() - st) / 100
+        self.assertLess(repeat, first)
+        self.assertLess(repeat, 0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
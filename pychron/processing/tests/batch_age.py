@@ -0,0 +1,165 @@
+import unittest
+
+from numpy import array, random, zeros
+from uncertainties import ufloat, covariance_matrix, nominal_value, std_dev
+
+from pychron.processing.arar_constants import ArArConstants
+from pychron.processing.argon_calculations import calculate_f, age_equation
+from pychron.processing.batch_age import calculate_ages_batch
+from pychron.pychron_constants import ARGON_KEYS
+
+INTERFERENCES = {
+    "K4039": (0.0007, 0.0001),
+    "K3839": (0.012, 0.0002),
+    "K3739": (0.0002, 0.00001),
+    "Ca3937": (0.0007, 0.00001),
+    "Ca3837": (0.00003, 0.000001),
+    "Ca3637": (0.00027, 0.000003),
+    "Cl3638": (262.8, 2),
+}
+
+
+class BatchAgeTestCase(unittest.TestCase):
+    n = 25
+
+    def setUp(self):
+        rs = random.RandomState(7)
+        n = self.n
+        a39 = rs.uniform(1, 20, n)
+        self.isotopes = array(
+            [
+                a39 * rs.uniform(5, 50, n),
+                a39,
+                a39 * rs.uniform(0.01, 0.02, n),
+                a39 * rs.uniform(0.01, 2, n),
+                a39 * rs.uniform(0.001, 0.01, n),
+            ]
+        ).T
+        self.errors = self.isotopes * rs.uniform(0.001, 0.02, (n, 5))
+        self.decay_days = rs.uniform(10, 500, n)
+        self.j = rs.uniform(0.001, 0.01, n)
+        self.j_err = self.j * 0.001
+
+    def _ufloat_path(self, i, isos, arc, include_decay_error=False, fixed_k3739=False):
+        interferences = {k: ufloat(v, e, tag=k) for k, (v, e) in INTERFERENCES.items()}
+        f, f_wo_irrad, non_ar, computed, _ = calculate_f(
+            isos,
+            self.decay_days[i],
+            interferences=interferences,
+            arar_constants=arc,
+            fixed_k3739=fixed_k3739,
+        )
+        j = ufloat(self.j[i], self.j_err[i], tag="J")
+        uage_w_j = age_equation(
+            j, f, include_decay_error=include_decay_error, arar_constants=arc
+        )
+        uage = age_equation(
+            ufloat(self.j[i], 0),
+            f,
+            include_decay_error=include_decay_error,
+            arar_constants=arc,
+        )
+        return f, f_wo_irrad, uage, uage_w_j, computed, non_ar
+
+    def _independent(self, i):
+        return [
+            ufloat(v, e, tag=k)
+            for k, v, e in zip(ARGON_KEYS, self.isotopes[i], self.errors[i])
+        ]
+
+    def _compare(self, arc=None, include_decay_error=False, fixed_k3739=False):
+        if arc is None:
+            arc = ArArConstants()
+
+        r = calculate_ages_batch(
+            self.isotopes,
+            self.errors,
+            self.decay_days,
+            j=self.j,
+            j_err=self.j_err,
+            interferences=INTERFERENCES,
+            arar_constants=arc,
+            include_decay_error=include_decay_error,
+            fixed_k3739=fixed_k3739,
+        )
+        for i in range(self.n):
+            f, f_wo_irrad, uage, uage_w_j, computed, non_ar = self._ufloat_path(
+                i, self._independent(i), arc, include_decay_error, fixed_k3739
+            )
+            self.assertAlmostEqual(r.f[i] / nominal_value(f), 1, 10)
+            self.assertAlmostEqual(r.f_err[i] / std_dev(f), 1, 8)
+            self.assertAlmostEqual(r.f_err_wo_irrad[i] / std_dev(f_wo_irrad), 1, 8)
+            self.assertAlmostEqual(r.age[i] / nominal_value(uage), 1, 10)
+            self.assertAlmostEqual(r.age_err[i] / std_dev(uage), 1, 8)
+            self.assertAlmostEqual(r.age_err_w_j[i] / std_dev(uage_w_j), 1, 8)
+
+            for k in ("rad40", "k39", "ca37"):
+                v, e = r.value(k)
+                self.assertAlmostEqual(v[i], nominal_value(computed[k]), 6)
+                self.assertAlmostEqual(e[i], std_dev(computed[k]), 6)
+
+            v, e = r.value("cl36")
+            self.assertAlmostEqual(v[i], nominal_value(non_ar["cl36"]), 6)
+
+            comps = {
+                var.tag: c
+                for var, c in uage_w_j.error_components().items()
+                if var.tag in ARGON_KEYS + ("J",)
+            }
+            for k, c in comps.items():
+                self.assertAlmostEqual(
+                    r.get_error_component(k)[i],
+                    (c / std_dev(uage_w_j)) ** 2 * 100,
+                    6,
+                )
+
+    def test_normal(self):
+        self._compare()
+
+    def test_decay_error(self):
+        self._compare(include_decay_error=True)
+
+    def test_fixed_k3739(self):
+        arc = ArArConstants()
+        arc.k3739_mode = "Fixed"
+        self._compare(arc)
+
+    def test_no_negative_ca(self):
+        self.isotopes[:5, 3] = 0
+        arc = ArArConstants()
+        arc.allow_negative_ca_correction = False
+        self._compare(arc)
+
+    def test_covariance(self):
+        # isotopes sharing a common (e.g. baseline) term are correlated
+        arc = ArArConstants()
+        cov = zeros((self.n, 5, 5))
+        isos = []
+        for i in range(self.n):
+            bs = ufloat(0, 0.05)
+            ii = [ufloat(v, e) + bs for v, e in zip(self.isotopes[i], self.errors[i])]
+            cov[i] = covariance_matrix(ii)
+            isos.append(ii)
+
+        r = calculate_ages_batch(
+            self.isotopes,
+            cov,
+            self.decay_days,
+            j=self.j,
+            j_err=self.j_err,
+            interferences=INTERFERENCES,
+            arar_constants=arc,
+        )
+        for i in range(self.n):
+            f, _, uage, _, _, _ = self._ufloat_path(i, isos[i], arc)
+            self.assertAlmostEqual(r.f_err[i] / std_dev(f), 1, 8)
+            self.assertAlmostEqual(r.age_err[i] / std_dev(uage), 1, 8)
+
+    def test_no_j(self):
+        r = calculate_ages_batch(self.isotopes, self.errors, self.decay_days)
+        self.assertIsNone(r.uage)
+        self.assertEqual(len(r.f), self.n)
+
+
+if __name__ == "__main__":
+    unittest.main()
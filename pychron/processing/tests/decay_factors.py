@@ -0,0 +1,109 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from numpy import random
+
+from pychron.processing.argon_calculations import calculate_arar_decay_factors
+from pychron.processing.decay_factors import (
+    DecayFactorCache,
+    chron_segments,
+)
+
+DC37 = 0.01975
+DC39 = 7.068e-6
+
+
+class DecayFactorCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cache = DecayFactorCache()
+
+    def _doses(self, rs, n):
+        st = datetime(2020, 1, 1) + timedelta(days=rs.uniform(0, 100))
+        doses = []
+        for i in range(n):
+            en = st + timedelta(hours=rs.uniform(1, 10))
+            doses.append((rs.uniform(0.5, 2), st, en))
+            st = en + timedelta(hours=rs.uniform(0, 48))
+        return doses
+
+    def _compare(self, use_endtime):
+        rs = random.RandomState(3)
+        for i in range(50):
+            doses = self._doses(rs, 1 + i % 5)
+            analts = doses[-1][2] + timedelta(days=rs.uniform(1, 1000))
+            expected = calculate_arar_decay_factors(
+                DC37, DC39, chron_segments(doses, analts, use_endtime)
+            )
+            dfs = self.cache.decay_factors(doses, analts, DC37, DC39, use_endtime)
+            for a, b in zip(dfs, expected):
+                self.assertAlmostEqual(a / b, 1, 12)
+
+    def test_start_time(self):
+        self._compare(False)
+
+    def test_end_time(self):
+        self._compare(True)
+
+    def test_no_doses(self):
+        self.assertEqual(
+            self.cache.decay_factors([], datetime.now(), DC37, DC39), (1.0, 1.0)
+        )
+
+    def test_shared(self):
+        doses = self._doses(random.RandomState(1), 3)
+        analts = doses[-1][2] + timedelta(days=10)
+        self.cache.decay_factors(doses, analts, DC37, DC39)
+        self.cache.decay_factors(list(doses), analts, DC37, DC39)
+        self.assertEqual(len(self.cache._terms), 2)
+
+    def test_chronology_changed(self):
+        doses = self._doses(random.RandomState(1), 3)
+        analts = doses[-1][2] + timedelta(days=10)
+        a = self.cache.decay_factors(doses, analts, DC37, DC39)
+
+        doses[0] = (doses[0][0] * 2,) + doses[0][1:]
+        b = self.cache.decay_factors(doses, analts, DC37, DC39)
+        self.assertNotEqual(a, b)
+
+
+class ChronologyCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        from pychron.paths import paths
+
+        self.root = tempfile.mkdtemp()
+        self._meta_root = paths.meta_root
+        paths.meta_root = self.root
+        os.mkdir(os.path.join(self.root, "NM-1"))
+
+    def tearDown(self):
+        from pychron.paths import paths
+
+        paths.meta_root = self._meta_root
+        shutil.rmtree(self.root)
+
+    def _write(self, power):
+        p = os.path.join(self.root, "NM-1", "chronology.txt")
+        with open(p, "w") as wfile:
+            wfile.write("{},2020-01-01 00:00:00,2020-01-01 10:00:00\n".format(power))
+
+    def test_reload_on_change(self):
+        from pychron.dvc.meta_repo import MetaRepo
+
+        repo = MetaRepo()
+        self._write(1.0)
+        a = repo.get_chronology("NM-1")
+        self.assertIs(repo.get_chronology("NM-1"), a)
+
+        time.sleep(0.01)
+        self._write(2.0)
+        b = repo.get_chronology("NM-1")
+        self.assertIsNot(a, b)
+        self.assertEqual(b.get_doses()[0][0], 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,55 @@ __author__ = "ross"
 
 import unittest
 
+from numpy import random
+
+from pychron.core.stats.core import calculate_mswd, validate_mswd
 from pychron.processing.plateau import Plateau
+from pychron.pychron_constants import FLECK, MAHON
+
+
+def reference_plateau(ages, errors, signals, excludes, method=""):
+    """
+    step by step search used before the vectorized implementation
+    """
+    n = len(ages)
+    total = sum(s for i, s in enumerate(signals) if i not in excludes)
+    mahon = method == MAHON
+
+    def overlaps(s, e):
+        for i in range(s, e):
+            for j in range(i + 1, e + 1):
+                ai, aj = ages[i], ages[j]
+                ei, ej = errors[i] * 2, errors[j] * 2
+                if not (ai - ei < aj + ej and ai + ei > aj - ej):
+                    return False
+        return True
+
+    idxs = []
+    for s in range(n):
+        if s in excludes:
+            continue
+        end = None
+        for e in range(s, n):
+            if e in excludes or e - s + 1 < 3:
+                continue
+            if mahon:
+                mswd = calculate_mswd(ages[s : e + 1], errors[s : e + 1])
+                if not validate_mswd(mswd, e - s + 1):
+                    continue
+            elif not overlaps(s, e):
+                break
+
+            released = sum(signals[i] for i in range(s, e + 1) if i not in excludes)
+            if released / total >= 0.5:
+                end = e
+        if end:
+            idxs.append((s, end))
+
+    if idxs:
+        spans = [e - s for s, e in idxs]
+        return idxs[spans.index(max(spans))]
+    return []
 
 
 class PlateauTestCase(unittest.TestCase):
@@ -153,5 +201,43 @@ class PlateauTestCase(unittest.TestCase):
         return ages, errors, signals, exclude, idx
 
 
+class VectorizedPlateauTestCase(unittest.TestCase):
+    def _random(self, seed, n):
+        rs = random.RandomState(seed)
+        ages = 10 + rs.normal(0, 1, n)
+        errors = rs.uniform(0.2, 1.5, n)
+        signals = rs.uniform(0.1, 1, n)
+        excludes = sorted(set(rs.randint(0, n, rs.randint(0, 3))))
+        return ages, errors, signals, excludes
+
+    def _compare(self, method):
+        for seed in range(100):
+            n = 3 + seed % 15
+            ages, errors, signals, excludes = self._random(seed, n)
+            p = Plateau(ages=ages, errors=errors, signals=signals, excludes=excludes)
+            self.assertEqual(
+                p.find_plateaus(method),
+                reference_plateau(ages, errors, signals, excludes, method),
+                "seed={}".format(seed),
+            )
+
+    def test_fleck_matches_reference(self):
+        self._compare(FLECK)
+
+    def test_mahon_matches_reference(self):
+        self._compare(MAHON)
+
+    def test_mahon_zero_error(self):
+        ages = [1, 1.05, 0.95, 1, 1.02]
+        errors = [0.05, 0.05, 0, 0.05, 0.05]
+        signals = [1, 1, 1, 1, 1]
+        p = Plateau(ages=ages, errors=errors, signals=signals)
+        self.assertEqual(p.find_plateaus(MAHON), [])
+
+    def test_check_mswd(self):
+        p = Plateau(ages=[1, 1.05, 0.95], errors=[0.05, 0.05, 0.05], signals=[1, 1, 1])
+        self.assertTrue(p.check_mswd(0, 2))
+
+
 if __name__ == "__main__":
     unittest.main()
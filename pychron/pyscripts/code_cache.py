@@ -0,0 +1,201 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+import copy
+import hashlib
+import os
+from collections import OrderedDict
+from threading import Lock
+
+PRIMITIVES = (str, int, float, bool, type(None))
+
+
+def text_hash(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def file_signature(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+
+    return st.st_mtime_ns, st.st_size
+
+
+def freeze_context(ctx):
+    """
+    return a hashable representation of a script context or None if the context
+    contains values that cannot be reliably compared (e.g. arbitrary objects)
+    """
+    items = []
+    for k in sorted(ctx):
+        # "mx" is built from the script's docstring so it is covered by the text hash
+        if k in ("ex", "mx", "testing_syntax"):
+            continue
+
+        v = ctx[k]
+        if isinstance(v, (list, tuple)):
+            if not all(isinstance(vi, PRIMITIVES) for vi in v):
+                return
+            v = tuple(v)
+        elif not isinstance(v, PRIMITIVES):
+            return
+
+        items.append((k, v))
+
+    return tuple(items)
+
+
+def strip_traceback(error):
+    """
+    return a copy of ``error`` without a traceback so a cached error does not keep
+    the frames (and script contexts) it was raised in alive
+    """
+    if isinstance(error, BaseException):
+        try:
+            error = copy.copy(error)
+        except TypeError:
+            # exceptions with required __init__ args that are not passed on to
+            # BaseException cannot be copied. strip the original instead
+            pass
+
+        error.__traceback__ = None
+        error.__context__ = None
+        error.__cause__ = None
+    return error
+
+
+class LRUDict(object):
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._d = OrderedDict()
+
+    def __len__(self):
+        return len(self._d)
+
+    def clear(self):
+        self._d.clear()
+
+    def get(self, key):
+        try:
+            self._d.move_to_end(key)
+        except KeyError:
+            return
+
+        return self._d[key]
+
+    def set(self, key, value):
+        self._d[key] = value
+        self._d.move_to_end(key)
+        while len(self._d) > self.max_size:
+            self._d.popitem(last=False)
+
+
+class PyScriptCodeCache(object):
+    """
+    process-wide cache of pyscript source text, compiled code objects and syntax check
+    results. each map is a bounded LRU.
+
+    source text is keyed by path and invalidated when the file's mtime or size changes.
+    code objects and syntax results are keyed by the sha1 of the script text so
+    identical scripts share entries regardless of where they were loaded from.
+
+    a syntax result also records the files read while testing (gosubs, hops) and is
+    ignored if any of them changed.
+    """
+
+    def __init__(self, max_size=500):
+        self._lock = Lock()
+        self._texts = LRUDict(max_size)
+        self._codes = LRUDict(max_size)
+        self._syntax = LRUDict(max_size)
+
+    def clear(self):
+        with self._lock:
+            self._texts.clear()
+            self._codes.clear()
+            self._syntax.clear()
+
+    def report(self):
+        return len(self._texts), len(self._codes), len(self._syntax)
+
+    def read(self, path):
+        sig = file_signature(path)
+        with self._lock:
+            entry = self._texts.get(path)
+            if entry and entry[0] == sig:
+                return entry[1]
+
+        with open(path, "r") as rfile:
+            text = rfile.read()
+
+        with self._lock:
+            self._texts.set(path, (sig, text))
+        return text
+
+    def compile(self, text, filename="<string>"):
+        """
+        return a compiled code object for ``text``. compilation errors are cached
+        and a fresh copy is raised so a bad script is only parsed once
+        """
+        key = (text_hash(text), filename)
+        with self._lock:
+            code = self._codes.get(key)
+
+        if code is None:
+            try:
+                code = compile(text, filename, "exec")
+            except (SyntaxError, ValueError, TypeError) as e:
+                code = strip_traceback(e)
+
+            with self._lock:
+                self._codes.set(key, code)
+
+        if isinstance(code, BaseException):
+            raise strip_traceback(code)
+
+        return code
+
+    def get_syntax_result(self, key):
+        """
+        return (error, estimated_duration, depends) or None if ``key`` has not been
+        tested or one of the files the test depended on has changed
+        """
+        if key is not None:
+            with self._lock:
+                entry = self._syntax.get(key)
+
+            if entry:
+                error, estimated_duration, sigs = entry
+                if all(file_signature(p) == sig for p, sig in sigs):
+                    return (
+                        strip_traceback(error),
+                        estimated_duration,
+                        [p for p, _ in sigs],
+                    )
+
+    def set_syntax_result(self, key, error, estimated_duration, depends=None):
+        if key is not None:
+            sigs = tuple((p, file_signature(p)) for p in set(depends or ()))
+            with self._lock:
+                self._syntax.set(
+                    key, (strip_traceback(error), estimated_duration, sigs)
+                )
+
+
+code_cache = PyScriptCodeCache()
+
+# ============= EOF =============================================
@@ -293,6 +293,7 @@ class MeasurementPyScript(ValvePyScript):
             p = os.path.join(self.root, p)
 
         if os.path.isfile(p):
+            self.add_syntax_dependency(p)
             self.hops_name = os.path.basename(p)
 
             with open(p, "r") as rfile:
@@ -894,6 +895,9 @@ class MeasurementPyScript(ValvePyScript):
     def _get_spectrometer_parameter(self, *args, **kw):
         return self._automated_run_call("py_get_spectrometer_parameter", *args, **kw)
 
+    def _get_syntax_cache_state(self):
+        return (self.abbreviated_count_ratio,)
+
     def _setup_docstr_context(self):
         """
         add a context object to the global script context
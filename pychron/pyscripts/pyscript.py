@@ -30,6 +30,12 @@ from pychron.core.yaml import yload
 from pychron.globals import globalv
 from pychron.loggable import Loggable
 from pychron.paths import paths
+from pychron.pyscripts.code_cache import (
+    code_cache,
+    text_hash,
+    freeze_context,
+    file_signature,
+)
 from pychron.pyscripts.contexts import EXPObject
 from pychron.pyscripts.decorators import (
     makeRegistry,
@@ -113,6 +119,7 @@ class PyScript(Loggable):
     interpolation_path = Str
 
     _interpolation_context = None
+    _syntax_depends = None
 
     def is_aborted(self):
         return self._aborted
@@ -206,18 +213,32 @@ class PyScript(Loggable):
             self._syntax_error = True
 
             self.setup_context()
+            self._syntax_depends = []
+
+            key = self._syntax_cache_key(argv)
+            cached = code_cache.get_syntax_result(key)
+            if cached is not None:
+                r, self._estimated_duration, depends = cached
+                for di in depends:
+                    self.add_syntax_dependency(di)
+                self.debug("using cached syntax check")
+            else:
+                r = self._execute(argv=argv)
+                if r is None and not self._interval_stack.empty():
+                    r = IntervalError()
+                code_cache.set_syntax_result(
+                    key, r, self._estimated_duration, self._syntax_depends
+                )
 
-            r = self._execute(argv=argv)
-            if r is not None:
+            if isinstance(r, IntervalError):
+                raise IntervalError()
+            elif r is not None:
                 self.console_info("invalid syntax")
                 ee = PyscriptError(self.filename, r)
                 print("invalid pyscript", self.text)
                 print("error", r)
                 raise ee
 
-            elif not self._interval_stack.empty():
-                raise IntervalError()
-
             else:
                 self.console_info("syntax checking passed")
                 self._syntax_error = False
@@ -252,7 +273,7 @@ class PyScript(Loggable):
         else:
 
             try:
-                code = compile(snippet, "<string>", "exec")
+                code = code_cache.compile(snippet)
             except BaseException as e:
                 exc = self.debug_exception()
                 self.exception_trace = exc
@@ -282,6 +303,20 @@ class PyScript(Loggable):
                 self.exception_trace = exc
                 return exc
 
+    def add_syntax_dependency(self, path):
+        """
+        register a file read while testing so cached syntax results are invalidated
+        when it changes
+        """
+        if not self.testing_syntax:
+            return
+
+        if self._syntax_depends is not None:
+            self._syntax_depends.append(path)
+
+        if self.parent_script:
+            self.parent_script.add_syntax_dependency(path)
+
     def syntax_ok(self, warn=True):
         try:
             self.test()
@@ -294,9 +329,7 @@ class PyScript(Loggable):
 
     def check_for_modifications(self):
         old = self.toblob()
-        with open(self.filename, "r") as f:
-            new = f.read()
-
+        new = code_cache.read(self.filename)
         return old != new
 
     def toblob(self):
@@ -403,9 +436,7 @@ class PyScript(Loggable):
         self._interval_stack = LifoQueue()
 
         if self.root and self.name and load:
-            with open(self.filename, "r") as f:
-                self.text = f.read()
-
+            self.text = code_cache.read(self.filename)
             return True
 
     # ===============================================================================
@@ -482,6 +513,8 @@ class PyScript(Loggable):
             **kw
         )
 
+        self.add_syntax_dependency(s.filename)
+
         if calc_time:
             s.bootstrap()
             s.calculate_estimated_duration(force=True)
@@ -863,6 +896,43 @@ class PyScript(Loggable):
 
         return self._tracer
 
+    def _syntax_cache_key(self, argv):
+        """
+        key syntax check results on the script text, the script class and the context
+        the script is tested with. returns None if the context cannot be frozen
+
+        files read while testing are covered as follows
+            - the script itself: text hash
+            - the interpolation file: path, mtime and size in the key
+            - gosub scripts and hops files: recorded with ``add_syntax_dependency``
+        """
+        ctx = freeze_context(self._ctx or {})
+        if ctx is None:
+            return
+
+        ip = self.interpolation_path
+        if ip:
+            ip = (ip, file_signature(ip))
+
+        if argv is not None:
+            argv = tuple(argv)
+
+        return (
+            text_hash(self.text),
+            self.__class__.__name__,
+            ctx,
+            ip,
+            argv,
+            self._get_syntax_cache_state(),
+        )
+
+    def _get_syntax_cache_state(self):
+        """
+        subclasses should return a hashable tuple of any attributes that change the
+        outcome of a syntax check
+        """
+        return ()
+
     def _generate_ctx_hash(self, ctx):
         """
         generate a sha1 hash from self.__class__, duration, cleanup and len(position)
@@ -0,0 +1,188 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+# no display is available when running headless
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from pychron.pyscripts.code_cache import (
+    code_cache,
+    freeze_context,
+    PyScriptCodeCache,
+)
+from pychron.pyscripts.error import PyscriptError
+from pychron.pyscripts.extraction_line_pyscript import ExtractionPyScript
+
+SCRIPT = """
+def main():
+    sleep(5)
+"""
+
+BAD_SCRIPT = """
+def main():
+    sleep(5
+"""
+
+
+class CountingPyScript(ExtractionPyScript):
+    nexecutes = 0
+
+    def _execute(self, **kw):
+        CountingPyScript.nexecutes += 1
+        return super(CountingPyScript, self)._execute(**kw)
+
+    def console_info(self, *args, **kw):
+        pass
+
+    def warning(self, *args, **kw):
+        pass
+
+
+class CodeCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        code_cache.clear()
+        CountingPyScript.nexecutes = 0
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _write(self, name, text):
+        p = os.path.join(self.root, name)
+        with open(p, "w") as wfile:
+            wfile.write(text)
+        return p
+
+    def _script(self, name="a.py", **ctx):
+        s = CountingPyScript(root=self.root, name=name)
+        s.bootstrap()
+        s.setup_context(analysis_type="blank", duration=1, **ctx)
+        return s
+
+    def test_compile_cached(self):
+        a = code_cache.compile(SCRIPT)
+        b = code_cache.compile(SCRIPT)
+        self.assertIs(a, b)
+
+    def test_compile_error_cached(self):
+        self.assertRaises(SyntaxError, code_cache.compile, BAD_SCRIPT)
+        self.assertRaises(SyntaxError, code_cache.compile, BAD_SCRIPT)
+
+    def test_read_invalidated(self):
+        p = self._write("a.py", SCRIPT)
+        self.assertEqual(code_cache.read(p), SCRIPT)
+
+        time.sleep(0.01)
+        self._write("a.py", BAD_SCRIPT)
+        self.assertEqual(code_cache.read(p), BAD_SCRIPT)
+
+    def test_syntax_cached(self):
+        self._write("a.py", SCRIPT)
+        s = self._script()
+        s.test()
+        d = s.get_estimated_duration()
+
+        s = self._script()
+        s.test()
+        self.assertEqual(CountingPyScript.nexecutes, 1)
+        self.assertEqual(s.get_estimated_duration(), d)
+
+    def test_syntax_error_cached(self):
+        self._write("a.py", BAD_SCRIPT)
+        for i in range(2):
+            s = self._script()
+            self.assertRaises(PyscriptError, s.test)
+
+        self.assertEqual(CountingPyScript.nexecutes, 1)
+
+    def test_syntax_context_key(self):
+        self._write("a.py", SCRIPT)
+        self._script(cleanup=1).test()
+        self._script(cleanup=2).test()
+        self.assertEqual(CountingPyScript.nexecutes, 2)
+
+    def test_syntax_file_changed(self):
+        self._write("a.py", SCRIPT)
+        s = self._script()
+        s.test()
+        d = s.get_estimated_duration()
+
+        self._write("a.py", SCRIPT.replace("5", "10"))
+        s = self._script()
+        s.test()
+        self.assertEqual(CountingPyScript.nexecutes, 2)
+        self.assertEqual(s.get_estimated_duration(), 2 * d)
+
+    def test_gosub_dependency(self):
+        self._write("a.py", "def main():\n    gosub('b.py')\n")
+        self._write("b.py", SCRIPT)
+        s = self._script()
+        s.test()
+        d = s.get_estimated_duration()
+
+        time.sleep(0.01)
+        self._write("b.py", SCRIPT.replace("5", "10"))
+        s = self._script()
+        s.test()
+        self.assertEqual(s.get_estimated_duration(), 2 * d)
+
+    def test_compile_error_traceback(self):
+        def depth(tb):
+            n = 0
+            while tb:
+                n += 1
+                tb = tb.tb_next
+            return n
+
+        depths = []
+        for i in range(3):
+            try:
+                code_cache.compile(BAD_SCRIPT)
+            except SyntaxError as e:
+                depths.append(depth(e.__traceback__))
+
+        self.assertEqual(len(set(depths)), 1)
+
+        key = list(code_cache._codes._d)[0]
+        self.assertIsNone(code_cache._codes.get(key).__traceback__)
+
+    def test_nested_gosub_dependency(self):
+        self._write("a1.py", "def main():\n    gosub('b.py')\n")
+        self._write("a2.py", "def main():\n    gosub('b.py')\n    # a2\n")
+        self._write("b.py", "def main():\n    gosub('c.py')\n")
+        self._write("c.py", SCRIPT)
+
+        ds = []
+        for name in ("a1.py", "a2.py"):
+            s = self._script(name)
+            s.test()
+            ds.append(s.get_estimated_duration())
+        self.assertEqual(ds[0], ds[1])
+
+        time.sleep(0.01)
+        self._write("c.py", SCRIPT.replace("5", "50"))
+        for name in ("a1.py", "a2.py"):
+            s = self._script(name)
+            s.test()
+            self.assertEqual(s.get_estimated_duration(), 10 * ds[0])
+
+    def test_lru(self):
+        cache = PyScriptCodeCache(max_size=2)
+        a = cache.compile("a=1")
+        cache.compile("b=1")
+        cache.compile("a=1")
+        cache.compile("c=1")
+        self.assertIs(cache.compile("a=1"), a)
+        self.assertEqual(cache.report()[1], 2)
+
+    def test_freeze_context(self):
+        self.assertEqual(
+            freeze_context({"a": 1, "b": [1, 2]}), (("a", 1), ("b", (1, 2)))
+        )
+        self.assertIsNone(freeze_context({"a": object()}))
+
+
+if __name__ == "__main__":
+    unittest.main()
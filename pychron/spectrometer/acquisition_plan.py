@@ -0,0 +1,84 @@
+# ===============================================================================
+# Copyright 2026 ross
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ===============================================================================
+
+# ============= enthought library imports =======================
+
+# ============= standard library imports ========================
+import time
+
+from numpy import zeros
+
+# ============= local library imports  ==========================
+
+
+class AcquisitionPlan(object):
+    """
+    the detectors of one intensity reply, resolved once per detector configuration.
+
+    a reply is parsed into a preallocated vector and the key to detector lookups are
+    done when the plan is compiled instead of on every count
+    """
+
+    def __init__(self, keys, detectors):
+        self.keys = list(keys)
+        self.detectors = list(detectors)
+        self.index = {k: i for i, k in enumerate(self.keys)}
+        self.raw = zeros(len(self.keys))
+        self.gains = zeros(len(self.keys))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def matches(self, keys):
+        return self.keys == keys
+
+    def parse(self, values):
+        """
+        convert a sequence of numeric strings, or numbers, into the raw vector
+        """
+        self.raw[:] = values
+        return self.raw
+
+
+class Frame(object):
+    """
+    the last set of gain corrected intensities
+    """
+
+    def __init__(self, plan, signals, timestamp=None):
+        self.plan = plan
+        self.signals = signals
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    @property
+    def age(self):
+        return time.time() - self.timestamp
+
+    def get(self, key):
+        """
+        return the intensity of key, 0 if key was not measured
+        """
+        try:
+            return self.signals[self.plan.index[key]]
+        except KeyError:
+            return 0
+
+    def has_keys(self, keys):
+        idx = self.plan.index
+        return all(k in idx for k in keys)
+
+
+# ============= EOF =============================================
@@ -15,10 +15,12 @@
 # ===============================================================================
 
 # ============= standard library imports ========================
-from numpy import array, hstack
+from collections import deque
+
+from numpy import array
 
 # ============= enthought library imports =======================
-from traits.api import HasTraits, Str, Int, Bool, Float, Property, Color, Array
+from traits.api import HasTraits, Str, Int, Bool, Float, Property, Color
 
 
 # ============= local library imports  ==========================
@@ -30,7 +32,7 @@ class BaseDetector(HasTraits):
     serial_id = Str
     intensity = Str
     std = Str
-    intensities = Array
+    intensities = Property
     nstd = Int(10)
     active = Bool(True)
     gain = Float
@@ -46,14 +48,23 @@ class BaseDetector(HasTraits):
     index = Float
     ypadding = Str
 
+    _window = None
+
     def set_intensity(self, v):
         if v is not None:
-            n = self.nstd
-            if self.intensities is None:
-                self.intensities = array([])
+            # called every count. keep the last nstd+1 values in a deque and compute
+            # the std in python, numpy is slower for so few values
+            w = self._window
+            if w is None or w.maxlen != self.nstd + 1:
+                w = self._window = deque(w or (), maxlen=self.nstd + 1)
 
-            self.intensities = hstack((self.intensities[-n:], [v]))
-            self.std = "{:0.5f}".format(self.intensities.std())
+            v = float(v)
+            w.append(v)
+            n = len(w)
+            m = sum(w) / n
+            std = (sum([(x - m) ** 2 for x in w]) / n) ** 0.5
+
+            self.std = "{:0.5f}".format(std)
             self.intensity = "{:0.5f}".format(v)
 
     @property
@@ -103,6 +114,9 @@ class BaseDetector(HasTraits):
     def _read_gain(self):
         raise NotImplementedError
 
+    def _get_intensities(self):
+        return array(self._window or ())
+
     def _get_isotopes(self):
         molweights = self.spectrometer.molecular_weights
         return sorted(molweights.keys())
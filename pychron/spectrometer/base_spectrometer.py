@@ -31,6 +31,7 @@ from pychron.spectrometer import (
     get_spectrometer_config_name,
     set_spectrometer_config_name,
 )
+from pychron.spectrometer.acquisition_plan import AcquisitionPlan, Frame
 from pychron.spectrometer.base_detector import BaseDetector
 from pychron.spectrometer.spectrometer_device import SpectrometerDevice
 
@@ -72,6 +73,10 @@ class BaseSpectrometer(SpectrometerDevice):
 
     _prev_signals = None
     _no_intensity_change_cnt = 0
+
+    _plan = None
+    _plans = None
+    _frame = None
     active_detectors = List
 
     def cancel(self):
@@ -674,17 +679,47 @@ class BaseSpectrometer(SpectrometerDevice):
         if not keys and globalv.communication_simulation:
             keys, signals, t = self._get_simulation_data()
 
-        signals = array(signals)
+        if not keys:
+            signals = array(signals)
+            self._check_intensity_no_change(signals)
+            self._frame = None
+            return keys, signals, t, inc
+
+        plan = self.get_acquisition_plan(keys)
+        if signals is not plan.raw:
+            signals = plan.parse(signals)
 
         self._check_intensity_no_change(signals)
 
-        gsignals = []
-        for k, v in zip(keys, signals):
-            det = self.get_detector(k)
+        gains = plan.gains
+        for i, (det, v) in enumerate(zip(plan.detectors, signals.tolist())):
             det.set_intensity(v)
-            gsignals.append(v * det.software_gain)
+            gains[i] = det.software_gain
 
-        return keys, array(gsignals), t, inc
+        gsignals = signals * gains
+        self._frame = Frame(plan, gsignals)
+        return keys, gsignals, t, inc
+
+    def get_acquisition_plan(self, keys):
+        """
+        return the plan for a reply with these keys. plans are compiled once per
+        detector configuration, e.g. once per peak hop
+
+        :param keys: list of detector names
+        :return: AcquisitionPlan
+        """
+        plan = self._plan
+        if plan is None or not plan.matches(keys):
+            if self._plans is None:
+                self._plans = {}
+
+            tkeys = tuple(keys)
+            plan = self._plans.get(tkeys)
+            if plan is None:
+                plan = AcquisitionPlan(keys, [self.get_detector(k) for k in keys])
+                self._plans[tkeys] = plan
+            self._plan = plan
+        return plan
 
     def _check_intensity_no_change(self, signals):
         if self.simulation:
@@ -699,55 +734,64 @@ class BaseSpectrometer(SpectrometerDevice):
             self._no_intensity_change_cnt += 1
         elif self._prev_signals is not None:
             try:
-                test = (signals == self._prev_signals).all()
+                prev = self._prev_signals
+                test = signals.shape == prev.shape and (signals == prev).all()
             except (AttributeError, TypeError):
                 test = True
 
             if test:
-                self.debug(
-                    "no intensity change cnt= {}".format(self._no_intensity_change_cnt)
-                )
-                self.debug("signals={}".format(signals))
-                self.debug("prev_signals={}".format(self._prev_signals))
+                self.debug("no intensity change cnt= %s", self._no_intensity_change_cnt)
+                self.debug("signals=%s", signals)
+                self.debug("prev_signals=%s", self._prev_signals)
 
                 self._no_intensity_change_cnt += 1
             else:
                 if self._no_intensity_change_cnt > 0:
                     self.debug("resetting no_intensity_change_cnt")
-                    self.debug("signals={}".format(signals))
-                    self.debug("prev_signals={}".format(self._prev_signals))
+                    self.debug("signals=%s", signals)
+                    self.debug("prev_signals=%s", self._prev_signals)
 
                 self._no_intensity_change_cnt = 0
                 self._prev_signals = None
 
-        self._prev_signals = signals
+        # copy, signals may be a buffer that is reused for the next reading
+        self._prev_signals = None if signals is None else signals.copy()
 
     def settle(self):
         import time
 
         time.sleep(self.integration_time)
 
-    def get_intensity(self, dkeys, integrated_intensity=True, **kw):
+    def get_intensity(self, dkeys, integrated_intensity=True, max_age=0, **kw):
         """
         dkeys: str or tuple of strs
 
+        max_age: seconds. serve the intensities from the last acquired frame if it is
+        younger than max_age instead of reading the spectrometer again
         """
-        try:
-            keys, signals, t, inc = self.get_intensities(
-                integrated_intensity=integrated_intensity
-            )
-        except ValueError:
-            self.debug("failed getting intensities")
-            self.debug_exception()
-            return
+        islist = isinstance(dkeys, (tuple, list))
+        frame = self._frame
+        if not (
+            max_age
+            and frame is not None
+            and frame.age <= max_age
+            and frame.has_keys(dkeys if islist else (dkeys,))
+        ):
+            try:
+                self.get_intensities(integrated_intensity=integrated_intensity)
+            except ValueError:
+                self.debug("failed getting intensities")
+                self.debug_exception()
+                return
 
-        def func(k):
-            return signals[keys.index(k)] if k in keys else 0
+            frame = self._frame
+            if frame is None:
+                return 0 if not islist else [0 for _ in dkeys]
 
-        if isinstance(dkeys, (tuple, list)):
-            return [func(key) for key in dkeys]
+        if islist:
+            return [frame.get(key) for key in dkeys]
         else:
-            return func(dkeys)
+            return frame.get(dkeys)
 
     def get_detector(self, name):
         """
@@ -779,6 +823,14 @@ class BaseSpectrometer(SpectrometerDevice):
         self._config = None
 
     # private
+    def _detectors_changed(self):
+        self._plan = None
+        self._plans = None
+        self._frame = None
+
+    def _detectors_items_changed(self):
+        self._detectors_changed()
+
     def _spectrometer_configuration_changed(self, new):
         if new:
             set_spectrometer_config_name(new)
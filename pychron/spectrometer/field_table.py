@@ -21,7 +21,24 @@ import os
 import shutil
 
 import six
-from numpy import asarray, array, nonzero, polyval
+from numpy import (
+    asarray,
+    array,
+    nonzero,
+    polyval,
+    polyder,
+    linspace,
+    interp,
+    diff,
+    full,
+    zeros,
+    clip,
+    errstate,
+    isfinite,
+    abs as nabs,
+    nan,
+    ndim,
+)
 from scipy.optimize import leastsq, brentq
 from traits.api import HasTraits, List, Str, Dict, Bool, Property, CFloat
 
@@ -52,6 +69,174 @@ def format_dac(dac):
     return "{:0.5f}".format(dac) if dac != NULL_STR else ""
 
 
+class MassMapping(object):
+    """
+    mass <-> dac conversion for one detector's fitted polynomial, dac = p(mass).
+
+    the inverse is evaluated by interpolating a dense grid of p over each monotonic
+    section of the mass range and refining with Newton iterations, so whole arrays of
+    dacs are converted in one call. the result matches brentq over [lo, hi]; dacs
+    without a sign change over the range are nan and dacs with more than one root are
+    solved with brentq
+    """
+
+    def __init__(self, coeffs, lo=0, hi=200, n=2001, tol=1e-12, max_iter=8):
+        self.coeffs = asarray(coeffs, dtype=float)
+        self.dcoeffs = polyder(self.coeffs)
+        self._coeffs, self._dcoeffs = self.coeffs.tolist(), self.dcoeffs.tolist()
+        self.lo, self.hi = lo, hi
+        self.tol = tol
+        self.max_iter = max_iter
+
+        masses = linspace(lo, hi, n)
+        dacs = polyval(self.coeffs, masses)
+
+        # split the grid at the turning points of p
+        d = diff(dacs)
+        turns = nonzero(d[1:] * d[:-1] < 0)[0] + 1
+        edges = [0] + turns.tolist() + [n - 1]
+        sections = []
+        for s, e in zip(edges[:-1], edges[1:]):
+            gd, gm = dacs[s : e + 1], masses[s : e + 1]
+            if gd[0] > gd[-1]:
+                gd, gm = gd[::-1], gm[::-1]
+            sections.append((gd, gm))
+
+        self._sections = sections
+        self._dac_lo, self._dac_hi = dacs[0], dacs[-1]
+
+    def mass_to_dac(self, mass):
+        return polyval(self.coeffs, mass)
+
+    def dac_to_mass(self, dac):
+        """
+        dac: float or array. returns nan where the dac does not map to a mass in the
+        range
+        """
+        dac = asarray(dac, dtype=float)
+        if not dac.ndim:
+            return self._scalar_dac_to_mass(float(dac))
+
+        dac = array(dac, ndmin=1)
+
+        mass = full(dac.shape, nan)
+        mlo = full(dac.shape, nan)
+        mhi = full(dac.shape, nan)
+        nroots = zeros(dac.shape, dtype=int)
+
+        # brentq requires a sign change over [lo, hi]
+        valid = (self._dac_lo - dac) * (self._dac_hi - dac) <= 0
+        for gd, gm in self._sections:
+            inside = valid & (dac >= gd[0]) & (dac <= gd[-1])
+            first = inside & (nroots == 0)
+            mass[first] = interp(dac[first], gd, gm)
+            mlo[first], mhi[first] = sorted((gm[0], gm[-1]))
+            nroots += inside
+
+        single = nroots == 1
+        if single.any():
+            c, dc = self.coeffs, self.dcoeffs
+            m, v = mass[single], dac[single]
+            lo, hi = mlo[single], mhi[single]
+            for _ in range(self.max_iter):
+                with errstate(divide="ignore", invalid="ignore"):
+                    step = (polyval(c, m) - v) / polyval(dc, m)
+                m = clip(m - step, lo, hi)
+                if not (nabs(step) > self.tol).any():
+                    break
+
+            # polish anything that did not converge, e.g. next to a turning point
+            bad = ~(nabs(step) <= self.tol)
+            if bad.any():
+                m[bad] = self._brentq(v[bad])
+            mass[single] = m
+
+        multi = nroots > 1
+        if multi.any():
+            mass[multi] = self._brentq(dac[multi])
+
+        return mass
+
+    def _scalar_dac_to_mass(self, dac):
+        if (self._dac_lo - dac) * (self._dac_hi - dac) > 0:
+            return nan
+
+        sections = [s for s in self._sections if s[0][0] <= dac <= s[0][-1]]
+        if len(sections) != 1:
+            return self._brentq([dac])[0]
+
+        gd, gm = sections[0]
+        lo, hi = sorted((gm[0], gm[-1]))
+        m = float(interp(dac, gd, gm))
+
+        c, dc = self._coeffs, self._dcoeffs
+        for _ in range(self.max_iter):
+            v = dv = 0
+            for ci in c:
+                v = v * m + ci
+            for ci in dc:
+                dv = dv * m + ci
+            if not dv:
+                break
+
+            step = (v - dac) / dv
+            m = min(max(m - step, lo), hi)
+            if abs(step) <= self.tol:
+                return m
+
+        return self._brentq([dac])[0]
+
+    def _brentq(self, dac):
+        c = self.coeffs
+
+        def root(v):
+            try:
+                return brentq(lambda x: polyval(c, x) - v, self.lo, self.hi)
+            except ValueError:
+                return nan
+
+        return array([root(v) for v in dac])
+
+
+class DacIndex(object):
+    """
+    isotope and mass lookups of the dacs in one mftable column
+    """
+
+    def __init__(self, isos, mws, dacs, mass_tol=0.15):
+        self.mass_tol = mass_tol
+        self.dacs = list(dacs)
+        self.isotopes = {}
+        for i, iso in enumerate(isos):
+            self.isotopes.setdefault(iso, i)
+
+        self.buckets = {}
+        for i, m in enumerate(mws):
+            self.buckets.setdefault(int(round(m)), []).append((i, m))
+
+    def get_isotope(self, iso):
+        try:
+            return self.dacs[self.isotopes[iso]]
+        except KeyError:
+            return
+
+    def get_mass(self, mass):
+        """
+        the dac of the first row within mass_tol of mass
+        """
+        tol = self.mass_tol
+        lo, hi = int(round(mass - tol)), int(round(mass + tol))
+        idx = None
+        for b in range(lo, hi + 1):
+            for i, m in self.buckets.get(b, ()):
+                if abs(m - mass) < tol and (idx is None or i < idx):
+                    idx = i
+                    break
+
+        if idx is not None:
+            return self.dacs[idx]
+
+
 class FieldItem(HasTraits):
     isotope = Str
 
@@ -84,6 +269,13 @@ class FieldTable(Loggable):
         self._detectors = None
         self._test_path = None
 
+        self._mftable_hash = None
+        self._mftable_stat = None
+        # fitted coefficients of each mftable version. hash: {detector: coeffs}
+        self._fit_cache = {}
+        self._mappings = {}
+        self._dac_indices = {}
+
         if bind:
             self.bind_preferences()
 
@@ -112,27 +304,28 @@ class FieldTable(Loggable):
         backup(self.path, paths.mftable_backup_dir)
 
     def map_dac_to_mass(self, dac, detname):
+        """
+        dac: float or array of dacs, e.g. the dac axis of a scan. an array returns an
+        array of masses with nan for dacs that do not map to a mass
+        """
         detname = get_detector_name(detname)
 
         d = self._get_mftable()
 
         _, xs, ys, p = d[detname]
         if self.polynominal_mass_func:
+            mass = self.get_mass_mapping(detname).dac_to_mass(dac)
+            if ndim(mass):
+                return mass
 
-            def func(x, *args):
-                c = list(p)
-                c[-1] -= dac
-                return polyval(c, x)
+            if isfinite(mass):
+                return float(mass)
 
-            try:
-                mass = brentq(func, 0, 200)
-                return mass
-            except ValueError as e:
-                self.debug(
-                    "DAC does not map to an isotope. DAC={}, Detector={}".format(
-                        dac, detname
-                    )
+            self.debug(
+                "DAC does not map to an isotope. DAC={}, Detector={}".format(
+                    dac, detname
                 )
+            )
         else:
             try:
                 idx = ys.index(dac)
@@ -164,10 +357,30 @@ class FieldTable(Loggable):
         return dac
 
     def get_dac(self, det, mass):
+        """
+        mass: isotope name or float. a float returns the dac of the first isotope within
+        0.15 amu of mass
+        """
         det = get_detector_name(det)
-        d = self._get_mftable()
-        dac = next((d for i, m, d in zip(*d[det][:3]) if abs(m - mass) < 0.15), None)
-        return dac
+        index = self._dac_indices.get(det)
+        if index is None or self._mftable is None or self._check_mftable_hash():
+            d = self._get_mftable()
+            index = self._dac_indices[det] = DacIndex(*d[det][:3])
+
+        if isinstance(mass, str):
+            return index.get_isotope(mass)
+        return index.get_mass(mass)
+
+    def get_mass_mapping(self, det):
+        """
+        the cached MassMapping for a detector's current coefficients
+        """
+        det = get_detector_name(det)
+        c = self._get_mftable()[det][3]
+        m = self._mappings.get(det)
+        if m is None or m.coeffs.tolist() != list(c):
+            m = self._mappings[det] = MassMapping(c)
+        return m
 
         # isotope = next((i for i, m in self.molweights.iteritems() if abs(m-mass)<1e-5), None)
         # if isotope is not None:
@@ -221,6 +434,7 @@ class FieldTable(Loggable):
                     p = None
                 d[k] = isoks, mws, ndacs, p
 
+            self._clear_indices()
             if save:
                 self.dump(isos, d, message)
 
@@ -334,9 +548,10 @@ class FieldTable(Loggable):
         mws = self.molweights
 
         self._set_mftable_hash(path)
+        fits = self._fit_cache.setdefault(self._mftable_hash, {})
         items = []
 
-        with open(path, "U") as f:
+        with open(path, "r", newline="") as f:
             reader = csv.reader(f)
             table = []
 
@@ -391,22 +606,28 @@ class FieldTable(Loggable):
             for i, k in enumerate(detectors):
                 ys = table[2 + i]
 
-                xs, dacs = self._clean_dacs(mws, ys)
-                initial_guess = self._get_initial_guess(dacs, xs)
-                if initial_guess:
-                    try:
-                        c = least_squares(
-                            polyval, xs, dacs, initial_guess=initial_guess
-                        )
-                    except TypeError as e:
-                        self.warning("load mftable {}".format(e))
-                        c = (0, 0, ys[0])
+                key = k, tuple(mws)
+                if key in fits:
+                    c = fits[key]
                 else:
-                    c = None
+                    xs, dacs = self._clean_dacs(mws, ys)
+                    initial_guess = self._get_initial_guess(dacs, xs)
+                    if initial_guess:
+                        try:
+                            c = least_squares(
+                                polyval, xs, dacs, initial_guess=initial_guess
+                            )
+                        except TypeError as e:
+                            self.warning("load mftable {}".format(e))
+                            c = (0, 0, ys[0])
+                    else:
+                        c = None
+                    fits[key] = c
 
                 d[k] = (isos, mws, ys, c)
 
             self._mftable = d
+            self._clear_indices()
             # self._mftable={k: (isos, mws, table[2 + i], )
             # for i, k in enumerate(detectors)}
             self._detectors = detectors
@@ -445,8 +666,12 @@ class FieldTable(Loggable):
             self.debug("{:<8s} {}".format(it.isotope, " ".join(vs)))
         self.debug("================================")
 
+    def _clear_indices(self):
+        self._mappings = {}
+        self._dac_indices = {}
+
     def _get_mftable(self):
-        if not self._mftable or not self._check_mftable_hash():
+        if not self._mftable or self._check_mftable_hash():
             self.debug("using mftable at {}".format(self.path))
             self.load_table()
 
@@ -457,15 +682,29 @@ class FieldTable(Loggable):
         return True if mftable externally modified
         """
         # p = paths.mftable
-        current_hash = self._make_hash(self.path)
+        p = self.path
+        st = self._stat(p)
+        if st is not None and st == self._mftable_stat:
+            # unchanged since hashed, do not read the file again
+            return False
+
+        current_hash = self._make_hash(p)
         return self._mftable_hash != current_hash
 
+    def _stat(self, p):
+        try:
+            st = os.stat(p)
+        except (OSError, TypeError):
+            return
+        return p, st.st_mtime_ns, st.st_size
+
     def _make_hash(self, p):
         if p and os.path.isfile(p):
             with open(p, "rb") as rfile:
-                return hashlib.md5(rfile.read())
+                return hashlib.md5(rfile.read()).hexdigest()
 
     def _set_mftable_hash(self, p):
+        self._mftable_stat = self._stat(p)
         self._mftable_hash = self._make_hash(p)
 
     def _add_to_archive(self, p, message):
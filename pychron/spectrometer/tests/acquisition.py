@@ -0,0 +1,170 @@
+import os
+import unittest
+from itertools import cycle
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from traits.api import HasTraits, Float
+
+from pychron.spectrometer.thermo.detector.argus import ArgusDetector
+from pychron.spectrometer.thermo.spectrometer.argus import ArgusSpectrometer
+
+DATA = os.path.join(os.path.dirname(__file__), "data", "getdata.txt")
+
+
+def load_replies(path=DATA):
+    with open(path, "r") as rfile:
+        return [line.strip() for line in rfile if line.strip()]
+
+
+class ReplayCommunicator:
+    """
+    answers GetData with recorded replies
+    """
+
+    simulation = False
+
+    def __init__(self, replies):
+        self.replies = cycle(replies)
+        self.nasks = 0
+
+    def ask(self, cmd, *args, **kw):
+        self.nasks += 1
+        return next(self.replies)
+
+
+class Stub(HasTraits):
+    dac = Float
+    dacmin = Float
+    current_hv = Float
+
+
+class ReplaySpectrometer(ArgusSpectrometer):
+    replies = None
+
+    def _microcontroller_default(self):
+        return ReplayCommunicator(self.replies)
+
+    def _magnet_default(self):
+        return Stub()
+
+    def _source_default(self):
+        return Stub()
+
+
+def make_spectrometer(replies=None):
+    if replies is None:
+        replies = load_replies()
+
+    spec = ReplaySpectrometer(replies=replies)
+    keys = replies[0].split(",")[::2]
+    for k in keys:
+        spec.detectors.append(
+            ArgusDetector(
+                name=k, spectrometer=spec, microcontroller=spec.microcontroller
+            )
+        )
+    return spec
+
+
+class AcquisitionPlanTestCase(unittest.TestCase):
+    def setUp(self):
+        self.replies = load_replies()
+        self.spec = make_spectrometer(self.replies)
+
+    def _expected(self, reply):
+        data = reply.split(",")
+        return data[::2], [float(v) for v in data[1::2]]
+
+    def test_parse(self):
+        for reply in self.replies[:3]:
+            keys, signals, t, inc = self.spec.get_intensities()
+            ekeys, esignals = self._expected(reply)
+            self.assertEqual(keys, ekeys)
+            self.assertEqual(signals.tolist(), esignals)
+
+    def test_plan_reused(self):
+        spec = self.spec
+        spec.get_intensities()
+        plan = spec._plan
+        spec.get_intensities()
+        self.assertIs(spec._plan, plan)
+        self.assertEqual(plan.detectors, spec.detectors)
+
+        spec.detectors.pop(-1)
+        self.assertIsNone(spec._plan)
+
+    def test_plan_per_configuration(self):
+        a = "H1,1.0,AX,2.0"
+        b = "H2,3.0,H1,4.0,AX,5.0"
+        spec = make_spectrometer([b, a])
+        spec.get_intensities()
+        pb = spec._plan
+        keys, signals, _, _ = spec.get_intensities()
+        self.assertEqual(keys, ["H1", "AX"])
+        self.assertEqual(signals.tolist(), [1.0, 2.0])
+
+        spec.get_intensities()
+        self.assertIs(spec._plan, pb)
+        self.assertEqual(len(spec._plans), 2)
+
+    def test_software_gain(self):
+        spec = self.spec
+        spec.get_detector("H1").software_gain = 2
+        keys, signals, _, _ = spec.get_intensities()
+        _, esignals = self._expected(self.replies[0])
+        self.assertAlmostEqual(signals[keys.index("H1")], esignals[1] * 2)
+        self.assertEqual(
+            spec.get_detector("H1").intensity, "{:0.5f}".format(esignals[1])
+        )
+
+    def test_no_intensity_change(self):
+        spec = self.spec
+        for i in range(10):
+            spec.get_intensities()
+        self.assertEqual(spec._no_intensity_change_cnt, 0)
+
+        spec = make_spectrometer(self.replies[:1])
+        for i in range(3):
+            spec.get_intensities()
+        self.assertEqual(spec._no_intensity_change_cnt, 2)
+
+    def test_untagged(self):
+        spec = make_spectrometer(["H2,1,H1,2,AX,3"])
+        spec.microcontroller.replies = cycle(["1.0,2.0,3.0"])
+        keys, signals, _, _ = spec.read_intensities(tagged=False)
+        self.assertEqual(keys, ["H2", "H1", "AX"])
+        self.assertEqual(signals.tolist(), [1.0, 2.0, 3.0])
+
+    def test_error_reply(self):
+        spec = self.spec
+        spec.get_intensities()
+        spec.microcontroller.replies = cycle(["ERROR: timeout"])
+        keys, signals, _, _ = spec.get_intensities()
+        self.assertEqual(keys, [])
+        self.assertEqual(spec.get_intensity("H1"), 0)
+
+    def test_get_intensity(self):
+        spec = self.spec
+        comm = spec.microcontroller
+
+        v = spec.get_intensity("H1")
+        self.assertEqual(v, self._expected(self.replies[0])[1][1])
+        self.assertEqual(comm.nasks, 1)
+
+        # served from the last frame
+        vs = spec.get_intensity(["H1", "AX"], max_age=60)
+        self.assertEqual(comm.nasks, 1)
+        self.assertEqual(vs[0], v)
+
+        # a detector that was not measured forces a new reading
+        self.assertEqual(spec.get_intensity(["H1", "XX"], max_age=60)[1], 0)
+        self.assertEqual(comm.nasks, 2)
+
+        # default is a fresh reading
+        spec.get_intensity("H1")
+        self.assertEqual(comm.nasks, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+per count overhead of the intensity acquisition path, measured with a simulated
+communicator that replays recorded GetData replies.
+
+    python -m pychron.spectrometer.tests.acquisition_benchmark [n]
+
+"legacy" repeats the previous path, a float() per value and a linear detector scan per
+key, for comparison
+"""
+
+import sys
+import time
+
+from numpy import array
+
+from pychron.spectrometer.tests.acquisition import make_spectrometer
+
+
+def legacy_get_intensities(spec):
+    datastr = spec.ask("GetData", verbose=False, quiet=True, use_error_mode=False)
+    data = datastr.split(",")
+    keys = data[::2]
+    signals = array([float(s) for s in data[1::2]])
+
+    gsignals = []
+    for k, v in zip(keys, signals):
+        det = next((d for d in spec.detectors if d.name == k))
+        det.set_intensity(v)
+        gsignals.append(v * det.software_gain)
+    return keys, array(gsignals)
+
+
+def legacy_get_intensity(spec, key):
+    keys, signals = legacy_get_intensities(spec)
+    return signals[keys.index(key)] if key in keys else 0
+
+
+def run(func, n):
+    st = time.perf_counter()
+    for _ in range(n):
+        func()
+    return (time.perf_counter() - st) / n * 1e6
+
+
+def benchmark(n=5000):
+    spec = make_spectrometer()
+    results = [
+        ("legacy get_intensities", run(lambda: legacy_get_intensities(spec), n)),
+        ("get_intensities", run(spec.get_intensities, n)),
+        ("legacy get_intensity", run(lambda: legacy_get_intensity(spec, "AX"), n)),
+        (
+            "get_intensity from frame",
+            run(lambda: spec.get_intensity("AX", max_age=60), n),
+        ),
+    ]
+    return results
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    for name, us in benchmark(n):
+        print("{:<28s}{:>10.2f} us/count".format(name, us))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,13 @@
 from __future__ import absolute_import
 import os
+import shutil
+import tempfile
 import unittest
 
-from pychron.spectrometer.field_table import FieldTable
+from numpy import array, linspace, polyval, isnan, nan
+from scipy.optimize import brentq
+
+from pychron.spectrometer.field_table import FieldTable, MassMapping
 
 
 class Argon2CDDMFTableTestCase(unittest.TestCase):
@@ -93,5 +98,149 @@ class MFTableTestCase(unittest.TestCase):
         self.assertNotEqual(dac, 5.8955)
 
 
+def brentq_mass(coeffs, dac):
+    def func(x):
+        c = list(coeffs)
+        c[-1] -= dac
+        return polyval(c, x)
+
+    try:
+        return brentq(func, 0, 200)
+    except ValueError:
+        return nan
+
+
+MOLWEIGHTS = {
+    "H1": 1.00783,
+    "He4": 4.0026,
+    "Ar40": 39.9624,
+    "Ar39": 38.964,
+    "Ar38": 37.9627,
+    "Ar37": 36.9668,
+    "Ar36": 35.9675,
+    "Kr84": 83.9115,
+    "Xe132": 131.9042,
+    "Hg200": 199.9683,
+}
+
+
+def write_mftable(path, detectors=("H2", "H1", "AX", "L1", "L2", "CDD")):
+    """
+    a table of dac = k*sqrt(mass) per detector, the shape of a real magnet calibration,
+    spanning the mass range so the parabolic fit is monotonic over it
+    """
+    with open(path, "w") as wfile:
+        wfile.write("parabolic\n")
+        wfile.write(",".join(("iso",) + detectors) + "\n")
+        for iso, m in MOLWEIGHTS.items():
+            dacs = [
+                "{:0.5f}".format((0.93 + 0.01 * i) * m**0.5)
+                for i in range(len(detectors))
+            ]
+            wfile.write(",".join([iso] + dacs) + "\n")
+
+
+class MassMappingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, "mftable.csv")
+        write_mftable(self.path)
+
+        self.mftable = FieldTable(bind=False)
+        self.mftable.molweights = MOLWEIGHTS
+        self.mftable._test_path = self.path
+        self.mftable.load_table(path=self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def assertMatches(self, masses, expected):
+        self.assertEqual(isnan(masses).tolist(), isnan(expected).tolist())
+        ok = ~isnan(expected)
+        if ok.any():
+            self.assertLess(abs(masses[ok] - expected[ok]).max(), 1e-9)
+
+    def test_matches_brentq(self):
+        ft = self.mftable
+        for det in ("H2", "H1", "AX", "L1", "L2", "CDD"):
+            c = ft.get_table()[det][3]
+            lo, hi = polyval(c, 1), polyval(c, 199)
+            dacs = linspace(lo, hi, 501)
+
+            masses = ft.map_dac_to_mass(dacs, det)
+            expected = array([brentq_mass(c, d) for d in dacs])
+            self.assertFalse(isnan(expected).all())
+            self.assertMatches(masses, expected)
+
+            for d in dacs[::100]:
+                self.assertAlmostEqual(
+                    ft.map_dac_to_mass(d, det), brentq_mass(c, d), delta=1e-9
+                )
+
+    def test_out_of_range(self):
+        ft = self.mftable
+        c = ft.get_table()["H1"][3]
+        self.assertTrue(isnan(brentq_mass(c, 1e6)))
+        self.assertIsNone(ft.map_dac_to_mass(1e6, "H1"))
+
+        masses = ft.map_dac_to_mass([1e6, polyval(c, 40)], "H1")
+        self.assertTrue(isnan(masses[0]))
+        self.assertAlmostEqual(masses[1], 40, delta=1e-9)
+
+    def test_functions(self):
+        for coeffs in (
+            (0.15, 0.1),
+            (-2e-4, 0.16, 0.05),
+            (1e-6, -2e-4, 0.15, 0.05),
+            # three roots for dacs near 5
+            (1e-5, -3e-3, 0.275, -2.5),
+        ):
+            m = MassMapping(coeffs)
+            dacs = polyval(coeffs, linspace(1, 199, 200))
+            expected = array([brentq_mass(coeffs, d) for d in dacs])
+            self.assertMatches(m.dac_to_mass(dacs), expected)
+
+    def test_not_monotonic(self):
+        # p(0)=1, max of 4.125 at 125, p(200)=3. dacs above 3 have either no sign
+        # change over the range or two roots, brentq fails on both
+        coeffs = (-2e-4, 0.05, 1)
+        m = MassMapping(coeffs)
+        dacs = linspace(0.5, 4.5, 41)
+        expected = array([brentq_mass(coeffs, d) for d in dacs])
+        self.assertMatches(m.dac_to_mass(dacs), expected)
+        self.assertTrue(isnan(m.dac_to_mass(3.5)))
+
+    def test_get_dac(self):
+        ft = self.mftable
+        isos, _, dacs, _ = ft.get_table()["H2"]
+        v = dacs[isos.index("Ar39")]
+        self.assertEqual(ft.get_dac("H2", "Ar39"), v)
+        self.assertEqual(ft.get_dac("H2", 39.0), v)
+        self.assertEqual(ft.get_dac("H2", 39.5), None)
+        self.assertIsNone(ft.get_dac("H2", "Ar41"))
+
+        ft.update_field_table("H2", "Ar39", 5.8, update_others=False, save=False)
+        self.assertAlmostEqual(ft.get_dac("H2", "Ar39"), 5.8)
+        self.assertAlmostEqual(ft.get_dac("H2", 38.9), 5.8)
+
+    def test_fit_cache(self):
+        ft = self.mftable
+        c = ft.get_table()["H1"][3]
+        ft.load_table(path=self.path)
+        self.assertIs(ft.get_table()["H1"][3], c)
+        self.assertEqual(len(ft._fit_cache), 1)
+
+    def test_modified(self):
+        ft = self.mftable
+        m = ft.map_dac_to_mass(5.9, "H1")
+        self.assertFalse(ft._check_mftable_hash())
+
+        write_mftable(self.path, detectors=("H1", "H2"))
+
+        self.assertTrue(ft._check_mftable_hash())
+        self.assertNotAlmostEqual(ft.map_dac_to_mass(5.9, "H1"), m)
+        self.assertEqual(len(ft._fit_cache), 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -36,6 +36,9 @@ from pychron.pychron_constants import (
 from pychron.spectrometer import get_spectrometer_config_path
 from pychron.spectrometer.base_spectrometer import BaseSpectrometer
 
+# detector order of an untagged GetData reply
+UNTAGGED_KEYS = ["H2", "H1", "AX", "L1", "L2", "CDD"]
+
 
 def normalize_integration_time(it):
     """
@@ -411,34 +414,18 @@ class ThermoSpectrometer(BaseSpectrometer):
                 data = datastr.split(",")
                 if tagged:
                     keys = data[::2]
-                    signals = data[1::2]
+                    values = data[1::2]
                 else:
-                    keys = ["H2", "H1", "AX", "L1", "L2", "CDD"]
-                    signals = data
+                    values = data
+                    keys = UNTAGGED_KEYS[: len(values)]
+                    values = values[: len(keys)]
 
-            signals = [float(s) for s in signals]
+                if keys:
+                    # parse straight into the plan's preallocated vector
+                    signals = self.get_acquisition_plan(keys).parse(values)
 
         return keys, signals, None, True
 
-    def get_intensity(self, dkeys):
-        """
-        dkeys: str or tuple of strs
-
-        """
-        data = self.get_intensities()
-        if data is not None:
-
-            keys, signals, _, _ = data
-
-            def func(k):
-                return signals[keys.index(k)] if k in keys else 0
-
-            if isinstance(dkeys, (tuple, list)):
-                return [func(key) for key in dkeys]
-            else:
-                return func(dkeys)
-                # return signals[keys.index(dkeys)] if dkeys in keys else 0
-
     def update_config(self, **kw):
         # p = os.path.join(paths.spectrometer_dir, 'config.cfg')
         p = get_spectrometer_config_path()